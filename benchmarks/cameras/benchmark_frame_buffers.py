@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-frame latency and memory footprint of the read path of `OpenCVCamera`.
+
+Frames are read at a given fps from a synthetic `cv2.VideoCapture` stand-in, which copies a fixed frame into the
+array given to `read` (or allocates a new one, like a decoder, when none is given), so that no camera is needed.
+Both read paths of the camera are compared:
+- `read`, which allocates the captured frame, then the color-converted and rotated frames,
+- `_read_into_frame_buffers`, used by the read thread, which writes into preallocated ring buffers.
+
+The last `--num-held-frames` frames are kept referenced, as done by the queue of frames to be saved in a
+dataset during recording. The resident memory is sampled every second.
+
+Example:
+
+```bash
+python benchmarks/cameras/benchmark_frame_buffers.py --duration-s 600 --height 1080 --width 1920
+```
+"""
+
+import argparse
+import collections
+import resource
+import time
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from lerobot.cameras.configs import ColorMode, Cv2Rotation
+from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+
+
+class SyntheticVideoCapture:
+    """Stand-in for `cv2.VideoCapture` returning a fixed BGR frame."""
+
+    def __init__(self, *args, width: int = 640, height: int = 480, fps: float = 30):
+        self.props = {
+            cv2.CAP_PROP_FRAME_WIDTH: float(width),
+            cv2.CAP_PROP_FRAME_HEIGHT: float(height),
+            cv2.CAP_PROP_FPS: float(fps),
+        }
+        self.frame = None
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return True
+
+    def release(self) -> None:
+        pass
+
+    def get(self, prop: int) -> float:
+        return self.props.get(prop, 0.0)
+
+    def set(self, prop: int, value: float) -> bool:
+        self.props[prop] = value
+        return True
+
+    def read(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        shape = (int(self.props[cv2.CAP_PROP_FRAME_HEIGHT]), int(self.props[cv2.CAP_PROP_FRAME_WIDTH]), 3)
+        if self.frame is None or self.frame.shape != shape:
+            self.frame = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+        if image is None or image.shape != shape:
+            image = np.empty(shape, dtype=np.uint8)
+        np.copyto(image, self.frame)
+        return True, image
+
+
+def get_rss_mb() -> float:
+    """Current resident memory of the process, or its peak when /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        # ru_maxrss is in KiB on Linux, in bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+
+
+def run(use_frame_buffers: bool, args) -> tuple[np.ndarray, list[float]]:
+    config = OpenCVCameraConfig(
+        index_or_path=0,
+        fps=args.fps,
+        width=args.width,
+        height=args.height,
+        color_mode=ColorMode(args.color_mode),
+        rotation=Cv2Rotation(args.rotation),
+    )
+    camera = OpenCVCamera(config)
+    read = camera._read_into_frame_buffers if use_frame_buffers else camera.read
+
+    held_frames = collections.deque(maxlen=args.num_held_frames)
+    latencies, rss_mb = [], []
+    num_frames = int(args.duration_s * args.fps)
+    # The stand-in must stay patched for `OpenCVCamera.is_connected` to recognize it
+    with patch("lerobot.cameras.opencv.camera_opencv.cv2.VideoCapture", SyntheticVideoCapture):
+        camera.connect(warmup=False)
+        start_t = time.perf_counter()
+        for frame_index in range(num_frames):
+            start = time.perf_counter()
+            held_frames.append(read())
+            latencies.append(time.perf_counter() - start)
+            if frame_index % args.fps == 0:
+                rss_mb.append(get_rss_mb())
+            time.sleep(max(0.0, start_t + (frame_index + 1) / args.fps - time.perf_counter()))
+        camera.disconnect()
+    return np.array(latencies), rss_mb
+
+
+def main(args):
+    print(
+        f"{args.width}x{args.height} {args.color_mode} frames rotated by {args.rotation} at {args.fps} fps "
+        f"for {args.duration_s} s, {args.num_held_frames} frames held"
+    )
+    for name, use_frame_buffers in [("allocated frames", False), ("frame buffers   ", True)]:
+        latencies, rss_mb = run(use_frame_buffers, args)
+        print(
+            f"{name}: latency mean {latencies.mean() * 1e3:6.3f} ms, "
+            f"p50 {np.percentile(latencies, 50) * 1e3:6.3f} ms, "
+            f"p99 {np.percentile(latencies, 99) * 1e3:6.3f} ms, "
+            f"max {latencies.max() * 1e3:6.3f} ms | "
+            f"RSS start {rss_mb[0]:7.1f} MB, end {rss_mb[-1]:7.1f} MB, max {max(rss_mb):7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--duration-s", type=float, default=600, help="Capture duration of each read path.")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second.")
+    parser.add_argument("--height", type=int, default=1080, help="Frame height.")
+    parser.add_argument("--width", type=int, default=1920, help="Frame width.")
+    parser.add_argument("--color-mode", default="rgb", choices=["rgb", "bgr"], help="Color mode.")
+    parser.add_argument(
+        "--rotation", type=int, default=0, choices=[-90, 0, 90, 180], help="Rotation in degrees."
+    )
+    parser.add_argument(
+        "--num-held-frames", type=int, default=30, help="Number of the last frames kept referenced."
+    )
+    main(parser.parse_args())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the throughput of `LeRobotDataset.__getitem__` with long `delta_timestamps` windows.
+
+A synthetic (non-video) dataset is recorded in a temporary directory, then samples are drawn at random and
+the samples/sec of the vectorized delta-window indexing is compared against the previous per-sample Python
+implementation, which is reproduced in `legacy_getitem` for reference. The batched `__getitems__` path used by
+`torch.utils.data.DataLoader` is measured as well.
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_delta_indexing.py --num-episodes 50 --episode-length 300 --horizon 100
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+
+def create_synthetic_dataset(root: Path, num_episodes: int, episode_length: int, dim: int, fps: int):
+    features = {
+        OBS_STATE: {"dtype": "float32", "shape": (dim,), "names": None},
+        ACTION: {"dtype": "float32", "shape": (dim,), "names": None},
+    }
+    dataset = LeRobotDataset.create(repo_id="bench/delta_indexing", fps=fps, features=features, root=root)
+    for _ in range(num_episodes):
+        for _ in range(episode_length):
+            dataset.add_frame(
+                {
+                    OBS_STATE: np.random.rand(dim).astype(np.float32),
+                    ACTION: np.random.rand(dim).astype(np.float32),
+                    "task": "benchmark",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+
+def legacy_getitem(dataset: LeRobotDataset, idx: int) -> dict:
+    """Per-sample implementation of `__getitem__` prior to the vectorized delta-window indexing."""
+    item = dataset.hf_dataset[idx]
+    ep_idx = item["episode_index"].item()
+    ep = dataset.meta.episodes[ep_idx]
+    ep_start = ep["dataset_from_index"]
+    ep_end = ep["dataset_to_index"]
+    for key, delta_idx in dataset.delta_indices.items():
+        q_idx = [max(ep_start, min(ep_end - 1, idx + delta)) for delta in delta_idx]
+        item[f"{key}_is_pad"] = torch.BoolTensor(
+            [(idx + delta < ep_start) | (idx + delta >= ep_end) for delta in delta_idx]
+        )
+        item[key] = torch.stack(dataset.hf_dataset[key][q_idx])
+    item["task"] = dataset.meta.tasks.iloc[item["task_index"].item()].name
+    return item
+
+
+def measure(fn, indices: np.ndarray) -> float:
+    start = time.perf_counter()
+    for idx in indices:
+        fn(int(idx))
+    return len(indices) / (time.perf_counter() - start)
+
+
+def measure_batched(dataset: LeRobotDataset, indices: np.ndarray, batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(indices), batch_size):
+        dataset.__getitems__(indices[i : i + batch_size].tolist())
+    return len(indices) / (time.perf_counter() - start)
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "dataset"
+        create_synthetic_dataset(root, args.num_episodes, args.episode_length, args.dim, args.fps)
+
+        delta_timestamps = {
+            OBS_STATE: [i / args.fps for i in range(-1, 1)],
+            ACTION: [i / args.fps for i in range(args.horizon)],
+        }
+        dataset = LeRobotDataset("bench/delta_indexing", root=root, delta_timestamps=delta_timestamps)
+
+        rng = np.random.default_rng(args.seed)
+        indices = rng.integers(0, len(dataset), size=args.num_samples)
+
+        # Warm up caches (Arrow memory mapping, lookup tables)
+        measure(dataset.__getitem__, indices[:10])
+        measure(lambda i: legacy_getitem(dataset, i), indices[:10])
+
+        legacy = measure(lambda i: legacy_getitem(dataset, i), indices)
+        vectorized = measure(dataset.__getitem__, indices)
+        batched = measure_batched(dataset, indices, args.batch_size)
+
+    print(f"frames={len(dataset)} horizon={args.horizon} samples={args.num_samples}")
+    print(f"legacy per-sample indexing: {legacy:10.1f} samples/s")
+    print(f"vectorized indexing:        {vectorized:10.1f} samples/s ({vectorized / legacy:.1f}x)")
+    print(f"batched __getitems__ (bs={args.batch_size}): {batched:10.1f} samples/s ({batched / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-episodes", type=int, default=20, help="Number of synthetic episodes.")
+    parser.add_argument("--episode-length", type=int, default=200, help="Number of frames per episode.")
+    parser.add_argument("--dim", type=int, default=14, help="Dimension of the state and action vectors.")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second of the synthetic dataset.")
+    parser.add_argument("--horizon", type=int, default=100, help="Length of the action delta window.")
+    parser.add_argument("--batch-size", type=int, default=64, help="Batch size of `__getitems__` calls.")
+    parser.add_argument("--num-samples", type=int, default=2000, help="Number of samples to draw.")
+    parser.add_argument("--seed", type=int, default=1337, help="Seed for the sampled indices.")
+    main(parser.parse_args())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time spent by the control loop to hand frames to `AsyncImageWriter` in process mode.
+
+Frames are either pickled through the queue of the writer processes (`num_slots=0`), or copied in slots of
+shared memory whose indices are queued (default). Frames are saved at a given fps, as done by `lerobot-record`,
+and the backpressure metrics of the writers are reported.
+
+Pickling and sending the frames to the subprocesses is done by a background thread of the queue, which competes
+with the control loop for the GIL. Hence, the CPU time of the main process per frame is reported along with the
+time spent in `save_image`.
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_image_writer.py --num-cameras 2 --height 1080 --width 1920
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.datasets.image_writer import DEFAULT_NUM_SHARED_MEMORY_SLOTS, AsyncImageWriter
+
+
+def run(root: Path, num_slots: int, args) -> tuple[np.ndarray, dict]:
+    rng = np.random.default_rng(0)
+    frames = [
+        rng.integers(0, 256, (args.height, args.width, 3), dtype=np.uint8) for _ in range(args.num_cameras)
+    ]
+    writer = AsyncImageWriter(
+        num_processes=args.num_processes, num_threads=args.num_threads, num_slots=num_slots
+    )
+    save_times = []
+    start_cpu_t = time.process_time()
+    try:
+        for frame_index in range(args.num_frames):
+            start_loop_t = time.perf_counter()
+            for camera_index, frame in enumerate(frames):
+                fpath = root / f"camera_{camera_index}" / f"frame_{frame_index:06d}.png"
+                fpath.parent.mkdir(parents=True, exist_ok=True)
+                start = time.perf_counter()
+                writer.save_image(frame, fpath)
+                save_times.append(time.perf_counter() - start)
+            time.sleep(max(0.0, 1 / args.fps - (time.perf_counter() - start_loop_t)))
+        writer.wait_until_done()
+        stats = writer.get_stats()
+        stats["cpu_time_per_frame_s"] = (time.process_time() - start_cpu_t) / len(save_times)
+    finally:
+        writer.stop()
+    return np.array(save_times), stats
+
+
+def main(args):
+    print(
+        f"{args.num_cameras} camera(s) {args.height}x{args.width} at {args.fps} fps, "
+        f"{args.num_processes} process(es) x {args.num_threads} thread(s)"
+    )
+    for name, num_slots in [("pickled frames", 0), ("shared memory ", args.num_slots)]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            save_times, stats = run(Path(tmp_dir), num_slots, args)
+        print(
+            f"{name}: save_image mean {save_times.mean() * 1e3:6.2f} ms, "
+            f"p99 {np.percentile(save_times, 99) * 1e3:6.2f} ms, "
+            f"main process CPU time {stats['cpu_time_per_frame_s'] * 1e3:6.2f} ms per frame | "
+            f"max queue depth {stats['max_queue_depth']}, {stats['num_blocked_frames']} blocked frames "
+            f"({stats['blocked_time_s']:.2f}s), {stats['num_dropped_frames']} dropped frames"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of cameras.")
+    parser.add_argument("--height", type=int, default=1080, help="Frame height.")
+    parser.add_argument("--width", type=int, default=1920, help="Frame width.")
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second of each camera.")
+    parser.add_argument("--num-frames", type=int, default=150, help="Number of frames per camera.")
+    parser.add_argument("--num-processes", type=int, default=2, help="Number of writer processes.")
+    parser.add_argument("--num-threads", type=int, default=4, help="Number of threads per writer process.")
+    parser.add_argument(
+        "--num-slots",
+        type=int,
+        default=DEFAULT_NUM_SHARED_MEMORY_SLOTS,
+        help="Number of shared memory slots per frame shape.",
+    )
+    main(parser.parse_args())
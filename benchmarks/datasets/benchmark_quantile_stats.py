@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the speed and accuracy of the quantiles of `RunningQuantileStats` with `np.quantile`.
+
+Random vectors are fed in batches to `RunningQuantileStats`, either to a single instance or to one instance per
+batch which are then merged (as done by `lerobot-compute-stats`). The quantiles are compared with the exact
+ones computed by `np.quantile` on the whole data, and the errors are reported in number of histogram bins.
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_quantile_stats.py --num-vectors 1000000 --vector-length 32
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lerobot.datasets.compute_stats import DEFAULT_QUANTILES, RunningQuantileStats
+
+DISTRIBUTIONS = {
+    "normal": lambda rng, shape: rng.normal(0, 1, shape),
+    "lognormal": lambda rng, shape: rng.lognormal(0, 2, shape),
+    "uint8": lambda rng, shape: rng.integers(0, 256, shape).astype(np.float64),
+    "drift": lambda rng, shape: np.cumsum(rng.normal(0, 1, shape), axis=0),
+}
+
+
+def run_sketch(data: np.ndarray, args, merge: bool) -> tuple[RunningQuantileStats, float]:
+    start = time.perf_counter()
+    running_stats = RunningQuantileStats(num_quantile_bins=args.num_quantile_bins)
+    for batch in np.array_split(data, args.num_batches):
+        if merge:
+            batch_stats = RunningQuantileStats(num_quantile_bins=args.num_quantile_bins)
+            batch_stats.update(batch)
+            running_stats.merge(batch_stats)
+        else:
+            running_stats.update(batch)
+    running_stats.get_statistics()
+    return running_stats, time.perf_counter() - start
+
+
+def main(args):
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"num_vectors={args.num_vectors} vector_length={args.vector_length} "
+        f"num_batches={args.num_batches} num_quantile_bins={args.num_quantile_bins}"
+    )
+    for name, distribution in DISTRIBUTIONS.items():
+        data = distribution(rng, (args.num_vectors, args.vector_length))
+
+        start = time.perf_counter()
+        expected = np.quantile(data, DEFAULT_QUANTILES, axis=0)
+        numpy_time = time.perf_counter() - start
+
+        for merge in [False, True]:
+            running_stats, sketch_time = run_sketch(data, args, merge)
+            stats = running_stats.get_statistics()
+            bin_width = np.array([edges[1] - edges[0] for edges in running_stats._bin_edges])
+            errors = np.stack(
+                [
+                    np.abs(stats[key] - expected[i]) / bin_width
+                    for i, key in enumerate(running_stats._quantile_keys)
+                ]
+            )
+            mode = "merge " if merge else "update"
+            print(
+                f"{name:>9} {mode}: sketch {sketch_time:7.3f}s | np.quantile {numpy_time:7.3f}s | "
+                f"max error {errors.max():5.2f} bins, mean error {errors.mean():5.2f} bins"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-vectors", type=int, default=200_000, help="Number of random vectors.")
+    parser.add_argument("--vector-length", type=int, default=16, help="Length of the vectors.")
+    parser.add_argument(
+        "--num-batches", type=int, default=100, help="Number of batches the vectors are fed in."
+    )
+    parser.add_argument("--num-quantile-bins", type=int, default=5000, help="Number of histogram bins.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    main(parser.parse_args())
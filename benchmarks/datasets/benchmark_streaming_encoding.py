@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the time spent in `save_episode` and the bytes written to disk per episode when recording videos
+by writing PNG images (encoded when the episode is saved) or with streaming encoding.
+
+Synthetic camera frames are added with `LeRobotDataset.add_frame` at the recording frame rate, as done by
+`lerobot-record` (with an `AsyncImageWriter` of 4 threads per camera), then `save_episode` is called. Its
+duration is the time the robot waits before the environment can be reset. Bytes written are the bytes passed
+to `write` system calls by the process (`wchar` in `/proc/self/io`, Linux only).
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_streaming_encoding.py --num-cameras 2 --episode-length 300
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.utils.constants import ACTION, OBS_IMAGES
+
+
+def get_written_bytes() -> int:
+    with open("/proc/self/io") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("wchar"))
+
+
+def record(root: Path, streaming_encoding: bool, args) -> dict[str, float]:
+    camera_keys = [f"{OBS_IMAGES}.cam{i}" for i in range(args.num_cameras)]
+    features = {
+        key: {
+            "dtype": "video",
+            "shape": (args.height, args.width, 3),
+            "names": ["height", "width", "channels"],
+        }
+        for key in camera_keys
+    }
+    features[ACTION] = {"dtype": "float32", "shape": (6,), "names": None}
+    dataset = LeRobotDataset.create(
+        repo_id="bench/streaming_encoding",
+        fps=args.fps,
+        features=features,
+        root=root,
+        image_writer_threads=4 * args.num_cameras,
+        streaming_encoding=streaming_encoding,
+    )
+
+    rng = np.random.default_rng(0)
+    # Smooth images with noise, which compress like camera frames
+    x = np.linspace(0, 255, args.width, dtype=np.float32)[None, :, None]
+    y = np.linspace(0, 255, args.height, dtype=np.float32)[:, None, None]
+    base = (x + y) / 2
+    save_times, written_bytes, frame_times = [], [], []
+    for _ in range(args.num_episodes):
+        start_bytes = get_written_bytes()
+        for frame_index in range(args.episode_length):
+            start = time.perf_counter()
+            frame = {ACTION: np.zeros(6, dtype=np.float32), "task": "benchmark"}
+            for key in camera_keys:
+                noise = rng.integers(0, 16, (args.height, args.width, 1), dtype=np.uint8)
+                frame[key] = ((base + 2 * frame_index) % 240 + noise).repeat(3, axis=2).astype(np.uint8)
+            dataset.add_frame(frame)
+            frame_times.append(time.perf_counter() - start)
+            # Wait for the next frame, as a camera would
+            time.sleep(max(0.0, 1 / args.fps - (time.perf_counter() - start)))
+
+        start = time.perf_counter()
+        dataset.save_episode()
+        save_times.append(time.perf_counter() - start)
+        written_bytes.append(get_written_bytes() - start_bytes)
+    dataset.finalize()
+    dataset.stop_image_writer()
+
+    return {
+        "save_episode_s": float(np.mean(save_times)),
+        "written_mb": float(np.mean(written_bytes)) / 1024**2,
+        "add_frame_p99_ms": float(np.percentile(frame_times, 99)) * 1000,
+    }
+
+
+def main(args):
+    print(
+        f"{args.num_episodes} episodes of {args.episode_length} frames, {args.num_cameras} camera(s) "
+        f"{args.height}x{args.width} @ {args.fps} fps"
+    )
+    results = {}
+    for streaming_encoding, name in [(False, "png + encode"), (True, "streaming   ")]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results[streaming_encoding] = r = record(Path(tmp_dir) / "dataset", streaming_encoding, args)
+        print(
+            f"{name}: save_episode {r['save_episode_s']:7.3f}s | written {r['written_mb']:8.1f} MiB/episode | "
+            f"add_frame p99 {r['add_frame_p99_ms']:6.2f}ms"
+        )
+    speedup = results[False]["save_episode_s"] / results[True]["save_episode_s"]
+    print(f"save_episode speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-episodes", type=int, default=3, help="Number of recorded episodes.")
+    parser.add_argument("--episode-length", type=int, default=150, help="Number of frames per episode.")
+    parser.add_argument("--num-cameras", type=int, default=1, help="Number of cameras.")
+    parser.add_argument("--height", type=int, default=480, help="Frame height.")
+    parser.add_argument("--width", type=int, default=640, help="Frame width.")
+    parser.add_argument("--fps", type=int, default=30, help="Recording frame rate.")
+    main(parser.parse_args())
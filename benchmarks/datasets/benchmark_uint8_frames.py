@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare DataLoader throughput and host memory when camera frames are returned as float32 or as uint8.
+
+A synthetic video dataset is recorded in a temporary directory, then iterated with a `torch.utils.data.DataLoader`
+twice: once with the default float32 frames and once with `LeRobotDataset(return_uint8_frames=True)`. In the
+latter case, frames are converted to float with `ImageToFloatProcessorStep` after being moved to the device,
+as done by `lerobot-train` with `--dataset.return_uint8_frames=true`.
+
+Each mode runs in a fresh process so that the reported peak resident memory (of the main process and of the
+DataLoader workers) is not polluted by the other mode.
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_uint8_frames.py --num-workers 4 --batch-size 64 --device cuda
+```
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.processor import (
+    DataProcessorPipeline,
+    DeviceProcessorStep,
+    ImageToFloatProcessorStep,
+)
+from lerobot.processor.converters import batch_to_transition, transition_to_batch
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+REPO_ID = "bench/uint8_frames"
+
+
+def create_synthetic_dataset(root: Path, num_episodes: int, episode_length: int, height: int, width: int):
+    features = {
+        f"{OBS_IMAGES}.top": {
+            "dtype": "video",
+            "shape": (height, width, 3),
+            "names": ["height", "width", "channels"],
+        },
+        OBS_STATE: {"dtype": "float32", "shape": (6,), "names": None},
+        ACTION: {"dtype": "float32", "shape": (6,), "names": None},
+    }
+    dataset = LeRobotDataset.create(repo_id=REPO_ID, fps=30, features=features, root=root)
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None, None]
+    for _ in range(num_episodes):
+        for frame_index in range(episode_length):
+            dataset.add_frame(
+                {
+                    f"{OBS_IMAGES}.top": ((x + y + 3 * frame_index) % 256).repeat(3, axis=2).astype(np.uint8),
+                    OBS_STATE: np.random.rand(6).astype(np.float32),
+                    ACTION: np.random.rand(6).astype(np.float32),
+                    "task": "benchmark",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+
+def run(root: Path, uint8: bool, args, results: dict):
+    dataset = LeRobotDataset(REPO_ID, root=root, return_uint8_frames=uint8)
+    steps = [DeviceProcessorStep(device=args.device)]
+    if uint8:
+        steps.append(ImageToFloatProcessorStep())
+    preprocessor = DataProcessorPipeline(
+        steps, to_transition=batch_to_transition, to_output=transition_to_batch
+    )
+    dataloader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=args.batch_size,
+        shuffle=True,
+        num_workers=args.num_workers,
+        pin_memory=args.device == "cuda",
+        drop_last=True,
+    )
+
+    num_samples = 0
+    batch_bytes = 0
+    start = time.perf_counter()
+    for epoch in range(args.num_epochs):
+        for batch in dataloader:
+            if epoch == 0 and num_samples == 0:
+                # Size of a batch as sent by a worker to the main process
+                batch_bytes = sum(v.nbytes for v in batch.values() if isinstance(v, torch.Tensor))
+            batch = preprocessor(batch)
+            assert batch[f"{OBS_IMAGES}.top"].dtype == torch.float32
+            num_samples += len(batch[ACTION])
+    if args.device == "cuda":
+        torch.cuda.synchronize()
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in KiB on Linux
+    results[uint8] = {
+        "samples_per_s": num_samples / elapsed,
+        "batch_mb": batch_bytes / 1024**2,
+        "main_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "workers_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "dataset"
+        create_synthetic_dataset(root, args.num_episodes, args.episode_length, args.height, args.width)
+
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Manager().dict()
+        for uint8 in [False, True]:
+            process = ctx.Process(target=run, args=(root, uint8, args, results))
+            process.start()
+            process.join()
+
+    print(f"batch_size={args.batch_size} num_workers={args.num_workers} frames={args.height}x{args.width}")
+    for uint8, name in [(False, "float32 frames"), (True, "uint8 frames  ")]:
+        r = results[uint8]
+        print(
+            f"{name}: {r['samples_per_s']:8.1f} samples/s | batch {r['batch_mb']:7.2f} MiB | "
+            f"peak RSS main {r['main_rss_mb']:7.1f} MiB, workers {r['workers_rss_mb']:7.1f} MiB"
+        )
+    speedup = results[True]["samples_per_s"] / results[False]["samples_per_s"]
+    print(f"uint8 speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-episodes", type=int, default=10, help="Number of synthetic episodes.")
+    parser.add_argument("--episode-length", type=int, default=100, help="Number of frames per episode.")
+    parser.add_argument("--height", type=int, default=240, help="Frame height.")
+    parser.add_argument("--width", type=int, default=320, help="Frame width.")
+    parser.add_argument("--batch-size", type=int, default=32, help="DataLoader batch size.")
+    parser.add_argument("--num-workers", type=int, default=2, help="Number of DataLoader workers.")
+    parser.add_argument("--num-epochs", type=int, default=1, help="Number of passes over the dataset.")
+    parser.add_argument("--device", type=str, default="cpu", help="Device the batches are moved to.")
+    main(parser.parse_args())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the I/O of adding episode videos to a video file of a dataset while recording, either by
+re-concatenating the whole file for every episode (`concatenate_video_files`) or by appending to the open file
+(`VideoFileAppender`, used by `LeRobotDataset.save_episode`).
+
+A synthetic episode video is encoded once, then added `--num-episodes` times to a single video file. Bytes
+written are the bytes passed to `write` system calls by the process (`wchar` in `/proc/self/io`, Linux only).
+With re-concatenation, the bytes written (and the time spent) per episode grow with the number of episodes
+already in the file, so that the total is quadratic in the number of episodes. With appending, they are
+constant.
+
+Example:
+
+```bash
+python benchmarks/datasets/benchmark_video_append.py --num-episodes 200
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.datasets.video_utils import (
+    StreamingVideoEncoder,
+    VideoFileAppender,
+    concatenate_video_files,
+    get_video_duration_in_s,
+)
+
+
+def get_written_bytes() -> int:
+    with open("/proc/self/io") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("wchar"))
+
+
+def encode_episode_video(path: Path, args) -> None:
+    encoder = StreamingVideoEncoder(path, args.fps)
+    rng = np.random.default_rng(0)
+    for _ in range(args.episode_length):
+        encoder.add_frame(rng.integers(0, 256, (args.height, args.width, 3), dtype=np.uint8))
+    encoder.finish()
+
+
+def run(ep_path: Path, output_path: Path, append: bool, args) -> tuple[np.ndarray, np.ndarray]:
+    """Return the bytes written and the time spent for every episode."""
+    ep_duration = get_video_duration_in_s(ep_path)
+    appender = VideoFileAppender(output_path)
+    written_bytes, times = [], []
+    for ep_idx in range(args.num_episodes):
+        start_bytes, start = get_written_bytes(), time.perf_counter()
+        if append:
+            appender.append(ep_path, from_timestamp=ep_idx * ep_duration)
+        elif ep_idx == 0:
+            output_path.write_bytes(ep_path.read_bytes())
+        else:
+            concatenate_video_files([output_path, ep_path], output_path)
+        written_bytes.append(get_written_bytes() - start_bytes)
+        times.append(time.perf_counter() - start)
+    # Closing the appended file writes its index
+    start_bytes, start = get_written_bytes(), time.perf_counter()
+    appender.close()
+    written_bytes[-1] += get_written_bytes() - start_bytes
+    times[-1] += time.perf_counter() - start
+    return np.array(written_bytes), np.array(times)
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ep_path = Path(tmp_dir) / "episode.mp4"
+        encode_episode_video(ep_path, args)
+        ep_size = ep_path.stat().st_size
+        print(
+            f"{args.num_episodes} episodes of {args.episode_length} frames {args.height}x{args.width} "
+            f"({ep_size / 1024**2:.2f} MiB per episode video) in a single video file"
+        )
+
+        quarter = args.num_episodes // 4
+        for append, name in [(False, "re-concatenate"), (True, "append        ")]:
+            written_bytes, times = run(ep_path, Path(tmp_dir) / f"file-{append}.mp4", append, args)
+            print(
+                f"{name}: total written {written_bytes.sum() / 1024**2:9.1f} MiB in {times.sum():7.2f}s | "
+                f"per episode, first quarter {written_bytes[:quarter].mean() / ep_size:6.1f}x the episode size "
+                f"({times[:quarter].mean() * 1000:6.1f}ms), last quarter "
+                f"{written_bytes[-quarter:].mean() / ep_size:6.1f}x ({times[-quarter:].mean() * 1000:6.1f}ms)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-episodes", type=int, default=200, help="Number of episodes added to the file.")
+    parser.add_argument("--episode-length", type=int, default=60, help="Number of frames per episode.")
+    parser.add_argument("--height", type=int, default=96, help="Frame height.")
+    parser.add_argument("--width", type=int, default=128, help="Frame width.")
+    parser.add_argument("--fps", type=int, default=30, help="Frame rate.")
+    main(parser.parse_args())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the ingestion throughput of `ReplayBuffer` when adding transitions one by one or stacked.
+
+Messages of `--message-size` transitions are serialized as sent by the actors, as a list of transitions or stacked
+by `stack_transitions`, then deserialized and added to the buffer as done by `learner.process_transitions`:
+- one by one with `add`, after checking each transition for NaN values,
+- at once with `add_batch`, after checking the whole batch for NaN values.
+
+Example:
+
+```bash
+python benchmarks/rl/benchmark_add_batch.py --message-size 100 --num-messages 50
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.transport.utils import bytes_to_transitions, transitions_to_bytes
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+from lerobot.utils.transition import Transition, stack_transitions
+
+
+def make_transitions(args) -> list[Transition]:
+    def make_state():
+        state = {
+            f"{OBS_IMAGES}.camera_{i}": torch.rand(1, 3, args.image_size, args.image_size)
+            for i in range(args.num_cameras)
+        }
+        state[OBS_STATE] = torch.randn(1, args.state_dim)
+        return state
+
+    return [
+        Transition(
+            state=make_state(),
+            action=torch.randn(1, args.action_dim),
+            reward=1.0,
+            next_state=make_state(),
+            done=False,
+            truncated=i == args.message_size - 1,
+            complementary_info={"discrete_penalty": torch.tensor([0.0])},
+        )
+        for i in range(args.message_size)
+    ]
+
+
+def has_nan(transition: Transition) -> bool:
+    tensors = [*transition["state"].values(), *transition["next_state"].values(), transition[ACTION]]
+    return any(torch.isnan(tensor).any() for tensor in tensors)
+
+
+def run(batched: bool, args) -> np.ndarray:
+    buffer = ReplayBuffer(
+        capacity=args.capacity,
+        device="cpu",
+        state_keys=[*(f"{OBS_IMAGES}.camera_{i}" for i in range(args.num_cameras)), OBS_STATE],
+        use_drq=False,
+        optimize_memory=True,
+    )
+    transitions = make_transitions(args)
+    message = transitions_to_bytes(stack_transitions(transitions) if batched else transitions)
+
+    times = []
+    for _ in range(args.num_messages):
+        start = time.perf_counter()
+        received = bytes_to_transitions(message)
+        if batched:
+            nan_mask = torch.zeros(len(received[ACTION]), dtype=torch.bool)
+            for tensor in [*received["state"].values(), *received["next_state"].values(), received[ACTION]]:
+                nan_mask |= torch.isnan(tensor.reshape(len(tensor), -1)).any(dim=1)
+            assert not nan_mask.any()
+            buffer.add_batch(**received)
+        else:
+            for transition in received:
+                if not has_nan(transition):
+                    buffer.add(**transition)
+        times.append(time.perf_counter() - start)
+    return np.array(times)
+
+
+def main(args):
+    print(
+        f"Messages of {args.message_size} transitions with {args.num_cameras} cameras of "
+        f"3x{args.image_size}x{args.image_size}, buffer capacity {args.capacity}"
+    )
+    for name, batched in [("add      ", False), ("add_batch", True)]:
+        times = run(batched, args)
+        print(
+            f"{name}: {times.mean() * 1e3:8.2f} ms per message, "
+            f"{args.message_size / times.mean():9.0f} transitions/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--capacity", type=int, default=10_000, help="Number of transitions in the buffer.")
+    parser.add_argument("--message-size", type=int, default=100, help="Number of transitions per message.")
+    parser.add_argument("--num-messages", type=int, default=50, help="Number of measured messages.")
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of image observations.")
+    parser.add_argument("--image-size", type=int, default=64, help="Height and width of the images.")
+    parser.add_argument("--state-dim", type=int, default=32, help="Dimension of the states.")
+    parser.add_argument("--action-dim", type=int, default=7, help="Dimension of the actions.")
+    main(parser.parse_args())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the memory footprint and the sampling throughput of `ReplayBuffer` with image observations.
+
+Four storage modes are compared at several capacities:
+- float32 images, with the next states stored separately or read from the next slot (`optimize_memory`),
+- uint8 images (`store_images_as_uint8`), converted to floats on the sampling device, with or without
+  `optimize_memory`.
+
+The storage is filled directly with random pixels, since adding transitions one by one would take much longer than
+the benchmark. Configurations whose storage would exceed `--max-memory-gb` are skipped.
+
+Example:
+
+```bash
+python benchmarks/rl/benchmark_image_storage.py --capacities 1000 10000 100000 --num-cameras 2 --image-size 128
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+MODES = {
+    "float32        ": {"store_images_as_uint8": False, "optimize_memory": False},
+    "float32 shared ": {"store_images_as_uint8": False, "optimize_memory": True},
+    "uint8          ": {"store_images_as_uint8": True, "optimize_memory": False},
+    "uint8 shared   ": {"store_images_as_uint8": True, "optimize_memory": True},
+}
+
+
+def image_keys(args) -> list[str]:
+    return [f"{OBS_IMAGES}.camera_{i}" for i in range(args.num_cameras)]
+
+
+def estimate_storage_gb(capacity: int, store_images_as_uint8: bool, optimize_memory: bool, args) -> float:
+    bytes_per_state = args.num_cameras * 3 * args.image_size**2 * (1 if store_images_as_uint8 else 4)
+    bytes_per_state += args.state_dim * 4
+    return capacity * bytes_per_state * (1 if optimize_memory else 2) / 2**30
+
+
+def storage_gb(buffer: ReplayBuffer) -> float:
+    tensors = list(buffer.states.values()) + [buffer.actions]
+    if not buffer.optimize_memory:
+        tensors += list(buffer.next_states.values())
+    return sum(t.numel() * t.element_size() for t in tensors) / 2**30
+
+
+def make_full_buffer(capacity: int, store_images_as_uint8: bool, optimize_memory: bool, args) -> ReplayBuffer:
+    buffer = ReplayBuffer(
+        capacity=capacity,
+        device=args.device,
+        state_keys=[*image_keys(args), OBS_STATE],
+        use_drq=False,
+        storage_device="cpu",
+        optimize_memory=optimize_memory,
+        store_images_as_uint8=store_images_as_uint8,
+    )
+    state = {key: torch.zeros(3, args.image_size, args.image_size) for key in image_keys(args)}
+    state[OBS_STATE] = torch.zeros(args.state_dim)
+    buffer.add(state, torch.zeros(args.action_dim), 0.0, state, False, False)
+
+    storages = [buffer.states] if optimize_memory else [buffer.states, buffer.next_states]
+    for storage in storages:
+        for tensor in storage.values():
+            if tensor.dtype == torch.uint8:
+                tensor.random_(0, 256)
+            else:
+                tensor.uniform_()
+    buffer.size = capacity
+    buffer.position = capacity - 1
+    return buffer
+
+
+def run(buffer: ReplayBuffer, args) -> np.ndarray:
+    sample_times = []
+    for step in range(args.warmup_steps + args.num_steps):
+        start = time.perf_counter()
+        batch = buffer.sample(args.batch_size)
+        if args.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        if step >= args.warmup_steps:
+            sample_times.append(time.perf_counter() - start)
+    assert batch["state"][image_keys(args)[0]].dtype == torch.float32
+    return np.array(sample_times)
+
+
+def main(args):
+    print(
+        f"{args.num_cameras} cameras of 3x{args.image_size}x{args.image_size}, batches of {args.batch_size} "
+        f"transitions sampled on {args.device}"
+    )
+    for capacity in args.capacities:
+        for name, mode in MODES.items():
+            estimated_gb = estimate_storage_gb(capacity, **mode, args=args)
+            if estimated_gb > args.max_memory_gb:
+                print(f"capacity {capacity:8d} {name}: skipped, {estimated_gb:7.2f} GB of storage")
+                continue
+            buffer = make_full_buffer(capacity, **mode, args=args)
+            sample_times = run(buffer, args)
+            print(
+                f"capacity {capacity:8d} {name}: storage {storage_gb(buffer):7.2f} GB, "
+                f"sample {sample_times.mean() * 1e3:7.2f} ms "
+                f"(p99 {np.percentile(sample_times, 99) * 1e3:7.2f} ms, "
+                f"{args.batch_size / sample_times.mean():8.0f} samples/s)"
+            )
+            del buffer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--capacities",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Numbers of transitions in the buffer.",
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of image observations.")
+    parser.add_argument("--image-size", type=int, default=128, help="Height and width of the images.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Number of transitions per batch.")
+    parser.add_argument("--state-dim", type=int, default=32, help="Dimension of the states.")
+    parser.add_argument("--action-dim", type=int, default=7, help="Dimension of the actions.")
+    parser.add_argument("--num-steps", type=int, default=50, help="Number of measured batches.")
+    parser.add_argument("--warmup-steps", type=int, default=5, help="Number of batches before measuring.")
+    parser.add_argument("--device", default="cpu", help="Sampling device.")
+    parser.add_argument(
+        "--max-memory-gb", type=float, default=16, help="Skip the configurations with a larger storage."
+    )
+    main(parser.parse_args())
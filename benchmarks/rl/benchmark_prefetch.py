@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure how long the learner waits for batches of `ReplayBuffer.get_iterator`, with and without prefetching.
+
+Each step fetches a batch with DrQ augmentation, then runs `--compute-ms` of matrix multiplications on `--device`
+to stand for an optimization step. Without prefetching, the batch is sampled, copied and augmented when fetched.
+With prefetching, it's prepared by a background thread while the previous step computes, on a side CUDA stream
+for a CUDA device. The wait reported is `last_batch_wait_s`, which the learner logs.
+
+Example:
+
+```bash
+python benchmarks/rl/benchmark_prefetch.py --device cuda --batch-size 256 --compute-ms 20
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+
+
+def make_full_buffer(args) -> ReplayBuffer:
+    image_keys = [f"{OBS_IMAGES}.camera_{i}" for i in range(args.num_cameras)]
+    buffer = ReplayBuffer(
+        capacity=args.capacity,
+        device=args.device,
+        state_keys=[*image_keys, OBS_STATE],
+        storage_device="cpu",
+        optimize_memory=True,
+        store_images_as_uint8=True,
+    )
+    state = {key: torch.zeros(3, args.image_size, args.image_size) for key in image_keys}
+    state[OBS_STATE] = torch.zeros(args.state_dim)
+    buffer.add(state, torch.zeros(args.action_dim), 0.0, None, False, False)
+
+    for key in image_keys:
+        buffer.states[key].random_(0, 256)
+    buffer.states[OBS_STATE].normal_()
+    buffer.actions.normal_()
+    buffer.size = args.capacity
+    buffer.position = args.capacity - 1
+    return buffer
+
+
+def synchronize(device: str) -> None:
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def run(async_prefetch: bool, args) -> tuple[np.ndarray, float]:
+    buffer = make_full_buffer(args)
+    iterator = buffer.get_iterator(batch_size=args.batch_size, async_prefetch=async_prefetch, queue_size=2)
+    weights = torch.randn(1024, 1024, device=args.device)
+
+    waits = []
+    start = time.perf_counter()
+    for step in range(args.warmup_steps + args.num_steps):
+        if step == args.warmup_steps:
+            synchronize(args.device)
+            start = time.perf_counter()
+        batch = next(iterator)
+        if step >= args.warmup_steps:
+            waits.append(buffer.last_batch_wait_s)
+
+        # Stand-in for an optimization step using the batch
+        compute_start = time.perf_counter()
+        x = batch["state"][OBS_STATE].sum() + weights
+        while time.perf_counter() - compute_start < args.compute_ms / 1e3:
+            x = torch.tanh(x @ weights)
+            synchronize(args.device)
+    synchronize(args.device)
+    steps_per_s = args.num_steps / (time.perf_counter() - start)
+    del iterator
+    return np.array(waits), steps_per_s
+
+
+def main(args):
+    print(
+        f"Batches of {args.batch_size} transitions with {args.num_cameras} uint8 cameras of "
+        f"3x{args.image_size}x{args.image_size} sampled to {args.device}, {args.compute_ms} ms of compute per step"
+    )
+    for name, async_prefetch in [("no prefetch", False), ("prefetch   ", True)]:
+        waits, steps_per_s = run(async_prefetch, args)
+        print(
+            f"{name}: wait per batch mean {waits.mean() * 1e3:7.2f} ms, "
+            f"p99 {np.percentile(waits, 99) * 1e3:7.2f} ms, {steps_per_s:6.1f} steps/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--capacity", type=int, default=10_000, help="Number of transitions in the buffer.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Number of transitions per batch.")
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of image observations.")
+    parser.add_argument("--image-size", type=int, default=128, help="Height and width of the images.")
+    parser.add_argument("--state-dim", type=int, default=32, help="Dimension of the states.")
+    parser.add_argument("--action-dim", type=int, default=7, help="Dimension of the actions.")
+    parser.add_argument("--compute-ms", type=float, default=20, help="Duration of the simulated step.")
+    parser.add_argument("--num-steps", type=int, default=100, help="Number of measured steps.")
+    parser.add_argument("--warmup-steps", type=int, default=5, help="Number of steps before measuring.")
+    parser.add_argument("--device", default="cpu", help="Sampling and compute device.")
+    main(parser.parse_args())
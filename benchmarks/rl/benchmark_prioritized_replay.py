@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the sampling throughput of `ReplayBuffer` with uniform and prioritized sampling.
+
+A full buffer of low-dimensional transitions is sampled in batches, as done by the learner. In prioritized mode,
+the priorities of each sampled batch are then updated from random TD errors. The storage and the priorities are
+filled directly, since adding a million transitions one by one would take much longer than the benchmark.
+
+Example:
+
+```bash
+python benchmarks/rl/benchmark_prioritized_replay.py --capacity 1000000 --batch-size 256
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+
+def make_full_buffer(prioritized: bool, args) -> ReplayBuffer:
+    buffer = ReplayBuffer(
+        capacity=args.capacity,
+        device=args.device,
+        state_keys=[OBS_STATE],
+        use_drq=False,
+        storage_device=args.device,
+        optimize_memory=True,
+        prioritized=prioritized,
+    )
+    state = {OBS_STATE: torch.zeros(args.state_dim)}
+    buffer.add(state, torch.zeros(args.action_dim), 0.0, None, False, False)
+
+    buffer.states[OBS_STATE].copy_(torch.randn(args.capacity, args.state_dim))
+    buffer.actions.copy_(torch.randn(args.capacity, args.action_dim))
+    buffer.rewards.copy_(torch.randn(args.capacity))
+    buffer.dones.zero_()
+    buffer.truncateds.zero_()
+    buffer.size = args.capacity
+    buffer.position = args.capacity - 1
+    if prioritized:
+        priorities = np.random.default_rng(0).exponential(size=args.capacity) ** buffer.priority_alpha
+        priorities[buffer.position] = 0.0
+        buffer.sum_tree.update(np.arange(args.capacity), priorities)
+    return buffer
+
+
+def run(prioritized: bool, args) -> tuple[np.ndarray, np.ndarray]:
+    buffer = make_full_buffer(prioritized, args)
+    sample_times, update_times = [], []
+    for step in range(args.warmup_steps + args.num_steps):
+        start = time.perf_counter()
+        batch = buffer.sample(args.batch_size)
+        sample_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if prioritized:
+            buffer.update_priorities(batch["indices"], torch.randn(args.batch_size))
+        update_time = time.perf_counter() - start
+
+        if step >= args.warmup_steps:
+            sample_times.append(sample_time)
+            update_times.append(update_time)
+    assert batch[ACTION].shape == (args.batch_size, args.action_dim)
+    return np.array(sample_times), np.array(update_times)
+
+
+def main(args):
+    print(
+        f"Capacity {args.capacity}, batches of {args.batch_size} transitions "
+        f"(state {args.state_dim}, action {args.action_dim}) on {args.device}"
+    )
+    for name, prioritized in [("uniform    ", False), ("prioritized", True)]:
+        sample_times, update_times = run(prioritized, args)
+        print(
+            f"{name}: sample {sample_times.mean() * 1e3:7.3f} ms "
+            f"(p99 {np.percentile(sample_times, 99) * 1e3:7.3f} ms, "
+            f"{args.batch_size / sample_times.mean():10.0f} transitions/s), "
+            f"update priorities {update_times.mean() * 1e3:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--capacity", type=int, default=1_000_000, help="Number of transitions in the buffer."
+    )
+    parser.add_argument("--batch-size", type=int, default=256, help="Number of transitions per batch.")
+    parser.add_argument("--state-dim", type=int, default=32, help="Dimension of the states.")
+    parser.add_argument("--action-dim", type=int, default=7, help="Dimension of the actions.")
+    parser.add_argument("--num-steps", type=int, default=1000, help="Number of measured batches.")
+    parser.add_argument("--warmup-steps", type=int, default=20, help="Number of batches before measuring.")
+    parser.add_argument("--device", default="cpu", help="Storage and sampling device.")
+    main(parser.parse_args())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare per-sample video decoding against keyframe-aligned batched decoding.
+
+A synthetic video is encoded in a temporary directory to mimic a v3.0 chunk file shared by many episodes.
+Batches of samples, each requesting a window of consecutive frames at a random position, are then decoded
+either sample by sample with `decode_video_frames` (what `LeRobotDataset.__getitem__` does) or all at once
+with `decode_video_frames_batch` (what `LeRobotDataset.__getitems__` does).
+
+Example:
+
+```bash
+python benchmarks/video/benchmark_batched_decoding.py --backend pyav --batch-size 64 --window 4 --g 10
+```
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import PIL.Image
+
+from benchmarks.video.benchmark import TimeBenchmark
+from lerobot.datasets.video_utils import (
+    decode_video_frames,
+    decode_video_frames_batch,
+    encode_video_frames,
+    get_safe_default_codec,
+)
+
+
+def create_synthetic_video(video_path: Path, num_frames: int, fps: int, width: int, height: int, g: int):
+    imgs_dir = video_path.parent / "images"
+    imgs_dir.mkdir(parents=True)
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None, None]
+    for frame_index in range(num_frames):
+        img = (x + y + 3 * frame_index + np.array([0, 85, 170])) % 256
+        PIL.Image.fromarray(img.astype(np.uint8)).save(imgs_dir / f"frame-{frame_index:06d}.png")
+    encode_video_frames(imgs_dir, video_path, fps, vcodec="h264", g=g)
+
+
+def sample_batches(rng, num_batches, batch_size, window, num_frames, fps) -> list[list[list[float]]]:
+    starts = rng.integers(0, num_frames - window, size=(num_batches, batch_size))
+    return [[[float(start + i) / fps for i in range(window)] for start in batch] for batch in starts]
+
+
+def main(args):
+    backend = args.backend if args.backend is not None else get_safe_default_codec()
+    rng = np.random.default_rng(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        video_path = Path(tmp_dir) / "video" / "file-000.mp4"
+        create_synthetic_video(video_path, args.num_frames, args.fps, args.width, args.height, args.g)
+        batches = sample_batches(
+            rng, args.num_batches, args.batch_size, args.window, args.num_frames, args.fps
+        )
+        num_decoded = args.num_batches * args.batch_size * args.window
+
+        per_sample = TimeBenchmark()
+        with per_sample:
+            for batch in batches:
+                for timestamps in batch:
+                    decode_video_frames(video_path, timestamps, args.tolerance_s, backend)
+
+        batched = TimeBenchmark()
+        with batched:
+            for batch in batches:
+                flat_timestamps = [ts for timestamps in batch for ts in timestamps]
+                decode_video_frames_batch(video_path, flat_timestamps, args.tolerance_s, backend)
+
+    per_sample_fps = num_decoded / per_sample.result
+    batched_fps = num_decoded / batched.result
+    print(f"{backend=} frames={args.num_frames} g={args.g} batch_size={args.batch_size} window={args.window}")
+    print(f"per-sample decoding: {per_sample_fps:10.1f} frames/s")
+    print(f"batched decoding:    {batched_fps:10.1f} frames/s ({batched_fps / per_sample_fps:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--backend", type=str, default=None, help="'torchcodec', 'pyav' or 'video_reader'.")
+    parser.add_argument("--num-frames", type=int, default=1800, help="Number of frames in the video.")
+    parser.add_argument("--fps", type=int, default=30, help="Frame rate of the video.")
+    parser.add_argument("--width", type=int, default=320, help="Frame width.")
+    parser.add_argument("--height", type=int, default=240, help="Frame height.")
+    parser.add_argument("--g", type=int, default=10, help="Key frame interval used for encoding.")
+    parser.add_argument("--num-batches", type=int, default=10, help="Number of batches to decode.")
+    parser.add_argument("--batch-size", type=int, default=64, help="Number of samples per batch.")
+    parser.add_argument("--window", type=int, default=2, help="Number of consecutive frames per sample.")
+    parser.add_argument("--tolerance-s", type=float, default=1e-4, help="Timestamp tolerance in seconds.")
+    parser.add_argument("--seed", type=int, default=1337, help="Seed for the sampled timestamps.")
+    main(parser.parse_args())
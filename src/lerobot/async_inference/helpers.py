@@ -19,6 +19,7 @@ import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import torch
 
 from lerobot.configs.types import PolicyFeature
@@ -128,7 +129,8 @@ def extract_images_from_raw_observation(
     camera_key: str,
 ) -> dict[str, torch.Tensor]:
     """Extract the images from a raw observation."""
-    return torch.tensor(lerobot_obs[camera_key])
+    # Array-like images (e.g. compressed camera frames) are converted to arrays first
+    return torch.tensor(np.asarray(lerobot_obs[camera_key]))
 
 
 def make_lerobot_observation(
@@ -161,7 +163,7 @@ def prepare_raw_observation(
     # Turns the image features to (C, H, W) with H, W matching the policy image features.
     # This reduces the resolution of the images
     image_dict = {
-        key: resize_robot_observation_image(torch.tensor(lerobot_obs[key]), policy_image_features[key].shape)
+        key: resize_robot_observation_image(image_dict[key], policy_image_features[key].shape)
         for key in image_keys
     }
 
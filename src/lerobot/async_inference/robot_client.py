@@ -62,6 +62,7 @@ from lerobot.transport import (
     services_pb2_grpc,  # type: ignore
 )
 from lerobot.transport.utils import grpc_channel_options, send_bytes_in_chunks
+from lerobot.utils.robot_utils import RateScheduler
 
 from .configs import RobotClientConfig
 from .constants import SUPPORTED_ROBOTS
@@ -448,6 +449,8 @@ class RobotClient:
         _performed_action = None
         _captured_observation = None
 
+        scheduler = RateScheduler(1 / self.config.environment_dt)
+        scheduler.start()
         while self.running:
             control_loop_start = time.perf_counter()
             """Control loop: (1) Performing actions, when available"""
@@ -459,9 +462,10 @@ class RobotClient:
                 _captured_observation = self.control_loop_observation(task, verbose)
 
             self.logger.debug(f"Control loop (ms): {(time.perf_counter() - control_loop_start) * 1000:.2f}")
-            # Dynamically adjust sleep time to maintain the desired control frequency
-            time.sleep(max(0, self.config.environment_dt - (time.perf_counter() - control_loop_start)))
+            # Wait until the next control period, with absolute deadlines to maintain the desired control frequency
+            scheduler.wait()
 
+        self.logger.info(f"Control loop jitter: {scheduler.jitter_stats()}")
         return _captured_observation, _performed_action
 
 
@@ -15,6 +15,8 @@
 # limitations under the License.
 
 import abc
+import time
+from dataclasses import dataclass
 from typing import Any
 
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
@@ -22,6 +24,22 @@ from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for num
 from .configs import CameraConfig, ColorMode
 
 
+@dataclass(frozen=True)
+class TimestampedFrame:
+    """A frame read by a camera, along with its capture time and sequence number.
+
+    Attributes:
+        frame (np.ndarray): The captured frame.
+        timestamp (float): Monotonic time (`time.perf_counter()`) at which the frame was read from the camera.
+        sequence (int): Number of the frame among the frames read from the camera, which increases by 1 for each
+            frame, so that gaps reveal frames that were never consumed.
+    """
+
+    frame: NDArray[Any]
+    timestamp: float
+    sequence: int
+
+
 class Camera(abc.ABC):
     """Base class for camera implementations.
 
@@ -114,6 +132,25 @@ class Camera(abc.ABC):
         """
         pass
 
+    def async_read_timestamped(self, timeout_ms: float = 200, after_sequence: int = -1) -> TimestampedFrame:
+        """Asynchronously capture a frame, along with its capture time and sequence number.
+
+        Cameras reading frames in a background thread override this method to return the latest frame with its
+        actual capture time. By default, a new frame is read with `async_read` and timestamped on return.
+
+        Args:
+            timeout_ms: Maximum time to wait for a frame in milliseconds.
+            after_sequence: The returned frame is newer than the frame with this sequence number, e.g. the last
+                frame returned.
+
+        Returns:
+            TimestampedFrame: Captured frame with its capture time and sequence number.
+        """
+        frame = self.async_read(timeout_ms=timeout_ms)
+        sequence = max(getattr(self, "_async_read_sequence", -1), after_sequence) + 1
+        self._async_read_sequence = sequence
+        return TimestampedFrame(frame, time.perf_counter(), sequence)
+
     @abc.abstractmethod
     def disconnect(self) -> None:
         """Disconnect from the camera and release resources."""
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the CameraGroup class for reading synchronized frames from several cameras.
+"""
+
+import logging
+import time
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from .camera import Camera, TimestampedFrame
+
+# Frame rate assumed for cameras whose frame rate is unknown, e.g. before they are connected
+DEFAULT_CAMERA_FPS = 30
+
+logger = logging.getLogger(__name__)
+
+
+class CameraGroup:
+    """
+    Reads coherent snapshots of the frames of several cameras.
+
+    Each camera captures frames in its own background thread, at its own pace. A snapshot is made of a new frame
+    of each camera, such that all the frames were captured within `tolerance_ms` of each other: the cameras whose
+    frame is too old compared to the newest one are read again, until the frames are aligned or the timeout
+    expires. The default tolerance, half the period of the slowest camera, can always be met by free-running
+    cameras.
+
+    The group keeps track of:
+    - the frames captured by the cameras but never returned in a snapshot (dropped frames),
+    - the frames older than `max_age_ms` when returned (stale frames),
+    - the snapshots returned without being aligned within the tolerance (misaligned snapshots).
+
+    Example:
+        ```python
+        group = CameraGroup({"front": front_camera, "wrist": wrist_camera})
+        frames = group.async_read()  # {"front": np.ndarray, "wrist": np.ndarray}
+        snapshot = group.async_read_timestamped()  # {"front": TimestampedFrame, "wrist": TimestampedFrame}
+        print(group.get_stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        cameras: dict[str, Camera],
+        tolerance_ms: float | None = None,
+        max_age_ms: float | None = None,
+    ):
+        """
+        Args:
+            cameras: Cameras of the group, by key.
+            tolerance_ms: Maximum time between the capture of the frames of a snapshot, in milliseconds.
+                Defaults to half the period of the slowest camera.
+            max_age_ms: Age of a frame above which it is counted as stale when returned, in milliseconds.
+                Defaults to twice the period of the slowest camera.
+        """
+        self.cameras = cameras
+        self.tolerance_ms = tolerance_ms
+        self.max_age_ms = max_age_ms
+
+        self.last_sequences: dict[str, int] = {}
+        self.num_snapshots = 0
+        self.num_misaligned = 0
+        self.num_dropped: dict[str, int] = dict.fromkeys(cameras, 0)
+        self.num_stale: dict[str, int] = dict.fromkeys(cameras, 0)
+        self.last_spread_ms = 0.0
+        self.last_ages_ms: dict[str, float] = dict.fromkeys(cameras, 0.0)
+
+    def __len__(self) -> int:
+        return len(self.cameras)
+
+    def _slowest_period_ms(self) -> float:
+        return max(1e3 / (camera.fps or DEFAULT_CAMERA_FPS) for camera in self.cameras.values())
+
+    def async_read_timestamped(self, timeout_ms: float = 200) -> dict[str, TimestampedFrame]:
+        """
+        Reads a snapshot of new frames of all the cameras, captured within the tolerance of each other.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for the frames, and then to align them. When
+                the frames can't be aligned in time, the latest frames are returned and the snapshot is counted
+                as misaligned. Defaults to 200ms (0.2 seconds).
+
+        Returns:
+            dict[str, TimestampedFrame]: The frame of each camera, with its capture time and sequence number.
+
+        Raises:
+            TimeoutError: If a camera doesn't provide a new frame within the timeout.
+        """
+        if not self.cameras:
+            return {}
+
+        tolerance_s = (self.tolerance_ms or self._slowest_period_ms() / 2) / 1e3
+        deadline = time.perf_counter() + timeout_ms / 1e3
+
+        frames = {
+            key: camera.async_read_timestamped(
+                max(deadline - time.perf_counter(), 0.0) * 1e3, self.last_sequences.get(key, -1)
+            )
+            for key, camera in self.cameras.items()
+        }
+
+        while True:
+            newest = max(frame.timestamp for frame in frames.values())
+            lagging = [key for key, frame in frames.items() if newest - frame.timestamp > tolerance_s]
+            remaining_ms = (deadline - time.perf_counter()) * 1e3
+            if not lagging:
+                break
+            if remaining_ms <= 0:
+                self.num_misaligned += 1
+                logger.debug(f"Frames of {lagging} are not aligned with the other cameras.")
+                break
+            for key in lagging:
+                try:
+                    frames[key] = self.cameras[key].async_read_timestamped(remaining_ms, frames[key].sequence)
+                except TimeoutError:
+                    # Keep the latest frame, the snapshot is counted as misaligned
+                    deadline = time.perf_counter()
+                    break
+
+        self._update_stats(frames)
+        return frames
+
+    def async_read(self, timeout_ms: float = 200) -> dict[str, NDArray[Any]]:
+        """Reads a snapshot of new frames of all the cameras, see `async_read_timestamped`."""
+        return {key: frame.frame for key, frame in self.async_read_timestamped(timeout_ms).items()}
+
+    def _update_stats(self, frames: dict[str, TimestampedFrame]) -> None:
+        now = time.perf_counter()
+        max_age_s = (self.max_age_ms or 2 * self._slowest_period_ms()) / 1e3
+        timestamps = [frame.timestamp for frame in frames.values()]
+        self.last_spread_ms = (max(timestamps) - min(timestamps)) * 1e3
+        self.num_snapshots += 1
+
+        for key, frame in frames.items():
+            if key in self.last_sequences:
+                self.num_dropped[key] += max(frame.sequence - self.last_sequences[key] - 1, 0)
+            self.last_sequences[key] = frame.sequence
+
+            age_s = now - frame.timestamp
+            self.last_ages_ms[key] = age_s * 1e3
+            if age_s > max_age_s:
+                self.num_stale[key] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Synchronization metrics of the group since it was created:
+        - `num_snapshots`: number of snapshots returned.
+        - `num_misaligned`: number of snapshots whose frames couldn't be aligned within the tolerance.
+        - `last_spread_ms`: time between the capture of the oldest and newest frames of the last snapshot.
+        - `num_dropped`, `num_stale`, `last_age_ms`: per camera, number of frames never returned, number of
+          frames older than `max_age_ms` when returned, and age of the last frame returned.
+        """
+        return {
+            "num_snapshots": self.num_snapshots,
+            "num_misaligned": self.num_misaligned,
+            "last_spread_ms": self.last_spread_ms,
+            "num_dropped": dict(self.num_dropped),
+            "num_stale": dict(self.num_stale),
+            "last_age_ms": dict(self.last_ages_ms),
+        }
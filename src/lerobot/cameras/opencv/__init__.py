@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .camera_opencv import OpenCVCamera
+from .camera_opencv import JpegFrame, OpenCVCamera
 from .configuration_opencv import OpenCVCameraConfig
 
-__all__ = ["OpenCVCamera", "OpenCVCameraConfig"]
+__all__ = ["JpegFrame", "OpenCVCamera", "OpenCVCameraConfig"]
@@ -22,9 +22,10 @@ import os
 import platform
 import time
 from pathlib import Path
-from threading import Event, Lock, Thread
+from threading import Condition, Event, Lock, Thread
 from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
 
 # Fix MSMF hardware transform compatibility for Windows before importing cv2
@@ -34,8 +35,8 @@ import cv2  # type: ignore  # TODO: add type stubs for OpenCV
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
-from ..camera import Camera
-from ..utils import get_cv2_backend, get_cv2_rotation
+from ..camera import Camera, TimestampedFrame
+from ..utils import FrameRingBuffer, get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
 # NOTE(Steven): The maximum opencv device index depends on your operating system. For instance,
@@ -48,6 +49,77 @@ MAX_OPENCV_INDEX = 60
 logger = logging.getLogger(__name__)
 
 
+class JpegFrame:
+    """
+    A frame captured as a JPEG image by an `OpenCVCamera` in MJPEG passthrough mode, decoded lazily.
+
+    The compressed image is kept as is, so that it can be stored or sent cheaply (e.g. pickled, or forwarded
+    by `lekiwi_host`), and is only decoded when converted to an array with `np.asarray(frame)` or `decode()`.
+    The decoded frame is in the color mode and rotation of the camera, like the frames of `OpenCVCamera.read`,
+    and is cached (read-only) so that several consumers decode it once.
+
+    Attributes:
+        data (np.ndarray): The JPEG image, as a 1D uint8 array.
+        shape (tuple[int, int, int]): The shape of the decoded frame (height, width, channels).
+        color_mode (ColorMode): The color mode of the decoded frame.
+        rotation (int | None): The OpenCV rotation applied to the decoded frame.
+    """
+
+    dtype = np.dtype(np.uint8)
+    ndim = 3
+
+    def __init__(
+        self,
+        data: NDArray[Any],
+        height: int,
+        width: int,
+        color_mode: ColorMode = ColorMode.RGB,
+        rotation: int | None = None,
+    ):
+        self.data = data.reshape(-1)
+        self.shape = (height, width, 3)
+        self.color_mode = color_mode
+        self.rotation = rotation
+        self._decoded: NDArray[Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self.shape}, {self.data.size} bytes)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Only the compressed image is pickled
+        return {**self.__dict__, "_decoded": None}
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> NDArray[Any]:
+        image = self.decode()
+        if dtype is not None and np.dtype(dtype) != image.dtype:
+            return image.astype(dtype)
+        return image.copy() if copy else image
+
+    def decode(self) -> NDArray[Any]:
+        """
+        Decodes the JPEG image, then converts and rotates it like `OpenCVCamera.read`.
+
+        Returns:
+            np.ndarray: The decoded frame, read-only.
+
+        Raises:
+            RuntimeError: If the image can't be decoded or its dimensions don't match `shape`.
+        """
+        if self._decoded is None:
+            image = cv2.imdecode(self.data, cv2.IMREAD_COLOR)
+            if image is None:
+                raise RuntimeError(f"Failed to decode {self}.")
+            if self.color_mode == ColorMode.RGB:
+                cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+            if self.rotation is not None:
+                image = cv2.rotate(image, self.rotation)
+            if image.shape != self.shape:
+                raise RuntimeError(f"Decoded frame of shape {image.shape} does not match {self}.")
+            image.flags.writeable = False
+            self._decoded = image
+        return self._decoded
+
+
 class OpenCVCamera(Camera):
     """
     Manages camera interactions using OpenCV for efficient frame recording.
@@ -116,14 +188,20 @@ class OpenCVCamera(Camera):
         self.fps = config.fps
         self.color_mode = config.color_mode
         self.warmup_s = config.warmup_s
+        self.mjpeg_passthrough = config.mjpeg_passthrough
 
         self.videocapture: cv2.VideoCapture | None = None
 
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
+        self.frame_condition: Condition = Condition(self.frame_lock)
         self.latest_frame: NDArray[Any] | None = None
+        self.latest_timestamp: float | None = None
+        self.latest_sequence: int = -1
         self.new_frame_event: Event = Event()
+        self.frame_buffers: FrameRingBuffer | None = None
+        self.capture_buffer: NDArray[Any] | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -225,6 +303,25 @@ class OpenCVCamera(Camera):
         else:
             self._validate_fps()
 
+        if self.mjpeg_passthrough:
+            self._configure_mjpeg_passthrough()
+
+    def _configure_mjpeg_passthrough(self) -> None:
+        """Configures the capture to return the JPEG images of the camera without decoding them."""
+
+        if self.videocapture is None:
+            raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
+
+        if self.videocapture.getBackendName() == "FFMPEG":
+            # E.g. video files, for which the encoded packets are returned instead of the decoded frames
+            success = self.videocapture.set(cv2.CAP_PROP_FORMAT, -1)
+        else:
+            success = self.videocapture.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+
+        if not success:
+            logger.warning(f"{self} failed to enable MJPEG passthrough. Continuing with decoded frames.")
+            self.mjpeg_passthrough = False
+
     def _validate_fps(self) -> None:
         """Validates and sets the camera's frames per second (FPS)."""
 
@@ -339,7 +436,7 @@ class OpenCVCamera(Camera):
 
         return found_cameras_info
 
-    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
+    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any] | JpegFrame:
         """
         Reads a single frame synchronously from the camera.
 
@@ -354,7 +451,8 @@ class OpenCVCamera(Camera):
         Returns:
             np.ndarray: The captured frame as a NumPy array in the format
                        (height, width, channels), using the specified or default
-                       color mode and applying any configured rotation.
+                       color mode and applying any configured rotation. In MJPEG
+                       passthrough mode, a `JpegFrame` decoded to such an array on demand.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
@@ -375,7 +473,10 @@ class OpenCVCamera(Camera):
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
 
-        processed_frame = self._postprocess_image(frame, color_mode)
+        if self.mjpeg_passthrough:
+            processed_frame = self._to_jpeg_frame(frame, color_mode)
+        else:
+            processed_frame = self._postprocess_image(frame, color_mode)
 
         read_duration_ms = (time.perf_counter() - start_time) * 1e3
         logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
@@ -425,14 +526,103 @@ class OpenCVCamera(Camera):
 
         return processed_image
 
+    def _to_jpeg_frame(
+        self, frame: NDArray[Any], color_mode: ColorMode | None = None
+    ) -> NDArray[Any] | JpegFrame:
+        """
+        Wraps a raw frame captured in MJPEG passthrough mode in a `JpegFrame`.
+
+        Raises:
+            ValueError: If the requested `color_mode` is invalid.
+            RuntimeError: If the raw frame is not a JPEG image.
+        """
+        if frame.ndim == 3:
+            # The backend decoded the frame anyway
+            return self._postprocess_image(frame, color_mode)
+
+        requested_color_mode = self.color_mode if color_mode is None else color_mode
+        if requested_color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"Invalid color mode '{requested_color_mode}'. Expected {ColorMode.RGB} or {ColorMode.BGR}."
+            )
+
+        data = frame.reshape(-1)
+        # JPEG images start with the SOI marker
+        if data.size < 2 or data[0] != 0xFF or data[1] != 0xD8:
+            raise RuntimeError(f"{self} frame of shape {frame.shape} is not a JPEG image.")
+
+        return JpegFrame(data, self.height, self.width, requested_color_mode, self.rotation)
+
+    def _read_into_frame_buffers(self) -> NDArray[Any] | JpegFrame:
+        """
+        Reads a single frame like `read`, but decodes and post-processes it into preallocated buffers.
+
+        The frame is decoded into `capture_buffer` (or directly into the next buffer of `frame_buffers` when it
+        needs no post-processing), then converted and rotated into the next buffer of `frame_buffers` using the
+        output arguments of OpenCV, so that no array is allocated per frame.
+
+        In MJPEG passthrough mode, the JPEG image is returned as a `JpegFrame` without being decoded.
+
+        Returns:
+            np.ndarray: A read-only view of the frame buffer, in the default color mode.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            RuntimeError: If reading the frame from the camera fails or if the
+                          received frame dimensions don't match expectations before rotation.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.videocapture is None:
+            raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
+
+        if self.mjpeg_passthrough:
+            ret, frame = self.videocapture.read()
+            if not ret or frame is None:
+                raise RuntimeError(f"{self} read failed (status={ret}).")
+            return self._to_jpeg_frame(frame)
+
+        frame_shape = (self.height, self.width, 3)
+        if self.frame_buffers is None or self.frame_buffers.shape != frame_shape:
+            self.frame_buffers = FrameRingBuffer(frame_shape)
+        buffer = self.frame_buffers.next_buffer()
+
+        rotate = self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]
+        convert = self.color_mode == ColorMode.RGB
+        if rotate or convert:
+            capture_shape = (self.capture_height, self.capture_width, 3)
+            if self.capture_buffer is None or self.capture_buffer.shape != capture_shape:
+                self.capture_buffer = np.empty(capture_shape, dtype=np.uint8)
+            capture = self.capture_buffer
+        else:
+            capture = buffer
+
+        ret, frame = self.videocapture.read(capture)
+
+        if not ret or frame is None:
+            raise RuntimeError(f"{self} read failed (status={ret}).")
+
+        if frame is not capture:
+            # The backend allocated its own frame instead, e.g. because its dimensions are unexpected
+            buffer = self._postprocess_image(frame)
+        elif rotate:
+            cv2.rotate(capture, self.rotation, dst=buffer)
+            if convert:
+                cv2.cvtColor(buffer, cv2.COLOR_BGR2RGB, dst=buffer)
+        elif convert:
+            cv2.cvtColor(capture, cv2.COLOR_BGR2RGB, dst=buffer)
+
+        return self.frame_buffers.read_only(buffer)
+
     def _read_loop(self) -> None:
         """
         Internal loop run by the background thread for asynchronous reading.
 
         On each iteration:
-        1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        1. Reads a color frame into a preallocated buffer, handed out as a read-only view
+        2. Stores result in latest_frame (thread-safe), along with its capture time and sequence number
+        3. Sets new_frame_event and notifies frame_condition to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
@@ -441,10 +631,14 @@ class OpenCVCamera(Camera):
 
         while not self.stop_event.is_set():
             try:
-                color_image = self.read()
+                color_image = self._read_into_frame_buffers()
+                capture_timestamp = time.perf_counter()
 
-                with self.frame_lock:
+                with self.frame_condition:
                     self.latest_frame = color_image
+                    self.latest_timestamp = capture_timestamp
+                    self.latest_sequence += 1
+                    self.frame_condition.notify_all()
                 self.new_frame_event.set()
 
             except DeviceNotConnectedError:
@@ -475,7 +669,7 @@ class OpenCVCamera(Camera):
         self.thread = None
         self.stop_event = None
 
-    def async_read(self, timeout_ms: float = 200) -> NDArray[Any]:
+    def async_read(self, timeout_ms: float = 200) -> NDArray[Any] | JpegFrame:
         """
         Reads the latest available frame asynchronously.
 
@@ -490,6 +684,9 @@ class OpenCVCamera(Camera):
         Returns:
             np.ndarray: The latest captured frame as a NumPy array in the format
                        (height, width, channels), processed according to configuration.
+                       The array is a read-only view of a buffer reused by the read thread
+                       once it is released, copy it to modify it. In MJPEG passthrough mode,
+                       a `JpegFrame` decoded to such an array on demand.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
@@ -518,6 +715,43 @@ class OpenCVCamera(Camera):
 
         return frame
 
+    def async_read_timestamped(self, timeout_ms: float = 200, after_sequence: int = -1) -> TimestampedFrame:
+        """
+        Reads the latest available frame asynchronously, along with its capture time and sequence number.
+
+        Unlike `async_read`, several consumers can wait for new frames, e.g. a `CameraGroup` and `async_read`,
+        since the latest frame is returned as soon as it is newer than `after_sequence`.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a frame newer than `after_sequence`.
+                Defaults to 200ms (0.2 seconds).
+            after_sequence (int): Sequence number of the last frame already consumed. Defaults to -1, in which
+                case any frame is returned.
+
+        Returns:
+            TimestampedFrame: The latest captured frame, its capture time and sequence number.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no new frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        with self.frame_condition:
+            if not self.frame_condition.wait_for(
+                lambda: self.latest_sequence > after_sequence, timeout=timeout_ms / 1000.0
+            ):
+                thread_alive = self.thread is not None and self.thread.is_alive()
+                raise TimeoutError(
+                    f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
+                    f"Read thread alive: {thread_alive}."
+                )
+            return TimestampedFrame(self.latest_frame, self.latest_timestamp, self.latest_sequence)
+
     def disconnect(self) -> None:
         """
         Disconnects from the camera and cleans up resources.
@@ -38,6 +38,7 @@ class OpenCVCameraConfig(CameraConfig):
     # Advanced configurations with FOURCC format
     OpenCVCameraConfig(128422271347, 30, 640, 480, rotation=Cv2Rotation.ROTATE_90, fourcc="MJPG")     # With 90° rotation and MJPG format
     OpenCVCameraConfig(0, 30, 1280, 720, fourcc="YUYV")     # With YUYV format
+    OpenCVCameraConfig(0, 30, 1280, 720, mjpeg_passthrough=True)     # JPEG frames decoded only when needed
     ```
 
     Attributes:
@@ -50,6 +51,9 @@ class OpenCVCameraConfig(CameraConfig):
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
         fourcc: FOURCC code for video format (e.g., "MJPG", "YUYV", "I420"). Defaults to None (auto-detect).
+        mjpeg_passthrough: Whether to capture the JPEG images compressed by the camera without decoding them.
+            Frames are then returned as `JpegFrame`, decoded only when converted to an array (e.g. for the
+            policy, or when writing the dataset). Requires the "MJPG" FOURCC. Defaults to False.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -62,6 +66,7 @@ class OpenCVCameraConfig(CameraConfig):
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
     fourcc: str | None = None
+    mjpeg_passthrough: bool = False
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -83,3 +88,11 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`fourcc` must be a 4-character string (e.g., 'MJPG', 'YUYV'), but '{self.fourcc}' is provided."
             )
+
+        if self.mjpeg_passthrough:
+            if self.fourcc is None:
+                self.fourcc = "MJPG"
+            elif self.fourcc != "MJPG":
+                raise ValueError(
+                    f"`mjpeg_passthrough` requires the 'MJPG' `fourcc`, but '{self.fourcc}' is provided."
+                )
@@ -18,7 +18,7 @@ Provides the RealSenseCamera class for capturing frames from Intel RealSense cam
 
 import logging
 import time
-from threading import Event, Lock, Thread
+from threading import Condition, Event, Lock, Thread
 from typing import Any
 
 import cv2  # type: ignore  # TODO: add type stubs for OpenCV
@@ -32,7 +32,7 @@ except Exception as e:
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
-from ..camera import Camera
+from ..camera import Camera, TimestampedFrame
 from ..configs import ColorMode
 from ..utils import get_cv2_rotation
 from .configuration_realsense import RealSenseCameraConfig
@@ -133,7 +133,10 @@ class RealSenseCamera(Camera):
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
+        self.frame_condition: Condition = Condition(self.frame_lock)
         self.latest_frame: NDArray[Any] | None = None
+        self.latest_timestamp: float | None = None
+        self.latest_sequence: int = -1
         self.new_frame_event: Event = Event()
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
@@ -454,8 +457,8 @@ class RealSenseCamera(Camera):
 
         On each iteration:
         1. Reads a color frame with 500ms timeout
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        2. Stores result in latest_frame (thread-safe), along with its capture time and sequence number
+        3. Sets new_frame_event and notifies frame_condition to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
@@ -465,9 +468,13 @@ class RealSenseCamera(Camera):
         while not self.stop_event.is_set():
             try:
                 color_image = self.read(timeout_ms=500)
+                capture_timestamp = time.perf_counter()
 
-                with self.frame_lock:
+                with self.frame_condition:
                     self.latest_frame = color_image
+                    self.latest_timestamp = capture_timestamp
+                    self.latest_sequence += 1
+                    self.frame_condition.notify_all()
                 self.new_frame_event.set()
 
             except DeviceNotConnectedError:
@@ -542,6 +549,43 @@ class RealSenseCamera(Camera):
 
         return frame
 
+    def async_read_timestamped(self, timeout_ms: float = 200, after_sequence: int = -1) -> TimestampedFrame:
+        """
+        Reads the latest available frame asynchronously, along with its capture time and sequence number.
+
+        Unlike `async_read`, several consumers can wait for new frames, e.g. a `CameraGroup` and `async_read`,
+        since the latest frame is returned as soon as it is newer than `after_sequence`.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a frame newer than `after_sequence`.
+                Defaults to 200ms (0.2 seconds).
+            after_sequence (int): Sequence number of the last frame already consumed. Defaults to -1, in which
+                case any frame is returned.
+
+        Returns:
+            TimestampedFrame: The latest captured frame, its capture time and sequence number.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no new frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        with self.frame_condition:
+            if not self.frame_condition.wait_for(
+                lambda: self.latest_sequence > after_sequence, timeout=timeout_ms / 1000.0
+            ):
+                thread_alive = self.thread is not None and self.thread.is_alive()
+                raise TimeoutError(
+                    f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
+                    f"Read thread alive: {thread_alive}."
+                )
+            return TimestampedFrame(self.latest_frame, self.latest_timestamp, self.latest_sequence)
+
     def disconnect(self) -> None:
         """
         Disconnects from the camera, stops the pipeline, and cleans up resources.
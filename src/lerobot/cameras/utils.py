@@ -14,14 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import platform
-from typing import cast
+import queue
+import threading
+import weakref
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
 
 from lerobot.utils.import_utils import make_device_from_device_class
 
 from .camera import Camera
 from .configs import CameraConfig, Cv2Rotation
 
+# Number of frame buffers preallocated by a `FrameRingBuffer`, and maximum number of buffers it grows to when
+# the frames handed out are held by consumers (e.g. queued to be written to a dataset)
+DEFAULT_NUM_FRAME_BUFFERS = 4
+MAX_NUM_FRAME_BUFFERS = 64
+
+logger = logging.getLogger(__name__)
+
 
 def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[str, Camera]:
     cameras: dict[str, Camera] = {}
@@ -74,3 +88,124 @@ def get_cv2_backend() -> int:
     #     return cv2.CAP_AVFOUNDATION
     else:  # Linux and others
         return int(cv2.CAP_ANY)
+
+
+class _FrameLease:
+    """Exposes a frame buffer through the array interface, so that every view of the frame keeps it alive."""
+
+    def __init__(self, buffer: NDArray[Any]):
+        self.buffer = buffer
+        interface = dict(buffer.__array_interface__)
+        interface["data"] = (interface["data"][0], True)
+        self.__array_interface__ = interface
+
+
+class FrameRingBuffer:
+    """
+    Ring of preallocated frame buffers, so that a camera read thread can decode and post-process frames without
+    allocating a new array for each frame.
+
+    Each buffer is leased explicitly: `next_buffer` leases a free buffer to write a frame into, and `read_only`
+    hands the frame out as a read-only view holding the lease. The lease is released once that view, and every
+    view derived from it, has been garbage collected, so a frame held by a consumer is never overwritten. A
+    buffer returned by `next_buffer` but never handed out is released by the next call to `next_buffer`. When all
+    the buffers are leased, a new buffer is added to the ring, up to `max_num_buffers`, beyond which frames are
+    allocated individually.
+
+    Example:
+        ```python
+        frame_buffers = FrameRingBuffer((480, 640, 3))
+        buffer = frame_buffers.next_buffer()
+        cv2.cvtColor(raw_frame, cv2.COLOR_BGR2RGB, dst=buffer)
+        frame = frame_buffers.read_only(buffer)
+        ```
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype | type = np.uint8,
+        num_buffers: int = DEFAULT_NUM_FRAME_BUFFERS,
+        max_num_buffers: int = MAX_NUM_FRAME_BUFFERS,
+    ):
+        if num_buffers < 1 or max_num_buffers < num_buffers:
+            raise ValueError(
+                f"Expected 1 <= num_buffers <= max_num_buffers, got {num_buffers=} and {max_num_buffers=}."
+            )
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.max_num_buffers = max_num_buffers
+        self.buffers = [np.empty(self.shape, dtype=self.dtype) for _ in range(num_buffers)]
+        self.leased = [False] * num_buffers
+        self.index = 0
+        self.num_allocations = 0
+        # Buffer returned by `next_buffer` that has not been handed out by `read_only` yet
+        self.pending_index: int | None = None
+        # Leases are released by the garbage collector, at any point of any thread, including while this thread
+        # holds `lock`: released buffers are queued without locking and only marked free under the lock
+        self.released_indices: queue.SimpleQueue[int] = queue.SimpleQueue()
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.buffers)
+
+    @property
+    def num_leased(self) -> int:
+        with self.lock:
+            self._free_released_buffers()
+            return sum(self.leased)
+
+    def _release(self, index: int) -> None:
+        self.released_indices.put(index)
+
+    def _free_released_buffers(self) -> None:
+        while True:
+            try:
+                self.leased[self.released_indices.get_nowait()] = False
+            except queue.Empty:
+                return
+
+    def next_buffer(self) -> NDArray[Any]:
+        """Leases the next buffer that is not in use anymore, to write a new frame into."""
+        with self.lock:
+            self._free_released_buffers()
+            if self.pending_index is not None:
+                self.leased[self.pending_index] = False
+                self.pending_index = None
+
+            for _ in range(len(self.buffers)):
+                self.index = (self.index + 1) % len(self.buffers)
+                if not self.leased[self.index]:
+                    self.leased[self.index] = True
+                    self.pending_index = self.index
+                    return self.buffers[self.index]
+
+            buffer = np.empty(self.shape, dtype=self.dtype)
+            self.num_allocations += 1
+            if len(self.buffers) < self.max_num_buffers:
+                self.buffers.append(buffer)
+                self.leased.append(True)
+                self.index = len(self.buffers) - 1
+                self.pending_index = self.index
+                logger.debug(
+                    f"All the frame buffers are in use, growing the ring to {len(self.buffers)} buffers."
+                )
+            return buffer
+
+    def read_only(self, buffer: NDArray[Any]) -> NDArray[Any]:
+        """
+        Returns a read-only view of a buffer returned by `next_buffer`. The buffer stays leased until the view,
+        and every view derived from it, is garbage collected.
+        """
+        with self.lock:
+            index = self.pending_index
+            if index is None or buffer is not self.buffers[index]:
+                # Individually allocated buffer (or foreign array), which is never reused
+                view = buffer.view()
+                view.flags.writeable = False
+                return view
+            self.pending_index = None
+
+        lease = _FrameLease(buffer)
+        weakref.finalize(lease, self._release, index).atexit = False
+        return np.asarray(lease)
@@ -17,7 +17,7 @@
 from dataclasses import dataclass, field
 
 from lerobot.datasets.transforms import ImageTransformsConfig
-from lerobot.datasets.video_utils import get_safe_default_codec
+from lerobot.datasets.video_utils import DEFAULT_VIDEO_DECODER_CACHE_SIZE, get_safe_default_codec
 
 
 @dataclass
@@ -34,6 +34,13 @@ class DatasetConfig:
     revision: str | None = None
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
+    # Max number of video decoders (and open video files) cached per dataloader worker. None means no limit.
+    video_decoder_cache_size: int | None = DEFAULT_VIDEO_DECODER_CACHE_SIZE
+    # Approximate memory budget in MiB of the cached video decoders per dataloader worker. None means no limit.
+    video_decoder_cache_memory_mb: float | None = None
+    # Return camera frames as uint8 and convert them to float on the policy device, which divides by 4 the size
+    # of the frames sent by the dataloader workers and copied to the device.
+    return_uint8_frames: bool = False
     streaming: bool = False
 
 
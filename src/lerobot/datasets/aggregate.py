@@ -15,11 +15,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
 import logging
+import os
 import shutil
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import tqdm
 
 from lerobot.datasets.compute_stats import aggregate_stats
@@ -33,13 +42,16 @@ from lerobot.datasets.utils import (
     DEFAULT_VIDEO_PATH,
     get_file_size_in_mb,
     get_parquet_file_size_in_mb,
-    to_parquet_with_hf_images,
     update_chunk_file_indices,
     write_info,
     write_stats,
     write_tasks,
 )
 from lerobot.datasets.video_utils import concatenate_video_files, get_video_duration_in_s
+from lerobot.utils.constants import HF_LEROBOT_HOME
+
+AGGREGATION_STAGING_SUFFIX = ".aggregation"
+AGGREGATION_CHECKPOINT = "checkpoint.json"
 
 
 def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
@@ -78,94 +90,6 @@ def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
     return fps, robot_type, features
 
 
-def update_data_df(df, src_meta, dst_meta):
-    """Updates a data DataFrame with new indices and task mappings for aggregation.
-
-    Adjusts episode indices, frame indices, and task indices to account for
-    previously aggregated data in the destination dataset.
-
-    Args:
-        df: DataFrame containing the data to be updated.
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-
-    Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices.
-    """
-
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
-    df["index"] = df["index"] + dst_meta.info["total_frames"]
-
-    src_task_names = src_meta.tasks.index.take(df["task_index"].to_numpy())
-    df["task_index"] = dst_meta.tasks.loc[src_task_names, "task_index"].to_numpy()
-
-    return df
-
-
-def update_meta_data(
-    df,
-    dst_meta,
-    meta_idx,
-    data_idx,
-    videos_idx,
-):
-    """Updates metadata DataFrame with new chunk, file, and timestamp indices.
-
-    Adjusts all indices and timestamps to account for previously aggregated
-    data and videos in the destination dataset.
-
-    Args:
-        df: DataFrame containing the metadata to be updated.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary containing current metadata chunk and file indices.
-        data_idx: Dictionary containing current data chunk and file indices.
-        videos_idx: Dictionary containing current video indices and timestamps.
-
-    Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices and timestamps.
-    """
-
-    df["meta/episodes/chunk_index"] = df["meta/episodes/chunk_index"] + meta_idx["chunk"]
-    df["meta/episodes/file_index"] = df["meta/episodes/file_index"] + meta_idx["file"]
-    df["data/chunk_index"] = df["data/chunk_index"] + data_idx["chunk"]
-    df["data/file_index"] = df["data/file_index"] + data_idx["file"]
-    for key, video_idx in videos_idx.items():
-        # Store original video file indices before updating
-        orig_chunk_col = f"videos/{key}/chunk_index"
-        orig_file_col = f"videos/{key}/file_index"
-        df["_orig_chunk"] = df[orig_chunk_col].copy()
-        df["_orig_file"] = df[orig_file_col].copy()
-
-        # Update chunk and file indices to point to destination
-        df[orig_chunk_col] = video_idx["chunk"]
-        df[orig_file_col] = video_idx["file"]
-
-        # Apply per-source-file timestamp offsets
-        src_to_offset = video_idx.get("src_to_offset", {})
-        if src_to_offset:
-            # Apply offset based on original source file
-            for idx in df.index:
-                src_key = (df.at[idx, "_orig_chunk"], df.at[idx, "_orig_file"])
-                offset = src_to_offset.get(src_key, 0)
-                df.at[idx, f"videos/{key}/from_timestamp"] += offset
-                df.at[idx, f"videos/{key}/to_timestamp"] += offset
-        else:
-            # Fallback to simple offset (for backward compatibility)
-            df[f"videos/{key}/from_timestamp"] = (
-                df[f"videos/{key}/from_timestamp"] + video_idx["latest_duration"]
-            )
-            df[f"videos/{key}/to_timestamp"] = df[f"videos/{key}/to_timestamp"] + video_idx["latest_duration"]
-
-        # Clean up temporary columns
-        df = df.drop(columns=["_orig_chunk", "_orig_file"])
-
-    df["dataset_from_index"] = df["dataset_from_index"] + dst_meta.info["total_frames"]
-    df["dataset_to_index"] = df["dataset_to_index"] + dst_meta.info["total_frames"]
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
-
-    return df
-
-
 def aggregate_datasets(
     repo_ids: list[str],
     aggr_repo_id: str,
@@ -174,14 +98,20 @@ def aggregate_datasets(
     data_files_size_in_mb: float | None = None,
     video_files_size_in_mb: float | None = None,
     chunk_size: int | None = None,
-):
+    num_workers: int | None = None,
+    resume: bool = True,
+) -> dict[str, float]:
     """Aggregates multiple LeRobot datasets into a single unified dataset.
 
     This is the main function that orchestrates the aggregation process by:
     1. Loading and validating all source dataset metadata
-    2. Creating a new destination dataset with unified tasks
-    3. Aggregating videos, data, and metadata from all source datasets
-    4. Finalizing the aggregated dataset with proper statistics
+    2. Planning the destination file of every source data and video file
+    3. Writing the destination data and video files in parallel, checkpointing progress
+    4. Writing the metadata and finalizing the aggregated dataset with proper statistics
+
+    Files are written in a staging directory next to `aggr_root`, which is only moved to `aggr_root` once the
+    aggregation is complete. If the aggregation is interrupted, running it again with the same arguments
+    resumes it, skipping the destination files already written.
 
     Args:
         repo_ids: List of repository IDs for the datasets to aggregate.
@@ -191,8 +121,16 @@ def aggregate_datasets(
         data_files_size_in_mb: Maximum size for data files in MB (defaults to DEFAULT_DATA_FILE_SIZE_IN_MB)
         video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
         chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        num_workers: Number of processes writing destination files in parallel (defaults to the number of
+            CPUs). Files are written in the main process if 0 or 1.
+        resume: Whether to resume a previously interrupted aggregation into `aggr_root`.
+
+    Returns:
+        dict: Throughput of the aggregation, with the number of frames and MB written by this run, the elapsed
+            time and the resulting frames/s and MB/s.
     """
     logging.info("Start aggregate_datasets")
+    start_time = time.perf_counter()
 
     if data_files_size_in_mb is None:
         data_files_size_in_mb = DEFAULT_DATA_FILE_SIZE_IN_MB
@@ -200,6 +138,10 @@ def aggregate_datasets(
         video_files_size_in_mb = DEFAULT_VIDEO_FILE_SIZE_IN_MB
     if chunk_size is None:
         chunk_size = DEFAULT_CHUNK_SIZE
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    aggr_root = Path(aggr_root) if aggr_root is not None else HF_LEROBOT_HOME / aggr_repo_id
+    staging_dir = aggr_root.parent / f".{aggr_root.name}{AGGREGATION_STAGING_SUFFIX}"
 
     all_metadata = (
         [LeRobotDatasetMetadata(repo_id) for repo_id in repo_ids]
@@ -211,6 +153,69 @@ def aggregate_datasets(
     fps, robot_type, features = validate_all_metadata(all_metadata)
     video_keys = [key for key in features if features[key]["dtype"] == "video"]
 
+    logging.info("Find all tasks")
+    unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
+    tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
+
+    executor = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+    try:
+        logging.info("Plan aggregation")
+        plan = plan_aggregation(
+            all_metadata,
+            video_keys,
+            tasks,
+            data_files_size_in_mb,
+            video_files_size_in_mb,
+            chunk_size,
+            executor,
+        )
+        checkpoint = load_aggregation_checkpoint(staging_dir, plan["fingerprint"], resume)
+        if aggr_root.exists() and not checkpoint["finalizing"]:
+            raise FileExistsError(f"The aggregated dataset root already exists: {aggr_root}")
+        save_aggregation_checkpoint(staging_dir, checkpoint)
+
+        jobs = {dst: (write_data_file, sources) for dst, sources in plan["data_files"].items()}
+        jobs.update({dst: (write_video_file, sources) for dst, sources in plan["video_files"].items()})
+        done = set(checkpoint["done"])
+        jobs = {dst: job for dst, job in jobs.items() if dst not in done}
+
+        num_frames, num_bytes = 0, 0
+        progress = tqdm.tqdm(total=len(jobs), desc="Copy data and videos", unit="file")
+        if executor is None:
+            results = ((dst, fn(staging_dir / dst, sources)) for dst, (fn, sources) in jobs.items())
+        else:
+            futures = {
+                executor.submit(fn, staging_dir / dst, sources): dst for dst, (fn, sources) in jobs.items()
+            }
+            results = ((futures[future], future.result()) for future in as_completed(futures))
+        for dst, (frames, nbytes) in results:
+            num_frames += frames
+            num_bytes += nbytes
+            checkpoint["done"].append(dst)
+            save_aggregation_checkpoint(staging_dir, checkpoint)
+
+            elapsed = time.perf_counter() - start_time
+            progress.set_postfix_str(
+                f"{num_frames / elapsed:.0f} frames/s, {num_bytes / 1024**2 / elapsed:.1f} MB/s"
+            )
+            progress.update()
+        progress.close()
+    except BaseException:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    if executor is not None:
+        executor.shutdown()
+
+    checkpoint["finalizing"] = True
+    save_aggregation_checkpoint(staging_dir, checkpoint)
+    if aggr_root.exists():
+        # A previous run was interrupted while finalizing: move its files back to the staging directory
+        for dirname in ["data", "videos"]:
+            if (aggr_root / dirname).exists() and not (staging_dir / dirname).exists():
+                os.replace(aggr_root / dirname, staging_dir / dirname)
+        shutil.rmtree(aggr_root)
+
     dst_meta = LeRobotDatasetMetadata.create(
         repo_id=aggr_repo_id,
         fps=fps,
@@ -222,284 +227,362 @@ def aggregate_datasets(
         data_files_size_in_mb=data_files_size_in_mb,
         video_files_size_in_mb=video_files_size_in_mb,
     )
+    dst_meta.tasks = tasks
+    for dirname in ["data", "videos"]:
+        if (staging_dir / dirname).exists():
+            os.replace(staging_dir / dirname, aggr_root / dirname)
 
-    logging.info("Find all tasks")
-    unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
-    dst_meta.tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
-
-    meta_idx = {"chunk": 0, "file": 0}
-    data_idx = {"chunk": 0, "file": 0}
-    videos_idx = {
-        key: {"chunk": 0, "file": 0, "latest_duration": 0, "episode_duration": 0} for key in video_keys
-    }
-
-    dst_meta.episodes = {}
-
-    for src_meta in tqdm.tqdm(all_metadata, desc="Copy data and videos"):
-        videos_idx = aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size)
-        data_idx = aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size)
-
-        meta_idx = aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx)
-
-        dst_meta.info["total_episodes"] += src_meta.total_episodes
-        dst_meta.info["total_frames"] += src_meta.total_frames
-
+    write_episodes_metadata(all_metadata, plan, aggr_root)
     finalize_aggregation(dst_meta, all_metadata)
-    logging.info("Aggregation complete.")
+    shutil.rmtree(staging_dir)
+
+    elapsed = time.perf_counter() - start_time
+    throughput = {
+        "num_frames": num_frames,
+        "num_mb": num_bytes / 1024**2,
+        "elapsed_s": elapsed,
+        "frames_per_s": num_frames / elapsed,
+        "mb_per_s": num_bytes / 1024**2 / elapsed,
+    }
+    logging.info(
+        f"Aggregation complete: {num_frames} frames ({throughput['num_mb']:.1f} MB) in {elapsed:.1f}s, "
+        f"{throughput['frames_per_s']:.0f} frames/s, {throughput['mb_per_s']:.1f} MB/s."
+    )
+    return throughput
 
 
-def aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size):
-    """Aggregates video chunks from a source dataset into the destination dataset.
+def plan_destination_files(sizes_in_mb: list[float], max_mb: float, chunk_size: int) -> list[tuple[int, int]]:
+    """Assigns an ordered list of source files to destination (chunk, file) indices.
 
-    Handles video file concatenation and rotation based on file size limits.
-    Creates new video files when size limits are exceeded.
+    Source files are appended to the current destination file until adding the next one would reach `max_mb`,
+    in which case a new destination file is started.
 
     Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        videos_idx: Dictionary tracking video chunk and file indices.
-        video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
-        chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        sizes_in_mb: Size of each source file in MB, in aggregation order.
+        max_mb: Maximum allowed destination file size in MB before rotation.
+        chunk_size: Maximum number of files per chunk before incrementing chunk index.
 
     Returns:
-        dict: Updated videos_idx with current chunk and file indices.
+        list[tuple[int, int]]: The destination (chunk, file) indices of each source file.
     """
-    for key in videos_idx:
-        videos_idx[key]["episode_duration"] = 0
-        # Track offset for each source (chunk, file) pair
-        videos_idx[key]["src_to_offset"] = {}
-
-    for key, video_idx in videos_idx.items():
-        unique_chunk_file_pairs = {
-            (chunk, file)
-            for chunk, file in zip(
-                src_meta.episodes[f"videos/{key}/chunk_index"],
-                src_meta.episodes[f"videos/{key}/file_index"],
-                strict=False,
+    chunk_idx, file_idx = 0, 0
+    dst_size = None
+    dst_indices = []
+    for size in sizes_in_mb:
+        if dst_size is not None and dst_size + size >= max_mb:
+            chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
+            dst_size = None
+        dst_indices.append((chunk_idx, file_idx))
+        dst_size = size if dst_size is None else dst_size + size
+    return dst_indices
+
+
+def get_source_files(src_meta: LeRobotDatasetMetadata, prefix: str) -> list[tuple[int, int]]:
+    """Returns the sorted (chunk, file) indices of the files referenced by the episodes of `src_meta`."""
+    return sorted(
+        set(
+            zip(
+                src_meta.episodes[f"{prefix}/chunk_index"],
+                src_meta.episodes[f"{prefix}/file_index"],
+                strict=True,
             )
-        }
-        unique_chunk_file_pairs = sorted(unique_chunk_file_pairs)
-
-        chunk_idx = video_idx["chunk"]
-        file_idx = video_idx["file"]
-        current_offset = video_idx["latest_duration"]
+        )
+    )
 
-        for src_chunk_idx, src_file_idx in unique_chunk_file_pairs:
-            src_path = src_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=src_chunk_idx,
-                file_index=src_file_idx,
-            )
 
-            dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=chunk_idx,
-                file_index=file_idx,
-            )
-
-            src_duration = get_video_duration_in_s(src_path)
-
-            if not dst_path.exists():
-                # Store offset before incrementing
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = current_offset
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                videos_idx[key]["episode_duration"] += src_duration
-                current_offset += src_duration
-                continue
-
-            # Check file sizes before appending
-            src_size = get_file_size_in_mb(src_path)
-            dst_size = get_file_size_in_mb(dst_path)
-
-            if dst_size + src_size >= video_files_size_in_mb:
-                # Rotate to a new file, this source becomes start of new destination
-                # So its offset should be 0
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = 0
-                chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
-                dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                    video_key=key,
-                    chunk_index=chunk_idx,
-                    file_index=file_idx,
-                )
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                # Reset offset for next file
-                current_offset = src_duration
-            else:
-                # Append to existing video file - use current accumulated offset
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = current_offset
-                concatenate_video_files(
-                    [dst_path, src_path],
-                    dst_path,
-                )
-                current_offset += src_duration
+def plan_aggregation(
+    all_metadata: list[LeRobotDatasetMetadata],
+    video_keys: list[str],
+    tasks: pd.DataFrame,
+    data_files_size_in_mb: float,
+    video_files_size_in_mb: float,
+    chunk_size: int,
+    executor: Executor | None = None,
+) -> dict:
+    """Decides upfront where every source file goes in the aggregated dataset.
 
-            videos_idx[key]["episode_duration"] += src_duration
+    Planning only reads metadata (file sizes, video durations), so that the destination files can then be
+    written independently of each other, in parallel, and skipped when resuming an interrupted aggregation.
 
-        videos_idx[key]["chunk"] = chunk_idx
-        videos_idx[key]["file"] = file_idx
+    Args:
+        all_metadata: Metadata of the source datasets, in aggregation order.
+        video_keys: Video keys of the datasets.
+        tasks: Tasks of the aggregated dataset.
+        data_files_size_in_mb: Maximum size for data files in MB.
+        video_files_size_in_mb: Maximum size for video files in MB.
+        chunk_size: Maximum number of files per chunk.
+        executor: Optional executor used to probe the duration of the source videos.
 
-    return videos_idx
+    Returns:
+        dict: With keys
+            - "data_files": destination data path -> list of sources, with the offsets to apply to their rows.
+            - "video_files": destination video path -> list of source video paths, to concatenate in order.
+            - "data_map": (dataset, chunk, file) of each source data file -> destination (chunk, file).
+            - "video_map": video key -> (dataset, chunk, file) of each source video file -> destination (chunk,
+              file, timestamp offset in the destination video).
+            - "episodes_map": (dataset, chunk, file) of each source episodes file -> destination (chunk, file).
+            - "fingerprint": hash of the plan, used to check that a checkpoint belongs to the same aggregation.
+    """
+    map_fn = executor.map if executor is not None else map
+
+    episode_offsets = np.cumsum([0] + [m.total_episodes for m in all_metadata])
+    index_offsets = np.cumsum([0] + [m.total_frames for m in all_metadata])
+
+    # Data files
+    sources = [
+        (ds_idx, chunk_idx, file_idx)
+        for ds_idx, src_meta in enumerate(all_metadata)
+        for chunk_idx, file_idx in get_source_files(src_meta, "data")
+    ]
+    src_paths = [
+        all_metadata[ds_idx].root / DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+        for ds_idx, chunk_idx, file_idx in sources
+    ]
+    task_maps = [tasks.loc[m.tasks.index, "task_index"].to_numpy() for m in all_metadata]
+    dst_indices = plan_destination_files(
+        [get_parquet_file_size_in_mb(path) for path in src_paths], data_files_size_in_mb, chunk_size
+    )
+    data_files = {}
+    for (ds_idx, _, _), src_path, (chunk_idx, file_idx) in zip(sources, src_paths, dst_indices, strict=True):
+        dst_path = DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+        data_files.setdefault(dst_path, []).append(
+            {
+                "path": str(src_path),
+                "episode_offset": int(episode_offsets[ds_idx]),
+                "index_offset": int(index_offsets[ds_idx]),
+                "task_map": task_maps[ds_idx],
+            }
+        )
+    data_map = dict(zip(sources, dst_indices, strict=True))
+
+    # Video files
+    video_files = {}
+    video_map = {}
+    for key in video_keys:
+        sources = [
+            (ds_idx, chunk_idx, file_idx)
+            for ds_idx, src_meta in enumerate(all_metadata)
+            for chunk_idx, file_idx in get_source_files(src_meta, f"videos/{key}")
+        ]
+        src_paths = [
+            all_metadata[ds_idx].root
+            / DEFAULT_VIDEO_PATH.format(video_key=key, chunk_index=chunk_idx, file_index=file_idx)
+            for ds_idx, chunk_idx, file_idx in sources
+        ]
+        durations = list(map_fn(get_video_duration_in_s, src_paths))
+        dst_indices = plan_destination_files(
+            [get_file_size_in_mb(path) for path in src_paths], video_files_size_in_mb, chunk_size
+        )
+        video_map[key] = {}
+        offset = 0.0
+        for src, src_path, duration, (chunk_idx, file_idx) in zip(
+            sources, src_paths, durations, dst_indices, strict=True
+        ):
+            dst_path = DEFAULT_VIDEO_PATH.format(video_key=key, chunk_index=chunk_idx, file_index=file_idx)
+            if dst_path not in video_files:
+                offset = 0.0
+            # The source video starts where the previous ones appended to the same destination end
+            video_map[key][src] = (chunk_idx, file_idx, offset)
+            video_files.setdefault(dst_path, []).append(str(src_path))
+            offset += duration
+
+    # Episodes metadata files
+    sources = [
+        (ds_idx, chunk_idx, file_idx)
+        for ds_idx, src_meta in enumerate(all_metadata)
+        for chunk_idx, file_idx in get_source_files(src_meta, "meta/episodes")
+    ]
+    dst_indices = plan_destination_files(
+        [
+            get_parquet_file_size_in_mb(
+                all_metadata[ds_idx].root / DEFAULT_EPISODES_PATH.format(chunk_index=c, file_index=f)
+            )
+            for ds_idx, c, f in sources
+        ],
+        DEFAULT_DATA_FILE_SIZE_IN_MB,
+        DEFAULT_CHUNK_SIZE,
+    )
+    episodes_map = dict(zip(sources, dst_indices, strict=True))
 
+    fingerprint = {
+        "sources": [str(m.root) for m in all_metadata],
+        "data_files": {dst: [src["path"] for src in srcs] for dst, srcs in data_files.items()},
+        "video_files": video_files,
+    }
+    fingerprint = hashlib.sha1(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+    return {
+        "data_files": data_files,
+        "video_files": video_files,
+        "data_map": data_map,
+        "video_map": video_map,
+        "episodes_map": episodes_map,
+        "fingerprint": fingerprint,
+    }
 
-def aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size):
-    """Aggregates data chunks from a source dataset into the destination dataset.
 
-    Reads source data files, updates indices to match the aggregated dataset,
-    and writes them to the destination with proper file rotation.
+def update_data_table(
+    table: pa.Table, episode_offset: int, index_offset: int, task_map: np.ndarray
+) -> pa.Table:
+    """Updates the episode, frame and task indices of a table of frames for aggregation.
 
     Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        data_idx: Dictionary tracking data chunk and file indices.
+        table: Frames of a source dataset.
+        episode_offset: Number of episodes of the datasets aggregated before the source dataset.
+        index_offset: Number of frames of the datasets aggregated before the source dataset.
+        task_map: Task index in the aggregated dataset of each task index of the source dataset.
 
     Returns:
-        dict: Updated data_idx with current chunk and file indices.
+        pa.Table: Table with adjusted indices.
     """
-    unique_chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["data/chunk_index"], src_meta.episodes["data/file_index"], strict=False
-        )
+    updates = {
+        "episode_index": pc.add(table["episode_index"], episode_offset),
+        "index": pc.add(table["index"], index_offset),
+        "task_index": pa.array(task_map[table["task_index"].to_numpy()]),
     }
+    for name, values in updates.items():
+        field_idx = table.schema.get_field_index(name)
+        field = table.schema.field(field_idx)
+        table = table.set_column(field_idx, field, values.cast(field.type))
+    return table
 
-    unique_chunk_file_ids = sorted(unique_chunk_file_ids)
-
-    for src_chunk_idx, src_file_idx in unique_chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_DATA_PATH.format(
-            chunk_index=src_chunk_idx, file_index=src_file_idx
-        )
-        df = pd.read_parquet(src_path)
-        df = update_data_df(df, src_meta, dst_meta)
 
-        data_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            data_idx,
-            data_files_size_in_mb,
-            chunk_size,
-            DEFAULT_DATA_PATH,
-            contains_images=len(dst_meta.image_keys) > 0,
-            aggr_root=dst_meta.root,
-        )
+def _partial_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.partial")
 
-    return data_idx
 
+def write_data_file(dst_path: Path, sources: list[dict]) -> tuple[int, int]:
+    """Streams the frames of `sources` into a single destination parquet file.
 
-def aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx):
-    """Aggregates metadata from a source dataset into the destination dataset.
-
-    Reads source metadata files, updates all indices and timestamps,
-    and writes them to the destination with proper file rotation.
+    Source files are read one row group at a time and written as Arrow tables, without going through pandas
+    and without reading back the destination file. The file is written under a temporary name and only
+    renamed to `dst_path` once complete.
 
     Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary tracking metadata chunk and file indices.
-        data_idx: Dictionary tracking data chunk and file indices.
-        videos_idx: Dictionary tracking video indices and timestamps.
+        dst_path: Path of the destination parquet file.
+        sources: Source files and offsets to apply to their rows, as planned by `plan_aggregation`.
 
     Returns:
-        dict: Updated meta_idx with current chunk and file indices.
+        tuple[int, int]: Number of frames written and number of bytes read.
     """
-    chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["meta/episodes/chunk_index"],
-            src_meta.episodes["meta/episodes/file_index"],
-            strict=False,
-        )
-    }
+    tmp_path = _partial_path(dst_path)
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    num_frames, num_bytes = 0, 0
+    writer = None
+    try:
+        for src in sources:
+            parquet_file = pq.ParquetFile(src["path"])
+            if writer is None:
+                # The schema metadata holds the HF features (e.g. images) of the dataset
+                writer = pq.ParquetWriter(tmp_path, parquet_file.schema_arrow)
+            for row_group in range(parquet_file.num_row_groups):
+                table = update_data_table(
+                    parquet_file.read_row_group(row_group),
+                    src["episode_offset"],
+                    src["index_offset"],
+                    src["task_map"],
+                )
+                writer.write_table(table)
+                num_frames += table.num_rows
+            num_bytes += os.path.getsize(src["path"])
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, dst_path)
+    return num_frames, num_bytes
 
-    chunk_file_ids = sorted(chunk_file_ids)
-    for chunk_idx, file_idx in chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        df = pd.read_parquet(src_path)
-        df = update_meta_data(
-            df,
-            dst_meta,
-            meta_idx,
-            data_idx,
-            videos_idx,
-        )
 
-        meta_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            meta_idx,
-            DEFAULT_DATA_FILE_SIZE_IN_MB,
-            DEFAULT_CHUNK_SIZE,
-            DEFAULT_EPISODES_PATH,
-            contains_images=False,
-            aggr_root=dst_meta.root,
-        )
+def write_video_file(dst_path: Path, sources: list[str]) -> tuple[int, int]:
+    """Concatenates the source videos, in order, into a single destination video file.
 
-    # Increment latest_duration by the total duration added from this source dataset
-    for k in videos_idx:
-        videos_idx[k]["latest_duration"] += videos_idx[k]["episode_duration"]
+    Args:
+        dst_path: Path of the destination video file.
+        sources: Paths of the source video files.
 
-    return meta_idx
+    Returns:
+        tuple[int, int]: Number of frames written (always 0, frames are counted with the data files) and
+            number of bytes read.
+    """
+    tmp_path = _partial_path(dst_path)
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    if len(sources) == 1:
+        shutil.copy(sources[0], tmp_path)
+    else:
+        concatenate_video_files([Path(src) for src in sources], tmp_path)
+    os.replace(tmp_path, dst_path)
+    return 0, sum(os.path.getsize(src) for src in sources)
 
 
-def append_or_create_parquet_file(
-    df: pd.DataFrame,
-    src_path: Path,
-    idx: dict[str, int],
-    max_mb: float,
-    chunk_size: int,
-    default_path: str,
-    contains_images: bool = False,
-    aggr_root: Path = None,
-):
-    """Appends data to an existing parquet file or creates a new one based on size constraints.
+def write_episodes_metadata(all_metadata: list[LeRobotDatasetMetadata], plan: dict, aggr_root: Path):
+    """Writes the episodes metadata of the aggregated dataset.
 
-    Manages file rotation when size limits are exceeded to prevent individual files
-    from becoming too large. Handles both regular parquet files and those containing images.
+    Episode indices, frame ranges, and the data and video files (and timestamps within them) of each episode
+    are updated according to `plan`.
 
     Args:
-        df: DataFrame to write to the parquet file.
-        src_path: Path to the source file (used for size estimation).
-        idx: Dictionary containing current 'chunk' and 'file' indices.
-        max_mb: Maximum allowed file size in MB before rotation.
-        chunk_size: Maximum number of files per chunk before incrementing chunk index.
-        default_path: Format string for generating file paths.
-        contains_images: Whether the data contains images requiring special handling.
+        all_metadata: Metadata of the source datasets, in aggregation order.
+        plan: Aggregation plan returned by `plan_aggregation`.
         aggr_root: Root path for the aggregated dataset.
-
-    Returns:
-        dict: Updated index dictionary with current chunk and file indices.
     """
-    dst_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-
-    if not dst_path.exists():
+    episode_offsets = np.cumsum([0] + [m.total_episodes for m in all_metadata])
+    index_offsets = np.cumsum([0] + [m.total_frames for m in all_metadata])
+
+    dst_dfs = {}
+    for (ds_idx, chunk_idx, file_idx), dst_indices in plan["episodes_map"].items():
+        src_meta = all_metadata[ds_idx]
+        df = pd.read_parquet(
+            src_meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+        )
+        df["episode_index"] += episode_offsets[ds_idx]
+        df["dataset_from_index"] += index_offsets[ds_idx]
+        df["dataset_to_index"] += index_offsets[ds_idx]
+        df["meta/episodes/chunk_index"], df["meta/episodes/file_index"] = dst_indices
+
+        src_files = zip(df["data/chunk_index"], df["data/file_index"], strict=True)
+        dst_files = np.array([plan["data_map"][(ds_idx, c, f)] for c, f in src_files]).reshape(-1, 2)
+        df["data/chunk_index"], df["data/file_index"] = dst_files[:, 0], dst_files[:, 1]
+
+        for key, video_map in plan["video_map"].items():
+            src_files = zip(df[f"videos/{key}/chunk_index"], df[f"videos/{key}/file_index"], strict=True)
+            dst_files = [video_map[(ds_idx, c, f)] for c, f in src_files]
+            df[f"videos/{key}/chunk_index"] = [dst[0] for dst in dst_files]
+            df[f"videos/{key}/file_index"] = [dst[1] for dst in dst_files]
+            offsets = np.array([dst[2] for dst in dst_files], dtype=np.float64)
+            df[f"videos/{key}/from_timestamp"] += offsets
+            df[f"videos/{key}/to_timestamp"] += offsets
+
+        dst_dfs.setdefault(dst_indices, []).append(df)
+
+    for (chunk_idx, file_idx), dfs in dst_dfs.items():
+        dst_path = aggr_root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
         dst_path.parent.mkdir(parents=True, exist_ok=True)
-        if contains_images:
-            to_parquet_with_hf_images(df, dst_path)
-        else:
-            df.to_parquet(dst_path)
-        return idx
-
-    src_size = get_parquet_file_size_in_mb(src_path)
-    dst_size = get_parquet_file_size_in_mb(dst_path)
-
-    if dst_size + src_size >= max_mb:
-        idx["chunk"], idx["file"] = update_chunk_file_indices(idx["chunk"], idx["file"], chunk_size)
-        new_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-        final_df = df
-        target_path = new_path
-    else:
-        existing_df = pd.read_parquet(dst_path)
-        final_df = pd.concat([existing_df, df], ignore_index=True)
-        target_path = dst_path
+        pd.concat(dfs, ignore_index=True).to_parquet(dst_path)
 
-    if contains_images:
-        to_parquet_with_hf_images(final_df, target_path)
-    else:
-        final_df.to_parquet(target_path)
 
-    return idx
+def load_aggregation_checkpoint(staging_dir: Path, fingerprint: str, resume: bool) -> dict:
+    """Loads the progress of a previous aggregation, or starts from scratch.
+
+    The checkpoint is discarded, along with the files already written in `staging_dir`, if `resume` is False
+    or if it was created for a different aggregation plan.
+    """
+    checkpoint_path = staging_dir / AGGREGATION_CHECKPOINT
+    if checkpoint_path.is_file():
+        checkpoint = json.loads(checkpoint_path.read_text())
+        if resume and checkpoint["fingerprint"] == fingerprint:
+            checkpoint["done"] = [path for path in checkpoint["done"] if (staging_dir / path).is_file()]
+            logging.info(f"Resuming aggregation, {len(checkpoint['done'])} files already written.")
+            return checkpoint
+        logging.warning(f"Discarding the previous aggregation progress in {staging_dir}.")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    return {"fingerprint": fingerprint, "done": [], "finalizing": False}
+
+
+def save_aggregation_checkpoint(staging_dir: Path, checkpoint: dict):
+    checkpoint_path = staging_dir / AGGREGATION_CHECKPOINT
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = _partial_path(checkpoint_path)
+    tmp_path.write_text(json.dumps(checkpoint))
+    os.replace(tmp_path, checkpoint_path)
 
 
 def finalize_aggregation(aggr_meta, all_metadata):
@@ -20,6 +20,10 @@ from lerobot.datasets.utils import load_image_as_numpy
 DEFAULT_QUANTILES = [0.01, 0.10, 0.50, 0.90, 0.99]
 
 
+# Smallest bin width of the histograms (2**-60), only used when all the observed values are equal to 0
+MIN_BIN_EXPONENT = -60
+
+
 class RunningQuantileStats:
     """
     Maintains running statistics for batches of vectors, including mean,
@@ -28,23 +32,51 @@ class RunningQuantileStats:
     Statistics are computed per feature dimension and updated incrementally
     as new batches are observed. Quantiles are estimated using histograms,
     which adapt dynamically if the observed data range expands.
+
+    The histograms of each dimension live on a grid of bins whose width is a power of two and whose edges are
+    multiples of that width. When the observed range expands, the width is doubled as many times as needed,
+    which merges pairs of bins exactly instead of redistributing approximate counts. The width only depends on
+    the observed range, so statistics computed in parallel on different parts of the data can be combined with
+    `merge` into the same histograms as if all the data had been observed by a single instance.
+
+    When the range of the data is known beforehand, `bin_range` sets the minimal range covered by the
+    histograms. Statistics created with the same `bin_range` always share the same bin width, even when some
+    parts of the data only take a single value.
     """
 
-    def __init__(self, quantile_list: list[float] | None = None, num_quantile_bins: int = 5000):
+    def __init__(
+        self,
+        quantile_list: list[float] | None = None,
+        num_quantile_bins: int = 5000,
+        bin_range: tuple[np.ndarray | float, np.ndarray | float] | None = None,
+    ):
         self._count = 0
         self._mean = None
         self._mean_of_squares = None
         self._min = None
         self._max = None
         self._histograms = None
-        self._bin_edges = None
+        self._bin_exponents = None
+        self._bin_offsets = None
         self._num_quantile_bins = num_quantile_bins
+        self._bin_range = bin_range
 
         self._quantile_list = quantile_list
         if self._quantile_list is None:
             self._quantile_list = DEFAULT_QUANTILES
         self._quantile_keys = [f"q{int(q * 100):02d}" for q in self._quantile_list]
 
+    @property
+    def _bin_edges(self) -> list[np.ndarray]:
+        """Bin edges of the histogram of each dimension."""
+        if self._histograms is None:
+            return None
+        bins = np.arange(self._num_quantile_bins + 1)
+        return [
+            (offset + bins) * np.exp2(float(exponent))
+            for offset, exponent in zip(self._bin_offsets, self._bin_exponents, strict=True)
+        ]
+
     def update(self, batch: np.ndarray) -> None:
         """Update the running statistics with a batch of vectors.
 
@@ -59,24 +91,16 @@ class RunningQuantileStats:
             self._mean_of_squares = np.mean(batch**2, axis=0)
             self._min = np.min(batch, axis=0)
             self._max = np.max(batch, axis=0)
-            self._histograms = [np.zeros(self._num_quantile_bins) for _ in range(vector_length)]
-            self._bin_edges = [
-                np.linspace(self._min[i] - 1e-10, self._max[i] + 1e-10, self._num_quantile_bins + 1)
-                for i in range(vector_length)
-            ]
+            self._histograms = np.zeros((vector_length, self._num_quantile_bins))
+            self._bin_exponents = self._required_bin_exponents()
+            self._bin_offsets = self._lowest_bins(self._bin_exponents)
         else:
             if vector_length != self._mean.size:
                 raise ValueError("The length of new vectors does not match the initialized vector length.")
 
-            new_max = np.max(batch, axis=0)
-            new_min = np.min(batch, axis=0)
-            max_changed = np.any(new_max > self._max)
-            min_changed = np.any(new_min < self._min)
-            self._max = np.maximum(self._max, new_max)
-            self._min = np.minimum(self._min, new_min)
-
-            if max_changed or min_changed:
-                self._adjust_histograms()
+            self._max = np.maximum(self._max, np.max(batch, axis=0))
+            self._min = np.minimum(self._min, np.min(batch, axis=0))
+            self._adjust_histograms()
 
         self._count += num_elements
 
@@ -91,6 +115,53 @@ class RunningQuantileStats:
 
         self._update_histograms(batch)
 
+    def merge(self, other: "RunningQuantileStats") -> None:
+        """Merge the statistics of another set of vectors into these statistics.
+
+        Both histograms are brought to the coarsest of their bin widths (and coarser if needed to cover the
+        combined range) before being summed, which is exact since bin widths are powers of two.
+
+        Args:
+            other: Statistics of other vectors with the same vector length and number of quantile bins.
+        """
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._count = other._count
+            self._mean = other._mean.copy()
+            self._mean_of_squares = other._mean_of_squares.copy()
+            self._min = other._min.copy()
+            self._max = other._max.copy()
+            self._histograms = other._histograms.copy()
+            self._bin_exponents = other._bin_exponents.copy()
+            self._bin_offsets = other._bin_offsets.copy()
+            if self._bin_range is None:
+                self._bin_range = other._bin_range
+            return
+
+        if other._mean.size != self._mean.size:
+            raise ValueError("The length of new vectors does not match the initialized vector length.")
+        if other._num_quantile_bins != self._num_quantile_bins:
+            raise ValueError("Cannot merge statistics with a different number of quantile bins.")
+
+        total_count = self._count + other._count
+        self._mean += (other._mean - self._mean) * (other._count / total_count)
+        self._mean_of_squares += (other._mean_of_squares - self._mean_of_squares) * (
+            other._count / total_count
+        )
+        self._min = np.minimum(self._min, other._min)
+        self._max = np.maximum(self._max, other._max)
+        self._count = total_count
+
+        self._adjust_histograms(np.maximum(self._bin_exponents, other._bin_exponents))
+        self._histograms += self._rebin(
+            other._histograms,
+            other._bin_exponents,
+            other._bin_offsets,
+            self._bin_exponents,
+            self._bin_offsets,
+        )
+
     def get_statistics(self) -> dict[str, np.ndarray]:
         """Compute and return the statistics of the vectors processed so far.
 
@@ -121,75 +192,92 @@ class RunningQuantileStats:
 
         return stats
 
-    def _adjust_histograms(self):
-        """Adjust histograms when min or max changes."""
-        for i in range(len(self._histograms)):
-            old_edges = self._bin_edges[i]
-            old_hist = self._histograms[i]
-
-            # Create new edges with small padding to ensure range coverage
-            padding = (self._max[i] - self._min[i]) * 1e-10
-            new_edges = np.linspace(
-                self._min[i] - padding, self._max[i] + padding, self._num_quantile_bins + 1
-            )
-
-            # Redistribute existing histogram counts to new bins
-            # We need to map each old bin center to the new bins
-            old_centers = (old_edges[:-1] + old_edges[1:]) / 2
-            new_hist = np.zeros(self._num_quantile_bins)
-
-            for old_center, count in zip(old_centers, old_hist, strict=False):
-                if count > 0:
-                    # Find which new bin this old center belongs to
-                    bin_idx = np.searchsorted(new_edges, old_center) - 1
-                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
-                    new_hist[bin_idx] += count
-
-            self._histograms[i] = new_hist
-            self._bin_edges[i] = new_edges
+    def _required_bin_exponents(self) -> np.ndarray:
+        """Smallest bin width exponents such that the histograms cover the observed range (and `bin_range`)."""
+        # Boolean features are binned like 0/1 values
+        low, high = self._min.astype(np.float64), self._max.astype(np.float64)
+        if self._bin_range is not None:
+            range_low, range_high = self._bin_range
+            low, high = np.minimum(low, range_low), np.maximum(high, range_high)
+        with np.errstate(divide="ignore"):
+            # A range spanning `num_quantile_bins - 1` bin widths always fits in `num_quantile_bins` bins
+            exponents = np.ceil(np.log2((high - low) / (self._num_quantile_bins - 1)))
+            # Bins narrower than the float64 resolution of the values are pointless
+            resolution = np.floor(np.log2(np.maximum(np.abs(low), np.abs(high)))) - 52
+        return np.maximum(np.maximum(exponents, resolution), MIN_BIN_EXPONENT).astype(np.int64)
+
+    def _lowest_bins(self, exponents: np.ndarray) -> np.ndarray:
+        """Index on the grid of bins of width `2**exponents` of the bin containing the minimum."""
+        return np.floor(self._min * np.exp2(-exponents)).astype(np.int64)
+
+    def _adjust_histograms(self, exponents: np.ndarray | None = None) -> None:
+        """Coarsen and shift the histograms so that they cover the observed range."""
+        exponents = np.maximum(
+            self._bin_exponents if exponents is None else exponents, self._required_bin_exponents()
+        )
+        offsets = self._lowest_bins(exponents)
+        if np.array_equal(exponents, self._bin_exponents) and np.array_equal(offsets, self._bin_offsets):
+            return
+        self._histograms = self._rebin(
+            self._histograms, self._bin_exponents, self._bin_offsets, exponents, offsets
+        )
+        self._bin_exponents = exponents
+        self._bin_offsets = offsets
+
+    def _rebin(
+        self,
+        histograms: np.ndarray,
+        exponents: np.ndarray,
+        offsets: np.ndarray,
+        new_exponents: np.ndarray,
+        new_offsets: np.ndarray,
+    ) -> np.ndarray:
+        """Map histograms onto a grid of bins at least as coarse."""
+        num_dims, num_bins = histograms.shape
+        bins = offsets[:, None] + np.arange(num_bins)
+        # Each bin of width 2**k is included in the bin of width 2**(k+s) with index `bin >> s`
+        new_bins = (bins >> (new_exponents - exponents)[:, None]) - new_offsets[:, None]
+        new_bins += np.arange(num_dims)[:, None] * num_bins
+        # Empty bins outside of the observed range may fall outside of the new grid
+        non_empty = histograms > 0
+        return np.bincount(
+            new_bins[non_empty], weights=histograms[non_empty], minlength=num_dims * num_bins
+        ).reshape(num_dims, num_bins)
 
     def _update_histograms(self, batch: np.ndarray) -> None:
         """Update histograms with new vectors."""
-        for i in range(batch.shape[1]):
-            hist, _ = np.histogram(batch[:, i], bins=self._bin_edges[i])
-            self._histograms[i] += hist
+        num_dims, num_bins = self._histograms.shape
+        bins = np.floor(batch * np.exp2(-self._bin_exponents)).astype(np.int64) - self._bin_offsets
+        np.clip(bins, 0, num_bins - 1, out=bins)
+        bins += np.arange(num_dims) * num_bins
+        self._histograms += np.bincount(bins.ravel(), minlength=num_dims * num_bins).reshape(
+            num_dims, num_bins
+        )
 
     def _compute_quantiles(self) -> list[np.ndarray]:
         """Compute quantiles based on histograms."""
+        num_dims, num_bins = self._histograms.shape
+        cumsum = np.cumsum(self._histograms, axis=1)
+        widths = np.exp2(self._bin_exponents.astype(np.float64))
+        rows = np.arange(num_dims)
         results = []
         for q in self._quantile_list:
             target_count = q * self._count
-            q_values = []
-
-            for hist, edges in zip(self._histograms, self._bin_edges, strict=True):
-                q_value = self._compute_single_quantile(hist, edges, target_count)
-                q_values.append(q_value)
-
-            results.append(np.array(q_values))
+            # Index of the first bin where the cumulative count reaches the target
+            idx = np.minimum((cumsum < target_count).sum(axis=1), num_bins - 1)
+            count_in_bin = self._histograms[rows, idx]
+            count_before = cumsum[rows, idx] - count_in_bin
+            # Linear interpolation within the bin
+            fraction = np.divide(
+                target_count - count_before,
+                count_in_bin,
+                out=np.zeros(num_dims),
+                where=count_in_bin > 0,
+            )
+            q_values = (self._bin_offsets + idx + np.clip(fraction, 0, 1)) * widths
+            results.append(np.clip(q_values, self._min, self._max))
         return results
 
-    def _compute_single_quantile(self, hist: np.ndarray, edges: np.ndarray, target_count: float) -> float:
-        """Compute a single quantile value from histogram and bin edges."""
-        cumsum = np.cumsum(hist)
-        idx = np.searchsorted(cumsum, target_count)
-
-        if idx == 0:
-            return edges[0]
-        if idx >= len(cumsum):
-            return edges[-1]
-
-        # If not edge case, interpolate within the bin
-        count_before = cumsum[idx - 1]
-        count_in_bin = cumsum[idx] - count_before
-
-        # If no samples in this bin, use the bin edge
-        if count_in_bin == 0:
-            return edges[idx]
-
-        # Linear interpolation within the bin
-        fraction = (target_count - count_before) / count_in_bin
-        return edges[idx] + fraction * (edges[idx + 1] - edges[idx])
-
 
 def estimate_num_samples(
     dataset_len: int, min_num_samples: int = 100, max_num_samples: int = 10_000, power: float = 0.75
@@ -488,7 +576,7 @@ def compute_episode_stats(
 
     Args:
         episode_data: Dictionary mapping feature names to data
-            - For images/videos: list of file paths
+            - For images/videos: list of file paths, or already sampled (N, C, H, W) uint8 images
             - For numerical data: numpy arrays
         features: Dictionary describing each feature's dtype and shape
 
@@ -509,7 +597,7 @@ def compute_episode_stats(
             continue
 
         if features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)
+            ep_ft_array = data if isinstance(data, np.ndarray) else sample_images(data)
             axes_to_reduce = (0, 2, 3)
             keepdims = True
         else:
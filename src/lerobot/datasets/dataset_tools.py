@@ -24,8 +24,11 @@ This module provides utilities for:
 """
 
 import logging
+import os
 import shutil
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 import datasets
@@ -44,6 +47,7 @@ from lerobot.datasets.utils import (
     DEFAULT_DATA_FILE_SIZE_IN_MB,
     DEFAULT_DATA_PATH,
     DEFAULT_EPISODES_PATH,
+    get_file_size_in_mb,
     get_parquet_file_size_in_mb,
     load_episodes,
     update_chunk_file_indices,
@@ -53,6 +57,13 @@ from lerobot.datasets.utils import (
 )
 from lerobot.utils.constants import HF_LEROBOT_HOME
 
+VIDEO_EDIT_METHODS = ("copy", "stream_copy", "reencode")
+
+# Throughputs of a worker used to estimate the duration of video edits
+ESTIMATED_COPY_MB_PER_S = 500
+ESTIMATED_STREAM_COPY_MB_PER_S = 200
+ESTIMATED_REENCODE_FPS = 60
+
 
 def _load_episode_with_stats(src_dataset: LeRobotDataset, episode_idx: int) -> dict:
     """Load a single episode's metadata including stats from parquet file.
@@ -81,6 +92,7 @@ def delete_episodes(
     episode_indices: list[int],
     output_dir: str | Path | None = None,
     repo_id: str | None = None,
+    num_workers: int | None = None,
 ) -> LeRobotDataset:
     """Delete episodes from a LeRobotDataset and create a new dataset.
 
@@ -89,6 +101,7 @@ def delete_episodes(
         episode_indices: List of episode indices to delete.
         output_dir: Directory to save the new dataset. If None, uses default location.
         repo_id: Repository ID for the new dataset. If None, appends "_modified" to original.
+        num_workers: Number of processes rewriting video files. If None, uses all the CPUs.
     """
     if not episode_indices:
         raise ValueError("No episodes to delete")
@@ -121,7 +134,7 @@ def delete_episodes(
 
     video_metadata = None
     if dataset.meta.video_keys:
-        video_metadata = _copy_and_reindex_videos(dataset, new_meta, episode_mapping)
+        video_metadata = _copy_and_reindex_videos(dataset, new_meta, episode_mapping, num_workers=num_workers)
 
     data_metadata = _copy_and_reindex_data(dataset, new_meta, episode_mapping)
 
@@ -143,6 +156,7 @@ def split_dataset(
     dataset: LeRobotDataset,
     splits: dict[str, float | list[int]],
     output_dir: str | Path | None = None,
+    num_workers: int | None = None,
 ) -> dict[str, LeRobotDataset]:
     """Split a LeRobotDataset into multiple smaller datasets.
 
@@ -151,6 +165,7 @@ def split_dataset(
         splits: Either a dict mapping split names to episode indices, or a dict mapping
                 split names to fractions (must sum to <= 1.0).
         output_dir: Base directory for output datasets. If None, uses default location.
+        num_workers: Number of processes rewriting video files. If None, uses all the CPUs.
 
     Examples:
       Split by specific episodes
@@ -211,7 +226,9 @@ def split_dataset(
 
         video_metadata = None
         if dataset.meta.video_keys:
-            video_metadata = _copy_and_reindex_videos(dataset, new_meta, episode_mapping)
+            video_metadata = _copy_and_reindex_videos(
+                dataset, new_meta, episode_mapping, num_workers=num_workers
+            )
 
         data_metadata = _copy_and_reindex_data(dataset, new_meta, episode_mapping)
 
@@ -276,6 +293,7 @@ def modify_features(
     remove_features: str | list[str] | None = None,
     output_dir: str | Path | None = None,
     repo_id: str | None = None,
+    num_workers: int | None = None,
 ) -> LeRobotDataset:
     """Modify a LeRobotDataset by adding and/or removing features in a single pass.
 
@@ -288,6 +306,7 @@ def modify_features(
         remove_features: Optional feature name(s) to remove. Can be a single string or list.
         output_dir: Directory to save the new dataset. If None, uses default location.
         repo_id: Repository ID for the new dataset. If None, appends "_modified" to original.
+        num_workers: Number of processes copying video files. If None, uses all the CPUs.
 
     Returns:
         New dataset with features modified.
@@ -361,7 +380,12 @@ def modify_features(
     )
 
     if new_meta.video_keys:
-        _copy_videos(dataset, new_meta, exclude_keys=video_keys_to_remove if video_keys_to_remove else None)
+        _copy_videos(
+            dataset,
+            new_meta,
+            exclude_keys=video_keys_to_remove if video_keys_to_remove else None,
+            num_workers=num_workers,
+        )
 
     new_dataset = LeRobotDataset(
         repo_id=repo_id,
@@ -379,6 +403,7 @@ def add_features(
     features: dict[str, tuple[np.ndarray | torch.Tensor | Callable, dict]],
     output_dir: str | Path | None = None,
     repo_id: str | None = None,
+    num_workers: int | None = None,
 ) -> LeRobotDataset:
     """Add multiple features to a LeRobotDataset in a single pass.
 
@@ -390,6 +415,7 @@ def add_features(
         features: Dictionary mapping feature names to (feature_values, feature_info) tuples.
         output_dir: Directory to save the new dataset. If None, uses default location.
         repo_id: Repository ID for the new dataset. If None, appends "_modified" to original.
+        num_workers: Number of processes copying video files. If None, uses all the CPUs.
 
     Returns:
         New dataset with all features added.
@@ -411,6 +437,7 @@ def add_features(
         remove_features=None,
         output_dir=output_dir,
         repo_id=repo_id,
+        num_workers=num_workers,
     )
 
 
@@ -419,6 +446,7 @@ def remove_feature(
     feature_names: str | list[str],
     output_dir: str | Path | None = None,
     repo_id: str | None = None,
+    num_workers: int | None = None,
 ) -> LeRobotDataset:
     """Remove features from a LeRobotDataset.
 
@@ -427,6 +455,7 @@ def remove_feature(
         feature_names: Name(s) of features to remove. Can be a single string or list.
         output_dir: Directory to save the new dataset. If None, uses default location.
         repo_id: Repository ID for the new dataset. If None, appends "_modified" to original.
+        num_workers: Number of processes copying video files. If None, uses all the CPUs.
 
     Returns:
         New dataset with features removed.
@@ -437,6 +466,7 @@ def remove_feature(
         remove_features=feature_names,
         output_dir=output_dir,
         repo_id=repo_id,
+        num_workers=num_workers,
     )
 
 
@@ -669,132 +699,352 @@ def _keep_episodes_from_video_with_av(
     in_container.close()
 
 
+@dataclass
+class VideoFileEdit:
+    """Planned rewrite of a video file of a dataset, keeping some of its episodes.
+
+    Edited files keep the chunk and file indices of their source file.
+
+    Attributes:
+        video_key: Video feature of the file.
+        chunk_index: Chunk index of the file.
+        file_index: File index of the file.
+        episodes: Source indices of the kept episodes, in their order in the edited file.
+        ranges: (from_timestamp, to_timestamp) of the kept episodes in the source file.
+        method: How the file is rewritten, one of `VIDEO_EDIT_METHODS`:
+            - "copy": all the episodes of the file are kept, the file is copied as is.
+            - "stream_copy": all the kept episodes start and end on keyframes, their packets are remuxed
+              without being decoded.
+            - "reencode": the frames of the kept episodes are decoded and encoded again.
+        size_in_mb: Size of the source file.
+        num_frames: Number of frames kept.
+    """
+
+    video_key: str
+    chunk_index: int
+    file_index: int
+    episodes: list[int]
+    ranges: list[tuple[float, float]]
+    method: str
+    size_in_mb: float
+    num_frames: int
+
+
+@dataclass
+class VideoEditsEstimate:
+    """Dry-run estimate of the cost of rewriting the video files of a dataset, see `estimate_video_edits`."""
+
+    num_files: dict[str, int]
+    size_in_mb: dict[str, float]
+    num_reencoded_frames: int
+    num_workers: int
+    estimated_time_s: float
+
+    def __str__(self) -> str:
+        lines = [
+            f"{method:>11}: {self.num_files[method]} files, {self.size_in_mb[method]:.1f} MB"
+            for method in VIDEO_EDIT_METHODS
+        ]
+        lines.append(f"Frames to re-encode: {self.num_reencoded_frames}")
+        lines.append(f"Estimated time with {self.num_workers} workers: {self.estimated_time_s:.0f} s")
+        return "\n".join(lines)
+
+
+def _is_keyframe_at(container, stream, timestamp: float, tolerance_s: float) -> bool:
+    """Whether a keyframe of the stream is presented at `timestamp`, found by seeking in the index."""
+    container.seek(round(timestamp / stream.time_base), stream=stream, backward=True, any_frame=False)
+    for packet in container.demux(stream):
+        if packet.pts is None:
+            continue
+        return packet.is_keyframe and abs(float(packet.pts * stream.time_base) - timestamp) < tolerance_s
+    return False
+
+
+def _ranges_on_keyframes(
+    video_path: Path, ranges: list[tuple[float, float]], end_timestamp: float, tolerance_s: float
+) -> bool:
+    """Whether all the ranges start and end on keyframes, or on the start or end of the video.
+
+    Only the index of the video is read, no frame is decoded.
+    """
+    import av
+
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        for timestamp in sorted({ts for time_range in ranges for ts in time_range}):
+            if timestamp < tolerance_s or abs(timestamp - end_timestamp) < tolerance_s:
+                continue
+            if not _is_keyframe_at(container, stream, timestamp, tolerance_s):
+                return False
+    return True
+
+
+def _stream_copy_video_ranges(
+    input_path: Path,
+    output_path: Path,
+    ranges: list[tuple[float, float]],
+    tolerance_s: float,
+) -> None:
+    """Keep only specified time ranges of a video file without re-encoding it.
+
+    The packets of each range are remuxed with their timestamps shifted, such that the ranges follow each other.
+    Every range must start and end on a keyframe (or the end of the video), see `_ranges_on_keyframes`.
+
+    Args:
+        input_path: Source video file path.
+        output_path: Destination video file path.
+        ranges: List of (start_time, end_time) tuples to keep, in their order in the destination video.
+        tolerance_s: Tolerance on the timestamps of the range boundaries, typically half a frame.
+    """
+    import av
+
+    with av.open(str(input_path)) as in_container:
+        v_in = in_container.streams.video[0]
+        time_base = v_in.time_base
+        with av.open(str(output_path), mode="w", format="mp4", options={"movflags": "faststart"}) as out:
+            v_out = out.add_stream_from_template(template=v_in, opaque=True)
+            v_out.time_base = time_base
+
+            out_start_ts = 0.0
+            for start_ts, end_ts in ranges:
+                in_container.seek(round(start_ts / time_base), stream=v_in, backward=True, any_frame=False)
+                offset = None
+                for packet in in_container.demux(v_in):
+                    # Skip the flushing packets of the demuxer
+                    if packet.dts is None:
+                        continue
+                    if packet.is_keyframe and packet.pts is not None:
+                        if offset is not None and float(packet.pts * time_base) > end_ts - tolerance_s:
+                            break
+                        if offset is None:
+                            offset = round(out_start_ts / time_base) - packet.pts
+                    if offset is None:
+                        continue
+                    packet.dts += offset
+                    if packet.pts is not None:
+                        packet.pts += offset
+                    packet.stream = v_out
+                    out.mux(packet)
+                out_start_ts += end_ts - start_ts
+
+
+def _edit_video_file(
+    edit: VideoFileEdit,
+    src_path: Path,
+    dst_path: Path,
+    fps: float,
+    vcodec: str,
+    pix_fmt: str,
+) -> None:
+    """Rewrite a video file as planned by `_plan_video_edits`. Runs in a worker process."""
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    if edit.method == "copy":
+        shutil.copy(src_path, dst_path)
+    elif edit.method == "stream_copy":
+        _stream_copy_video_ranges(src_path, dst_path, edit.ranges, tolerance_s=0.5 / fps)
+    else:
+        _keep_episodes_from_video_with_av(src_path, dst_path, edit.ranges, fps, vcodec, pix_fmt)
+
+
+def _run_in_processes(fn: Callable, jobs: list[tuple], num_workers: int | None, desc: str) -> None:
+    """Call `fn` on the arguments of each job, in a pool of `num_workers` processes (all the CPUs if None)."""
+    num_workers = min(num_workers or os.cpu_count() or 1, len(jobs))
+    if num_workers <= 1:
+        for job in tqdm(jobs, desc=desc):
+            fn(*job)
+        return
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(fn, *job) for job in jobs]
+        for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+            # Raises the exception of the job, if any
+            future.result()
+
+
+def _plan_video_edits(
+    src_dataset: LeRobotDataset,
+    episode_mapping: dict[int, int],
+    video_keys: list[str] | None = None,
+) -> list[VideoFileEdit]:
+    """Plan how to rewrite each video file of a dataset to keep only some episodes.
+
+    Files whose episodes are all kept are copied. Files where every kept episode starts and ends on a keyframe
+    are stream copied, which is the case of the files recorded by LeRobot since each episode is encoded on its
+    own. The other files are re-encoded. Files without any kept episode are dropped.
+
+    Args:
+        src_dataset: Source dataset.
+        episode_mapping: Mapping from the old indices of the kept episodes to their new indices.
+        video_keys: Video features to plan, all of them if None.
+
+    Returns:
+        The edit of each video file to write, sorted by video key, chunk index and file index.
+    """
+    if src_dataset.meta.episodes is None:
+        src_dataset.meta.episodes = load_episodes(src_dataset.meta.root)
+    if src_dataset.meta.video_path is None:
+        raise ValueError("Source metadata has no video_path defined")
+
+    episodes = src_dataset.meta.episodes
+    fps = src_dataset.meta.fps
+    lengths = episodes["length"]
+    edits = []
+    for video_key in video_keys if video_keys is not None else src_dataset.meta.video_keys:
+        chunk_indices = episodes[f"videos/{video_key}/chunk_index"]
+        file_indices = episodes[f"videos/{video_key}/file_index"]
+        from_timestamps = episodes[f"videos/{video_key}/from_timestamp"]
+        to_timestamps = episodes[f"videos/{video_key}/to_timestamp"]
+
+        file_to_episodes: dict[tuple[int, int], list[int]] = {}
+        for ep_idx, file_key in enumerate(zip(chunk_indices, file_indices, strict=True)):
+            file_to_episodes.setdefault(file_key, []).append(ep_idx)
+
+        for (chunk_idx, file_idx), episodes_in_file in sorted(file_to_episodes.items()):
+            kept = sorted((ep for ep in episodes_in_file if ep in episode_mapping), key=episode_mapping.get)
+            if not kept:
+                continue
+
+            src_path = src_dataset.root / src_dataset.meta.video_path.format(
+                video_key=video_key, chunk_index=chunk_idx, file_index=file_idx
+            )
+            ranges = [(from_timestamps[ep], to_timestamps[ep]) for ep in kept]
+            end_timestamp = max(to_timestamps[ep] for ep in episodes_in_file)
+            if len(kept) == len(episodes_in_file):
+                method = "copy"
+            elif _ranges_on_keyframes(src_path, ranges, end_timestamp, tolerance_s=0.5 / fps):
+                method = "stream_copy"
+            else:
+                method = "reencode"
+
+            edits.append(
+                VideoFileEdit(
+                    video_key=video_key,
+                    chunk_index=chunk_idx,
+                    file_index=file_idx,
+                    episodes=kept,
+                    ranges=ranges,
+                    method=method,
+                    size_in_mb=get_file_size_in_mb(src_path),
+                    num_frames=sum(lengths[ep] for ep in kept),
+                )
+            )
+    return edits
+
+
+def estimate_video_edits(
+    dataset: LeRobotDataset,
+    episodes_to_keep: list[int],
+    num_workers: int | None = None,
+    video_keys: list[str] | None = None,
+) -> VideoEditsEstimate:
+    """Estimate the cost of rewriting the video files of a dataset to keep only some episodes, without doing it.
+
+    The estimated time assumes the throughputs `ESTIMATED_COPY_MB_PER_S`, `ESTIMATED_STREAM_COPY_MB_PER_S` and
+    `ESTIMATED_REENCODE_FPS` per worker, which vary a lot with the storage, the CPU and the resolution.
+
+    Args:
+        dataset: The source LeRobotDataset.
+        episodes_to_keep: Indices of the episodes to keep.
+        num_workers: Number of processes rewriting video files, all the CPUs if None.
+        video_keys: Video features to rewrite, all of them if None.
+    """
+    episode_mapping = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(episodes_to_keep))}
+    edits = _plan_video_edits(dataset, episode_mapping, video_keys)
+
+    num_files = dict.fromkeys(VIDEO_EDIT_METHODS, 0)
+    size_in_mb = dict.fromkeys(VIDEO_EDIT_METHODS, 0.0)
+    durations_s = []
+    for edit in edits:
+        num_files[edit.method] += 1
+        size_in_mb[edit.method] += edit.size_in_mb
+        if edit.method == "copy":
+            durations_s.append(edit.size_in_mb / ESTIMATED_COPY_MB_PER_S)
+        elif edit.method == "stream_copy":
+            durations_s.append(edit.size_in_mb / ESTIMATED_STREAM_COPY_MB_PER_S)
+        else:
+            durations_s.append(edit.num_frames / ESTIMATED_REENCODE_FPS)
+
+    num_workers = max(min(num_workers or os.cpu_count() or 1, len(edits)), 1)
+    # Files are not split between workers, the longest file bounds the duration
+    estimated_time_s = max(sum(durations_s) / num_workers, max(durations_s, default=0.0))
+    return VideoEditsEstimate(
+        num_files=num_files,
+        size_in_mb=size_in_mb,
+        num_reencoded_frames=sum(edit.num_frames for edit in edits if edit.method == "reencode"),
+        num_workers=num_workers,
+        estimated_time_s=estimated_time_s,
+    )
+
+
 def _copy_and_reindex_videos(
     src_dataset: LeRobotDataset,
     dst_meta: LeRobotDatasetMetadata,
     episode_mapping: dict[int, int],
     vcodec: str = "libsvtav1",
     pix_fmt: str = "yuv420p",
+    num_workers: int | None = None,
 ) -> dict[int, dict]:
-    """Copy and filter video files, only re-encoding files with deleted episodes.
+    """Copy and filter video files, only decoding the files whose kept episodes are not keyframe-aligned.
 
-    For video files that only contain kept episodes, we copy them directly.
-    For files with mixed kept/deleted episodes, we use PyAV filters to efficiently
-    re-encode only the desired segments.
+    Each video file is copied, stream copied or re-encoded as planned by `_plan_video_edits`, in a pool of
+    `num_workers` processes.
 
     Args:
         src_dataset: Source dataset to copy from
         dst_meta: Destination metadata object
         episode_mapping: Mapping from old episode indices to new indices
+        num_workers: Number of processes rewriting video files, all the CPUs if None
 
     Returns:
         dict mapping episode index to its video metadata (chunk_index, file_index, timestamps)
     """
-    if src_dataset.meta.episodes is None:
-        src_dataset.meta.episodes = load_episodes(src_dataset.meta.root)
+    if dst_meta.video_path is None:
+        raise ValueError("Destination metadata has no video_path defined")
+
+    edits = _plan_video_edits(src_dataset, episode_mapping)
+    for method in VIDEO_EDIT_METHODS:
+        num_files = sum(edit.method == method for edit in edits)
+        logging.info(f"{num_files} video files to {method.replace('_', ' ')}")
+
+    jobs = [
+        (
+            edit,
+            src_dataset.root
+            / src_dataset.meta.video_path.format(
+                video_key=edit.video_key, chunk_index=edit.chunk_index, file_index=edit.file_index
+            ),
+            dst_meta.root
+            / dst_meta.video_path.format(
+                video_key=edit.video_key, chunk_index=edit.chunk_index, file_index=edit.file_index
+            ),
+            src_dataset.meta.fps,
+            vcodec,
+            pix_fmt,
+        )
+        for edit in edits
+    ]
+    _run_in_processes(_edit_video_file, jobs, num_workers, desc="Processing video files")
 
     episodes_video_metadata: dict[int, dict] = {new_idx: {} for new_idx in episode_mapping.values()}
-
-    for video_key in src_dataset.meta.video_keys:
-        logging.info(f"Processing videos for {video_key}")
-
-        if dst_meta.video_path is None:
-            raise ValueError("Destination metadata has no video_path defined")
-
-        file_to_episodes: dict[tuple[int, int], list[int]] = {}
-        for old_idx in episode_mapping:
-            src_ep = src_dataset.meta.episodes[old_idx]
-            chunk_idx = src_ep[f"videos/{video_key}/chunk_index"]
-            file_idx = src_ep[f"videos/{video_key}/file_index"]
-            file_key = (chunk_idx, file_idx)
-            if file_key not in file_to_episodes:
-                file_to_episodes[file_key] = []
-            file_to_episodes[file_key].append(old_idx)
-
-        for (src_chunk_idx, src_file_idx), episodes_in_file in tqdm(
-            sorted(file_to_episodes.items()), desc=f"Processing {video_key} video files"
-        ):
-            all_episodes_in_file = [
-                ep_idx
-                for ep_idx in range(src_dataset.meta.total_episodes)
-                if src_dataset.meta.episodes[ep_idx].get(f"videos/{video_key}/chunk_index") == src_chunk_idx
-                and src_dataset.meta.episodes[ep_idx].get(f"videos/{video_key}/file_index") == src_file_idx
-            ]
-
-            episodes_to_keep_set = set(episodes_in_file)
-            all_in_file_set = set(all_episodes_in_file)
-
-            if all_in_file_set == episodes_to_keep_set:
-                assert src_dataset.meta.video_path is not None
-                src_video_path = src_dataset.root / src_dataset.meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path = dst_meta.root / dst_meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(src_video_path, dst_video_path)
-
-                for old_idx in episodes_in_file:
-                    new_idx = episode_mapping[old_idx]
-                    src_ep = src_dataset.meta.episodes[old_idx]
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/chunk_index"] = src_chunk_idx
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/file_index"] = src_file_idx
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/from_timestamp"] = src_ep[
-                        f"videos/{video_key}/from_timestamp"
-                    ]
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/to_timestamp"] = src_ep[
-                        f"videos/{video_key}/to_timestamp"
-                    ]
+    for edit in edits:
+        prefix = f"videos/{edit.video_key}"
+        cumulative_ts = 0.0
+        for old_idx, (from_ts, to_ts) in zip(edit.episodes, edit.ranges, strict=True):
+            new_metadata = episodes_video_metadata[episode_mapping[old_idx]]
+            new_metadata[f"{prefix}/chunk_index"] = edit.chunk_index
+            new_metadata[f"{prefix}/file_index"] = edit.file_index
+            if edit.method == "copy":
+                new_metadata[f"{prefix}/from_timestamp"] = from_ts
+                new_metadata[f"{prefix}/to_timestamp"] = to_ts
             else:
-                # Build list of time ranges to keep, in sorted order.
-                sorted_keep_episodes = sorted(episodes_in_file, key=lambda x: episode_mapping[x])
-                episodes_to_keep_ranges: list[tuple[float, float]] = []
-
-                for old_idx in sorted_keep_episodes:
-                    src_ep = src_dataset.meta.episodes[old_idx]
-                    from_ts = src_ep[f"videos/{video_key}/from_timestamp"]
-                    to_ts = src_ep[f"videos/{video_key}/to_timestamp"]
-                    episodes_to_keep_ranges.append((from_ts, to_ts))
-
-                # Use PyAV filters to efficiently re-encode only the desired segments.
-                assert src_dataset.meta.video_path is not None
-                src_video_path = src_dataset.root / src_dataset.meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path = dst_meta.root / dst_meta.video_path.format(
-                    video_key=video_key, chunk_index=src_chunk_idx, file_index=src_file_idx
-                )
-                dst_video_path.parent.mkdir(parents=True, exist_ok=True)
-
-                logging.info(
-                    f"Re-encoding {video_key} (chunk {src_chunk_idx}, file {src_file_idx}) "
-                    f"with {len(episodes_to_keep_ranges)} episodes"
-                )
-                _keep_episodes_from_video_with_av(
-                    src_video_path,
-                    dst_video_path,
-                    episodes_to_keep_ranges,
-                    src_dataset.meta.fps,
-                    vcodec,
-                    pix_fmt,
-                )
-
-                cumulative_ts = 0.0
-                for old_idx in sorted_keep_episodes:
-                    new_idx = episode_mapping[old_idx]
-                    src_ep = src_dataset.meta.episodes[old_idx]
-                    ep_length = src_ep["length"]
-                    ep_duration = ep_length / src_dataset.meta.fps
-
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/chunk_index"] = src_chunk_idx
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/file_index"] = src_file_idx
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/from_timestamp"] = cumulative_ts
-                    episodes_video_metadata[new_idx][f"videos/{video_key}/to_timestamp"] = (
-                        cumulative_ts + ep_duration
-                    )
-
-                    cumulative_ts += ep_duration
+                # Stream copied ranges keep their duration, re-encoded ones have exactly `length` frames
+                if edit.method == "stream_copy":
+                    ep_duration = to_ts - from_ts
+                else:
+                    ep_duration = src_dataset.meta.episodes[old_idx]["length"] / src_dataset.meta.fps
+                new_metadata[f"{prefix}/from_timestamp"] = cumulative_ts
+                new_metadata[f"{prefix}/to_timestamp"] = cumulative_ts + ep_duration
+                cumulative_ts += ep_duration
 
     return episodes_video_metadata
 
@@ -1018,11 +1268,13 @@ def _copy_videos(
     src_dataset: LeRobotDataset,
     dst_meta: LeRobotDatasetMetadata,
     exclude_keys: list[str] | None = None,
+    num_workers: int | None = None,
 ) -> None:
-    """Copy video files, optionally excluding certain keys."""
+    """Copy video files, optionally excluding certain keys, in a pool of `num_workers` processes."""
     if exclude_keys is None:
         exclude_keys = []
 
+    jobs = []
     for video_key in src_dataset.meta.video_keys:
         if video_key in exclude_keys:
             continue
@@ -1034,10 +1286,12 @@ def _copy_videos(
             except KeyError:
                 continue
 
-        for src_path in tqdm(sorted(video_files), desc=f"Copying {video_key} videos"):
+        for src_path in sorted(video_files):
             dst_path = dst_meta.root / src_path
             dst_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(src_dataset.root / src_path, dst_path)
+            jobs.append((src_dataset.root / src_path, dst_path))
+
+    _run_in_processes(shutil.copy, jobs, num_workers, desc="Copying videos")
 
 
 def _copy_episodes_metadata_and_stats(
@@ -98,6 +98,9 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 image_transforms=image_transforms,
                 revision=cfg.dataset.revision,
                 video_backend=cfg.dataset.video_backend,
+                video_decoder_cache_size=cfg.dataset.video_decoder_cache_size,
+                video_decoder_cache_memory_mb=cfg.dataset.video_decoder_cache_memory_mb,
+                return_uint8_frames=cfg.dataset.return_uint8_frames,
             )
         else:
             dataset = StreamingLeRobotDataset(
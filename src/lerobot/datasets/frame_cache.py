@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A cache of decoded video frames, so that frames are only decoded once across training epochs.
+
+Frames are stored as uint8 tensors and looked up by `(video_path, frame_index)`. The cache has two tiers:
+    - an in-memory LRU tier, bounded by `max_memory_mb`, private to each process (e.g. DataLoader worker).
+    - an optional on-disk tier made of one uint8 `numpy.memmap` per video file, bounded by `max_disk_mb`. It
+      is shared by all processes and persists across runs, so that later epochs and later trainings read
+      frames without decoding them.
+
+Both tiers are invalidated when the modification time or the size of a video file changes.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.video_utils import get_video_duration_in_s
+
+FRAME_CACHE_DIR = ".cache/frames"  # Relative to the dataset root
+FRAMES_FILENAME = "frames.u8"
+VALID_FILENAME = "valid.u8"
+META_FILENAME = "meta.json"
+
+
+def _video_signature(video_path: str) -> tuple[int, int]:
+    stat = os.stat(video_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+class VideoFrameCache:
+    """Two-tier (RAM + on-disk memmap) cache of decoded uint8 video frames.
+
+    Args:
+        fps: Frame rate of the videos, used to convert timestamps into frame indices.
+        cache_dir: Directory of the on-disk tier. The on-disk tier is disabled if None.
+        max_memory_mb: Maximum size in MiB of the in-memory tier, per process. Least recently used frames are
+            evicted first. The in-memory tier is disabled if 0.
+        max_disk_mb: Maximum size in MiB of the on-disk tier. When spilling a new video file would exceed it,
+            the least recently used video files are removed from the on-disk tier. Unbounded if None.
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        cache_dir: str | Path | None = None,
+        max_memory_mb: float = 1024,
+        max_disk_mb: float | None = None,
+    ):
+        if max_memory_mb < 0:
+            raise ValueError(f"`max_memory_mb` must be non-negative, got {max_memory_mb}.")
+        if max_disk_mb is not None and max_disk_mb <= 0:
+            raise ValueError(f"`max_disk_mb` must be positive, got {max_disk_mb}.")
+        self.fps = fps
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_memory_mb = max_memory_mb
+        self.max_disk_mb = max_disk_mb
+        self._reset()
+
+    def _reset(self):
+        # (video_path, frame_index) -> frame, ordered from least to most recently used
+        self._frames: OrderedDict[tuple[str, int], torch.Tensor] = OrderedDict()
+        self._memory_bytes = 0
+        # video_path -> (mtime_ns, size) of the video when its frames were cached
+        self._signatures: dict[str, tuple[int, int]] = {}
+        # video_path -> (frames memmap, valid memmap), or None when the video can't be spilled to disk
+        self._disk: dict[str, tuple[np.memmap, np.memmap] | None] = {}
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getstate__(self) -> dict:
+        # Frames and memmaps are not pickled: each DataLoader worker starts with an empty in-memory tier
+        return {
+            "fps": self.fps,
+            "cache_dir": self.cache_dir,
+            "max_memory_mb": self.max_memory_mb,
+            "max_disk_mb": self.max_disk_mb,
+        }
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)
+
+    def _spill_dir(self, video_path: str) -> Path:
+        return self.cache_dir / hashlib.sha1(video_path.encode()).hexdigest()[:16]
+
+    def _check_signature(self, video_path: str):
+        """Drops the cached frames of `video_path` if the video changed since they were cached."""
+        signature = _video_signature(video_path)
+        if self._signatures.get(video_path, signature) != signature:
+            self._invalidate(video_path)
+        self._signatures[video_path] = signature
+
+    def _invalidate(self, video_path: str):
+        for key in [key for key in self._frames if key[0] == video_path]:
+            self._memory_bytes -= self._frames.pop(key).nbytes
+        self._disk.pop(video_path, None)
+        if self.cache_dir is not None:
+            shutil.rmtree(self._spill_dir(video_path), ignore_errors=True)
+
+    def _open_disk(self, video_path: str, frame_shape: tuple[int, ...] | None) -> tuple | None:
+        """Opens the memmaps of `video_path`, creating them if `frame_shape` is provided."""
+        if self.cache_dir is None:
+            return None
+        if video_path in self._disk:
+            return self._disk[video_path]
+
+        spill_dir = self._spill_dir(video_path)
+        meta_path = spill_dir / META_FILENAME
+        signature = list(self._signatures[video_path])
+        if meta_path.is_file():
+            meta = json.loads(meta_path.read_text())
+            if meta["video_path"] == video_path and meta["signature"] == signature:
+                meta_path.touch()  # Keep track of the least recently used videos
+                self._disk[video_path] = self._map(spill_dir, meta["num_frames"], meta["frame_shape"], "r+")
+                return self._disk[video_path]
+            # Stale spill of a video that has since been modified
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+        if frame_shape is None:
+            return None
+
+        num_frames = round(get_video_duration_in_s(video_path) * self.fps) + 1
+        nbytes = num_frames * (int(np.prod(frame_shape)) + 1)
+        if not self._make_disk_room(nbytes):
+            self._disk[video_path] = None
+            return None
+
+        # Write to a temporary directory first so that concurrent workers never see a partial spill
+        tmp_dir = spill_dir.with_name(f"{spill_dir.name}.{os.getpid()}.tmp")
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._map(tmp_dir, num_frames, frame_shape, "w+")
+        meta = {
+            "video_path": video_path,
+            "signature": signature,
+            "num_frames": num_frames,
+            "frame_shape": list(frame_shape),
+        }
+        (tmp_dir / META_FILENAME).write_text(json.dumps(meta))
+        try:
+            tmp_dir.rename(spill_dir)
+        except OSError:
+            # Another process created it in the meantime
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._disk[video_path] = self._map(spill_dir, num_frames, frame_shape, "r+")
+        return self._disk[video_path]
+
+    @staticmethod
+    def _map(spill_dir: Path, num_frames: int, frame_shape, mode: str) -> tuple[np.memmap, np.memmap]:
+        frames = np.memmap(
+            spill_dir / FRAMES_FILENAME, dtype=np.uint8, mode=mode, shape=(num_frames, *frame_shape)
+        )
+        valid = np.memmap(spill_dir / VALID_FILENAME, dtype=np.uint8, mode=mode, shape=(num_frames,))
+        return frames, valid
+
+    def _make_disk_room(self, nbytes: int) -> bool:
+        """Removes least recently used spilled videos until `nbytes` fit in `max_disk_mb`."""
+        if self.max_disk_mb is None:
+            return True
+        max_bytes = self.max_disk_mb * 1024**2
+        if nbytes > max_bytes:
+            return False
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        spill_dirs = [d for d in self.cache_dir.iterdir() if (d / META_FILENAME).is_file()]
+        spill_dirs.sort(key=lambda d: (d / META_FILENAME).stat().st_mtime_ns)
+        total = sum(_dir_size(d) for d in spill_dirs)
+        while spill_dirs and total + nbytes > max_bytes:
+            oldest = spill_dirs.pop(0)
+            total -= _dir_size(oldest)
+            shutil.rmtree(oldest, ignore_errors=True)
+            self._disk = {path: mm for path, mm in self._disk.items() if self._spill_dir(path) != oldest}
+        return total + nbytes <= max_bytes
+
+    def _add_to_memory(self, key: tuple[str, int], frame: torch.Tensor):
+        if frame.nbytes > self.max_memory_mb * 1024**2:
+            return
+        if key in self._frames:
+            self._frames.move_to_end(key)
+            return
+        self._frames[key] = frame
+        self._memory_bytes += frame.nbytes
+        while self._memory_bytes > self.max_memory_mb * 1024**2:
+            _, evicted = self._frames.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self._evictions += 1
+
+    def frame_indices(self, timestamps: list[float]) -> list[int]:
+        return [round(ts * self.fps) for ts in timestamps]
+
+    def get(self, video_path: str | Path, timestamps: list[float]) -> list[torch.Tensor | None]:
+        """Returns the cached uint8 frame of each timestamp, or None for the frames that need to be decoded."""
+        video_path = str(video_path)
+        self._check_signature(video_path)
+        disk = self._open_disk(video_path, frame_shape=None)
+
+        frames = []
+        for frame_index in self.frame_indices(timestamps):
+            key = (video_path, frame_index)
+            if key in self._frames:
+                self._memory_hits += 1
+                self._frames.move_to_end(key)
+                frames.append(self._frames[key])
+            elif disk is not None and frame_index < len(disk[1]) and disk[1][frame_index]:
+                self._disk_hits += 1
+                frame = torch.from_numpy(np.array(disk[0][frame_index]))
+                self._add_to_memory(key, frame)
+                frames.append(frame)
+            else:
+                self._misses += 1
+                frames.append(None)
+        return frames
+
+    def put(self, video_path: str | Path, timestamps: list[float], frames: torch.Tensor):
+        """Adds decoded frames to the cache.
+
+        Args:
+            video_path: Path to the video file the frames were decoded from.
+            timestamps: Timestamps of the frames.
+            frames: Frames as uint8, or as float in the [0, 1] range, with shape (len(timestamps), C, H, W).
+        """
+        video_path = str(video_path)
+        if frames.dtype != torch.uint8:
+            frames = (frames * 255).round().to(torch.uint8)
+        self._check_signature(video_path)
+        disk = self._open_disk(video_path, frame_shape=tuple(frames.shape[1:]))
+
+        for frame_index, frame in zip(self.frame_indices(timestamps), frames, strict=True):
+            # Clone so that cached frames don't keep the whole decoded batch alive
+            self._add_to_memory((video_path, frame_index), frame.clone())
+            if disk is not None and frame_index < len(disk[1]) and not disk[1][frame_index]:
+                disk[0][frame_index] = frame.numpy()
+                # The frame is flagged as valid only once it has been fully written
+                disk[1][frame_index] = 1
+
+    def clear(self):
+        """Empties the in-memory tier of this process and removes the on-disk tier."""
+        self._reset()
+        if self.cache_dir is not None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self) -> dict[str, int | float]:
+        """Returns hit/miss/eviction counters and the size of the in-memory tier of this process."""
+        lookups = self._memory_hits + self._disk_hits + self._misses
+        return {
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": (self._memory_hits + self._disk_hits) / lookups if lookups > 0 else 0.0,
+            "memory_mb": self._memory_bytes / 1024**2,
+        }
@@ -16,12 +16,19 @@
 import multiprocessing
 import queue
 import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.sharedctypes import Synchronized
 from pathlib import Path
+from typing import NamedTuple
 
 import numpy as np
 import PIL.Image
 import torch
 
+# Number of frames of each shape which can be queued in shared memory for the writer processes
+DEFAULT_NUM_SHARED_MEMORY_SLOTS = 64
+
 
 def safe_stop_image_writer(func):
     def wrapper(*args, **kwargs):
@@ -68,12 +75,12 @@ def image_array_to_pil_image(image_array: np.ndarray, range_check: bool = True)
     return PIL.Image.fromarray(image_array)
 
 
-def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level: int = 1):
+def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level: int = 1) -> bool:
     """
     Saves a NumPy array or PIL Image to a file.
 
     This function handles both NumPy arrays and PIL Image objects, converting
-    the former to a PIL Image before saving. It includes error handling for
+    the former (or any array-like object) to a PIL Image before saving. It includes error handling for
     the save operation.
 
     Args:
@@ -84,6 +91,9 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level
             Refer to: https://github.com/huggingface/lerobot/pull/2135
             for more details on the default value rationale.
 
+    Returns:
+        bool: Whether the image was written.
+
     Raises:
         TypeError: If the input 'image' is not a NumPy array or a
             PIL.Image.Image object.
@@ -97,33 +107,128 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path, compress_level
             img = image_array_to_pil_image(image)
         elif isinstance(image, PIL.Image.Image):
             img = image
+        elif hasattr(image, "__array__"):
+            # Array-like frames, e.g. compressed camera frames which are decoded here
+            img = image_array_to_pil_image(np.asarray(image))
         else:
             raise TypeError(f"Unsupported image type: {type(image)}")
         img.save(fpath, compress_level=compress_level)
     except Exception as e:
         print(f"Error writing image {fpath}: {e}")
+        return False
+    return True
+
+
+class SharedFrame(NamedTuple):
+    """Location of a frame in a `SharedFrameRing`, which is sent to the writer processes instead of the frame."""
+
+    shm_name: str
+    slot: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def shared_frame_view(buffer: memoryview, slot: int, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return np.ndarray(shape, dtype=dtype, buffer=buffer, offset=slot * nbytes)
+
+
+class SharedFrameRing:
+    """
+    Preallocated slots of shared memory holding frames of a given shape and dtype, e.g. the frames of a camera.
+
+    Frames are copied once in a free slot by the control loop, and only the location of the slot (`SharedFrame`)
+    is sent to the writer processes, which give the slot back once the frame is written. Free slots are reused
+    last-in first-out, so that only the slots needed to absorb the backlog of the writers are ever touched.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype, num_slots: int):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        frame_nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        self.shm = shared_memory.SharedMemory(create=True, size=max(frame_nbytes * num_slots, 1))
+        self.free_slots = list(reversed(range(num_slots)))
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
 
+    def put(self, slot: int, image: np.ndarray) -> SharedFrame:
+        np.copyto(shared_frame_view(self.shm.buf, slot, self.shape, self.dtype), image)
+        return SharedFrame(self.name, slot, self.shape, self.dtype.str)
 
-def worker_thread_loop(queue: queue.Queue):
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class SharedFrameReader:
+    """Attach the writer processes to the shared memory of the `SharedFrameRing`s, once per ring."""
+
+    def __init__(self, release_queue: queue.Queue):
+        self.release_queue = release_queue
+        self.shared_memories: dict[str, shared_memory.SharedMemory] = {}
+        self.lock = threading.Lock()
+
+    def view(self, frame: SharedFrame) -> np.ndarray:
+        with self.lock:
+            if frame.shm_name not in self.shared_memories:
+                self.shared_memories[frame.shm_name] = shared_memory.SharedMemory(name=frame.shm_name)
+            shm = self.shared_memories[frame.shm_name]
+        return shared_frame_view(shm.buf, frame.slot, frame.shape, np.dtype(frame.dtype))
+
+    def release(self, frame: SharedFrame):
+        self.release_queue.put((frame.shm_name, frame.slot))
+
+    def close(self):
+        for shm in self.shared_memories.values():
+            shm.close()
+
+
+def worker_thread_loop(
+    queue: queue.Queue,
+    num_done: Synchronized | None = None,
+    num_dropped: Synchronized | None = None,
+    reader: SharedFrameReader | None = None,
+):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
-        image_array, fpath = item
-        write_image(image_array, fpath)
+        image, fpath = item
+        if isinstance(image, SharedFrame):
+            written = write_image(reader.view(image), fpath)
+            reader.release(image)
+        else:
+            written = write_image(image, fpath)
+        if num_done is not None:
+            with num_done.get_lock():
+                num_done.value += 1
+        if not written and num_dropped is not None:
+            with num_dropped.get_lock():
+                num_dropped.value += 1
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(
+    queue: queue.Queue,
+    num_threads: int,
+    num_done: Synchronized | None = None,
+    num_dropped: Synchronized | None = None,
+    release_queue: queue.Queue | None = None,
+):
+    reader = SharedFrameReader(release_queue) if release_queue is not None else None
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, num_done, num_dropped, reader))
         t.daemon = True
         t.start()
         threads.append(t)
     for t in threads:
         t.join()
+    if reader is not None:
+        reader.close()
 
 
 class AsyncImageWriter:
@@ -139,16 +244,35 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    When `num_processes>0`, numpy frames are not pickled to the subprocesses: they are copied in `num_slots`
+    preallocated slots of shared memory per frame shape (see `SharedFrameRing`), and only the slot indices are
+    queued. When all the slots are in use, `save_image` blocks until the subprocesses free one. Set `num_slots=0`
+    to pickle frames instead. The backpressure of the writers can be monitored with `get_stats`.
     """
 
-    def __init__(self, num_processes: int = 0, num_threads: int = 1):
+    def __init__(
+        self, num_processes: int = 0, num_threads: int = 1, num_slots: int = DEFAULT_NUM_SHARED_MEMORY_SLOTS
+    ):
         self.num_processes = num_processes
         self.num_threads = num_threads
+        self.num_slots = num_slots
         self.queue = None
+        self.release_queue = None
         self.threads = []
         self.processes = []
+        self.rings: dict[tuple, SharedFrameRing] = {}
+        self._rings_by_name: dict[str, SharedFrameRing] = {}
         self._stopped = False
 
+        # Backpressure metrics
+        self.num_frames = 0
+        self.max_queue_depth = 0
+        self.num_blocked_frames = 0
+        self.blocked_time_s = 0.0
+        self._num_done = multiprocessing.Value("q", 0)
+        self._num_dropped = multiprocessing.Value("q", 0)
+
         if num_threads <= 0 and num_processes <= 0:
             raise ValueError("Number of threads and processes must be greater than zero.")
 
@@ -156,15 +280,32 @@ class AsyncImageWriter:
             # Use threading
             self.queue = queue.Queue()
             for _ in range(self.num_threads):
-                t = threading.Thread(target=worker_thread_loop, args=(self.queue,))
+                t = threading.Thread(
+                    target=worker_thread_loop, args=(self.queue, self._num_done, self._num_dropped)
+                )
                 t.daemon = True
                 t.start()
                 self.threads.append(t)
         else:
             # Use multiprocessing
             self.queue = multiprocessing.JoinableQueue()
+            self.release_queue = None
+            if self.num_slots > 0:
+                self.release_queue = multiprocessing.Queue()
+                # The subprocesses must share the resource tracker of the main process, else the shared memory
+                # they attach to is unlinked by their own resource tracker when they exit
+                resource_tracker.ensure_running()
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
+                p = multiprocessing.Process(
+                    target=worker_process,
+                    args=(
+                        self.queue,
+                        self.num_threads,
+                        self._num_done,
+                        self._num_dropped,
+                        self.release_queue,
+                    ),
+                )
                 p.daemon = True
                 p.start()
                 self.processes.append(p)
@@ -173,7 +314,70 @@ class AsyncImageWriter:
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
+        if self.release_queue is not None and isinstance(image, np.ndarray):
+            image = self._put_in_shared_memory(image)
         self.queue.put((image, fpath))
+        self.num_frames += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def _put_in_shared_memory(self, image: np.ndarray) -> SharedFrame:
+        key = (image.shape, image.dtype.str)
+        if key not in self.rings:
+            ring = SharedFrameRing(image.shape, image.dtype, self.num_slots)
+            self.rings[key] = ring
+            self._rings_by_name[ring.name] = ring
+        ring = self.rings[key]
+
+        self._release_slots(block=False)
+        if not ring.free_slots:
+            # Backpressure: wait for the writers to free a slot
+            self.num_blocked_frames += 1
+            start = time.perf_counter()
+            while not ring.free_slots:
+                self._release_slots(block=True)
+            self.blocked_time_s += time.perf_counter() - start
+        return ring.put(ring.free_slots.pop(), image)
+
+    def _release_slots(self, block: bool):
+        """Give back to their ring the slots freed by the writers. When `block`, wait until one is freed."""
+        while True:
+            try:
+                shm_name, slot = (
+                    self.release_queue.get(timeout=1.0) if block else self.release_queue.get_nowait()
+                )
+            except queue.Empty:
+                if not block:
+                    return
+                if not any(p.is_alive() for p in self.processes):
+                    raise RuntimeError(
+                        "The image writer processes stopped before writing the queued images."
+                    ) from None
+                continue
+            self._rings_by_name[shm_name].free_slots.append(slot)
+            block = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of images queued or being written."""
+        return self.num_frames - self._num_done.value
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Backpressure metrics of the writers since they were started:
+        - `queue_depth`, `max_queue_depth`: current and maximum number of images queued or being written.
+        - `num_frames`: number of images queued.
+        - `num_blocked_frames`, `blocked_time_s`: number of images for which `save_image` had to wait for a free
+          slot of shared memory, and total time spent waiting.
+        - `num_dropped_frames`: number of images which could not be written.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "num_frames": self.num_frames,
+            "num_blocked_frames": self.num_blocked_frames,
+            "blocked_time_s": self.blocked_time_s,
+            "num_dropped_frames": self._num_dropped.value,
+        }
 
     def wait_until_done(self):
         self.queue.join()
@@ -192,10 +396,18 @@ class AsyncImageWriter:
             for _ in range(num_nones):
                 self.queue.put(None)
             for p in self.processes:
+                while p.is_alive() and self.release_queue is not None:
+                    # Keep receiving the freed slots, so that the processes can flush them and exit
+                    self._release_slots(block=False)
+                    p.join(timeout=0.1)
                 p.join()
                 if p.is_alive():
                     p.terminate()
             self.queue.close()
             self.queue.join_thread()
+            if self.release_queue is not None:
+                self.release_queue.close()
+            for ring in self.rings.values():
+                ring.close()
 
         self._stopped = True
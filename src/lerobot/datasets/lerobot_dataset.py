@@ -25,7 +25,6 @@ import numpy as np
 import packaging.version
 import pandas as pd
 import PIL.Image
-import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 import torch.utils
@@ -33,13 +32,18 @@ from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.frame_cache import FRAME_CACHE_DIR, VideoFrameCache
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     DEFAULT_FEATURES,
+    DEFAULT_FRAME_INDEX_PATH,
     DEFAULT_IMAGE_PATH,
     INFO_PATH,
+    VIDEO_DIR,
+    EpisodeIndex,
     _validate_feature_names,
+    arrow_array_to_tensor,
     check_delta_timestamps,
     check_version_compatibility,
     create_empty_dataset_info,
@@ -66,9 +70,15 @@ from lerobot.datasets.utils import (
     write_tasks,
 )
 from lerobot.datasets.video_utils import (
+    DEFAULT_VIDEO_DECODER_CACHE_SIZE,
+    StreamingVideoEncoder,
+    VideoDecoderCache,
+    VideoFileAppender,
     VideoFrame,
-    concatenate_video_files,
+    VideoFrameIndex,
     decode_video_frames,
+    decode_video_frames_at_indices,
+    decode_video_frames_batch,
     encode_video_frames,
     get_safe_default_codec,
     get_video_duration_in_s,
@@ -92,8 +102,11 @@ class LeRobotDatasetMetadata:
         self.revision = revision if revision else CODEBASE_VERSION
         self.root = Path(root) if root is not None else HF_LEROBOT_HOME / repo_id
         self.writer = None
-        self.latest_episode = None
-        self.metadata_buffer: list[dict] = []
+        # Episodes recorded since the metadata were loaded, the first `_num_written_episodes` of which are
+        # written to the episodes parquet files
+        self.recorded_episodes = EpisodeIndex()
+        self._num_written_episodes = 0
+        self._num_complete_episodes = 0
         self.metadata_buffer_size = metadata_buffer_size
 
         try:
@@ -108,42 +121,56 @@ class LeRobotDatasetMetadata:
             self.pull_from_repo(allow_patterns="meta/")
             self.load_metadata()
 
-    def _flush_metadata_buffer(self) -> None:
-        """Write all buffered episode metadata to parquet file."""
-        if not hasattr(self, "metadata_buffer") or len(self.metadata_buffer) == 0:
-            return
+    def _flush_metadata_buffer(self, force: bool = False) -> None:
+        """Write the buffered episode metadata to parquet file, along with `info.json` and `stats.json`.
 
-        combined_dict = {}
-        for episode_dict in self.metadata_buffer:
-            for key, value in episode_dict.items():
-                if key not in combined_dict:
-                    combined_dict[key] = []
-                # Extract value and serialize numpy arrays
-                # because PyArrow's from_pydict function doesn't support numpy arrays
-                val = value[0] if isinstance(value, list) else value
-                combined_dict[key].append(val.tolist() if isinstance(val, np.ndarray) else val)
+        Metadata are written once `metadata_buffer_size` episodes are buffered, or whenever `force` is set.
+        Unless forced, episodes whose videos are not encoded yet (see `LeRobotDataset.batch_encoding_size`)
+        are kept in the buffer, so that each episode is written once.
+
+        `info.json` and `stats.json` are only checkpointed along with the episodes, so if the process crashes
+        before the writer is closed, the metadata of up to `metadata_buffer_size` episodes (more while videos
+        are waiting to be encoded) are lost, while the written metadata stay consistent with each other.
+        """
+        episodes = getattr(self, "recorded_episodes", None)
+        if episodes is None:
+            return
 
-        first_ep = self.metadata_buffer[0]
-        chunk_idx = first_ep["meta/episodes/chunk_index"][0]
-        file_idx = first_ep["meta/episodes/file_index"][0]
+        while self._num_complete_episodes < len(episodes) and all(
+            episodes.get(self._num_complete_episodes, f"videos/{key}/chunk_index") is not None
+            for key in self.video_keys
+        ):
+            self._num_complete_episodes += 1
+        stop = len(episodes) if force else self._num_complete_episodes
+        num_buffered = stop - self._num_written_episodes
+        if num_buffered <= 0 or (not force and num_buffered < self.metadata_buffer_size):
+            return
 
-        table = pa.Table.from_pydict(combined_dict)
+        table = episodes.to_table(self._num_written_episodes, stop)
 
         if not self.writer:
+            chunk_idx = episodes.get(self._num_written_episodes, "meta/episodes/chunk_index")
+            file_idx = episodes.get(self._num_written_episodes, "meta/episodes/file_index")
             path = Path(self.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx))
             path.parent.mkdir(parents=True, exist_ok=True)
             self.writer = pq.ParquetWriter(
                 path, schema=table.schema, compression="snappy", use_dictionary=True
             )
+        elif table.schema != self.writer.schema:
+            # Metadata of videos which were never encoded are missing
+            table = table.cast(self.writer.schema)
 
         self.writer.write_table(table)
+        self._num_written_episodes = stop
 
-        self.latest_episode = self.metadata_buffer[-1]
-        self.metadata_buffer.clear()
+        # Checkpoint the dataset info and stats, so that they are consistent with the written episodes
+        write_info(self.info, self.root)
+        if self.stats is not None:
+            write_stats(self.stats, self.root)
 
     def _close_writer(self) -> None:
         """Close and cleanup the parquet writer if it exists."""
-        self._flush_metadata_buffer()
+        self._flush_metadata_buffer(force=True)
 
         writer = getattr(self, "writer", None)
         if writer is not None:
@@ -212,6 +239,46 @@ class LeRobotDatasetMetadata:
         fpath = self.video_path.format(video_key=vid_key, chunk_index=chunk_idx, file_index=file_idx)
         return Path(fpath)
 
+    def load_video_frame_index(self, vid_key: str, chunk_idx: int, file_idx: int) -> VideoFrameIndex | None:
+        """Load the frame index of a video file, building and writing it first if missing or stale.
+
+        Frame indices are stored next to the episodes metadata, under 'meta/frame_index'. Returns None if the
+        video file is not available locally.
+        """
+        fpath_kwargs = {"video_key": vid_key, "chunk_index": chunk_idx, "file_index": file_idx}
+        video_path = self.root / self.video_path.format(**fpath_kwargs)
+        if not video_path.is_file():
+            return None
+
+        index_path = self.root / DEFAULT_FRAME_INDEX_PATH.format(**fpath_kwargs)
+        if index_path.is_file():
+            frame_index = VideoFrameIndex.from_table(pq.read_table(index_path))
+            if frame_index.video_size == video_path.stat().st_size:
+                return frame_index
+
+        frame_index = VideoFrameIndex.from_video(video_path)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(frame_index.to_table(), index_path)
+        except OSError as e:
+            logging.warning(f"Could not write the frame index of {video_path}: {e}")
+        return frame_index
+
+    def write_video_frame_indices(self) -> None:
+        """Build the missing or stale frame indices of all the video files of the dataset."""
+        if len(self.video_keys) == 0 or self.total_episodes == 0:
+            return
+        # Read the episodes from disk, as the ones in memory might not include the latest recorded episodes
+        episodes = load_episodes(self.root)
+        for vid_key in self.video_keys:
+            video_files = zip(
+                episodes[f"videos/{vid_key}/chunk_index"],
+                episodes[f"videos/{vid_key}/file_index"],
+                strict=True,
+            )
+            for chunk_idx, file_idx in sorted(set(video_files)):
+                self.load_video_frame_index(vid_key, chunk_idx, file_idx)
+
     @property
     def data_path(self) -> str:
         """Formattable string for the parquet files."""
@@ -321,44 +388,33 @@ class LeRobotDatasetMetadata:
             write_tasks(self.tasks, self.root)
 
     def _save_episode_metadata(self, episode_dict: dict) -> None:
-        """Buffer episode metadata and write to parquet in batches for efficiency.
+        """Add episode metadata to the index of recorded episodes, which is written to parquet in batches.
 
-        This function accumulates episode metadata in a buffer and flushes it when the buffer
-        reaches the configured size. This reduces I/O overhead by writing multiple episodes
-        at once instead of one row at a time.
-
-        Notes: We both need to update parquet files and HF dataset:
-        - `pandas` loads parquet file in RAM
-        - `datasets` relies on a memory mapping from pyarrow (no RAM). It either converts parquet files to a pyarrow cache on disk,
-          or loads directly from pyarrow cache.
+        The index of recorded episodes (`recorded_episodes`) is the source of truth for the episodes recorded
+        since the metadata were loaded: saving an episode doesn't read nor rewrite the metadata of the previous
+        ones. They are written to parquet every `metadata_buffer_size` episodes (see `_flush_metadata_buffer`),
+        which reduces I/O overhead by writing multiple episodes at once instead of one row at a time.
         """
-        # Convert to list format for each value
-        episode_dict = {key: [value] for key, value in episode_dict.items()}
-        num_frames = episode_dict["length"][0]
+        num_frames = episode_dict["length"]
 
-        if self.latest_episode is None:
+        if len(self.recorded_episodes) == 0:
             # Initialize indices and frame count for a new dataset made of the first episode data
             chunk_idx, file_idx = 0, 0
+            from_index = 0
             if self.episodes is not None and len(self.episodes) > 0:
                 # It means we are resuming recording, so we need to load the latest episode
                 # Update the indices to avoid overwriting the latest episode
                 chunk_idx = self.episodes[-1]["meta/episodes/chunk_index"]
                 file_idx = self.episodes[-1]["meta/episodes/file_index"]
-                latest_num_frames = self.episodes[-1]["dataset_to_index"]
-                episode_dict["dataset_from_index"] = [latest_num_frames]
-                episode_dict["dataset_to_index"] = [latest_num_frames + num_frames]
+                from_index = self.episodes[-1]["dataset_to_index"]
 
                 # When resuming, move to the next file
                 chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, self.chunks_size)
-            else:
-                episode_dict["dataset_from_index"] = [0]
-                episode_dict["dataset_to_index"] = [num_frames]
-
-            episode_dict["meta/episodes/chunk_index"] = [chunk_idx]
-            episode_dict["meta/episodes/file_index"] = [file_idx]
         else:
-            chunk_idx = self.latest_episode["meta/episodes/chunk_index"][0]
-            file_idx = self.latest_episode["meta/episodes/file_index"][0]
+            latest_episode = self.recorded_episodes[-1]
+            chunk_idx = latest_episode["meta/episodes/chunk_index"]
+            file_idx = latest_episode["meta/episodes/file_index"]
+            from_index = latest_episode["dataset_to_index"]
 
             latest_path = (
                 self.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
@@ -366,30 +422,41 @@ class LeRobotDatasetMetadata:
                 else self.writer.where
             )
 
-            if Path(latest_path).exists():
+            # Episodes whose videos are not encoded yet are written to the current file once they are
+            if Path(latest_path).exists() and self._num_complete_episodes == len(self.recorded_episodes):
                 latest_size_in_mb = get_file_size_in_mb(Path(latest_path))
-                latest_num_frames = self.latest_episode["episode_index"][0]
+                latest_num_frames = latest_episode["dataset_to_index"] - latest_episode["dataset_from_index"]
 
                 av_size_per_frame = latest_size_in_mb / latest_num_frames if latest_num_frames > 0 else 0.0
 
                 if latest_size_in_mb + av_size_per_frame * num_frames >= self.data_files_size_in_mb:
                     # Size limit is reached, flush buffer and prepare new parquet file
-                    self._flush_metadata_buffer()
                     chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, self.chunks_size)
                     self._close_writer()
 
-            # Update the existing pandas dataframe with new row
-            episode_dict["meta/episodes/chunk_index"] = [chunk_idx]
-            episode_dict["meta/episodes/file_index"] = [file_idx]
-            episode_dict["dataset_from_index"] = [self.latest_episode["dataset_to_index"][0]]
-            episode_dict["dataset_to_index"] = [self.latest_episode["dataset_to_index"][0] + num_frames]
+        episode_dict["meta/episodes/chunk_index"] = chunk_idx
+        episode_dict["meta/episodes/file_index"] = file_idx
+        episode_dict["dataset_from_index"] = from_index
+        episode_dict["dataset_to_index"] = from_index + num_frames
+        self.recorded_episodes.append(episode_dict)
 
-        # Add to buffer
-        self.metadata_buffer.append(episode_dict)
-        self.latest_episode = episode_dict
-
-        if len(self.metadata_buffer) >= self.metadata_buffer_size:
-            self._flush_metadata_buffer()
+    def get_recorded_episode(self, episode_index: int) -> dict | None:
+        """Metadata of an episode recorded since the metadata were loaded, or None for other episodes."""
+        if len(self.recorded_episodes) == 0:
+            return None
+        position = episode_index - self.recorded_episodes.get(0, "episode_index")
+        if not 0 <= position < len(self.recorded_episodes):
+            return None
+        return self.recorded_episodes[position]
+
+    def update_episode(self, episode_index: int, episode_metadata: dict) -> None:
+        """Add metadata to an episode recorded since the metadata were loaded, e.g. once its videos are
+        encoded, and write the episodes whose metadata are complete."""
+        position = episode_index - self.recorded_episodes.get(0, "episode_index")
+        if not self._num_written_episodes <= position < len(self.recorded_episodes):
+            raise ValueError(f"Metadata of episode {episode_index} can't be updated.")
+        self.recorded_episodes.update(position, episode_metadata)
+        self._flush_metadata_buffer()
 
     def save_episode(
         self,
@@ -414,15 +481,18 @@ class LeRobotDatasetMetadata:
         self.info["total_tasks"] = len(self.tasks)
         self.info["splits"] = {"train": f"0:{self.info['total_episodes']}"}
 
-        write_info(self.info, self.root)
-
         self.stats = aggregate_stats([self.stats, episode_stats]) if self.stats is not None else episode_stats
-        write_stats(self.stats, self.root)
 
-    def update_video_info(self, video_key: str | None = None) -> None:
+        # `info.json` and `stats.json` are written along with the episodes metadata
+        self._flush_metadata_buffer()
+
+    def update_video_info(self, video_key: str | None = None, video_path: Path | None = None) -> None:
         """
         Warning: this function writes info from first episode videos, implicitly assuming that all videos have
         been encoded the same way. Also, this means it assumes the first episode exists.
+
+        The video of the first episode can be given with `video_path` along with `video_key`, e.g. when the
+        first video file of the dataset is not written yet.
         """
         if video_key is not None and video_key not in self.video_keys:
             raise ValueError(f"Video key {video_key} not found in dataset")
@@ -430,7 +500,10 @@ class LeRobotDatasetMetadata:
         video_keys = [video_key] if video_key is not None else self.video_keys
         for key in video_keys:
             if not self.features[key].get("info", None):
-                video_path = self.root / self.video_path.format(video_key=key, chunk_index=0, file_index=0)
+                if video_path is None or video_key is None:
+                    video_path = self.root / self.video_path.format(
+                        video_key=key, chunk_index=0, file_index=0
+                    )
                 self.info["features"][key]["info"] = get_video_info(video_path)
 
     def update_chunk_settings(
@@ -533,8 +606,9 @@ class LeRobotDatasetMetadata:
         write_json(obj.info, obj.root / INFO_PATH)
         obj.revision = None
         obj.writer = None
-        obj.latest_episode = None
-        obj.metadata_buffer = []
+        obj.recorded_episodes = EpisodeIndex()
+        obj._num_written_episodes = 0
+        obj._num_complete_episodes = 0
         obj.metadata_buffer_size = metadata_buffer_size
         return obj
 
@@ -553,6 +627,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         download_videos: bool = True,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        streaming_encoding: bool = False,
+        video_decoder_cache_size: int | None = DEFAULT_VIDEO_DECODER_CACHE_SIZE,
+        video_decoder_cache_memory_mb: float | None = None,
+        video_frame_cache_memory_mb: float | None = None,
+        video_frame_cache_disk_mb: float | None = None,
+        return_uint8_frames: bool = False,
+        use_video_frame_index: bool = True,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -665,6 +746,33 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
             batch_encoding_size (int, optional): Number of episodes to accumulate before batch encoding videos.
                 Set to 1 for immediate encoding (default), or higher for batched encoding. Defaults to 1.
+            streaming_encoding (bool, optional): When recording, encode the frames of video features as they
+                are added with `add_frame` (see `StreamingVideoEncoder`), instead of writing them as PNG images
+                which are encoded in `save_episode`. `save_episode` then only waits for the last frames to be
+                encoded. Can't be used with `batch_encoding_size > 1`. Defaults to False.
+            video_decoder_cache_size (int | None, optional): Maximum number of video decoders (and open video
+                files) kept by the 'torchcodec' backend. Least recently used decoders are closed first. Each
+                DataLoader worker holds its own cache. Set to None for no limit. Defaults to 64.
+            video_decoder_cache_memory_mb (float | None, optional): Approximate memory budget in MiB of the
+                cached video decoders, per worker. Defaults to None (no limit).
+            video_frame_cache_memory_mb (float | None, optional): If set, decoded video frames are kept in
+                memory (as uint8, per worker) up to this size in MiB, so that frames sampled again in later
+                epochs are not decoded again. Defaults to None (no in-memory frame cache).
+            video_frame_cache_disk_mb (float | None, optional): If set, decoded video frames are also spilled
+                to uint8 memory-mapped files under 'root/.cache/frames', up to this size in MiB. They are shared
+                by all workers and persist across runs, until the video files are modified. Defaults to None
+                (no on-disk frame cache).
+            return_uint8_frames (bool, optional): Return camera frames (from videos or images) as uint8 tensors
+                in [0, 255] instead of float32 tensors in [0, 1]. This divides by 4 the size of the frames
+                sent from DataLoader workers to the training process and copied to the GPU. Frames are then
+                expected to be converted to float on the GPU, e.g. with `ImageToFloatProcessorStep`. Note that
+                `image_transforms` then receive uint8 frames. Defaults to False.
+            use_video_frame_index (bool, optional): Address video frames by their exact position in the video
+                files, using the frame index of each video file (see `VideoFrameIndex`) stored in
+                'meta/frame_index' and built if missing. Timestamps are then checked against the tolerance once
+                for the whole dataset at load time, instead of matching decoded frames with the queried
+                timestamps for every sample. Video keys whose timestamps are not in sync with their video files
+                fall back to timestamp matching. Defaults to True.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -678,15 +786,33 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.delta_indices = None
         self.batch_encoding_size = batch_encoding_size
         self.episodes_since_last_encoding = 0
+        self.streaming_encoding = streaming_encoding
+        self._check_streaming_encoding()
+        self.video_decoder_cache = VideoDecoderCache(video_decoder_cache_size, video_decoder_cache_memory_mb)
+        self.video_frame_cache = None
+        self.return_uint8_frames = return_uint8_frames
+
+        # Exact video frame addressing (see `_build_video_frame_lookup`)
+        self._video_frame_indices: dict[str, VideoFrameIndex] = {}
+        self._video_frame_starts: dict[str, np.ndarray] = {}
+
+        # Lazily built numpy lookup tables used to resolve delta windows (see `_get_query_indices`)
+        self._episode_index_table = None
+        self._delta_offsets = None
 
         # Unused attributes
         self.image_writer = None
+        self._video_encoders: dict[str, StreamingVideoEncoder] = {}
+        self._video_appenders: dict[str, VideoFileAppender] = {}
         self.episode_buffer = None
         self.writer = None
         self.latest_episode = None
         self._current_file_start_frame = None  # Track the starting frame index of the current parquet file
 
         self.root.mkdir(exist_ok=True, parents=True)
+        if (self.root / VIDEO_DIR).is_dir():
+            # Restore the video files left open by a crashed recording session, before they are read or resumed
+            VideoFileAppender.recover_partial_files(self.root / VIDEO_DIR)
 
         # Load metadata
         self.meta = LeRobotDatasetMetadata(
@@ -717,6 +843,20 @@ class LeRobotDataset(torch.utils.data.Dataset):
             check_delta_timestamps(self.delta_timestamps, self.fps, self.tolerance_s)
             self.delta_indices = get_delta_indices(self.delta_timestamps, self.fps)
 
+        if use_video_frame_index and len(self.meta.video_keys) > 0:
+            self._build_video_frame_lookup()
+
+        # Setup the decoded frames cache
+        if len(self.meta.video_keys) > 0 and (
+            video_frame_cache_memory_mb is not None or video_frame_cache_disk_mb is not None
+        ):
+            self.video_frame_cache = VideoFrameCache(
+                self.fps,
+                cache_dir=self.root / FRAME_CACHE_DIR if video_frame_cache_disk_mb is not None else None,
+                max_memory_mb=video_frame_cache_memory_mb or 0,
+                max_disk_mb=video_frame_cache_disk_mb,
+            )
+
     def _close_writer(self) -> None:
         """Close and cleanup the parquet writer if it exists."""
         writer = getattr(self, "writer", None)
@@ -729,6 +869,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Trust the user to call .finalize() but as an added safety check call the parquet writer to stop when calling the destructor
         """
         self._close_writer()
+        self._close_video_appenders()
 
     def push_to_hub(
         self,
@@ -742,7 +883,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         upload_large_folder: bool = False,
         **card_kwargs,
     ) -> None:
-        ignore_patterns = ["images/"]
+        ignore_patterns = ["images/", f"{FRAME_CACHE_DIR}/"]
         if not push_videos:
             ignore_patterns.append("videos/")
 
@@ -908,45 +1049,164 @@ class LeRobotDataset(torch.utils.data.Dataset):
         else:
             return get_hf_features_from_features(self.features)
 
-    def _get_query_indices(self, idx: int, ep_idx: int) -> tuple[dict[str, list[int | bool]]]:
-        ep = self.meta.episodes[ep_idx]
-        ep_start = ep["dataset_from_index"]
-        ep_end = ep["dataset_to_index"]
-        query_indices = {
-            key: [max(ep_start, min(ep_end - 1, idx + delta)) for delta in delta_idx]
-            for key, delta_idx in self.delta_indices.items()
-        }
-        padding = {  # Pad values outside of current episode range
-            f"{key}_is_pad": torch.BoolTensor(
-                [(idx + delta < ep_start) | (idx + delta >= ep_end) for delta in delta_idx]
+    def _get_episode_index_table(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per-episode `dataset_from_index` and `dataset_to_index` as numpy arrays indexed by episode_index.
+
+        The table is rebuilt whenever the number of episodes in the metadata changes (e.g. while recording).
+        """
+        num_episodes = len(self.meta.episodes)
+        if self._episode_index_table is None or len(self._episode_index_table[0]) != num_episodes:
+            episodes = self.meta.episodes.data
+            self._episode_index_table = (
+                episodes.column("dataset_from_index").to_numpy().astype(np.int64),
+                episodes.column("dataset_to_index").to_numpy().astype(np.int64),
             )
-            for key, delta_idx in self.delta_indices.items()
-        }
+        return self._episode_index_table
+
+    def _build_video_frame_lookup(self) -> None:
+        """Map every frame of the dataset to its exact position in its video files.
+
+        The frame index of each video file is loaded (or built), and the position of the first frame of each
+        episode is found from its `from_timestamp`. The timestamps of all the frames are then checked at once
+        against the presentation timestamps of the video frames they map to, so that samples can later be
+        decoded by position without any per-sample timestamp matching.
+        """
+        if len(self.hf_dataset) == 0:
+            return
+        episodes = self.meta.episodes.data
+        ep_from, _ = self._get_episode_index_table()
+        all_rows = np.arange(len(self.hf_dataset))
+        row_index = self._gather_hf_column("index", all_rows).numpy()
+        row_ep = self._gather_hf_column("episode_index", all_rows).numpy()
+        row_ts = self._gather_hf_column("timestamp", all_rows).numpy().astype(np.float64)
+        row_offset = row_index - ep_from[row_ep]
+
+        for vid_key in self.meta.video_keys:
+            chunk_indices = episodes.column(f"videos/{vid_key}/chunk_index").to_numpy()
+            file_indices = episodes.column(f"videos/{vid_key}/file_index").to_numpy()
+            from_timestamps = episodes.column(f"videos/{vid_key}/from_timestamp").to_numpy()
+            starts = np.full(len(from_timestamps), -1, dtype=np.int64)
+            frame_indices = {}
+            in_sync = True
+
+            # Group the rows by video file
+            file_keys = chunk_indices.astype(np.int64) * (file_indices.max() + 1) + file_indices
+            order = np.argsort(file_keys[row_ep], kind="stable")
+            unique_keys, group_starts = np.unique(file_keys[row_ep][order], return_index=True)
+            for rows, file_key in zip(np.split(order, group_starts[1:]), unique_keys, strict=True):
+                file_eps = np.flatnonzero(file_keys == file_key)
+                chunk_idx, file_idx = int(chunk_indices[file_eps[0]]), int(file_indices[file_eps[0]])
+                frame_index = self.meta.load_video_frame_index(vid_key, chunk_idx, file_idx)
+                if frame_index is None:
+                    in_sync = False
+                    break
+                video_ts = frame_index.timestamps
+                starts[file_eps] = np.searchsorted(video_ts, from_timestamps[file_eps] - self.tolerance_s)
+
+                positions = starts[row_ep[rows]] + row_offset[rows]
+                if positions.max() >= len(video_ts):
+                    in_sync = False
+                    break
+                expected_ts = from_timestamps[row_ep[rows]] + row_ts[rows]
+                if not (np.abs(video_ts[positions] - expected_ts) < self.tolerance_s).all():
+                    in_sync = False
+                    break
+                video_path = self.root / self.meta.video_path.format(
+                    video_key=vid_key, chunk_index=chunk_idx, file_index=file_idx
+                )
+                frame_indices[str(video_path)] = frame_index
+
+            if in_sync:
+                self._video_frame_starts[vid_key] = starts
+                self._video_frame_indices.update(frame_indices)
+            else:
+                logging.warning(
+                    f"The frames of '{vid_key}' can't be mapped to exact positions in the video files (video "
+                    "files are missing or timestamps are out of sync). Falling back to timestamp matching."
+                )
+
+    def _get_video_frame_positions(
+        self,
+        idx: int | np.ndarray,
+        ep_idx: int | np.ndarray,
+        query_indices: dict[str, np.ndarray] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Positions of the queried frames in their video files, for the video keys with a frame index.
+
+        Returns positions of shape `(num_timestamps,)` or `(batch_size, num_timestamps)` like `_get_query_indices`.
+        """
+        ep_from, _ = self._get_episode_index_table()
+        positions = {}
+        for key, starts in self._video_frame_starts.items():
+            if query_indices is not None and key in query_indices:
+                q_idx = query_indices[key]
+            else:
+                q_idx = np.asarray(idx)[..., None]
+            positions[key] = np.asarray(starts[ep_idx] - ep_from[ep_idx])[..., None] + q_idx
+        return positions
+
+    def _get_query_indices(
+        self, idx: int | np.ndarray, ep_idx: int | np.ndarray
+    ) -> tuple[dict[str, np.ndarray], dict[str, torch.Tensor]]:
+        """Resolve the delta window of each key for one sample (scalars) or a batch of samples (1D arrays).
+
+        Returns indices of shape `(num_deltas,)` or `(batch_size, num_deltas)` clamped to the episode range,
+        along with boolean padding masks of the same shape flagging the clamped positions.
+        """
+        if self._delta_offsets is None:
+            self._delta_offsets = {
+                key: np.asarray(delta_idx, dtype=np.int64) for key, delta_idx in self.delta_indices.items()
+            }
+        ep_from_index, ep_to_index = self._get_episode_index_table()
+        ep_start = ep_from_index[ep_idx][..., None]
+        ep_end = ep_to_index[ep_idx][..., None]
+        idx = np.asarray(idx, dtype=np.int64)[..., None]
+
+        query_indices = {}
+        padding = {}
+        for key, offsets in self._delta_offsets.items():
+            abs_indices = idx + offsets
+            query_indices[key] = np.clip(abs_indices, ep_start, ep_end - 1)
+            # Pad values outside of current episode range
+            padding[f"{key}_is_pad"] = torch.from_numpy((abs_indices < ep_start) | (abs_indices >= ep_end))
         return query_indices, padding
 
     def _get_query_timestamps(
         self,
         current_ts: float,
-        query_indices: dict[str, list[int]] | None = None,
+        query_indices: dict[str, np.ndarray] | None = None,
     ) -> dict[str, list[float]]:
         query_timestamps = {}
         for key in self.meta.video_keys:
+            if key in self._video_frame_starts:
+                continue
             if query_indices is not None and key in query_indices:
-                timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
-                query_timestamps[key] = torch.stack(timestamps).tolist()
+                timestamps = self._gather_hf_column("timestamp", query_indices[key])
+                query_timestamps[key] = timestamps.tolist()
             else:
                 query_timestamps[key] = [current_ts]
 
         return query_timestamps
 
-    def _query_hf_dataset(self, query_indices: dict[str, list[int]]) -> dict:
+    def _gather_hf_column(self, key: str, indices: np.ndarray) -> torch.Tensor:
+        """Gather the rows of a single column with one Arrow `take`, preserving the shape of `indices`."""
+        flat_indices = indices.reshape(-1)
+        if self.hf_dataset._indices is not None:
+            # Map through the indices mapping of a `select`/`filter`-ed dataset
+            flat_indices = self.hf_dataset._indices.column(0).take(flat_indices).to_numpy()
+        column = self.hf_dataset.data.column(key).take(flat_indices)
+        values = arrow_array_to_tensor(column)
+        return values.reshape(*indices.shape, *values.shape[1:])
+
+    def _query_hf_dataset(self, query_indices: dict[str, np.ndarray]) -> dict:
         """
         Query dataset for indices across keys, skipping video keys.
 
-        Tries column-first [key][indices] for speed, falls back to row-first.
+        Numeric columns are gathered column-first with a single Arrow `take` per key. Image columns, which
+        need to be decoded, fall back to the formatted row-first access.
 
         Args:
-            query_indices: Dict mapping keys to index lists to retrieve
+            query_indices: Dict mapping keys to index arrays to retrieve
 
         Returns:
             Dict with stacked tensors of queried data (video keys excluded)
@@ -955,17 +1215,87 @@ class LeRobotDataset(torch.utils.data.Dataset):
         for key, q_idx in query_indices.items():
             if key in self.meta.video_keys:
                 continue
-            try:
-                result[key] = torch.stack(self.hf_dataset[key][q_idx])
-            except (KeyError, TypeError, IndexError):
-                result[key] = torch.stack(self.hf_dataset[q_idx][key])
+            if key in self.meta.image_keys:
+                flat_idx = q_idx.reshape(-1).tolist()
+                try:
+                    frames = torch.stack(self.hf_dataset[key][flat_idx])
+                except (KeyError, TypeError, IndexError):
+                    frames = torch.stack(self.hf_dataset[flat_idx][key])
+                result[key] = frames.reshape(*q_idx.shape, *frames.shape[1:])
+            else:
+                result[key] = self._gather_hf_column(key, q_idx)
         return result
 
-    def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict[str, torch.Tensor]:
+    def _decode_video_frames(
+        self,
+        video_path: Path,
+        timestamps: list[float] | None = None,
+        batched: bool = False,
+        positions: list[int] | None = None,
+    ) -> torch.Tensor:
+        """Decodes the frames of `video_path` at `timestamps`, reading them from `video_frame_cache` if possible.
+
+        With `batched=True`, timestamps can be spread over the whole video (see `decode_video_frames_batch`).
+        Frames can also be addressed by their exact `positions` in a video with a frame index (see
+        `_build_video_frame_lookup`), in which case `timestamps` are not needed.
+        """
+        frame_index = None
+        if positions is not None:
+            frame_index = self._video_frame_indices[str(video_path)]
+            timestamps = frame_index.timestamps[positions].tolist()
+
+        def decode(query: list[int], return_uint8: bool) -> torch.Tensor:
+            # `query` are positions into `timestamps` (and `positions`)
+            if frame_index is not None:
+                return decode_video_frames_at_indices(
+                    video_path,
+                    [positions[i] for i in query],
+                    frame_index,
+                    self.video_backend,
+                    decoder_cache=self.video_decoder_cache,
+                    return_uint8=return_uint8,
+                )
+            # Cache misses can be anywhere in the video, hence the batched decoding
+            decode_fn = (
+                decode_video_frames_batch if batched or len(query) < len(timestamps) else decode_video_frames
+            )
+            return decode_fn(
+                video_path,
+                [timestamps[i] for i in query],
+                self.tolerance_s,
+                self.video_backend,
+                decoder_cache=self.video_decoder_cache,
+                return_uint8=return_uint8,
+            )
+
+        if self.video_frame_cache is None:
+            return decode(list(range(len(timestamps))), self.return_uint8_frames)
+
+        cached = self.video_frame_cache.get(video_path, timestamps)
+        missing = [pos for pos, frame in enumerate(cached) if frame is None]
+        if len(missing) > 0:
+            missing_ts = [timestamps[pos] for pos in missing]
+            decoded = decode(missing, return_uint8=True)
+            self.video_frame_cache.put(video_path, missing_ts, decoded)
+            for pos, frame in zip(missing, decoded, strict=True):
+                cached[pos] = frame
+        frames = torch.stack(cached)
+        # convert to the pytorch format which is float32 in [0,1] range (and channel first)
+        return frames if self.return_uint8_frames else frames.type(torch.float32) / 255
+
+    def _query_videos(
+        self,
+        query_timestamps: dict[str, list[float]],
+        ep_idx: int,
+        query_positions: dict[str, np.ndarray] | None = None,
+    ) -> dict[str, torch.Tensor]:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
+
+        Frames of the video keys in `query_positions` are addressed by their position in the video file (see
+        `_get_video_frame_positions`) instead of by timestamp.
         """
         ep = self.meta.episodes[ep_idx]
         item = {}
@@ -977,11 +1307,60 @@ class LeRobotDataset(torch.utils.data.Dataset):
             shifted_query_ts = [from_timestamp + ts for ts in query_ts]
 
             video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self.tolerance_s, self.video_backend)
+            frames = self._decode_video_frames(video_path, shifted_query_ts)
+            item[vid_key] = frames.squeeze(0)
+
+        for vid_key, positions in (query_positions or {}).items():
+            video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+            frames = self._decode_video_frames(video_path, positions=positions.tolist())
             item[vid_key] = frames.squeeze(0)
 
         return item
 
+    def _query_videos_batch(
+        self,
+        query_timestamps: dict[str, torch.Tensor],
+        ep_indices: np.ndarray,
+        query_positions: dict[str, np.ndarray] | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Batched counterpart of `_query_videos`.
+
+        `query_timestamps` maps each video key to episode-relative timestamps of shape
+        `(batch_size, num_timestamps)`, and `query_positions` to positions in the video files of the same shape.
+        Samples whose frames live in the same video file are decoded together with a single call per
+        (camera, video file), which only decodes each keyframe-aligned range once, then frames are distributed
+        back to their samples.
+        """
+        unique_episodes = {int(ep_idx): self.meta.episodes[int(ep_idx)] for ep_idx in np.unique(ep_indices)}
+        queries = {}
+        for vid_key, query_ts in query_timestamps.items():
+            from_timestamps = torch.tensor(
+                [unique_episodes[int(ep_idx)][f"videos/{vid_key}/from_timestamp"] for ep_idx in ep_indices]
+            )
+            queries[vid_key] = ("timestamps", from_timestamps[:, None] + query_ts)
+        for vid_key, positions in (query_positions or {}).items():
+            queries[vid_key] = ("positions", positions)
+
+        item = {}
+        for vid_key, (query_type, query) in queries.items():
+            batch_size, num_ts = query.shape
+            groups: dict[Path, list[int]] = {}
+            for sample_idx, ep_idx in enumerate(ep_indices):
+                video_path = self.root / self.meta.get_video_file_path(int(ep_idx), vid_key)
+                groups.setdefault(video_path, []).append(sample_idx)
+
+            frames = None
+            for video_path, sample_indices in groups.items():
+                group_query = query[sample_indices].reshape(-1).tolist()
+                decoded = self._decode_video_frames(video_path, batched=True, **{query_type: group_query})
+                if frames is None:
+                    frames = torch.empty((batch_size, num_ts, *decoded.shape[1:]), dtype=decoded.dtype)
+                frames[sample_indices] = decoded.reshape(len(sample_indices), num_ts, *decoded.shape[1:])
+
+            item[vid_key] = frames.squeeze(1) if num_ts == 1 else frames
+
+        return item
+
     def _ensure_hf_dataset_loaded(self):
         """Lazy load the HF dataset only when needed for reading."""
         if self._lazy_loading or self.hf_dataset is None:
@@ -989,12 +1368,19 @@ class LeRobotDataset(torch.utils.data.Dataset):
             if self.writer is not None:
                 self._close_writer()
                 self._writer_closed_for_reading = True
+            # Same for the video files being appended to
+            self._close_video_appenders()
             self.hf_dataset = self.load_hf_dataset()
             self._lazy_loading = False
 
     def __len__(self):
         return self.num_frames
 
+    def _images_to_uint8(self, item: dict):
+        """Converts in place the (non-video) image frames, decoded as float32 in [0, 1], to uint8."""
+        for key in self.meta.image_keys:
+            item[key] = (item[key] * 255).round_().to(torch.uint8)
+
     def __getitem__(self, idx) -> dict:
         # Ensure dataset is loaded when we actually need to read from it
         self._ensure_hf_dataset_loaded()
@@ -1012,9 +1398,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         if len(self.meta.video_keys) > 0:
             current_ts = item["timestamp"].item()
             query_timestamps = self._get_query_timestamps(current_ts, query_indices)
-            video_frames = self._query_videos(query_timestamps, ep_idx)
+            query_positions = self._get_video_frame_positions(item["index"].item(), ep_idx, query_indices)
+            video_frames = self._query_videos(query_timestamps, ep_idx, query_positions)
             item = {**video_frames, **item}
 
+        if self.return_uint8_frames:
+            self._images_to_uint8(item)
+
         if self.image_transforms is not None:
             image_keys = self.meta.camera_keys
             for cam in image_keys:
@@ -1025,6 +1415,51 @@ class LeRobotDataset(torch.utils.data.Dataset):
         item["task"] = self.meta.tasks.iloc[task_idx].name
         return item
 
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Fetch a list of samples at once, as used by `torch.utils.data.DataLoader` for a whole batch.
+
+        Data columns are gathered with one columnar Arrow access per key for the whole batch, delta windows
+        and padding masks are resolved in a single vectorized pass and video frames are decoded once per
+        (camera, video file). The returned samples are identical to the ones returned by `__getitem__`.
+        """
+        self._ensure_hf_dataset_loaded()
+        indices = np.asarray(indices, dtype=np.int64)
+        batch = self._query_hf_dataset(dict.fromkeys(self.hf_features, indices))
+        ep_indices = batch["episode_index"].numpy()
+
+        query_indices = None
+        if self.delta_indices is not None:
+            query_indices, padding = self._get_query_indices(indices, ep_indices)
+            batch.update(self._query_hf_dataset(query_indices))
+            batch.update(padding)
+
+        if len(self.meta.video_keys) > 0:
+            query_timestamps = {}
+            for key in self.meta.video_keys:
+                if key in self._video_frame_starts:
+                    continue
+                if query_indices is not None and key in query_indices:
+                    query_timestamps[key] = self._gather_hf_column("timestamp", query_indices[key])
+                else:
+                    query_timestamps[key] = batch["timestamp"][:, None]
+            query_positions = self._get_video_frame_positions(
+                batch["index"].numpy(), ep_indices, query_indices
+            )
+            batch.update(self._query_videos_batch(query_timestamps, ep_indices, query_positions))
+
+        if self.return_uint8_frames:
+            self._images_to_uint8(batch)
+
+        items = [{key: values[i] for key, values in batch.items()} for i in range(len(indices))]
+        for item in items:
+            if self.image_transforms is not None:
+                for cam in self.meta.camera_keys:
+                    item[cam] = self.image_transforms(item[cam])
+
+            # Add task as a string
+            item["task"] = self.meta.tasks.iloc[item["task_index"].item()].name
+        return items
+
     def __repr__(self):
         feature_keys = list(self.features)
         return (
@@ -1042,7 +1477,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         The dataset won't be valid and can't be loaded as ds = LeRobotDataset(repo_id=repo, root=HF_LEROBOT_HOME.joinpath(repo))
         """
         self._close_writer()
+        self._close_video_appenders()
         self.meta._close_writer()
+        self.meta.write_video_frame_indices()
 
     def create_episode_buffer(self, episode_index: int | None = None) -> dict:
         current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
@@ -1074,8 +1511,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def add_frame(self, frame: dict) -> None:
         """
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
-        temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
-        then needs to be called.
+        temporary directory, or encoded on the fly when `streaming_encoding` is enabled — nothing is written to
+        disk. To save those frames, the 'save_episode()' method then needs to be called.
         """
         # Convert torch to numpy if needed
         for name in frame:
@@ -1101,7 +1538,11 @@ class LeRobotDataset(torch.utils.data.Dataset):
                     f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
                 )
 
-            if self.features[key]["dtype"] in ["image", "video"]:
+            if self.features[key]["dtype"] == "video" and self.streaming_encoding:
+                if frame_index == 0:
+                    self._start_video_encoder(key, self.episode_buffer["episode_index"])
+                self._video_encoders[key].add_frame(frame[key])
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
@@ -1114,7 +1555,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         self.episode_buffer["size"] += 1
 
-    def save_episode(self, episode_data: dict | None = None) -> None:
+    def save_episode(self, episode_data: dict | None = None, episode_metadata: dict | None = None) -> None:
         """
         This will save to disk the current episode in self.episode_buffer.
 
@@ -1126,6 +1567,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
             episode_data (dict | None, optional): Dict containing the episode data to save. If None, this will
                 save the current episode in self.episode_buffer, which is filled with 'add_frame'. Defaults to
                 None.
+            episode_metadata (dict | None, optional): Additional metadata of the episode, e.g. timings of the
+                recording loop, stored in the episodes metadata. Keys must be the same for all the episodes.
+                Defaults to None.
         """
         episode_buffer = episode_data if episode_data is not None else self.episode_buffer
 
@@ -1155,6 +1599,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         # Wait for image writer to end, so that episode stats over images can be computed
         self._wait_image_writer()
+        # Wait for streaming encoders to end, and compute episode stats over their sampled frames
+        encoded_videos = {}
+        for video_key, encoder in self._video_encoders.items():
+            encoded_videos[video_key] = encoder.finish()
+            episode_buffer[video_key] = encoder.sample_frames()
+        self._video_encoders = {}
         ep_stats = compute_episode_stats(episode_buffer, self.features)
 
         ep_metadata = self._save_episode_data(episode_buffer)
@@ -1163,7 +1613,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         if has_video_keys and not use_batched_encoding:
             for video_key in self.meta.video_keys:
-                ep_metadata.update(self._save_episode_video(video_key, episode_index))
+                ep_metadata.update(
+                    self._save_episode_video(video_key, episode_index, encoded_videos.get(video_key))
+                )
+
+        if episode_metadata is not None:
+            ep_metadata.update(episode_metadata)
 
         # `meta.save_episode` need to be executed after encoding the videos
         self.meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
@@ -1196,43 +1651,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
             f"Batch encoding {self.batch_encoding_size} videos for episodes {start_episode} to {end_episode - 1}"
         )
 
-        chunk_idx = self.meta.episodes[start_episode]["data/chunk_index"]
-        file_idx = self.meta.episodes[start_episode]["data/file_index"]
-        episode_df_path = self.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        episode_df = pd.read_parquet(episode_df_path)
-
         for ep_idx in range(start_episode, end_episode):
             logging.info(f"Encoding videos for episode {ep_idx}")
 
-            if (
-                self.meta.episodes[ep_idx]["data/chunk_index"] != chunk_idx
-                or self.meta.episodes[ep_idx]["data/file_index"] != file_idx
-            ):
-                # The current episode is in a new chunk or file.
-                # Save previous episode dataframe and update the Hugging Face dataset by reloading it.
-                episode_df.to_parquet(episode_df_path)
-                self.meta.episodes = load_episodes(self.root)
-
-                # Load new episode dataframe
-                chunk_idx = self.meta.episodes[ep_idx]["data/chunk_index"]
-                file_idx = self.meta.episodes[ep_idx]["data/file_index"]
-                episode_df_path = self.root / DEFAULT_EPISODES_PATH.format(
-                    chunk_index=chunk_idx, file_index=file_idx
-                )
-                episode_df = pd.read_parquet(episode_df_path)
-
-            # Save the current episode's video metadata to the dataframe
+            # Save the current episode's video metadata to the episodes metadata, which are written once
+            # complete (see `LeRobotDatasetMetadata.update_episode`)
             video_ep_metadata = {}
             for video_key in self.meta.video_keys:
                 video_ep_metadata.update(self._save_episode_video(video_key, ep_idx))
             video_ep_metadata.pop("episode_index")
-            video_ep_df = pd.DataFrame(video_ep_metadata, index=[ep_idx]).convert_dtypes(
-                dtype_backend="pyarrow"
-            )  # allows NaN values along with integers
-
-            episode_df = episode_df.combine_first(video_ep_df)
-            episode_df.to_parquet(episode_df_path)
-            self.meta.episodes = load_episodes(self.root)
+            self.meta.update_episode(ep_idx, video_ep_metadata)
 
     def _save_episode_data(self, episode_buffer: dict) -> dict:
         """Save episode data to a parquet file and update the Hugging Face dataset of frames data.
@@ -1328,17 +1756,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         return metadata
 
-    def _save_episode_video(self, video_key: str, episode_index: int) -> dict:
-        # Encode episode frames into a temporary video
-        ep_path = self._encode_temporary_episode_video(video_key, episode_index)
+    def _save_episode_video(self, video_key: str, episode_index: int, ep_path: Path | None = None) -> dict:
+        # Encode episode frames into a temporary video, unless it was already encoded while recording
+        if ep_path is None:
+            ep_path = self._encode_temporary_episode_video(video_key, episode_index)
         ep_size_in_mb = get_file_size_in_mb(ep_path)
         ep_duration_in_s = get_video_duration_in_s(ep_path)
 
-        if (
-            episode_index == 0
-            or self.meta.latest_episode is None
-            or f"videos/{video_key}/chunk_index" not in self.meta.latest_episode
-        ):
+        # The previous episode is the latest one in the video files, unless it was recorded in a previous session
+        latest_ep = self.meta.get_recorded_episode(episode_index - 1)
+        if latest_ep is None or latest_ep.get(f"videos/{video_key}/chunk_index") is None:
             # Initialize indices for a new dataset made of the first episode data
             chunk_idx, file_idx = 0, 0
             if self.meta.episodes is not None and len(self.meta.episodes) > 0:
@@ -1353,44 +1780,42 @@ class LeRobotDataset(torch.utils.data.Dataset):
             new_path = self.root / self.meta.video_path.format(
                 video_key=video_key, chunk_index=chunk_idx, file_index=file_idx
             )
-            new_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(ep_path), str(new_path))
+            self._append_episode_video(video_key, new_path, ep_path, latest_duration_in_s)
         else:
             # Retrieve information from the latest updated video file using latest_episode
-            latest_ep = self.meta.latest_episode
-            chunk_idx = latest_ep[f"videos/{video_key}/chunk_index"][0]
-            file_idx = latest_ep[f"videos/{video_key}/file_index"][0]
+            chunk_idx = latest_ep[f"videos/{video_key}/chunk_index"]
+            file_idx = latest_ep[f"videos/{video_key}/file_index"]
 
             latest_path = self.root / self.meta.video_path.format(
                 video_key=video_key, chunk_index=chunk_idx, file_index=file_idx
             )
-            latest_size_in_mb = get_file_size_in_mb(latest_path)
-            latest_duration_in_s = latest_ep[f"videos/{video_key}/to_timestamp"][0]
+            appender = self._video_appenders.get(video_key)
+            if appender is not None and appender.video_path == latest_path:
+                latest_size_in_mb = appender.size_in_mb
+            else:
+                latest_size_in_mb = get_file_size_in_mb(latest_path)
+            latest_duration_in_s = latest_ep[f"videos/{video_key}/to_timestamp"]
 
             if latest_size_in_mb + ep_size_in_mb >= self.meta.video_files_size_in_mb:
-                # Move temporary episode video to a new video file in the dataset
+                # Start a new video file in the dataset with the temporary episode video
                 chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, self.meta.chunks_size)
                 new_path = self.root / self.meta.video_path.format(
                     video_key=video_key, chunk_index=chunk_idx, file_index=file_idx
                 )
-                new_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(ep_path), str(new_path))
                 latest_duration_in_s = 0.0
+                self._append_episode_video(video_key, new_path, ep_path, latest_duration_in_s)
             else:
                 # Update latest video file
-                concatenate_video_files(
-                    [latest_path, ep_path],
-                    latest_path,
-                )
-
-        # Remove temporary directory
-        shutil.rmtree(str(ep_path.parent))
+                self._append_episode_video(video_key, latest_path, ep_path, latest_duration_in_s)
 
         # Update video info (only needed when first episode is encoded since it reads from episode 0)
         if episode_index == 0:
-            self.meta.update_video_info(video_key)
+            self.meta.update_video_info(video_key, ep_path)
             write_info(self.meta.info, self.meta.root)  # ensure video info always written properly
 
+        # Remove temporary directory
+        shutil.rmtree(str(ep_path.parent))
+
         metadata = {
             "episode_index": episode_index,
             f"videos/{video_key}/chunk_index": chunk_idx,
@@ -1400,7 +1825,36 @@ class LeRobotDataset(torch.utils.data.Dataset):
         }
         return metadata
 
+    def _append_episode_video(
+        self, video_key: str, video_path: Path, ep_path: Path, from_timestamp: float
+    ) -> None:
+        """Append the video of an episode to a video file of the dataset, which is kept open until the next
+        video file is started or the dataset is finalized (see `VideoFileAppender`). If recording is interrupted
+        before, the file is restored from its `.partial` file when the dataset is loaded again."""
+        appender = self._video_appenders.get(video_key)
+        if appender is None or appender.video_path != video_path:
+            if appender is not None:
+                appender.close()
+            appender = VideoFileAppender(video_path)
+            self._video_appenders[video_key] = appender
+            if from_timestamp > 0:
+                # The video file was already closed (e.g. to be read), its content is copied once
+                appender.append(video_path, 0.0)
+        appender.append(ep_path, from_timestamp)
+
+    def _close_video_appenders(self) -> None:
+        """Close the video files being appended to, so that they can be read."""
+        for appender in getattr(self, "_video_appenders", {}).values():
+            appender.close()
+        self._video_appenders = {}
+
     def clear_episode_buffer(self, delete_images: bool = True) -> None:
+        # Discard the videos being encoded for the current episode buffer
+        for encoder in self._video_encoders.values():
+            encoder.cancel()
+            shutil.rmtree(encoder.video_path.parent, ignore_errors=True)
+        self._video_encoders = {}
+
         # Clean up image files for the current episode buffer
         if delete_images:
             # Wait for the async image writer to finish
@@ -1442,6 +1896,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
         if self.image_writer is not None:
             self.image_writer.wait_until_done()
 
+    def _check_streaming_encoding(self) -> None:
+        if self.streaming_encoding and self.batch_encoding_size > 1:
+            raise ValueError("Streaming video encoding can't be combined with batch encoding of the videos.")
+
+    def _start_video_encoder(self, video_key: str, episode_index: int) -> None:
+        """Start encoding the video of an episode, frames being added with `add_frame`."""
+        temp_path = Path(tempfile.mkdtemp(dir=self.root)) / f"{video_key}_{episode_index:03d}.mp4"
+        self._video_encoders[video_key] = StreamingVideoEncoder(temp_path, self.fps)
+
     def _encode_temporary_episode_video(self, video_key: str, episode_index: int) -> Path:
         """
         Use ffmpeg to convert frames stored as png into mp4 videos.
@@ -1468,6 +1931,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_threads: int = 0,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        streaming_encoding: bool = False,
     ) -> "LeRobotDataset":
         """Create a LeRobot Dataset from scratch in order to record data."""
         obj = cls.__new__(cls)
@@ -1486,6 +1950,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.image_writer = None
         obj.batch_encoding_size = batch_encoding_size
         obj.episodes_since_last_encoding = 0
+        obj.streaming_encoding = streaming_encoding
+        obj._check_streaming_encoding()
+        obj._video_encoders = {}
+        obj._video_appenders = {}
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
@@ -1498,7 +1966,14 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.image_transforms = None
         obj.delta_timestamps = None
         obj.delta_indices = None
+        obj._episode_index_table = None
+        obj._delta_offsets = None
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
+        obj.video_decoder_cache = VideoDecoderCache(DEFAULT_VIDEO_DECODER_CACHE_SIZE)
+        obj.video_frame_cache = None
+        obj.return_uint8_frames = False
+        obj._video_frame_indices = {}
+        obj._video_frame_starts = {}
         obj.writer = None
         obj.latest_episode = None
         obj._current_file_start_frame = None
@@ -34,6 +34,7 @@ from lerobot.datasets.utils import (
     safe_shard,
 )
 from lerobot.datasets.video_utils import (
+    DEFAULT_VIDEO_DECODER_CACHE_SIZE,
     VideoDecoderCache,
     decode_video_frames_torchcodec,
 )
@@ -189,7 +190,7 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     # in parallel, feeding a queue from which this iterator will yield processed items.
     def __iter__(self) -> Iterator[dict[str, torch.Tensor]]:
         if self.video_decoder_cache is None:
-            self.video_decoder_cache = VideoDecoderCache()
+            self.video_decoder_cache = VideoDecoderCache(DEFAULT_VIDEO_DECODER_CACHE_SIZE)
 
         # keep the same seed across exhaustions if shuffle is False, otherwise shuffle data across exhaustions
         rng = np.random.default_rng(self.seed) if not self.shuffle else self.rng
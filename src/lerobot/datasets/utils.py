@@ -28,6 +28,7 @@ import numpy as np
 import packaging.version
 import pandas
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 from datasets import Dataset
@@ -63,6 +64,7 @@ DEFAULT_EPISODES_PATH = EPISODES_DIR + "/" + CHUNK_FILE_PATTERN + ".parquet"
 DEFAULT_DATA_PATH = DATA_DIR + "/" + CHUNK_FILE_PATTERN + ".parquet"
 DEFAULT_VIDEO_PATH = VIDEO_DIR + "/{video_key}/" + CHUNK_FILE_PATTERN + ".mp4"
 DEFAULT_IMAGE_PATH = "images/{image_key}/episode-{episode_index:06d}/frame-{frame_index:06d}.png"
+DEFAULT_FRAME_INDEX_PATH = "meta/frame_index/{video_key}/" + CHUNK_FILE_PATTERN + ".parquet"
 
 LEGACY_EPISODES_PATH = "meta/episodes.jsonl"
 LEGACY_EPISODES_STATS_PATH = "meta/episodes_stats.jsonl"
@@ -370,6 +372,127 @@ def load_episodes(local_dir: Path) -> datasets.Dataset:
     return episodes
 
 
+class EpisodeIndex:
+    """In-memory, append-only index of the metadata of recorded episodes.
+
+    The metadata of the episodes are stored column by column in preallocated numpy arrays, whose capacity is
+    doubled when full, so that adding an episode costs amortized O(1) whatever the number of episodes already
+    recorded. Integer, float and boolean metadata are stored in typed arrays along with a mask of the episodes
+    they are set for, other metadata (e.g. lists of tasks or statistics) in object arrays. The episodes are
+    written to the episodes parquet files separately (see `LeRobotDatasetMetadata`). `index[i]` returns the
+    metadata of the i-th episode of the index as a dict, and `index[key]` returns a column as a numpy array, as
+    for the dataset returned by `load_episodes`.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = capacity
+        self._num_episodes = 0
+        self._columns: dict[str, np.ndarray] = {}
+        # Whether each value of the columns is set, missing values being None
+        self._is_set: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self._num_episodes
+
+    def __getitem__(self, item: int | str) -> dict | np.ndarray:
+        if isinstance(item, str):
+            column = self._columns[item][: self._num_episodes]
+            is_set = self._is_set[item][: self._num_episodes]
+            if not is_set.all():
+                column = column.astype(object)
+                column[~is_set] = None
+            return column.copy()
+        position = self._position(item)
+        return {key: self._value(key, position) for key in self._columns}
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._columns)
+
+    def _position(self, position: int) -> int:
+        if not -self._num_episodes <= position < self._num_episodes:
+            raise IndexError(f"Episode position {position} out of range for {self._num_episodes} episodes.")
+        return position % self._num_episodes
+
+    def _value(self, key: str, position: int) -> Any:
+        if not self._is_set[key][position]:
+            return None
+        value = self._columns[key][position]
+        return value.item() if isinstance(value, np.generic) else value
+
+    @staticmethod
+    def _dtype(value: Any) -> np.dtype:
+        if isinstance(value, (bool, np.bool_)):
+            return np.dtype(bool)
+        if isinstance(value, (int, np.integer)):
+            return np.dtype(np.int64)
+        if isinstance(value, (float, np.floating)):
+            return np.dtype(np.float64)
+        return np.dtype(object)
+
+    def _set(self, key: str, position: int, value: Any) -> None:
+        if value is None:
+            if key in self._is_set:
+                self._is_set[key][position] = False
+            return
+
+        dtype = self._dtype(value)
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = np.zeros(self._capacity, dtype=dtype)
+            self._is_set[key] = np.zeros(self._capacity, dtype=bool)
+        elif column.dtype != dtype and column.dtype != object:
+            # Mixed types, e.g. integers and floats, are kept as they are
+            column = self._columns[key] = column.astype(object)
+        column[position] = value
+        self._is_set[key][position] = True
+
+    def _grow(self, capacity: int) -> None:
+        for columns in (self._columns, self._is_set):
+            for key, column in columns.items():
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[: self._num_episodes] = column[: self._num_episodes]
+                columns[key] = grown
+        self._capacity = capacity
+
+    def get(self, position: int, key: str, default: Any = None) -> Any:
+        """Metadata `key` of the episode at a given position, or `default` if missing."""
+        value = self._value(key, self._position(position)) if key in self._columns else None
+        return default if value is None else value
+
+    def append(self, episode: dict) -> None:
+        """Add the metadata of an episode. Metadata missing for the episode are set to None."""
+        if self._num_episodes == self._capacity:
+            self._grow(2 * self._capacity)
+        for key, value in episode.items():
+            self._set(key, self._num_episodes, value)
+        self._num_episodes += 1
+
+    def update(self, position: int, values: dict) -> None:
+        """Set metadata of the episode at a given position, e.g. once its videos are encoded."""
+        position = self._position(position)
+        for key, value in values.items():
+            self._set(key, position, value)
+
+    def to_table(self, start: int = 0, stop: int | None = None) -> pa.Table:
+        """Convert the metadata of the episodes in [start, stop) to a pyarrow table."""
+        stop = self._num_episodes if stop is None else min(stop, self._num_episodes)
+        arrays = {}
+        for key, column in self._columns.items():
+            values = column[start:stop]
+            is_set = self._is_set[key][start:stop]
+            if column.dtype != object:
+                arrays[key] = pa.array(values, mask=~is_set)
+            else:
+                values = values.copy()
+                values[~is_set] = None
+                # numpy arrays are serialized because PyArrow doesn't convert nested numpy arrays
+                arrays[key] = pa.array(
+                    [value.tolist() if isinstance(value, np.ndarray) else value for value in values]
+                )
+        return pa.Table.from_pydict(arrays)
+
+
 def load_image_as_numpy(
     fpath: str | Path, dtype: np.dtype = np.float32, channel_first: bool = True
 ) -> np.ndarray:
@@ -421,6 +544,44 @@ def hf_transform_to_torch(items_dict: dict[str, list[Any]]) -> dict[str, list[to
     return items_dict
 
 
+def arrow_array_to_tensor(array: pa.Array | pa.ChunkedArray) -> torch.Tensor:
+    """Convert a numeric Arrow array to a torch tensor without materializing Python objects.
+
+    Nested list columns (e.g. `datasets.Sequence` or `datasets.Array2D` features) are flattened level by
+    level, so that the returned tensor has shape `(len(array), *feature_shape)`. Scalar columns return a
+    tensor of shape `(len(array),)`. Dtypes follow `hf_transform_to_torch`: floating values are returned as
+    float32 and integer values as int64.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): The Arrow array to convert, typically the result of a `take`.
+
+    Returns:
+        torch.Tensor: The converted tensor.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if isinstance(array, pa.ExtensionArray):
+        array = array.storage
+
+    num_rows = len(array)
+    shape = [num_rows]
+    while (
+        pa.types.is_list(array.type)
+        or pa.types.is_large_list(array.type)
+        or pa.types.is_fixed_size_list(array.type)
+    ):
+        parent_len = len(array)
+        array = array.flatten()
+        shape.append(len(array) // parent_len if parent_len > 0 else 0)
+
+    tensor = torch.from_numpy(array.to_numpy(zero_copy_only=False, writable=True)).reshape(shape)
+    if tensor.is_floating_point():
+        return tensor.to(torch.float32)
+    if tensor.dtype != torch.bool:
+        return tensor.to(torch.int64)
+    return tensor
+
+
 def is_valid_version(version: str) -> bool:
     """Check if a string is a valid PEP 440 version.
 
@@ -1078,7 +1239,8 @@ def validate_feature_image_or_video(
 ) -> str:
     """Validate a feature that is expected to be an image or video frame.
 
-    Accepts `np.ndarray` (channel-first or channel-last) or `PIL.Image.Image`.
+    Accepts `np.ndarray` (channel-first or channel-last) or `PIL.Image.Image`, as well as array-like objects
+    with a `shape` which are converted to arrays when written (e.g. compressed camera frames decoded lazily).
 
     Args:
         name (str): The name of the feature.
@@ -1090,8 +1252,8 @@ def validate_feature_image_or_video(
     """
     # Note: The check of pixels range ([0,1] for float and [0,255] for uint8) is done by the image writer threads.
     error_message = ""
-    if isinstance(value, np.ndarray):
-        actual_shape = value.shape
+    if isinstance(value, np.ndarray) or (hasattr(value, "__array__") and hasattr(value, "shape")):
+        actual_shape = tuple(value.shape)
         c, h, w = expected_shape
         if len(actual_shape) != 3 or (actual_shape != (c, h, w) and actual_shape != (h, w, c)):
             error_message += f"The feature '{name}' of shape '{actual_shape}' does not have the expected shape '{(c, h, w)}' or '{(h, w, c)}'.\n"
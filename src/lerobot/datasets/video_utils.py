@@ -13,25 +13,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 import glob
 import importlib
 import logging
+import os
+import queue
 import shutil
 import tempfile
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Thread
 from typing import Any, ClassVar
 
 import av
 import fsspec
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.datasets.compute_stats import auto_downsample_height_width, sample_indices
+
 
 def get_safe_default_codec():
     if importlib.util.find_spec("torchcodec"):
@@ -48,6 +57,8 @@ def decode_video_frames(
     timestamps: list[float],
     tolerance_s: float,
     backend: str | None = None,
+    decoder_cache: "VideoDecoderCache | None" = None,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """
     Decodes video frames using the specified backend.
@@ -57,6 +68,9 @@ def decode_video_frames(
         timestamps (list[float]): List of timestamps to extract frames.
         tolerance_s (float): Allowed deviation in seconds for frame retrieval.
         backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the platform; otherwise, defaults to "pyav"..
+        decoder_cache (VideoDecoderCache, optional): Decoder cache used by "torchcodec". Uses a process-wide
+            unbounded cache if None.
+        return_uint8 (bool, optional): Return uint8 frames in [0, 255] instead of float32 frames in [0, 1].
 
     Returns:
         torch.Tensor: Decoded frames.
@@ -66,9 +80,13 @@ def decode_video_frames(
     if backend is None:
         backend = get_safe_default_codec()
     if backend == "torchcodec":
-        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s)
+        return decode_video_frames_torchcodec(
+            video_path, timestamps, tolerance_s, decoder_cache=decoder_cache, return_uint8=return_uint8
+        )
     elif backend in ["pyav", "video_reader"]:
-        return decode_video_frames_torchvision(video_path, timestamps, tolerance_s, backend)
+        return decode_video_frames_torchvision(
+            video_path, timestamps, tolerance_s, backend, return_uint8=return_uint8
+        )
     else:
         raise ValueError(f"Unsupported video backend: {backend}")
 
@@ -79,9 +97,12 @@ def decode_video_frames_torchvision(
     tolerance_s: float,
     backend: str = "pyav",
     log_loaded_timestamps: bool = False,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated to the requested timestamps of a video
 
+    Frames are returned channel first, as float32 in [0, 1] or, with `return_uint8=True`, as uint8 in [0, 255].
+
     The backend can be either "pyav" (default) or "video_reader".
     "video_reader" requires installing torchvision from source, see:
     https://github.com/pytorch/vision/blob/main/torchvision/csrc/io/decoder/gpu/README.rst
@@ -164,49 +185,148 @@ def decode_video_frames_torchvision(
     if log_loaded_timestamps:
         logging.info(f"{closest_ts=}")
 
-    # convert to the pytorch format which is float32 in [0,1] range (and channel first)
-    closest_frames = closest_frames.type(torch.float32) / 255
+    if not return_uint8:
+        # convert to the pytorch format which is float32 in [0,1] range (and channel first)
+        closest_frames = closest_frames.type(torch.float32) / 255
 
     assert len(timestamps) == len(closest_frames)
     return closest_frames
 
 
+DEFAULT_VIDEO_DECODER_CACHE_SIZE = 64  # Max number of decoders (and open video files) per process
+
+
 class VideoDecoderCache:
-    """Thread-safe cache for video decoders to avoid expensive re-initialization."""
+    """Thread-safe LRU cache for video decoders to avoid expensive re-initialization.
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, Any]] = {}
-        self._lock = Lock()
+    Each cached decoder keeps an open file handle and its own decoding buffers, so the cache is bounded both
+    in number of decoders and in approximate memory. When a limit is exceeded, the least recently used
+    decoders are evicted and their file handles closed.
 
-    def get_decoder(self, video_path: str):
-        """Get a cached decoder or create a new one."""
+    The cache is per-process: a cache inherited by a forked DataLoader worker, or unpickled in a spawned one,
+    starts empty so that workers never share decoders or file descriptors with the main process.
+
+    Args:
+        max_decoders: Maximum number of decoders kept open. Unbounded if None.
+        max_memory_mb: Approximate memory budget in MiB for the cached decoders, estimated from the frame size
+            of each video (see `DECODER_BUFFERED_FRAMES`). Unbounded if None.
+    """
+
+    # Rough number of decoded frames buffered by a decoder, used to estimate its memory footprint
+    DECODER_BUFFERED_FRAMES = 16
+
+    def __init__(self, max_decoders: int | None = None, max_memory_mb: float | None = None):
+        if max_decoders is not None and max_decoders < 1:
+            raise ValueError(f"`max_decoders` must be at least 1, got {max_decoders}.")
+        if max_memory_mb is not None and max_memory_mb <= 0:
+            raise ValueError(f"`max_memory_mb` must be positive, got {max_memory_mb}.")
+        self.max_decoders = max_decoders
+        self.max_memory_mb = max_memory_mb
+        self._lock = Lock()
+        self._reset()
+
+    def _reset(self):
+        # video_path -> (decoder, file_handle, approximate size in bytes), ordered from least to most recently used
+        self._cache: OrderedDict[str, tuple[Any, Any, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> dict:
+        # Decoders and file handles can't be shared across processes: only the configuration is pickled
+        return {"max_decoders": self.max_decoders, "max_memory_mb": self.max_memory_mb}
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # Forked process: drop the references inherited from the parent without closing its file handles
+            self._reset()
+
+    @classmethod
+    def _estimate_decoder_bytes(cls, decoder) -> int:
+        metadata = decoder.metadata
+        height = getattr(metadata, "height", None) or 0
+        width = getattr(metadata, "width", None) or 0
+        return height * width * 3 * cls.DECODER_BUFFERED_FRAMES
+
+    def _evict(self):
+        max_bytes = None if self.max_memory_mb is None else self.max_memory_mb * 1024**2
+        # Always keep the most recently used decoder, even if it alone exceeds the memory budget
+        while len(self._cache) > 1 and (
+            (self.max_decoders is not None and len(self._cache) > self.max_decoders)
+            or (max_bytes is not None and self._memory_bytes > max_bytes)
+        ):
+            _, (_, file_handle, num_bytes) = self._cache.popitem(last=False)
+            file_handle.close()
+            self._memory_bytes -= num_bytes
+            self._evictions += 1
+
+    def _create_decoder(self, video_path: str) -> tuple[Any, Any]:
         if importlib.util.find_spec("torchcodec"):
             from torchcodec.decoders import VideoDecoder
         else:
             raise ImportError("torchcodec is required but not available.")
 
+        file_handle = fsspec.open(video_path).__enter__()
+        try:
+            decoder = VideoDecoder(file_handle, seek_mode="approximate")
+        except Exception:
+            file_handle.close()
+            raise
+        return decoder, file_handle
+
+    def get_decoder(self, video_path: str):
+        """Get a cached decoder or create a new one."""
         video_path = str(video_path)
 
         with self._lock:
-            if video_path not in self._cache:
-                file_handle = fsspec.open(video_path).__enter__()
-                decoder = VideoDecoder(file_handle, seek_mode="approximate")
-                self._cache[video_path] = (decoder, file_handle)
-
-            return self._cache[video_path][0]
+            self._check_pid()
+            if video_path in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(video_path)
+                return self._cache[video_path][0]
+
+            self._misses += 1
+            decoder, file_handle = self._create_decoder(video_path)
+            num_bytes = self._estimate_decoder_bytes(decoder)
+            self._cache[video_path] = (decoder, file_handle, num_bytes)
+            self._memory_bytes += num_bytes
+            self._evict()
+            return decoder
 
     def clear(self):
         """Clear the cache and close file handles."""
         with self._lock:
-            for _, file_handle in self._cache.values():
+            self._check_pid()
+            for _, file_handle, _ in self._cache.values():
                 file_handle.close()
             self._cache.clear()
+            self._memory_bytes = 0
 
     def size(self) -> int:
         """Return the number of cached decoders."""
         with self._lock:
+            self._check_pid()
             return len(self._cache)
 
+    def stats(self) -> dict[str, int | float]:
+        """Return the hit/miss/eviction counters and the current occupancy of the cache in this process."""
+        with self._lock:
+            self._check_pid()
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups > 0 else 0.0,
+                "size": len(self._cache),
+                "memory_mb": self._memory_bytes / 1024**2,
+            }
+
 
 class FrameTimestampError(ValueError):
     """Helper error to indicate the retrieved timestamps exceed the queried ones"""
@@ -223,6 +343,7 @@ def decode_video_frames_torchcodec(
     tolerance_s: float,
     log_loaded_timestamps: bool = False,
     decoder_cache: VideoDecoderCache | None = None,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated with the requested timestamps of a video using torchcodec.
 
@@ -232,6 +353,7 @@ def decode_video_frames_torchcodec(
         tolerance_s: Allowed deviation in seconds for frame retrieval.
         log_loaded_timestamps: Whether to log loaded timestamps.
         decoder_cache: Optional decoder cache instance. Uses default if None.
+        return_uint8: Return uint8 frames in [0, 255] instead of float32 frames in [0, 1].
 
     Note: Setting device="cuda" outside the main process, e.g. in data loader workers, will lead to CUDA initialization errors.
 
@@ -289,8 +411,9 @@ def decode_video_frames_torchcodec(
     if log_loaded_timestamps:
         logging.info(f"{closest_ts=}")
 
-    # convert to float32 in [0,1] range
-    closest_frames = (closest_frames / 255.0).type(torch.float32)
+    if not return_uint8:
+        # convert to float32 in [0,1] range
+        closest_frames = (closest_frames / 255.0).type(torch.float32)
 
     if not len(timestamps) == len(closest_frames):
         raise FrameTimestampError(
@@ -300,6 +423,400 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+@lru_cache(maxsize=1024)
+def _get_video_keyframe_timestamps(video_path: str, mtime_ns: int, size: int) -> tuple[float, ...]:
+    # `mtime_ns` and `size` are part of the cache key so that files being appended to are re-scanned
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        return tuple(
+            float(packet.pts * packet.time_base)
+            for packet in container.demux(stream)
+            if packet.is_keyframe and packet.pts is not None
+        )
+
+
+def get_video_keyframe_timestamps(video_path: Path | str) -> tuple[float, ...]:
+    """Returns the sorted timestamps (in seconds) of the key frames of the first video stream.
+
+    Only packets are demuxed (no frame is decoded) and results are cached per file, so this is cheap to call
+    repeatedly. The cache is invalidated when the file size or modification time changes.
+    """
+    stat = Path(video_path).stat()
+    return _get_video_keyframe_timestamps(str(video_path), stat.st_mtime_ns, stat.st_size)
+
+
+def plan_video_decoding(timestamps: list[float], keyframe_timestamps: tuple[float, ...]) -> list[list[int]]:
+    """Group requested timestamps into keyframe-aligned ranges that can each be decoded in a single pass.
+
+    Timestamps are sorted and consecutive requests are merged into the same range as long as the key frame
+    preceding the next request is not after the previous request, i.e. as long as the next request can only
+    be reached by decoding forward from the previous one. A new range (and thus a seek to that key frame) is
+    started whenever the key frame preceding the next request is after the previous request, even if it is
+    the very next key frame: e.g. with key frames at 0s, 1s and 2s, requests at 0.1s and 1.2s are decoded in
+    two ranges.
+
+    Args:
+        timestamps: Requested timestamps in seconds, in any order and possibly duplicated.
+        keyframe_timestamps: Sorted timestamps of the key frames of the video.
+
+    Returns:
+        list[list[int]]: Ranges of positions into `timestamps`, each sorted by increasing timestamp.
+    """
+    order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    ranges: list[list[int]] = []
+    previous_ts = None
+    for pos in order:
+        ts = timestamps[pos]
+        keyframe_idx = bisect.bisect_right(keyframe_timestamps, ts) - 1
+        keyframe_ts = keyframe_timestamps[keyframe_idx] if keyframe_idx >= 0 else float("-inf")
+        if previous_ts is not None and keyframe_ts <= previous_ts:
+            ranges[-1].append(pos)
+        else:
+            ranges.append([pos])
+        previous_ts = ts
+    return ranges
+
+
+def decode_video_frames_batch(
+    video_path: Path | str,
+    timestamps: list[float],
+    tolerance_s: float,
+    backend: str | None = None,
+    decoder_cache: VideoDecoderCache | None = None,
+    return_uint8: bool = False,
+) -> torch.Tensor:
+    """Decodes many frames of a single video file at once, e.g. all the frames requested by a batch of samples.
+
+    Unlike `decode_video_frames`, timestamps don't need to be close to each other: they are sorted and merged
+    into keyframe-aligned ranges (see `plan_video_decoding`), each range is decoded once and frames are
+    distributed back in the order of `timestamps`. With "torchcodec", which supports random access, the
+    unique sorted timestamps are fetched in a single call.
+
+    Args:
+        video_path (Path): Path to the video file.
+        timestamps (list[float]): List of timestamps to extract frames, in any order.
+        tolerance_s (float): Allowed deviation in seconds for frame retrieval.
+        backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the
+            platform; otherwise, defaults to "pyav".
+        decoder_cache (VideoDecoderCache, optional): Decoder cache used by "torchcodec". Uses a process-wide
+            unbounded cache if None.
+        return_uint8 (bool, optional): Return uint8 frames in [0, 255] instead of float32 frames in [0, 1].
+
+    Returns:
+        torch.Tensor: Decoded frames, one per requested timestamp.
+    """
+    if backend is None:
+        backend = get_safe_default_codec()
+
+    if backend == "torchcodec":
+        unique_ts = sorted(set(timestamps))
+        frames = decode_video_frames_torchcodec(
+            video_path, unique_ts, tolerance_s, decoder_cache=decoder_cache, return_uint8=return_uint8
+        )
+        position = {ts: i for i, ts in enumerate(unique_ts)}
+        return frames[[position[ts] for ts in timestamps]]
+    elif backend not in ["pyav", "video_reader"]:
+        raise ValueError(f"Unsupported video backend: {backend}")
+
+    decode_ranges = plan_video_decoding(timestamps, get_video_keyframe_timestamps(video_path))
+    if backend == "pyav":
+        return _decode_video_ranges_pyav(video_path, timestamps, decode_ranges, tolerance_s, return_uint8)
+
+    frames = None
+    for decode_range in decode_ranges:
+        range_ts = [timestamps[pos] for pos in decode_range]
+        range_frames = decode_video_frames_torchvision(
+            video_path, range_ts, tolerance_s, backend, return_uint8=return_uint8
+        )
+        if frames is None:
+            frames = torch.empty((len(timestamps), *range_frames.shape[1:]), dtype=range_frames.dtype)
+        frames[decode_range] = range_frames
+    return frames
+
+
+def _decode_video_ranges_pyav(
+    video_path: Path | str,
+    timestamps: list[float],
+    decode_ranges: list[list[int]],
+    tolerance_s: float,
+    return_uint8: bool = False,
+) -> torch.Tensor:
+    """Decodes keyframe-aligned ranges (see `plan_video_decoding`) with a single pyav container.
+
+    Each range starts with a seek to the key frame preceding its first timestamp and decodes forward until its
+    last timestamp. Only the frames matching a requested timestamp are converted to RGB.
+    """
+    frames = None
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        for decode_range in decode_ranges:
+            range_ts = [timestamps[pos] for pos in decode_range]
+            container.seek(int(range_ts[0] / stream.time_base), stream=stream, backward=True, any_frame=False)
+
+            loaded_frames = []
+            loaded_ts = []
+            for frame in container.decode(stream):
+                current_ts = float(frame.pts * stream.time_base)
+                # Skip the conversion of frames that are not requested
+                closest_idx = bisect.bisect_left(range_ts, current_ts - tolerance_s)
+                if closest_idx < len(range_ts) and range_ts[closest_idx] <= current_ts + tolerance_s:
+                    loaded_frames.append(torch.from_numpy(frame.to_ndarray(format="rgb24")).permute(2, 0, 1))
+                    loaded_ts.append(current_ts)
+                if current_ts >= range_ts[-1]:
+                    break
+
+            query_ts = torch.tensor(range_ts)
+            if len(loaded_ts) == 0:
+                raise FrameTimestampError(
+                    f"No frame could be loaded for {query_ts=} from video: {video_path}"
+                )
+            dist = torch.cdist(query_ts[:, None], torch.tensor(loaded_ts)[:, None], p=1)
+            min_, argmin_ = dist.min(1)
+            is_within_tol = min_ < tolerance_s
+            if not is_within_tol.all():
+                raise FrameTimestampError(
+                    f"One or several query timestamps unexpectedly violate the tolerance "
+                    f"({min_[~is_within_tol]} > {tolerance_s=}).\nqueried timestamps: {query_ts}"
+                    f"\nloaded timestamps: {loaded_ts}\nvideo: {video_path}"
+                )
+
+            if frames is None:
+                dtype = torch.uint8 if return_uint8 else torch.float32
+                frames = torch.empty((len(timestamps), *loaded_frames[0].shape), dtype=dtype)
+            range_frames = torch.stack([loaded_frames[idx] for idx in argmin_])
+            # convert to the pytorch format which is float32 in [0,1] range (and channel first)
+            frames[decode_range] = range_frames if return_uint8 else range_frames.type(torch.float32) / 255
+
+    return frames
+
+
+@dataclass
+class VideoFrameIndex:
+    """Table of the frames of a video file, sorted by presentation time.
+
+    It is built by demuxing the video once (no frame is decoded) and lets frames be addressed by their integer
+    position in the video, which is exact, instead of by timestamp, which requires nearest neighbour matching.
+
+    Attributes:
+        pts: Presentation timestamps of the frames, in `time_base` units.
+        is_keyframe: Whether each frame is a key frame, i.e. a valid starting point for decoding.
+        byte_offset: Byte offset of the packet of each frame in the file, or -1 if unknown.
+        time_base: Time base of the video stream, in seconds.
+        video_size: Size in bytes of the video file the table was built from, used to detect stale tables.
+    """
+
+    pts: np.ndarray
+    is_keyframe: np.ndarray
+    byte_offset: np.ndarray
+    time_base: Fraction
+    video_size: int
+
+    def __len__(self) -> int:
+        return len(self.pts)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Presentation timestamps of the frames in seconds."""
+        return self.pts * float(self.time_base)
+
+    def keyframe_positions(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the position of the key frame preceding (or equal to) each frame position."""
+        keyframes = np.flatnonzero(self.is_keyframe)
+        return keyframes[np.searchsorted(keyframes, positions, side="right") - 1]
+
+    @classmethod
+    def from_video(cls, video_path: Path | str) -> "VideoFrameIndex":
+        video_path = Path(video_path)
+        with av.open(str(video_path)) as container:
+            stream = container.streams.video[0]
+            time_base = stream.time_base
+            packets = [
+                (packet.pts, packet.is_keyframe, packet.pos if packet.pos is not None else -1)
+                for packet in container.demux(stream)
+                if packet.pts is not None
+            ]
+        # Packets are in decoding order, which differs from presentation order when there are B-frames
+        packets.sort()
+        pts, is_keyframe, byte_offset = zip(*packets, strict=True) if packets else ((), (), ())
+        return cls(
+            pts=np.asarray(pts, dtype=np.int64),
+            is_keyframe=np.asarray(is_keyframe, dtype=bool),
+            byte_offset=np.asarray(byte_offset, dtype=np.int64),
+            time_base=Fraction(time_base.numerator, time_base.denominator),
+            video_size=video_path.stat().st_size,
+        )
+
+    def to_table(self) -> pa.Table:
+        table = pa.table({"pts": self.pts, "is_keyframe": self.is_keyframe, "byte_offset": self.byte_offset})
+        return table.replace_schema_metadata(
+            {"time_base": str(self.time_base), "video_size": str(self.video_size)}
+        )
+
+    @classmethod
+    def from_table(cls, table: pa.Table) -> "VideoFrameIndex":
+        metadata = table.schema.metadata
+        return cls(
+            pts=table["pts"].to_numpy(),
+            is_keyframe=table["is_keyframe"].to_numpy(zero_copy_only=False),
+            byte_offset=table["byte_offset"].to_numpy(),
+            time_base=Fraction(metadata[b"time_base"].decode()),
+            video_size=int(metadata[b"video_size"]),
+        )
+
+
+def decode_video_frames_at_indices(
+    video_path: Path | str,
+    frame_indices: list[int],
+    frame_index: VideoFrameIndex,
+    backend: str | None = None,
+    decoder_cache: VideoDecoderCache | None = None,
+    return_uint8: bool = False,
+) -> torch.Tensor:
+    """Decodes the frames at the given positions of a video, using its `VideoFrameIndex`.
+
+    Unlike `decode_video_frames` and `decode_video_frames_batch`, there is no nearest neighbour matching of
+    timestamps: "torchcodec" fetches the frames by index, and "pyav" identifies them by their exact presentation
+    timestamp, seeking directly to the key frame preceding each range of requested frames. Only "video_reader"
+    matches the timestamps of the frame index. Positions can be in any order and spread over the whole video.
+
+    Args:
+        video_path (Path): Path to the video file.
+        frame_indices (list[int]): Positions of the frames to decode in the video, as in `frame_index`.
+        frame_index (VideoFrameIndex): Frame table of the video.
+        backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the
+            platform; otherwise, defaults to "pyav".
+        decoder_cache (VideoDecoderCache, optional): Decoder cache used by "torchcodec". Uses a process-wide
+            unbounded cache if None.
+        return_uint8 (bool, optional): Return uint8 frames in [0, 255] instead of float32 frames in [0, 1].
+
+    Returns:
+        torch.Tensor: Decoded frames, one per requested position.
+    """
+    if backend is None:
+        backend = get_safe_default_codec()
+    positions = np.asarray(frame_indices, dtype=np.int64)
+    if len(positions) > 0 and (positions.min() < 0 or positions.max() >= len(frame_index)):
+        raise IndexError(f"Frame indices out of range for video {video_path} of {len(frame_index)} frames.")
+
+    if backend == "torchcodec":
+        return _decode_video_frames_at_indices_torchcodec(
+            video_path, positions, frame_index, decoder_cache, return_uint8
+        )
+    if backend != "pyav":
+        # Timestamps are exact, so the nearest neighbour matching of other backends always succeeds
+        timestamps = frame_index.timestamps[positions].tolist()
+        tolerance_s = float(frame_index.time_base) / 2
+        return decode_video_frames_batch(
+            video_path,
+            timestamps,
+            tolerance_s,
+            backend,
+            decoder_cache=decoder_cache,
+            return_uint8=return_uint8,
+        )
+
+    keyframe_positions = frame_index.keyframe_positions(positions)
+    order = np.argsort(positions, kind="stable")
+    frames = None
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        start = 0
+        while start < len(order):
+            # Extend the range while the next frame's key frame is not after the last requested frame
+            stop = start + 1
+            while stop < len(order) and keyframe_positions[order[stop]] <= positions[order[stop - 1]]:
+                stop += 1
+            range_order = order[start:stop]
+            wanted: dict[int, list[int]] = {}
+            for pos in range_order:
+                wanted.setdefault(int(frame_index.pts[positions[pos]]), []).append(int(pos))
+            last_pts = int(frame_index.pts[positions[range_order[-1]]])
+
+            container.seek(
+                int(frame_index.pts[keyframe_positions[range_order[0]]]),
+                stream=stream,
+                backward=True,
+                any_frame=False,
+            )
+            for frame in container.decode(stream):
+                if frame.pts in wanted:
+                    data = torch.from_numpy(frame.to_ndarray(format="rgb24")).permute(2, 0, 1)
+                    if frames is None:
+                        frames = torch.empty((len(positions), *data.shape), dtype=torch.uint8)
+                    frames[wanted.pop(frame.pts)] = data
+                if frame.pts is not None and frame.pts >= last_pts:
+                    break
+            if len(wanted) > 0:
+                raise FrameTimestampError(
+                    f"Frames with pts {list(wanted)} could not be decoded from video: {video_path}. "
+                    "The frame index of the video might be stale."
+                )
+            start = stop
+
+    if frames is None:
+        return torch.empty((0,), dtype=torch.uint8 if return_uint8 else torch.float32)
+    # convert to the pytorch format which is float32 in [0,1] range (and channel first)
+    return frames if return_uint8 else frames.type(torch.float32) / 255
+
+
+def _decode_video_frames_at_indices_torchcodec(
+    video_path: Path | str,
+    positions: np.ndarray,
+    frame_index: VideoFrameIndex,
+    decoder_cache: VideoDecoderCache | None,
+    return_uint8: bool,
+) -> torch.Tensor:
+    if len(positions) == 0:
+        return torch.empty((0,), dtype=torch.uint8 if return_uint8 else torch.float32)
+    if decoder_cache is None:
+        decoder_cache = _default_decoder_cache
+    decoder = decoder_cache.get_decoder(str(video_path))
+
+    unique_positions, inverse = np.unique(positions, return_inverse=True)
+    timestamps = frame_index.timestamps[unique_positions]
+    frames_batch = decoder.get_frames_at(indices=unique_positions.tolist())
+    loaded_ts = frames_batch.pts_seconds.numpy()
+    if not np.allclose(loaded_ts, timestamps, rtol=0, atol=float(frame_index.time_base) / 2):
+        # In "approximate" seek mode, the decoder derives the timestamps of indices from the average frame
+        # rate, which is off for variable frame rate videos: fetch the frames at their exact timestamps instead
+        frames_batch = decoder.get_frames_played_at(seconds=timestamps.tolist())
+
+    frames = frames_batch.data[torch.from_numpy(inverse.reshape(-1))]
+    return frames if return_uint8 else frames.type(torch.float32) / 255
+
+
+def get_video_encoder_options(
+    vcodec: str, pix_fmt: str, g: int | None, crf: int | None, fast_decode: int
+) -> tuple[str, dict[str, str]]:
+    """Check the encoding parameters and return the pixel format and the codec options to use."""
+    # Check encoder availability
+    if vcodec not in ["h264", "hevc", "libsvtav1"]:
+        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+
+    # Encoders/pixel formats incompatibility check
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+
+    # Define video codec options
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    return pix_fmt, video_options
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -313,10 +830,6 @@ def encode_video_frames(
     overwrite: bool = False,
 ) -> None:
     """More info on ffmpeg arguments tuning on `benchmark/video/README.md`"""
-    # Check encoder availability
-    if vcodec not in ["h264", "hevc", "libsvtav1"]:
-        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
-
     video_path = Path(video_path)
     imgs_dir = Path(imgs_dir)
 
@@ -326,12 +839,7 @@ def encode_video_frames(
 
     video_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
+    pix_fmt, video_options = get_video_encoder_options(vcodec, pix_fmt, g, crf, fast_decode)
 
     # Get input frames
     template = "frame-" + ("[0-9]" * 6) + ".png"
@@ -345,20 +853,6 @@ def encode_video_frames(
     with Image.open(input_list[0]) as dummy_image:
         width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
     # Set logging level
     if log_level is not None:
         # "While less efficient, it is generally preferable to modify logging with Python's logging"
@@ -393,6 +887,146 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+DEFAULT_ENCODER_QUEUE_SIZE = 64  # Max number of frames waiting to be encoded
+DEFAULT_MAX_SAMPLED_FRAMES = 512  # Max number of downsampled frames kept for the episode statistics
+
+
+class StreamingVideoEncoder:
+    """Encode the frames of a video in a background thread, as they are added.
+
+    This is an alternative to writing every frame as a PNG image and encoding them with `encode_video_frames`
+    once all the frames are known: the video is ready as soon as the last frame is encoded, and frames are
+    never written to (nor read back from) the disk. The encoding parameters are the same as the ones of
+    `encode_video_frames`.
+
+    Frames are handed to the encoding thread through a queue of at most `queue_size` frames. When the encoder
+    can't keep up with the frame rate, `add_frame` blocks until a frame is encoded, so that memory usage stays
+    bounded.
+
+    Since frames are not kept, a downsampled copy of evenly spaced frames (at most `max_sampled_frames`) is
+    kept to compute the statistics of the episode (see `sample_frames`).
+    """
+
+    def __init__(
+        self,
+        video_path: Path | str,
+        fps: int,
+        vcodec: str = "libsvtav1",
+        pix_fmt: str = "yuv420p",
+        g: int | None = 2,
+        crf: int | None = 30,
+        fast_decode: int = 0,
+        queue_size: int = DEFAULT_ENCODER_QUEUE_SIZE,
+        max_sampled_frames: int = DEFAULT_MAX_SAMPLED_FRAMES,
+    ):
+        self.video_path = Path(video_path)
+        self.fps = fps
+        self.vcodec = vcodec
+        self.pix_fmt, self.video_options = get_video_encoder_options(vcodec, pix_fmt, g, crf, fast_decode)
+        self.max_sampled_frames = max_sampled_frames
+        self.num_frames = 0
+
+        # Downsampled frames, the i-th one being the frame `i * self._sampling_stride`
+        self._sampled_frames = []
+        self._sampling_stride = 1
+        self._error = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = Thread(target=self._encode_loop, daemon=True)
+        self._thread.start()
+
+    def add_frame(self, image: np.ndarray | Image.Image) -> None:
+        """Queue a frame to be encoded.
+
+        Args:
+            image: A uint8 image in [0, 255] or a float image in [0, 1], channel first or channel last.
+        """
+        if self._error is not None:
+            raise RuntimeError(f"Encoding of {self.video_path} failed.") from self._error
+        self._queue.put(image)
+        self.num_frames += 1
+
+    def finish(self) -> Path:
+        """Wait until all the frames are encoded and close the video file."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(f"Encoding of {self.video_path} failed.") from self._error
+        if not self.video_path.exists():
+            raise OSError(f"Video encoding did not work. File not found: {self.video_path}.")
+        return self.video_path
+
+    def cancel(self) -> None:
+        """Stop encoding and remove the video file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.video_path.unlink(missing_ok=True)
+
+    def sample_frames(self) -> np.ndarray:
+        """Return the downsampled frames used to compute the episode statistics.
+
+        The frames are the ones `sample_images` would load from the PNG images of the episode, or the closest
+        ones when more than `max_sampled_frames` frames were added.
+
+        Returns:
+            A (num_samples, channels, height, width) uint8 array.
+        """
+        indices = np.round(np.array(sample_indices(self.num_frames)) / self._sampling_stride).astype(int)
+        indices = np.minimum(indices, len(self._sampled_frames) - 1)
+        return np.stack([self._sampled_frames[i] for i in indices])
+
+    def _encode_loop(self) -> None:
+        output = None
+        stream = None
+        frame_index = 0
+        while True:
+            image = self._queue.get()
+            if image is None:
+                break
+            # Keep consuming frames after an error, so that `add_frame` never blocks
+            if self._error is not None:
+                continue
+            try:
+                image = image_to_uint8_hwc(image)
+                if output is None:
+                    self.video_path.parent.mkdir(parents=True, exist_ok=True)
+                    output = av.open(str(self.video_path), "w")
+                    stream = output.add_stream(self.vcodec, self.fps, options=self.video_options)
+                    stream.pix_fmt = self.pix_fmt
+                    stream.height, stream.width = image.shape[:2]
+                for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+                    output.mux(packet)
+
+                if frame_index % self._sampling_stride == 0:
+                    self._sampled_frames.append(auto_downsample_height_width(image.transpose(2, 0, 1)).copy())
+                    if len(self._sampled_frames) > self.max_sampled_frames:
+                        self._sampled_frames = self._sampled_frames[::2]
+                        self._sampling_stride *= 2
+                frame_index += 1
+            except Exception as e:
+                self._error = e
+
+        if output is not None:
+            try:
+                if self._error is None:
+                    # Flush the encoder
+                    for packet in stream.encode():
+                        output.mux(packet)
+                output.close()
+            except Exception as e:
+                self._error = e
+
+
+def image_to_uint8_hwc(image: np.ndarray | Image.Image) -> np.ndarray:
+    """Convert an image to a channel last uint8 array, with the same conventions as `write_image`."""
+    image = np.asarray(image)
+    if image.ndim == 3 and image.shape[0] == 3:
+        image = image.transpose(1, 2, 0)
+    if image.dtype != np.uint8:
+        image = (image * 255).astype(np.uint8)
+    return np.ascontiguousarray(image)
+
+
 def concatenate_video_files(
     input_video_paths: list[Path | str], output_video_path: Path, overwrite: bool = True
 ):
@@ -476,6 +1110,146 @@ def concatenate_video_files(
     Path(tmp_concatenate_path).unlink()
 
 
+class VideoFileAppender:
+    """Append the videos of episodes to a video file, without re-encoding them.
+
+    Unlike `concatenate_video_files`, which rewrites the whole output file every time a video is added to it,
+    the output file is kept open so that appending an episode only costs the size of its video. This makes
+    recording I/O linear, instead of quadratic, in the number of episodes per video file.
+
+    The file is written to a temporary path next to `video_path` (`<name>.partial`). While it is being written,
+    it is a fragmented mp4, starting a fragment at each key frame, so that what was written before a crash can
+    still be read: since each appended video starts with a key frame, every episode but the last one appended is
+    complete in the file on disk, the last one being completed by the next `append` or by `close`. `close` then
+    remuxes it, without re-encoding, into a regular mp4 at `video_path`, so that the video files of the dataset
+    keep their layout. Interrupted files are restored the same way with `recover_partial_files`.
+    """
+
+    # Negative composition offsets keep the first frame at timestamp 0 without an edit list, which fragmented
+    # files can't have, when frames are reordered (e.g. B-frames)
+    MUXER_OPTIONS = {
+        "movflags": "frag_keyframe+empty_moov+default_base_moof+negative_cts_offsets",
+        "flush_packets": "1",
+    }
+
+    def __init__(self, video_path: Path | str):
+        self.video_path = Path(video_path)
+        self.size_in_bytes = 0
+        self._partial_path = self.video_path.with_name(f"{self.video_path.name}.partial")
+        self._output = None
+        self._stream = None
+
+    @property
+    def size_in_mb(self) -> float:
+        return self.size_in_bytes / (1024**2)
+
+    def append(self, input_video_path: Path | str, from_timestamp: float) -> None:
+        """Copy the packets of the video stream of a video file at the end of the output file.
+
+        Args:
+            input_video_path: Video to append, encoded with the same parameters as the previous ones.
+            from_timestamp: Timestamp in seconds of the first frame of the appended video in the output file.
+        """
+        with av.open(str(input_video_path)) as input_container:
+            input_stream = input_container.streams.video[0]
+            if self._output is None:
+                self._partial_path.parent.mkdir(parents=True, exist_ok=True)
+                self._output = av.open(
+                    str(self._partial_path), mode="w", format="mp4", options=self.MUXER_OPTIONS
+                )
+                self._stream = self._output.add_stream_from_template(template=input_stream, opaque=True)
+                self._stream.time_base = input_stream.time_base
+
+            offset = round(from_timestamp / input_stream.time_base)
+            for packet in input_container.demux(input_stream):
+                # Skip demux flushing packets
+                if packet.dts is None:
+                    continue
+                packet.dts += offset
+                if packet.pts is not None:
+                    packet.pts += offset
+                packet.stream = self._stream
+                self._output.mux(packet)
+                self.size_in_bytes += packet.size
+
+    def close(self) -> None:
+        """Complete the output file and remux it to a regular mp4 at `video_path`."""
+        if self._output is None:
+            return
+        self._output.close()
+        self._output = None
+        self._stream = None
+        self._remux(self._partial_path, self.video_path)
+
+    @staticmethod
+    def _remux(partial_path: Path, video_path: Path) -> None:
+        """Copy the packets of a fragmented `.partial` file into a regular mp4 at `video_path`, then delete it."""
+        tmp_path = video_path.with_name(f"{video_path.name}.remux")
+        with (
+            av.open(str(partial_path)) as input_container,
+            av.open(
+                str(tmp_path), mode="w", format="mp4", options={"movflags": "faststart"}
+            ) as output_container,
+        ):
+            input_stream = input_container.streams.video[0]
+            output_stream = output_container.add_stream_from_template(template=input_stream, opaque=True)
+            output_stream.time_base = input_stream.time_base
+            # Packet durations aren't read back from the fragments, while the last packet of a regular mp4 is
+            # dropped without a duration: they are set from the timestamps of the following packets
+            previous = None
+            for packet in input_container.demux(input_stream):
+                # Skip demux flushing packets
+                if packet.dts is None:
+                    continue
+                if previous is not None:
+                    previous.duration = packet.dts - previous.dts
+                    output_container.mux(previous)
+                packet.stream = output_stream
+                previous = packet
+            if previous is not None:
+                if not previous.duration:
+                    previous.duration = round(1 / (input_stream.guessed_rate * input_stream.time_base))
+                output_container.mux(previous)
+        os.replace(tmp_path, video_path)
+        partial_path.unlink()
+
+    @staticmethod
+    def recover_partial_files(videos_dir: Path | str) -> list[Path]:
+        """Restore the video files left open by an interrupted recording session.
+
+        Readable `.partial` files are remuxed to their video file, which they hold the whole content of (a video
+        file that is appended to again is first copied to the `.partial` file). Unreadable ones, e.g. interrupted
+        before their first fragment was written, are deleted.
+
+        Args:
+            videos_dir: Directory searched recursively for `.partial` files.
+
+        Returns:
+            list[Path]: Paths of the restored video files.
+        """
+        recovered = []
+        for partial_path in sorted(Path(videos_dir).rglob("*.mp4.partial")):
+            video_path = partial_path.with_name(partial_path.name.removesuffix(".partial"))
+            try:
+                with av.open(str(partial_path)) as container:
+                    stream = container.streams.video[0]
+                    readable = any(packet.dts is not None for packet in container.demux(stream))
+            except (av.FFmpegError, IndexError):
+                readable = False
+
+            if readable:
+                VideoFileAppender._remux(partial_path, video_path)
+                recovered.append(video_path)
+                logging.warning(
+                    f"Recovered interrupted video file {video_path}. The last episode appended to it might be "
+                    "truncated."
+                )
+            else:
+                partial_path.unlink()
+                logging.warning(f"Deleted unreadable interrupted video file {partial_path}.")
+        return recovered
+
+
 @dataclass
 class VideoFrame:
     # TODO(rcadene, lhoestq): move to Hugging Face `datasets` repo
@@ -145,6 +145,17 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Whether to sample the online replay buffer by priority, from the TD errors of the critics
+    use_prioritized_replay: bool = False
+    # Priority exponent of the prioritized replay, 0 being uniform sampling
+    priority_alpha: float = 0.6
+    # Initial importance-sampling exponent of the prioritized replay, annealed to 1 over the online steps
+    priority_beta: float = 0.4
+    # Whether to store the images of the replay buffers as uint8 pixels, converted to floats when sampling
+    store_images_as_uint8: bool = False
+    # Whether to store the online replay buffer in memory-mapped files under the output directory, which are
+    # reopened when resuming instead of converting the buffer to and from a dataset. Requires a "cpu" storage device
+    use_memmap_replay_buffer: bool = False
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -152,6 +152,7 @@ class SACPolicy(
                 - done: Done mask tensor
                 - observation_feature: Optional pre-computed observation features
                 - next_observation_feature: Optional pre-computed next observation features
+                - weights: Optional importance-sampling weights of the transitions, for the critic loss
             model: Which model to compute the loss for ("actor", "critic", "discrete_critic", or "temperature")
 
         Returns:
@@ -169,7 +170,7 @@ class SACPolicy(
             done: Tensor = batch["done"]
             next_observation_features: Tensor = batch.get("next_observation_feature")
 
-            loss_critic = self.compute_loss_critic(
+            loss_critic, td_error = self.compute_loss_critic(
                 observations=observations,
                 actions=actions,
                 rewards=rewards,
@@ -177,9 +178,10 @@ class SACPolicy(
                 done=done,
                 observation_features=observation_features,
                 next_observation_features=next_observation_features,
+                weights=batch.get("weights"),
             )
 
-            return {"loss_critic": loss_critic}
+            return {"loss_critic": loss_critic, "td_error": td_error}
 
         if model == "discrete_critic" and self.config.num_discrete_actions is not None:
             # Extract critic-specific components
@@ -251,7 +253,10 @@ class SACPolicy(
         done,
         observation_features: Tensor | None = None,
         next_observation_features: Tensor | None = None,
-    ) -> Tensor:
+        weights: Tensor | None = None,
+    ) -> tuple[Tensor, Tensor]:
+        """Compute the TD loss of the critics, weighted by the importance-sampling `weights` of the transitions
+        if given, and the absolute TD error of each transition averaged over the critics."""
         with torch.no_grad():
             next_action_preds, next_log_probs, _ = self.actor(next_observations, next_observation_features)
 
@@ -294,14 +299,17 @@ class SACPolicy(
         # Compute state-action value loss (TD loss) for all of the Q functions in the ensemble.
         td_target_duplicate = einops.repeat(td_target, "b -> e b", e=q_preds.shape[0])
         # You compute the mean loss of the batch for each critic and then to compute the final loss you sum them up
-        critics_loss = (
-            F.mse_loss(
-                input=q_preds,
-                target=td_target_duplicate,
-                reduction="none",
-            ).mean(dim=1)
-        ).sum()
-        return critics_loss
+        td_losses = F.mse_loss(
+            input=q_preds,
+            target=td_target_duplicate,
+            reduction="none",
+        )
+        if weights is not None:
+            td_losses = td_losses * weights
+        critics_loss = td_losses.mean(dim=1).sum()
+
+        td_error = (q_preds - td_target_duplicate).detach().abs().mean(dim=0)
+        return critics_loss, td_error
 
     def compute_loss_discrete_critic(
         self,
@@ -126,7 +126,12 @@ def prepare_observation_for_inference(
         to (C, H, W) and normalized to a [0, 1] range.
     """
     for name in observation:
-        observation[name] = torch.from_numpy(observation[name])
+        # Array-like values (e.g. compressed camera frames) are converted to arrays first
+        array = np.asarray(observation[name])
+        if not array.flags.writeable:
+            # e.g. a read-only view of a camera frame buffer, which the tensor must not share
+            array = array.copy()
+        observation[name] = torch.from_numpy(array)
         if "image" in name:
             observation[name] = observation[name].type(torch.float32) / 255
             observation[name] = observation[name].permute(2, 0, 1).contiguous()
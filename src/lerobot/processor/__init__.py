@@ -49,6 +49,7 @@ from .hil_processor import (
     RewardClassifierProcessorStep,
     TimeLimitProcessorStep,
 )
+from .image_processor import ImageToFloatProcessorStep
 from .joint_observations_processor import JointVelocityProcessorStep, MotorCurrentProcessorStep
 from .normalize_processor import NormalizerProcessorStep, UnnormalizerProcessorStep, hotswap_stats
 from .observation_processor import VanillaObservationProcessorStep
@@ -92,6 +93,7 @@ __all__ = [
     "hotswap_stats",
     "IdentityProcessorStep",
     "ImageCropResizeProcessorStep",
+    "ImageToFloatProcessorStep",
     "InfoProcessorStep",
     "InterventionActionProcessorStep",
     "JointVelocityProcessorStep",
@@ -52,6 +52,9 @@ def to_tensor(
     Raises:
         TypeError: If the input type is not supported.
     """
+    if hasattr(value, "__array__"):
+        # Array-like values, e.g. the `JpegFrame` of a camera in MJPEG passthrough mode
+        return to_tensor(np.asarray(value), dtype=dtype, device=device)
     raise TypeError(f"Unsupported type for tensor conversion: {type(value)}")
 
 
@@ -80,7 +83,9 @@ def _(
         scalar_value = value.item()
         return torch.tensor(scalar_value, dtype=dtype, device=device)
 
-    # Create tensor from numpy array.
+    # Create tensor from numpy array, copying read-only arrays (e.g. camera frame buffers) it must not share.
+    if not value.flags.writeable:
+        value = value.copy()
     tensor = torch.from_numpy(value)
 
     # Apply dtype and device conversion if specified.
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This script defines a processor step converting uint8 image observations to floating point images in [0, 1].
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import torch
+
+from lerobot.configs.types import PipelineFeatureType, PolicyFeature
+from lerobot.utils.constants import OBS_IMAGE
+
+from .pipeline import ObservationProcessorStep, ProcessorStepRegistry
+
+
+@ProcessorStepRegistry.register("image_to_float_processor")
+@dataclass
+class ImageToFloatProcessorStep(ObservationProcessorStep):
+    """
+    Processor step converting uint8 images in [0, 255] to floating point images in [0, 1].
+
+    It is meant to be placed right after the `DeviceProcessorStep` when the dataset returns uint8 frames (see
+    `LeRobotDataset(return_uint8_frames=True)`), so that frames cross the DataLoader and the host-to-device copy
+    as uint8 and are only converted to float on the device. Images which are already floating point are left
+    unchanged, so the step is a no-op for float inputs (e.g. at inference time).
+
+    Attributes:
+        float_dtype: The target floating-point dtype as a string (e.g., "float32", "float16", "bfloat16").
+    """
+
+    float_dtype: str = "float32"
+
+    def __post_init__(self):
+        dtype = getattr(torch, self.float_dtype, None)
+        if not isinstance(dtype, torch.dtype) or not dtype.is_floating_point:
+            raise ValueError(f"Invalid float_dtype '{self.float_dtype}'.")
+        self._target_float_dtype = dtype
+
+    def observation(self, observation: dict[str, Any]) -> dict[str, Any]:
+        for key, value in observation.items():
+            if key.startswith(OBS_IMAGE) and isinstance(value, torch.Tensor) and value.dtype == torch.uint8:
+                observation[key] = value.to(dtype=self._target_float_dtype).div_(255)
+        return observation
+
+    def get_config(self) -> dict[str, Any]:
+        return {"float_dtype": self.float_dtype}
+
+    def transform_features(
+        self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
+    ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
+        """Returns the input features unchanged, the conversion doesn't alter their shape."""
+        return features
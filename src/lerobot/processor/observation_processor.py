@@ -58,7 +58,9 @@ class VanillaObservationProcessorStep(ObservationProcessorStep):
 
         Args:
             img: A NumPy array representing the image, expected to be in channel-last
-                 (H, W, C) format with a `uint8` dtype.
+                 (H, W, C) format with a `uint8` dtype. Array-like images, e.g. the
+                 `JpegFrame` of a camera in MJPEG passthrough mode, are converted to
+                 arrays first.
 
         Returns:
             A `float32` PyTorch tensor in channel-first (B, C, H, W) format, with
@@ -68,7 +70,10 @@ class VanillaObservationProcessorStep(ObservationProcessorStep):
             ValueError: If the input image does not appear to be in channel-last
                         format or is not of `uint8` dtype.
         """
-        # Convert to tensor
+        # Convert to tensor, copying read-only arrays (e.g. camera frame buffers) the tensor must not share
+        img = np.asarray(img)
+        if not img.flags.writeable:
+            img = img.copy()
         img_tensor = torch.from_numpy(img)
 
         # Add batch dimension if needed
@@ -83,6 +83,7 @@ from lerobot.utils.transition import (
     Transition,
     move_state_dict_to_device,
     move_transition_to_device,
+    stack_transitions,
 )
 from lerobot.utils.utils import (
     TimerManager,
@@ -357,6 +358,7 @@ def act_with_policy(
                 push_transitions_to_transport_queue(
                     transitions=list_transition_to_send_to_learner,
                     transitions_queue=transitions_queue,
+                    stack=True,
                 )
                 list_transition_to_send_to_learner = []
 
@@ -681,23 +683,31 @@ def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device)
 #  Utilities functions
 
 
-def push_transitions_to_transport_queue(transitions: list, transitions_queue):
+def push_transitions_to_transport_queue(transitions: list, transitions_queue, stack: bool = False):
     """Send transitions to learner in smaller chunks to avoid network issues.
 
     Args:
         transitions: List of transitions to send
         message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        stack: Whether to send the transitions stacked into tensors with a leading batch dimension, which are
+            faster to serialize and are added to the replay buffer at once, instead of a list of transitions
     """
     transition_to_send_to_learner = []
     for transition in transitions:
         tr = move_transition_to_device(transition=transition, device="cpu")
-        for key, value in tr["state"].items():
-            if torch.isnan(value).any():
-                logging.warning(f"Found NaN values in transition {key}")
+        if not stack:
+            for key, value in tr["state"].items():
+                if torch.isnan(value).any():
+                    logging.warning(f"Found NaN values in transition {key}")
 
         transition_to_send_to_learner.append(tr)
 
+    if stack and len(transition_to_send_to_learner) > 0:
+        transition_to_send_to_learner = stack_transitions(transition_to_send_to_learner)
+        for key, value in transition_to_send_to_learner["state"].items():
+            if torch.isnan(value).any():
+                logging.warning(f"Found NaN values in transitions {key}")
+
     transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
 
 
@@ -15,10 +15,16 @@
 # limitations under the License.
 
 import functools
+import json
+import os
+import threading
+import time
 from collections.abc import Callable, Sequence
 from contextlib import suppress
+from pathlib import Path
 from typing import TypedDict
 
+import numpy as np
 import torch
 import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
@@ -27,6 +33,11 @@ from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
 from lerobot.utils.transition import Transition
 
+# File of a replay buffer stored in a directory, holding its position, size and tensor layout
+REPLAY_BUFFER_HEADER = "replay_buffer.json"
+# File of a prioritized replay buffer stored in a directory, holding the priorities of its transitions
+REPLAY_BUFFER_PRIORITIES = "priorities.npy"
+
 
 class BatchTransition(TypedDict):
     state: dict[str, torch.Tensor]
@@ -36,6 +47,10 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Indices of the transitions in the buffer, to update their priorities
+    indices: torch.Tensor | None = None
+    # Importance-sampling weights of the transitions, all ones when sampled uniformly
+    weights: torch.Tensor | None = None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -77,6 +92,53 @@ def random_shift(images: torch.Tensor, pad: int = 4):
     return random_crop_vectorized(images=images, output_size=(h, w))
 
 
+class SumTree:
+    """
+    Binary tree over `capacity` non-negative priorities, where each node holds the sum of its two children.
+
+    The nodes are stored in a flat array with the root at index 1 and the leaves in the second half, so that a
+    batch of priorities is updated, and a batch of leaves is found from prefix sums of the priorities, with one
+    vectorized operation per level of the tree, i.e. in O(log N).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.depth = max(1, (capacity - 1).bit_length())
+        self.num_leaves = 1 << self.depth
+        self.tree = np.zeros(2 * self.num_leaves, dtype=np.float64)
+
+    def total(self) -> float:
+        """Sum of all the priorities."""
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Priorities of the leaves at `indices`."""
+        return self.tree[indices + self.num_leaves]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Sets the priorities of the leaves at `indices`, and the sums of their ancestors."""
+        nodes = np.asarray(indices, dtype=np.int64) + self.num_leaves
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, prefix_sums: np.ndarray) -> np.ndarray:
+        """
+        Indices of the leaves where the cumulative sum of the priorities reaches `prefix_sums`, i.e. leaves
+        sampled proportionally to their priorities for prefix sums uniform in [0, total).
+        """
+        values = np.array(prefix_sums, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = self.tree[2 * nodes]
+            # Never descend into a subtree without priority, which rounding errors could otherwise reach
+            go_right = (values >= left) & (self.tree[2 * nodes + 1] > 0)
+            values = np.where(go_right, values - left, values)
+            nodes = 2 * nodes + go_right
+        return nodes - self.num_leaves
+
+
 class ReplayBuffer:
     def __init__(
         self,
@@ -87,12 +149,34 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+        store_images_as_uint8: bool = False,
+        storage_dir: str | Path | None = None,
     ):
         """
         Replay buffer for storing transitions.
         It will allocate tensors on the specified device, when the first transition is added.
         NOTE: If you encounter memory issues, you can try to use the `optimize_memory` flag to save memory or
         and use the `storage_device` flag to store the buffer on a different device.
+
+        In prioritized mode (Prioritized Experience Replay, Schaul et al. 2016), transitions are sampled with a
+        probability proportional to their priority to the power `priority_alpha`, kept in a `SumTree`. New
+        transitions get the highest priority seen so far, and the priorities of sampled transitions are updated
+        from their TD errors with `update_priorities`. The bias of the sampling is corrected by the importance-
+        sampling weights of the batch, `(N * P(i)) ** -priority_beta` with `N = len(self)` the number of
+        transitions, normalized by their maximum.
+
+        With `optimize_memory`, the next state of a transition is read from the state of the following slot. When
+        an episode is truncated, the next state of its last transition is stored in the following slot, which is
+        marked as a frame-only slot: it holds a state but no transition, and is never sampled.
+
+        With a `storage_dir`, each storage tensor is a memory-mapped file in that directory, so the capacity isn't
+        limited by the RAM. `flush` writes the tensors and a header with the position and size of the buffer, from
+        which `from_storage_dir` reopens it without copying, e.g. after a restart of the learner. Transitions added
+        after the last flush are lost on reopening, and may have replaced the oldest transitions.
         Args:
             capacity (int): Maximum number of transitions to store in the buffer.
             device (str): The device where the tensors will be moved when sampling ("cuda:0" or "cpu").
@@ -104,9 +188,24 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            prioritized (bool): Whether to sample transitions by priority instead of uniformly.
+            priority_alpha (float): How much the priorities skew the sampling, 0 being uniform.
+            priority_beta (float): How much the importance-sampling weights correct the bias of the sampling,
+                1 being a full correction. It is typically annealed to 1 during training.
+            priority_eps (float): Added to the absolute TD errors so that no transition has a zero priority.
+            store_images_as_uint8 (bool): If True, image states (keys starting with "observation.image") are
+                stored as uint8 pixels, 4 times smaller than float32, and converted back to floats in [0, 1] on
+                `device` when sampling. Images added as floats must be in [0, 1], they are rounded to the nearest
+                pixel value.
+            storage_dir (str | Path | None): If given, directory of the memory-mapped files storing the buffer,
+                whose content is overwritten. Requires `storage_device` to be "cpu".
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
+        if storage_dir is not None and storage_device != "cpu":
+            raise ValueError(
+                f"A buffer stored in a directory must use the 'cpu' storage device, not '{storage_device}'."
+            )
 
         self.capacity = capacity
         self.device = device
@@ -116,8 +215,22 @@ class ReplayBuffer:
         self.initialized = False
         self.optimize_memory = optimize_memory
 
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self._storage_layout: dict[str, dict] = {}
+        self._memmaps: list[np.memmap] = []
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            # The header and priorities of a previous buffer don't describe the overwritten files anymore
+            (self.storage_dir / REPLAY_BUFFER_HEADER).unlink(missing_ok=True)
+            (self.storage_dir / REPLAY_BUFFER_PRIORITIES).unlink(missing_ok=True)
+
         # Track episode boundaries for memory optimization
-        self.episode_ends = torch.zeros(capacity, dtype=torch.bool, device=storage_device)
+        self.episode_ends = self._zeros("episode_ends", (capacity,), torch.bool)
+        # Slots only holding the next state of the last transition of a truncated episode
+        self.frame_only = self._zeros("frame_only", (capacity,), torch.bool)
+        # Number of frame-only slots among the `size` filled slots, which are not transitions
+        self.num_frame_slots = 0
+        self.store_images_as_uint8 = store_images_as_uint8
 
         # If no state_keys provided, default to an empty list
         self.state_keys = state_keys if state_keys is not None else []
@@ -129,6 +242,17 @@ class ReplayBuffer:
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
 
+        self.prioritized = prioritized
+        self.priority_alpha = priority_alpha
+        self.priority_beta = priority_beta
+        self.priority_eps = priority_eps
+        self.max_priority = 1.0
+        self.sum_tree = SumTree(capacity) if prioritized else None
+        # Time spent waiting for the last batch yielded by `get_iterator`
+        self.last_batch_wait_s = 0.0
+        # Updates of the priorities and prefetching threads sampling by priority share the tree
+        self._sum_tree_lock = threading.Lock()
+
     def _initialize_storage(
         self,
         state: dict[str, torch.Tensor],
@@ -142,16 +266,16 @@ class ReplayBuffer:
 
         # Pre-allocate tensors for storage
         self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            key: self._empty(f"states.{key}", (self.capacity, *shape), self._state_dtype(key))
             for key, shape in state_shapes.items()
         }
-        self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
-        self.rewards = torch.empty((self.capacity,), device=self.storage_device)
+        self.actions = self._empty("actions", (self.capacity, *action_shape))
+        self.rewards = self._empty("rewards", (self.capacity,))
 
         if not self.optimize_memory:
             # Standard approach: store states and next_states separately
             self.next_states = {
-                key: torch.empty((self.capacity, *shape), device=self.storage_device)
+                key: self._empty(f"next_states.{key}", (self.capacity, *shape), self._state_dtype(key))
                 for key, shape in state_shapes.items()
             }
         else:
@@ -159,8 +283,8 @@ class ReplayBuffer:
             # Just create a reference to states for consistent API
             self.next_states = self.states  # Just a reference for API consistency
 
-        self.dones = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
-        self.truncateds = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
+        self.dones = self._empty("dones", (self.capacity,), torch.bool)
+        self.truncateds = self._empty("truncateds", (self.capacity,), torch.bool)
 
         # Initialize storage for complementary_info
         self.has_complementary_info = complementary_info is not None
@@ -173,19 +297,102 @@ class ReplayBuffer:
             for key, value in complementary_info.items():
                 if isinstance(value, torch.Tensor):
                     value_shape = value.squeeze(0).shape
-                    self.complementary_info[key] = torch.empty(
-                        (self.capacity, *value_shape), device=self.storage_device
+                    self.complementary_info[key] = self._empty(
+                        f"complementary_info.{key}", (self.capacity, *value_shape)
                     )
                 elif isinstance(value, (int | float)):
                     # Handle scalar values similar to reward
-                    self.complementary_info[key] = torch.empty((self.capacity,), device=self.storage_device)
+                    self.complementary_info[key] = self._empty(f"complementary_info.{key}", (self.capacity,))
                 else:
                     raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
 
         self.initialized = True
 
     def __len__(self):
-        return self.size
+        """Number of transitions stored, the frame-only slots (see `optimize_memory`) being excluded."""
+        return self.size - self.num_frame_slots
+
+    def _empty(
+        self, name: str, shape: tuple[int, ...], dtype: torch.dtype | None = None, mode: str = "w+"
+    ) -> torch.Tensor:
+        """Allocates a storage tensor, memory-mapped to the file `name` of `storage_dir` if there is one.
+
+        A new file (mode "w+") is filled with zeros, an existing one is opened with mode "r+".
+        """
+        dtype = dtype if dtype is not None else torch.get_default_dtype()
+        if self.storage_dir is None:
+            return torch.empty(shape, dtype=dtype, device=self.storage_device)
+
+        self._storage_layout[name] = {"shape": list(shape), "dtype": str(dtype).removeprefix("torch.")}
+        array = np.memmap(
+            self.storage_dir / f"{name}.bin",
+            dtype=torch.empty(0, dtype=dtype).numpy().dtype,
+            mode=mode,
+            shape=tuple(shape),
+        )
+        self._memmaps.append(array)
+        return torch.from_numpy(array)
+
+    def _zeros(self, name: str, shape: tuple[int, ...], dtype: torch.dtype) -> torch.Tensor:
+        if self.storage_dir is None:
+            return torch.zeros(shape, dtype=dtype, device=self.storage_device)
+        return self._empty(name, shape, dtype)
+
+    def flush(self) -> None:
+        """Writes the memory-mapped storage and its header to `storage_dir`, to be reopened by `from_storage_dir`."""
+        if self.storage_dir is None:
+            raise RuntimeError("Only a buffer stored in a directory can be flushed.")
+
+        for array in self._memmaps:
+            array.flush()
+        if self.sum_tree is not None:
+            with self._sum_tree_lock:
+                priorities = self.sum_tree.get(np.arange(self.capacity))
+            np.save(self.storage_dir / REPLAY_BUFFER_PRIORITIES, priorities)
+
+        header = {
+            "capacity": self.capacity,
+            "position": self.position,
+            "size": self.size,
+            "initialized": self.initialized,
+            "optimize_memory": self.optimize_memory,
+            "store_images_as_uint8": self.store_images_as_uint8,
+            "state_keys": list(self.states) if self.initialized else list(self.state_keys),
+            "complementary_info_keys": self.complementary_info_keys if self.initialized else [],
+            "max_priority": self.max_priority,
+            "tensors": self._storage_layout,
+        }
+        # Replace the previous header at once, so that a crash never leaves a partially written one
+        header_path = self.storage_dir / REPLAY_BUFFER_HEADER
+        tmp_path = header_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(header, f, indent=4)
+        os.replace(tmp_path, header_path)
+
+    def _state_dtype(self, key: str) -> torch.dtype:
+        if self.store_images_as_uint8 and key.startswith(OBS_IMAGE):
+            return torch.uint8
+        return torch.get_default_dtype()
+
+    @staticmethod
+    def _to_storage_dtype(storage: torch.Tensor, value: torch.Tensor) -> torch.Tensor:
+        """Converts images in [0, 1] to pixels if they are stored as uint8."""
+        if storage.dtype == torch.uint8 and value.dtype != torch.uint8:
+            value = (value * 255).round_().clamp_(0, 255)
+        return value
+
+    @classmethod
+    def _copy_state(cls, storage: torch.Tensor, index: int, value: torch.Tensor) -> None:
+        """Copies a state into its storage, converting images in [0, 1] to pixels if stored as uint8."""
+        storage[index].copy_(cls._to_storage_dtype(storage, value.squeeze(dim=0)))
+
+    @staticmethod
+    def _load_states(storage: torch.Tensor, indices: torch.Tensor, device: str) -> torch.Tensor:
+        """Gathers states on `device`, converting pixels stored as uint8 to floats in [0, 1] after the transfer."""
+        states = storage[indices].to(device)
+        if states.dtype == torch.uint8:
+            states = states.float().div_(255)
+        return states
 
     def add(
         self,
@@ -204,16 +411,19 @@ class ReplayBuffer:
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+            self._copy_state(self.states[key], self.position, state[key])
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
-                self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
+                self._copy_state(self.next_states[key], self.position, next_state[key])
 
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
         self.dones[self.position] = done
         self.truncateds[self.position] = truncated
+        self.episode_ends[self.position] = bool(done) or bool(truncated)
+        self.num_frame_slots -= int(self.frame_only[self.position])
+        self.frame_only[self.position] = False
 
         # Handle complementary_info if provided and storage is initialized
         if complementary_info is not None and self.has_complementary_info:
@@ -226,38 +436,308 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        if self.sum_tree is not None:
+            self._set_new_transition_priority()
+
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
+        if self.optimize_memory and truncated and not done and next_state is not None:
+            # The next state of the last transition of a truncated episode is needed for its TD target, it's not
+            # the state of the next transition (the first one of the next episode).
+            self._add_next_state_frame(next_state)
+
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """Saves stacked transitions, whose values have a leading batch dimension (see `stack_transitions`).
+
+        This is equivalent to calling `add` on each transition in order, but each storage tensor is written with
+        one slice copy, or two when the transitions wrap around the end of the buffer.
+        """
+        num_transitions = len(action)
+        if num_transitions == 0:
+            return
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: val[0] for key, val in state.items()},
+                action=action[0],
+                complementary_info=(
+                    {key: val[0] for key, val in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        reward = torch.as_tensor(reward)
+        done = torch.as_tensor(done, dtype=torch.bool)
+        truncated = torch.as_tensor(truncated, dtype=torch.bool)
+        transitions = (state, action, reward, next_state, done, truncated, complementary_info)
+
+        start = 0
+        if self.optimize_memory and next_state is not None:
+            # The last transition of each truncated episode is followed by the frame of its next state, see `add`
+            for end in torch.nonzero(truncated & ~done).flatten().tolist():
+                self._write_transitions(*transitions, start=start, stop=end + 1)
+                self._add_next_state_frame({key: val[end] for key, val in next_state.items()})
+                start = end + 1
+        self._write_transitions(*transitions, start=start, stop=num_transitions)
+
+    def _write_transitions(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None,
+        start: int,
+        stop: int,
+    ) -> None:
+        """Writes the stacked transitions `start:stop` in the slots following `self.position`."""
+        if stop - start > self.capacity:
+            # Only the last transitions would remain after writing them one by one
+            self.position = (self.position + stop - start - self.capacity) % self.capacity
+            start = stop - self.capacity
+        num_transitions = stop - start
+        if num_transitions == 0:
+            return
+
+        # Slots from the position to the end of the buffer, then from its start
+        num_first = min(num_transitions, self.capacity - self.position)
+        slices = [(slice(self.position, self.position + num_first), slice(start, start + num_first))]
+        if num_first < num_transitions:
+            slices.append((slice(0, num_transitions - num_first), slice(start + num_first, stop)))
+
+        for dst, src in slices:
+            for key in self.states:
+                self.states[key][dst].copy_(self._to_storage_dtype(self.states[key], state[key][src]))
+                if not self.optimize_memory:
+                    self.next_states[key][dst].copy_(
+                        self._to_storage_dtype(self.next_states[key], next_state[key][src])
+                    )
+
+            self.actions[dst].copy_(action[src])
+            self.rewards[dst].copy_(reward[src])
+            self.dones[dst].copy_(done[src])
+            self.truncateds[dst].copy_(truncated[src])
+            self.episode_ends[dst].copy_(done[src] | truncated[src])
+            self.num_frame_slots -= int(self.frame_only[dst].sum())
+            self.frame_only[dst] = False
+
+            if complementary_info is not None and self.has_complementary_info:
+                for key in self.complementary_info_keys:
+                    if key in complementary_info:
+                        self.complementary_info[key][dst].copy_(complementary_info[key][src])
+
+        if self.sum_tree is not None:
+            self._set_new_transition_priority(num_transitions)
+
+        self.position = (self.position + num_transitions) % self.capacity
+        self.size = min(self.size + num_transitions, self.capacity)
+
+    def _add_next_state_frame(self, next_state: dict[str, torch.Tensor]) -> None:
+        """Stores the next state of the last added transition in a frame-only slot."""
+        for key in self.states:
+            self._copy_state(self.states[key], self.position, next_state[key])
+        # The slot holds no transition, its other values are never sampled
+        self.actions[self.position] = 0
+        self.rewards[self.position] = 0
+        for key in self.complementary_info_keys:
+            self.complementary_info[key][self.position] = 0
+        self.dones[self.position] = False
+        self.truncateds[self.position] = False
+        self.episode_ends[self.position] = False
+        self.num_frame_slots += 1 - int(self.frame_only[self.position])
+        self.frame_only[self.position] = True
+
+        if self.sum_tree is not None:
+            self._set_new_transition_priority()
+
+        self.position = (self.position + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def _resample_unsampleable_indices(self, indices: torch.Tensor, high: int, max_retries: int = 3) -> None:
+        """Replaces in place the sampled frame-only slots and last transition, whose next state isn't stored yet.
+
+        They are few, so they are sampled again a few times, before drawing among all the sampleable slots.
+        """
+        invalid = ~self._is_sampleable(indices)
+        for _ in range(max_retries):
+            if not invalid.any():
+                return
+            indices[invalid] = torch.randint(
+                low=0, high=high, size=(int(invalid.sum()),), device=self.storage_device
+            )
+            invalid = ~self._is_sampleable(indices)
+
+        if invalid.any():
+            candidates = torch.arange(high, device=self.storage_device)
+            candidates = candidates[self._is_sampleable(candidates)]
+            if len(candidates) == 0:
+                raise RuntimeError(
+                    "Cannot sample from a buffer without a transition whose next state is stored."
+                )
+            indices[invalid] = candidates[
+                torch.randint(len(candidates), (int(invalid.sum()),), device=self.storage_device)
+            ]
+
+    def _is_sampleable(self, indices: torch.Tensor) -> torch.Tensor:
+        """Whether the slots at `indices` hold transitions whose next state is stored, with `optimize_memory`."""
+        return ~self.frame_only[indices] & (indices != (self.position - 1) % self.capacity)
+
+    def _set_new_transition_priority(self, num_transitions: int = 1) -> None:
+        """Gives the transitions being added from `self.position` the highest priority seen so far."""
+        max_priority = self.max_priority**self.priority_alpha
+        indices = (self.position + np.arange(num_transitions)) % self.capacity
+        priorities = np.full(num_transitions, max_priority)
+        if self.optimize_memory:
+            # The next state of a transition is the state of the following one: a transition can only be
+            # sampled once the following one is added.
+            priorities[-1] = 0.0
+            previous = (self.position - 1) % self.capacity
+            if self.size > 0 and num_transitions < self.capacity and not self.frame_only[previous]:
+                indices = np.append(indices, previous)
+                priorities = np.append(priorities, max_priority)
+        with self._sum_tree_lock:
+            self.sum_tree.update(indices, priorities)
+
+    def _sample_prioritized_indices(self, batch_size: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Samples indices proportionally to their priority, with one sample in each of `batch_size` equal
+        segments of the total priority, and computes their importance-sampling weights."""
+        segments = torch.arange(batch_size, dtype=torch.float64) + torch.rand(batch_size, dtype=torch.float64)
+        with self._sum_tree_lock:
+            total = self.sum_tree.total()
+            if total <= 0:
+                raise RuntimeError("Cannot sample from the buffer before a transition has a next state.")
+            indices = self.sum_tree.find(segments.numpy() * (total / batch_size))
+            probabilities = self.sum_tree.get(indices) / total
+
+        weights = (len(self) * probabilities) ** -self.priority_beta
+        weights /= weights.max()
+        return (
+            torch.from_numpy(indices).to(self.storage_device),
+            torch.from_numpy(weights).to(device=self.device, dtype=torch.float32),
+        )
+
+    def update_priorities(self, indices: torch.Tensor, td_errors: torch.Tensor) -> None:
+        """
+        Sets the priorities of sampled transitions from their TD errors, in prioritized mode.
+
+        Args:
+            indices (torch.Tensor): Indices of the transitions, as returned in `BatchTransition["indices"]`.
+            td_errors (torch.Tensor): TD errors of the transitions, e.g. from the critic loss.
+        """
+        if self.sum_tree is None:
+            raise RuntimeError("Priorities can only be updated in prioritized mode.")
+
+        priorities = td_errors.detach().abs().double().cpu().numpy() + self.priority_eps
+        if self.optimize_memory:
+            # Sampled transitions may have been replaced by ones that can't be sampled yet, or by frames
+            keep = self._is_sampleable(indices.to(self.storage_device)).cpu().numpy()
+            indices, priorities = indices.cpu().numpy()[keep], priorities[keep]
+        else:
+            indices = indices.cpu().numpy()
+        if len(indices) == 0:
+            return
+
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        with self._sum_tree_lock:
+            self.sum_tree.update(indices, priorities**self.priority_alpha)
+
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
             raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
 
+        idx, batch_weights = self._sample_indices(batch_size)
+        return self._batch_to_device(self._gather_batch(idx), idx, batch_weights)
+
+    def _sample_indices(self, batch_size: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Samples the indices of a batch on the storage device, and their importance-sampling weights."""
         batch_size = min(batch_size, self.size)
         high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
 
+        if self.sum_tree is not None:
+            return self._sample_prioritized_indices(batch_size)
+
         # Random indices for sampling - create on the same device as storage
         idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        if self.optimize_memory:
+            self._resample_unsampleable_indices(idx, high)
+        return idx, torch.ones(batch_size, device=self.device)
 
-        # Identify image keys that need augmentation
-        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
+    def _gather_batch(
+        self, idx: torch.Tensor, out: dict[str, torch.Tensor] | None = None, pin_memory: bool = False
+    ) -> dict[str, torch.Tensor]:
+        """
+        Gathers the transitions at `idx` on the storage device, in the dtypes of the storage.
 
-        # Create batched state and next_state
-        batch_state = {}
-        batch_next_state = {}
+        Args:
+            idx (torch.Tensor): Indices of the transitions.
+            out (dict[str, torch.Tensor] | None): Staging tensors to gather into, by name. Missing ones, or ones of
+                another batch size, are allocated and added to `out`.
+            pin_memory (bool): Whether to allocate the staging tensors in pinned memory, for asynchronous copies
+                to a CUDA device.
 
-        # First pass: load all state tensors to target device
+        Returns:
+            dict[str, torch.Tensor]: The gathered tensors, named "state.<key>", "next_state.<key>", "action",
+                "reward", "done", "truncated" and "complementary_info.<key>".
+        """
+        next_idx = (idx + 1) % self.capacity if self.optimize_memory else idx
+        sources = {}
         for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
+            sources[f"state.{key}"] = (self.states[key], idx)
+            sources[f"next_state.{key}"] = (self.next_states[key], next_idx)
+        sources["action"] = (self.actions, idx)
+        sources["reward"] = (self.rewards, idx)
+        sources["done"] = (self.dones, idx)
+        sources["truncated"] = (self.truncateds, idx)
+        if self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                sources[f"complementary_info.{key}"] = (self.complementary_info[key], idx)
 
-            if not self.optimize_memory:
-                # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
-            else:
-                # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+        if out is None:
+            return {name: storage[indices] for name, (storage, indices) in sources.items()}
+
+        for name, (storage, indices) in sources.items():
+            shape = (len(indices), *storage.shape[1:])
+            if name not in out or out[name].shape != shape:
+                out[name] = torch.empty(shape, dtype=storage.dtype, pin_memory=pin_memory)
+            torch.index_select(storage, 0, indices, out=out[name])
+        return out
+
+    def _batch_to_device(
+        self,
+        batch: dict[str, torch.Tensor],
+        idx: torch.Tensor,
+        batch_weights: torch.Tensor,
+        non_blocking: bool = False,
+    ) -> BatchTransition:
+        """Moves a batch gathered by `_gather_batch` to `device`, where images stored as uint8 are converted to
+        floats and augmented."""
+
+        def to_device(tensor: torch.Tensor) -> torch.Tensor:
+            tensor = tensor.to(self.device, non_blocking=non_blocking)
+            if tensor.dtype == torch.uint8:
+                tensor = tensor.float().div_(255)
+            return tensor
+
+        batch_size = len(idx)
+        batch_state = {key: to_device(batch[f"state.{key}"]) for key in self.states}
+        batch_next_state = {key: to_device(batch[f"next_state.{key}"]) for key in self.states}
+
+        # Identify image keys that need augmentation
+        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -280,27 +760,23 @@ class ReplayBuffer:
                 # Next states start after the states at index (i*2+1)*batch_size and also take up batch_size slots
                 batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
 
-        # Sample other tensors
-        batch_actions = self.actions[idx].to(self.device)
-        batch_rewards = self.rewards[idx].to(self.device)
-        batch_dones = self.dones[idx].to(self.device).float()
-        batch_truncateds = self.truncateds[idx].to(self.device).float()
-
         # Sample complementary_info if available
         batch_complementary_info = None
         if self.has_complementary_info:
-            batch_complementary_info = {}
-            for key in self.complementary_info_keys:
-                batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
+            batch_complementary_info = {
+                key: to_device(batch[f"complementary_info.{key}"]) for key in self.complementary_info_keys
+            }
 
         return BatchTransition(
             state=batch_state,
-            action=batch_actions,
-            reward=batch_rewards,
+            action=to_device(batch["action"]),
+            reward=to_device(batch["reward"]),
             next_state=batch_next_state,
-            done=batch_dones,
-            truncated=batch_truncateds,
+            done=to_device(batch["done"]).float(),
+            truncated=to_device(batch["truncated"]).float(),
             complementary_info=batch_complementary_info,
+            indices=idx,
+            weights=batch_weights,
         )
 
     def get_iterator(
@@ -313,6 +789,9 @@ class ReplayBuffer:
         Creates an infinite iterator that yields batches of transitions.
         Will automatically restart when internal iterator is exhausted.
 
+        The time the last batch was waited for is kept in `last_batch_wait_s`: when it's not close to zero, the
+        learner is starved of data.
+
         Args:
             batch_size (int): Size of batches to sample
             async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
@@ -338,6 +817,12 @@ class ReplayBuffer:
         background thread. The design is intentionally simple and avoids busy
         waiting / complex state management.
 
+        When the storage is on the CPU and `device` is a CUDA device, batches are gathered into `queue_size + 2`
+        reused staging buffers in pinned memory, then copied, converted and augmented on a side stream, so that
+        the copies overlap with the computations of the learner. A staging buffer is reused once the learner
+        fetches the batch following the one it was used for, the batches yielded being copies on the device.
+        Otherwise, each batch is sampled into its own tensors.
+
         Args:
             batch_size (int): Size of batches to sample.
             queue_size (int): Maximum number of prefetched batches to keep in
@@ -351,33 +836,86 @@ class ReplayBuffer:
 
         data_queue: queue.Queue = queue.Queue(maxsize=queue_size)
         shutdown_event = threading.Event()
+        producer_errors: list[Exception] = []
+
+        # On the CPU, `.to(device)` would return the staging buffers themselves, which would then be overwritten
+        # while the learner still uses the batches
+        use_staging = (
+            torch.device(self.storage_device).type == "cpu" and torch.device(self.device).type == "cuda"
+        )
+        side_stream = torch.cuda.Stream(device=self.device) if use_staging else None
+        num_slots = queue_size + 2
+        staging_buffers: list[dict[str, torch.Tensor]] = [{} for _ in range(num_slots)]
+        # Events marking when the copies from each staging buffer are done, before it can be reused
+        copy_events: list[torch.cuda.Event | None] = [None] * num_slots
+        free_slots: queue.Queue = queue.Queue()
+        for slot in range(num_slots):
+            free_slots.put(slot)
+
+        def prepare_batch(slot: int) -> tuple[BatchTransition, torch.cuda.Event | None]:
+            if side_stream is None:
+                return self.sample(batch_size), None
+
+            if copy_events[slot] is not None:
+                copy_events[slot].synchronize()
+            with torch.cuda.stream(side_stream):
+                idx, batch_weights = self._sample_indices(batch_size)
+                batch = self._gather_batch(idx, out=staging_buffers[slot], pin_memory=True)
+                batch = self._batch_to_device(batch, idx, batch_weights, non_blocking=True)
+                copy_events[slot] = torch.cuda.Event()
+                copy_events[slot].record(side_stream)
+            return batch, copy_events[slot]
 
         def producer() -> None:
             """Continuously put sampled batches into the queue until shutdown."""
             while not shutdown_event.is_set():
                 try:
-                    batch = self.sample(batch_size)
-                    # The timeout ensures the thread unblocks if the queue is full
-                    # and the shutdown event gets set meanwhile.
-                    data_queue.put(batch, block=True, timeout=0.5)
-                except queue.Full:
-                    # Queue is full – loop again (will re-check shutdown_event)
+                    slot = free_slots.get(block=True, timeout=0.5)
+                except queue.Empty:
                     continue
-                except Exception:
-                    # Surface any unexpected error and terminate the producer.
+                try:
+                    item = (*prepare_batch(slot), slot)
+                except Exception as e:
+                    # Surface any unexpected error to the consumer and terminate the producer.
+                    producer_errors.append(e)
                     shutdown_event.set()
+                    return
+                while not shutdown_event.is_set():
+                    try:
+                        # The timeout ensures the thread unblocks if the queue is full
+                        # and the shutdown event gets set meanwhile.
+                        data_queue.put(item, block=True, timeout=0.5)
+                        break
+                    except queue.Full:
+                        # Queue is full – loop again (will re-check shutdown_event)
+                        continue
 
         producer_thread = threading.Thread(target=producer, daemon=True)
         producer_thread.start()
 
+        previous_slot = None
         try:
             while not shutdown_event.is_set():
+                start = time.perf_counter()
                 try:
-                    yield data_queue.get(block=True)
-                except Exception:
-                    # If the producer already set the shutdown flag we exit.
-                    if shutdown_event.is_set():
-                        break
+                    batch, ready_event, slot = data_queue.get(block=True, timeout=0.5)
+                except queue.Empty:
+                    continue
+                self.last_batch_wait_s = time.perf_counter() - start
+
+                if ready_event is not None:
+                    # The batch is used on the current stream, after the copies of the side stream
+                    current_stream = torch.cuda.current_stream(self.device)
+                    current_stream.wait_event(ready_event)
+                    _record_stream(batch, current_stream)
+                # The learner is done with the previous batch, its staging buffer can be reused
+                if previous_slot is not None:
+                    free_slots.put(previous_slot)
+                previous_slot = slot
+                yield batch
+
+            if producer_errors:
+                raise producer_errors[0]
         finally:
             shutdown_event.set()
             # Drain the queue quickly to help the thread exit if it's blocked on `put`.
@@ -409,7 +947,105 @@ class ReplayBuffer:
         enqueue(queue_size)
         while queue:
             yield queue.popleft()
+            start = time.perf_counter()
             enqueue(1)
+            self.last_batch_wait_s = time.perf_counter() - start
+
+    @classmethod
+    def from_storage_dir(
+        cls,
+        storage_dir: str | Path,
+        device: str = "cuda:0",
+        image_augmentation_function: Callable | None = None,
+        use_drq: bool = True,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+    ) -> "ReplayBuffer":
+        """
+        Reopen a replay buffer stored in a directory, as of its last `flush`, without copying its storage.
+
+        Args:
+            storage_dir (str | Path): Directory of the buffer, given as `storage_dir` when it was created.
+            device (str): The device where sampled tensors will be moved.
+            image_augmentation_function (Optional[Callable]): Function for data augmentation on images.
+            use_drq (bool): Whether to use the default DRQ image augmentation style, when sampling in the buffer.
+            prioritized (bool): Whether to sample transitions by priority, see `ReplayBuffer`. If the buffer
+                wasn't prioritized when flushed, all its transitions get the same priority.
+            priority_alpha (float): How much the priorities skew the sampling, 0 being uniform.
+            priority_beta (float): How much the importance-sampling weights correct the bias of the sampling.
+            priority_eps (float): Added to the absolute TD errors so that no transition has a zero priority.
+
+        Returns:
+            ReplayBuffer: The replay buffer, whose storage is memory-mapped to the files of `storage_dir`.
+        """
+        storage_dir = Path(storage_dir)
+        header_path = storage_dir / REPLAY_BUFFER_HEADER
+        if not header_path.exists():
+            raise FileNotFoundError(f"No replay buffer was flushed to {storage_dir}.")
+        with open(header_path) as f:
+            header = json.load(f)
+
+        replay_buffer = cls(
+            capacity=header["capacity"],
+            device=device,
+            state_keys=header["state_keys"],
+            image_augmentation_function=image_augmentation_function,
+            use_drq=use_drq,
+            storage_device="cpu",
+            optimize_memory=header["optimize_memory"],
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            priority_eps=priority_eps,
+            store_images_as_uint8=header["store_images_as_uint8"],
+        )
+        replay_buffer.storage_dir = storage_dir
+        tensors = {
+            name: replay_buffer._empty(name, tuple(spec["shape"]), getattr(torch, spec["dtype"]), mode="r+")
+            for name, spec in header["tensors"].items()
+        }
+        replay_buffer.episode_ends = tensors["episode_ends"]
+        replay_buffer.frame_only = tensors["frame_only"]
+
+        if header["initialized"]:
+            replay_buffer.states = {key: tensors[f"states.{key}"] for key in header["state_keys"]}
+            if replay_buffer.optimize_memory:
+                replay_buffer.next_states = replay_buffer.states
+            else:
+                replay_buffer.next_states = {
+                    key: tensors[f"next_states.{key}"] for key in header["state_keys"]
+                }
+            replay_buffer.actions = tensors["actions"]
+            replay_buffer.rewards = tensors["rewards"]
+            replay_buffer.dones = tensors["dones"]
+            replay_buffer.truncateds = tensors["truncateds"]
+            replay_buffer.complementary_info_keys = header["complementary_info_keys"]
+            replay_buffer.complementary_info = {
+                key: tensors[f"complementary_info.{key}"] for key in header["complementary_info_keys"]
+            }
+            replay_buffer.has_complementary_info = bool(replay_buffer.complementary_info_keys)
+            replay_buffer.initialized = True
+
+        replay_buffer.position = header["position"]
+        replay_buffer.size = header["size"]
+        replay_buffer.num_frame_slots = int(replay_buffer.frame_only[: replay_buffer.size].sum())
+        replay_buffer.max_priority = header["max_priority"]
+
+        if replay_buffer.sum_tree is not None and replay_buffer.size > 0:
+            priorities_path = storage_dir / REPLAY_BUFFER_PRIORITIES
+            if priorities_path.exists():
+                priorities = np.load(priorities_path)
+            else:
+                priorities = np.zeros(replay_buffer.capacity)
+                priorities[: replay_buffer.size] = replay_buffer.max_priority**priority_alpha
+                if replay_buffer.optimize_memory:
+                    slots = torch.arange(replay_buffer.capacity)
+                    priorities[~replay_buffer._is_sampleable(slots).numpy()] = 0.0
+            replay_buffer.sum_tree.update(np.arange(replay_buffer.capacity), priorities)
+
+        return replay_buffer
 
     @classmethod
     def from_lerobot_dataset(
@@ -422,6 +1058,12 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+        store_images_as_uint8: bool = False,
+        storage_dir: str | Path | None = None,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +1079,12 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            prioritized (bool): Whether to sample transitions by priority, see `ReplayBuffer`.
+            priority_alpha (float): How much the priorities skew the sampling, 0 being uniform.
+            priority_beta (float): How much the importance-sampling weights correct the bias of the sampling.
+            priority_eps (float): Added to the absolute TD errors so that no transition has a zero priority.
+            store_images_as_uint8 (bool): If True, stores the images as uint8 pixels, see `ReplayBuffer`.
+            storage_dir (str | Path | None): If given, directory of the memory-mapped files storing the buffer.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +1106,12 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            priority_eps=priority_eps,
+            store_images_as_uint8=store_images_as_uint8,
+            storage_dir=storage_dir,
         )
 
         # Convert dataset to transitions
@@ -569,12 +1223,14 @@ class ReplayBuffer:
 
         for idx in range(self.size):
             actual_idx = (self.position - self.size + idx) % self.capacity
+            if self.frame_only[actual_idx]:
+                continue
 
             frame_dict = {}
 
             # Fill the data for state keys
             for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+                frame_dict[key] = self._load_states(self.states[key], actual_idx, "cpu")
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -758,6 +1414,16 @@ def guess_feature_info(t, name: str):
         }
 
 
+def _record_stream(batch: BatchTransition, stream: torch.cuda.Stream) -> None:
+    """Marks the tensors of a batch allocated on another stream as used by `stream`, so that their memory isn't
+    reused before the work queued on `stream` is done."""
+    for value in batch.values():
+        values = value.values() if isinstance(value, dict) else [value]
+        for tensor in values:
+            if isinstance(tensor, torch.Tensor) and tensor.is_cuda:
+                tensor.record_stream(stream)
+
+
 def concatenate_batch_transitions(
     left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition
 ) -> BatchTransition:
@@ -831,4 +1497,11 @@ def concatenate_batch_transitions(
                 else:
                     left_info[key] = right_info[key]
 
+    # Concatenate the sampling information, if sampled from buffers
+    for key in ("indices", "weights"):
+        if left_batch_transitions.get(key) is not None and right_batch_transition.get(key) is not None:
+            left_batch_transitions[key] = torch.cat(
+                [left_batch_transitions[key], right_batch_transition[key]], dim=0
+            )
+
     return left_batch_transitions
@@ -66,7 +66,7 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import REPLAY_BUFFER_HEADER, ReplayBuffer, concatenate_batch_transitions
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -93,7 +93,13 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import (
+    Transition,
+    index_transitions,
+    move_state_dict_to_device,
+    move_transition_to_device,
+    stack_transitions,
+)
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -295,6 +301,8 @@ def add_actor_information_and_train(
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
+    use_prioritized_replay = cfg.policy.use_prioritized_replay
+    priority_beta = cfg.policy.priority_beta
 
     # Initialize logging for multiprocessing
     if not use_threads(cfg):
@@ -390,10 +398,17 @@ def add_actor_information_and_train(
                 batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
             )
 
+        if use_prioritized_replay:
+            # Anneal the importance-sampling correction to a full correction at the end of training
+            replay_buffer.priority_beta = priority_beta + (1.0 - priority_beta) * min(
+                1.0, optimization_step / online_steps
+            )
+
         time_for_one_optimization_step = time.time()
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
             batch = next(online_iterator)
+            online_indices = batch["indices"]
 
             if dataset_repo_id is not None:
                 batch_offline = next(offline_iterator)
@@ -423,9 +438,15 @@ def add_actor_information_and_train(
                 "next_observation_feature": next_observation_features,
                 "complementary_info": batch["complementary_info"],
             }
+            if use_prioritized_replay:
+                forward_batch["weights"] = batch["weights"]
 
             # Use the forward method for critic loss
             critic_output = policy.forward(forward_batch, model="critic")
+            if use_prioritized_replay:
+                replay_buffer.update_priorities(
+                    online_indices, critic_output["td_error"][: len(online_indices)]
+                )
 
             # Main critic optimization
             loss_critic = critic_output["loss_critic"]
@@ -452,6 +473,7 @@ def add_actor_information_and_train(
 
         # Sample for the last update in the UTD ratio
         batch = next(online_iterator)
+        online_indices = batch["indices"]
 
         if dataset_repo_id is not None:
             batch_offline = next(offline_iterator)
@@ -481,8 +503,12 @@ def add_actor_information_and_train(
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
         }
+        if use_prioritized_replay:
+            forward_batch["weights"] = batch["weights"]
 
         critic_output = policy.forward(forward_batch, model="critic")
+        if use_prioritized_replay:
+            replay_buffer.update_priorities(online_indices, critic_output["td_error"][: len(online_indices)])
 
         loss_critic = critic_output["loss_critic"]
         optimizers["critic"].zero_grad()
@@ -559,8 +585,13 @@ def add_actor_information_and_train(
         # Log training metrics at specified intervals
         if optimization_step % log_freq == 0:
             training_infos["replay_buffer_size"] = len(replay_buffer)
+            # Time waited for the last batch, the learner is starved of data when it's not close to zero
+            training_infos["replay_buffer_wait_ms"] = replay_buffer.last_batch_wait_s * 1e3
             if offline_replay_buffer is not None:
                 training_infos["offline_replay_buffer_size"] = len(offline_replay_buffer)
+                training_infos["offline_replay_buffer_wait_ms"] = (
+                    offline_replay_buffer.last_batch_wait_s * 1e3
+                )
             training_infos["Optimization step"] = optimization_step
 
             # Log training metrics
@@ -694,7 +725,7 @@ def save_training_checkpoint(
     2. Saves the policy model, configuration, and optimizer states
     3. Saves the current interaction step for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
-    5. Saves the replay buffer as a dataset for later use
+    5. Saves the replay buffer as a dataset for later use, or flushes it if it's stored in memory-mapped files
     6. If an offline replay buffer exists, saves it as a separate dataset
 
     Args:
@@ -735,17 +766,21 @@ def save_training_checkpoint(
     # Update the "last" symlink
     update_last_checkpoint(checkpoint_dir)
 
-    # TODO : temporary save replay buffer here, remove later when on the robot
-    # We want to control this with the keyboard inputs
-    dataset_dir = os.path.join(cfg.output_dir, "dataset")
-    if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
-        shutil.rmtree(dataset_dir)
-
-    # Save dataset
-    # NOTE: Handle the case where the dataset repo id is not specified in the config
-    # eg. RL training without demonstrations data
-    repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
-    replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
+    if replay_buffer.storage_dir is not None:
+        # The buffer is already on disk, only its header and the pending writes have to be saved
+        replay_buffer.flush()
+    else:
+        # TODO : temporary save replay buffer here, remove later when on the robot
+        # We want to control this with the keyboard inputs
+        dataset_dir = os.path.join(cfg.output_dir, "dataset")
+        if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
+            shutil.rmtree(dataset_dir)
+
+        # Save dataset
+        # NOTE: Handle the case where the dataset repo id is not specified in the config
+        # eg. RL training without demonstrations data
+        repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
+        replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
 
     if offline_replay_buffer is not None:
         dataset_offline_dir = os.path.join(cfg.output_dir, "dataset_offline")
@@ -938,6 +973,9 @@ def initialize_replay_buffer(
     """
     Initialize a replay buffer, either empty or from a dataset if resuming.
 
+    With `use_memmap_replay_buffer`, the buffer is stored in memory-mapped files under the output directory, which
+    are reopened as is when resuming.
+
     Args:
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
@@ -946,6 +984,24 @@ def initialize_replay_buffer(
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
+    storage_dir = None
+    if cfg.policy.use_memmap_replay_buffer:
+        storage_dir = os.path.join(cfg.output_dir, "replay_buffer")
+
+    if (
+        cfg.resume
+        and storage_dir is not None
+        and os.path.exists(os.path.join(storage_dir, REPLAY_BUFFER_HEADER))
+    ):
+        logging.info(f"Resume training reopen the online replay buffer stored in {storage_dir}")
+        return ReplayBuffer.from_storage_dir(
+            storage_dir,
+            device=device,
+            prioritized=cfg.policy.use_prioritized_replay,
+            priority_alpha=cfg.policy.priority_alpha,
+            priority_beta=cfg.policy.priority_beta,
+        )
+
     if not cfg.resume:
         return ReplayBuffer(
             capacity=cfg.policy.online_buffer_capacity,
@@ -953,6 +1009,11 @@ def initialize_replay_buffer(
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            prioritized=cfg.policy.use_prioritized_replay,
+            priority_alpha=cfg.policy.priority_alpha,
+            priority_beta=cfg.policy.priority_beta,
+            store_images_as_uint8=cfg.policy.store_images_as_uint8,
+            storage_dir=storage_dir,
         )
 
     logging.info("Resume training load the online dataset")
@@ -972,6 +1033,11 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        prioritized=cfg.policy.use_prioritized_replay,
+        priority_alpha=cfg.policy.priority_alpha,
+        priority_beta=cfg.policy.priority_beta,
+        store_images_as_uint8=cfg.policy.store_images_as_uint8,
+        storage_dir=storage_dir,
     )
 
 
@@ -1010,6 +1076,7 @@ def initialize_offline_replay_buffer(
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        store_images_as_uint8=cfg.policy.store_images_as_uint8,
     )
     return offline_replay_buffer
 
@@ -1094,6 +1161,30 @@ def check_nan_in_transition(
     return nan_detected
 
 
+def check_nan_in_transitions(transitions: Transition) -> torch.Tensor:
+    """
+    Check for NaN values in stacked transitions (see `stack_transitions`).
+
+    Args:
+        transitions: Stacked transitions, whose values have a leading batch dimension
+
+    Returns:
+        torch.Tensor: Boolean mask of the transitions whose states, next states or actions contain NaN values
+    """
+    tensors = {
+        **{f"observations[{key}]": val for key, val in transitions["state"].items()},
+        **{f"next_state[{key}]": val for key, val in transitions["next_state"].items()},
+        "actions": transitions[ACTION],
+    }
+    nan_mask = torch.zeros(len(transitions[ACTION]), dtype=torch.bool, device=transitions[ACTION].device)
+    for name, tensor in tensors.items():
+        tensor_nan_mask = torch.isnan(tensor.reshape(len(tensor), -1)).any(dim=1)
+        if tensor_nan_mask.any():
+            logging.error(f"{name} contains NaN values in {int(tensor_nan_mask.sum())} transitions")
+            nan_mask |= tensor_nan_mask
+    return nan_mask
+
+
 def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
     logging.debug("[LEARNER] Pushing actor policy to the queue")
 
@@ -1145,28 +1236,29 @@ def process_transitions(
         shutdown_event: Event to signal shutdown
     """
     while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
-
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
-                continue
+        transitions = bytes_to_transitions(buffer=transition_queue.get())
 
-            replay_buffer.add(**transition)
-
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+        # Actors may send transitions stacked or as a list
+        if isinstance(transitions, list):
+            if len(transitions) == 0:
+                continue
+            transitions = stack_transitions(transitions)
+        transitions = move_transition_to_device(transition=transitions, device=device)
+
+        # Skip transitions with NaN values
+        nan_mask = check_nan_in_transitions(transitions)
+        if nan_mask.any():
+            logging.warning(f"[LEARNER] NaN detected in {int(nan_mask.sum())} transitions, skipping them")
+            transitions = index_transitions(transitions, ~nan_mask)
+
+        replay_buffer.add_batch(**transitions)
+
+        # Add to offline buffer the interventions
+        complementary_info = transitions.get("complementary_info") or {}
+        if dataset_repo_id is not None and TeleopEvents.IS_INTERVENTION in complementary_info:
+            is_intervention = complementary_info[TeleopEvents.IS_INTERVENTION].bool().reshape(-1)
+            if is_intervention.any():
+                offline_replay_buffer.add_batch(**index_transitions(transitions, is_intervention))
 
 
 def process_interaction_messages(
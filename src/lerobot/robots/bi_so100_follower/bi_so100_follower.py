@@ -19,6 +19,7 @@ import time
 from functools import cached_property
 from typing import Any
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.robots.so100_follower import SO100Follower
 from lerobot.robots.so100_follower.config_so100_follower import SO100FollowerConfig
@@ -65,6 +66,7 @@ class BiSO100Follower(Robot):
         self.left_arm = SO100Follower(left_arm_config)
         self.right_arm = SO100Follower(right_arm_config)
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
 
     @property
     def _motors_ft(self) -> dict[str, type]:
@@ -128,11 +130,11 @@ class BiSO100Follower(Robot):
         right_obs = self.right_arm.get_observation()
         obs_dict.update({f"right_{key}": value for key, value in right_obs.items()})
 
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # Capture synchronized images from cameras
+        start = time.perf_counter()
+        obs_dict.update(self.camera_group.async_read())
+        dt_ms = (time.perf_counter() - start) * 1e3
+        logger.debug(f"{self} read cameras: {dt_ms:.1f}ms")
 
         return obs_dict
 
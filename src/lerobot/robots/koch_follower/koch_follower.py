@@ -19,6 +19,7 @@ import time
 from functools import cached_property
 from typing import Any
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.motors.dynamixel import (
@@ -61,6 +62,7 @@ class KochFollower(Robot):
             calibration=self.calibration,
         )
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
 
     @property
     def _motors_ft(self) -> dict[str, type]:
@@ -193,12 +195,11 @@ class KochFollower(Robot):
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # Capture synchronized images from cameras
+        start = time.perf_counter()
+        obs_dict.update(self.camera_group.async_read())
+        dt_ms = (time.perf_counter() - start) * 1e3
+        logger.debug(f"{self} read cameras: {dt_ms:.1f}ms")
 
         return obs_dict
 
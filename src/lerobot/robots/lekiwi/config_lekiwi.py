@@ -19,6 +19,10 @@ from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig
 
 from ..config import RobotConfig
 
+# Key of the observations sent by the host describing the cameras whose JPEG images are forwarded as captured
+# (see `mjpeg_passthrough`), so that the client decodes them like `JpegFrame`
+JPEG_FRAMES_KEY = "jpeg_frames"
+
 
 def lekiwi_cameras_config() -> dict[str, CameraConfig]:
     return {
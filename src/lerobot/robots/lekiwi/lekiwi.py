@@ -22,6 +22,7 @@ from typing import Any
 
 import numpy as np
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.motors.feetech import (
@@ -72,6 +73,7 @@ class LeKiwi(Robot):
         self.arm_motors = [motor for motor in self.bus.motors if motor.startswith("arm")]
         self.base_motors = [motor for motor in self.bus.motors if motor.startswith("base")]
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
 
     @property
     def _state_ft(self) -> dict[str, type]:
@@ -360,12 +362,11 @@ class LeKiwi(Robot):
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # Capture synchronized images from cameras
+        start = time.perf_counter()
+        obs_dict.update(self.camera_group.async_read())
+        dt_ms = (time.perf_counter() - start) * 1e3
+        logger.debug(f"{self} read cameras: {dt_ms:.1f}ms")
 
         return obs_dict
 
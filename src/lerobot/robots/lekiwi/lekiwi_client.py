@@ -23,11 +23,13 @@ from typing import Any
 import cv2
 import numpy as np
 
+from lerobot.cameras.configs import ColorMode
+from lerobot.cameras.opencv import JpegFrame
 from lerobot.utils.constants import ACTION, OBS_STATE
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..robot import Robot
-from .config_lekiwi import LeKiwiClientConfig
+from .config_lekiwi import JPEG_FRAMES_KEY, LeKiwiClientConfig
 
 
 class LeKiwiClient(Robot):
@@ -195,6 +197,20 @@ class LeKiwiClient(Robot):
             logging.error(f"Error decoding base64 image data: {e}")
             return None
 
+    def _jpeg_frame_from_b64(
+        self, image_b64: str, shape: list[int], color_mode: str, rotation: int | None
+    ) -> JpegFrame | None:
+        """Wraps a base64 encoded JPEG image captured by a camera in a `JpegFrame`, without decoding it."""
+        if not image_b64:
+            return None
+        try:
+            jpg_data = np.frombuffer(base64.b64decode(image_b64), dtype=np.uint8)
+        except (TypeError, ValueError) as e:
+            logging.error(f"Error decoding base64 image data: {e}")
+            return None
+        height, width = shape[:2]
+        return JpegFrame(jpg_data, height, width, ColorMode(color_mode), rotation)
+
     def _remote_state_from_obs(
         self, observation: dict[str, Any]
     ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
@@ -206,12 +222,16 @@ class LeKiwiClient(Robot):
 
         obs_dict: dict[str, Any] = {**flat_state, OBS_STATE: state_vec}
 
-        # Decode images
-        current_frames: dict[str, np.ndarray] = {}
+        # Decode images. The JPEG images forwarded as captured by the cameras are decoded lazily.
+        jpeg_frames = observation.get(JPEG_FRAMES_KEY, {})
+        current_frames: dict[str, np.ndarray | JpegFrame] = {}
         for cam_name, image_b64 in observation.items():
             if cam_name not in self._cameras_ft:
                 continue
-            frame = self._decode_image_from_b64(image_b64)
+            if cam_name in jpeg_frames:
+                frame = self._jpeg_frame_from_b64(image_b64, **jpeg_frames[cam_name])
+            else:
+                frame = self._decode_image_from_b64(image_b64)
             if frame is not None:
                 current_frames[cam_name] = frame
 
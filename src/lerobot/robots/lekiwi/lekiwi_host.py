@@ -22,9 +22,12 @@ from dataclasses import dataclass, field
 
 import cv2
 import draccus
+import numpy as np
 import zmq
 
-from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
+from lerobot.cameras.opencv import JpegFrame
+
+from .config_lekiwi import JPEG_FRAMES_KEY, LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
 
 
@@ -99,15 +102,26 @@ def main(cfg: LeKiwiServerConfig):
 
             last_observation = robot.get_observation()
 
-            # Encode ndarrays to base64 strings
+            # Encode frames to base64 strings. The JPEG images of the cameras in MJPEG passthrough mode are
+            # forwarded as captured, instead of being decoded and encoded again.
+            jpeg_frames = {}
             for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
+                frame = last_observation[cam_key]
+                if isinstance(frame, JpegFrame):
+                    ret, buffer = True, frame.data
+                    jpeg_frames[cam_key] = {
+                        "shape": list(frame.shape),
+                        "color_mode": frame.color_mode.value,
+                        "rotation": frame.rotation,
+                    }
+                else:
+                    ret, buffer = cv2.imencode(".jpg", np.asarray(frame), [int(cv2.IMWRITE_JPEG_QUALITY), 90])
                 if ret:
                     last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
                 else:
                     last_observation[cam_key] = ""
+            if jpeg_frames:
+                last_observation[JPEG_FRAMES_KEY] = jpeg_frames
 
             # Send the observation to the remote agent
             try:
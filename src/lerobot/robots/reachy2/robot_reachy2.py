@@ -20,6 +20,7 @@ from typing import Any
 import numpy as np
 from reachy2_sdk import ReachySDK
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 
 from ..robot import Robot
@@ -84,6 +85,7 @@ class Reachy2Robot(Robot):
 
         self.reachy: None | ReachySDK = None
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
 
         self.logs: dict[str, float] = {}
 
@@ -173,9 +175,8 @@ class Reachy2Robot(Robot):
         obs_dict.update(self._get_state())
         self.logs["read_pos_dt_s"] = time.perf_counter() - before_read_t
 
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            obs_dict[cam_key] = cam.async_read()
+        # Capture synchronized images from cameras
+        obs_dict.update(self.camera_group.async_read())
 
         return obs_dict
 
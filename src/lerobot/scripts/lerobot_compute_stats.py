@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Recompute the statistics of a LeRobot dataset (`meta/stats.json`) with bounded memory.
+
+Unlike the statistics written at recording time, which are aggregated from per-episode statistics (quantiles
+being averaged across episodes), the statistics computed by this script are the ones of the whole dataset:
+- Numerical features are streamed from the parquet files, one row group at a time.
+- Image and video features are sampled in each episode (see `sample_indices`) and decoded in chunks.
+
+Episodes are processed in parallel by a pool of processes, each feeding a `RunningQuantileStats` per feature.
+The partial statistics of the episodes are merged exactly. All the statistics of a feature are created with
+the same `bin_range` (computed in a first pass over the numerical columns, and [0, 255] for images), so that
+they share the same histogram bin width even for episodes where a feature is constant.
+
+Example:
+
+```shell
+lerobot-compute-stats \
+    --repo_id=lerobot/pusht \
+    --num_workers=8
+```
+"""
+
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import PIL.Image
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+from lerobot.configs import parser
+from lerobot.datasets.compute_stats import (
+    DEFAULT_QUANTILES,
+    RunningQuantileStats,
+    auto_downsample_height_width,
+    sample_indices,
+)
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.utils import DEFAULT_DATA_PATH, DEFAULT_VIDEO_PATH, write_stats
+from lerobot.datasets.video_utils import decode_video_frames_batch
+from lerobot.utils.utils import init_logging
+
+# uint8 images are accumulated in [0, 255] and normalized to [0, 1] at the end
+IMAGE_BIN_RANGE = (0.0, 255.0)
+
+
+@dataclass
+class ComputeStatsConfig:
+    # Dataset identifier (e.g. `lerobot/pusht`).
+    repo_id: str
+    # Root directory where the dataset is stored (e.g. 'dataset/path').
+    root: str | None = None
+    # Number of processes computing the statistics of episodes in parallel. Defaults to the number of CPUs.
+    # Episodes are processed in the main process if 0 or 1.
+    num_workers: int | None = None
+    # Maximum number of images or video frames decoded at once, per process.
+    frames_per_chunk: int = 32
+    # Number of histogram bins used to estimate quantiles.
+    num_quantile_bins: int = 5000
+    # Video backend used to decode frames ("torchcodec" or "pyav"). Defaults to the platform default.
+    video_backend: str | None = None
+    # Upload the dataset with its new statistics to the hub.
+    push_to_hub: bool = False
+
+
+def get_numeric_keys(features: dict) -> list[str]:
+    return [key for key, ft in features.items() if ft["dtype"] not in ["image", "video", "string"]]
+
+
+def column_to_numpy(column: pa.ChunkedArray | pa.Array, shape: tuple[int, ...]) -> np.ndarray:
+    """Converts a (possibly nested list) parquet column into a float64 array of shape (num_rows, *shape)."""
+    num_rows = len(column)
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    while (
+        pa.types.is_list(column.type)
+        or pa.types.is_large_list(column.type)
+        or pa.types.is_fixed_size_list(column.type)
+    ):
+        column = pc.list_flatten(column)
+    return column.to_numpy(zero_copy_only=False).astype(np.float64).reshape(num_rows, *shape)
+
+
+def iter_row_groups(
+    parquet_file: pq.ParquetFile,
+    columns: list[str],
+    from_index: int | None = None,
+    to_index: int | None = None,
+):
+    """Yields the rows of `parquet_file` one row group at a time, optionally restricted to a range of `index`.
+
+    Row groups which don't overlap with [from_index, to_index) are skipped using the parquet column statistics.
+    """
+    index_column = parquet_file.schema_arrow.get_field_index("index")
+    for row_group in range(parquet_file.num_row_groups):
+        index_stats = parquet_file.metadata.row_group(row_group).column(index_column).statistics
+        if (
+            from_index is not None
+            and index_stats is not None
+            and index_stats.has_min_max
+            and (index_stats.max < from_index or index_stats.min >= to_index)
+        ):
+            continue
+        table = parquet_file.read_row_group(row_group, columns=[*columns, "index"])
+        if from_index is not None:
+            index = table["index"]
+            table = table.filter(pc.and_(pc.greater_equal(index, from_index), pc.less(index, to_index)))
+        if table.num_rows > 0:
+            yield table
+
+
+def compute_file_ranges(data_path: Path, features: dict) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Computes the min and max of every numerical feature in a data file."""
+    keys = get_numeric_keys(features)
+    ranges = {}
+    for table in iter_row_groups(pq.ParquetFile(data_path), keys):
+        for key in keys:
+            values = column_to_numpy(table[key], features[key]["shape"])
+            values = values.reshape(-1, values.shape[-1])
+            low, high = values.min(axis=0), values.max(axis=0)
+            if key in ranges:
+                low, high = np.minimum(ranges[key][0], low), np.maximum(ranges[key][1], high)
+            ranges[key] = (low, high)
+    return ranges
+
+
+def _update_image_stats(stats: RunningQuantileStats, images: list[np.ndarray]) -> None:
+    # (num_images, C, H, W) -> (num_images * H * W, C)
+    images = np.stack([auto_downsample_height_width(img) for img in images])
+    stats.update(images.transpose(0, 2, 3, 1).reshape(-1, images.shape[1]))
+
+
+def compute_episode_partial_stats(
+    root: Path,
+    episode: dict,
+    features: dict,
+    fps: int,
+    ranges: dict[str, tuple[np.ndarray, np.ndarray]],
+    frames_per_chunk: int = 32,
+    num_quantile_bins: int = 5000,
+    video_backend: str | None = None,
+) -> dict[str, tuple[RunningQuantileStats, int]]:
+    """Computes the partial statistics of an episode, to be merged with the ones of the other episodes.
+
+    Args:
+        root: Root directory of the dataset.
+        episode: Metadata of the episode, as stored in `meta/episodes`.
+        features: Features of the dataset.
+        fps: Frame rate of the dataset.
+        ranges: Range of every numerical feature in the whole dataset, used as histograms bin range.
+        frames_per_chunk: Maximum number of images or video frames decoded at once.
+        num_quantile_bins: Number of histogram bins used to estimate quantiles.
+        video_backend: Video backend used to decode frames.
+
+    Returns:
+        dict: Feature key -> (partial statistics, number of frames they were computed on).
+    """
+    from_index, to_index = episode["dataset_from_index"], episode["dataset_to_index"]
+    data_path = root / DEFAULT_DATA_PATH.format(
+        chunk_index=episode["data/chunk_index"], file_index=episode["data/file_index"]
+    )
+    parquet_file = pq.ParquetFile(data_path)
+    results = {}
+
+    numeric_keys = get_numeric_keys(features)
+    for key in numeric_keys:
+        stats = RunningQuantileStats(DEFAULT_QUANTILES, num_quantile_bins, bin_range=ranges[key])
+        results[key] = (stats, to_index - from_index)
+    for table in iter_row_groups(parquet_file, numeric_keys, from_index, to_index):
+        for key in numeric_keys:
+            results[key][0].update(column_to_numpy(table[key], features[key]["shape"]))
+
+    sampled = from_index + np.array(sample_indices(to_index - from_index))
+    for key, ft in features.items():
+        if ft["dtype"] == "image":
+            stats = RunningQuantileStats(DEFAULT_QUANTILES, num_quantile_bins, bin_range=IMAGE_BIN_RANGE)
+            for table in iter_row_groups(parquet_file, [key], from_index, to_index):
+                rows = np.flatnonzero(np.isin(table["index"].to_numpy(), sampled))
+                for start in range(0, len(rows), frames_per_chunk):
+                    images = [
+                        np.array(PIL.Image.open(io.BytesIO(image["bytes"])).convert("RGB")).transpose(2, 0, 1)
+                        for image in table[key].take(rows[start : start + frames_per_chunk]).to_pylist()
+                    ]
+                    _update_image_stats(stats, images)
+            results[key] = (stats, len(sampled))
+
+        elif ft["dtype"] == "video":
+            stats = RunningQuantileStats(DEFAULT_QUANTILES, num_quantile_bins, bin_range=IMAGE_BIN_RANGE)
+            video_path = root / DEFAULT_VIDEO_PATH.format(
+                video_key=key,
+                chunk_index=episode[f"videos/{key}/chunk_index"],
+                file_index=episode[f"videos/{key}/file_index"],
+            )
+            timestamps = episode[f"videos/{key}/from_timestamp"] + (sampled - from_index) / fps
+            for start in range(0, len(timestamps), frames_per_chunk):
+                frames = decode_video_frames_batch(
+                    video_path,
+                    timestamps[start : start + frames_per_chunk].tolist(),
+                    tolerance_s=1 / fps / 2,
+                    backend=video_backend,
+                    return_uint8=True,
+                )
+                _update_image_stats(stats, list(frames.numpy()))
+            results[key] = (stats, len(sampled))
+
+    return results
+
+
+def compute_dataset_stats(
+    dataset: LeRobotDataset,
+    num_workers: int | None = None,
+    frames_per_chunk: int = 32,
+    num_quantile_bins: int = 5000,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Computes the statistics of a whole dataset, streaming its data across a pool of processes.
+
+    Args:
+        dataset: The dataset to compute statistics for.
+        num_workers: Number of processes. Defaults to the number of CPUs. The main process is used if 0 or 1.
+        frames_per_chunk: Maximum number of images or video frames decoded at once, per process.
+        num_quantile_bins: Number of histogram bins used to estimate quantiles.
+
+    Returns:
+        dict: Statistics of every non-string feature, in the format of `meta/stats.json`.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    meta = dataset.meta
+    features = {key: ft for key, ft in meta.features.items() if ft["dtype"] != "string"}
+    episodes = meta.episodes.select_columns(
+        [col for col in meta.episodes.column_names if not col.startswith("stats/")]
+    )
+
+    executor = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+    map_fn = executor.map if executor is not None else map
+    try:
+        # First pass over the numerical columns: a common histogram range for each feature
+        data_paths = sorted(
+            {
+                meta.root / DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+                for chunk_idx, file_idx in zip(
+                    episodes["data/chunk_index"], episodes["data/file_index"], strict=True
+                )
+            }
+        )
+        ranges = {}
+        file_ranges = map_fn(compute_file_ranges, data_paths, [features] * len(data_paths))
+        for file_range in tqdm(file_ranges, total=len(data_paths), desc="Computing ranges"):
+            for key, (low, high) in file_range.items():
+                if key in ranges:
+                    low, high = np.minimum(ranges[key][0], low), np.maximum(ranges[key][1], high)
+                ranges[key] = (low, high)
+
+        # Second pass over episodes: partial statistics are merged as soon as they are computed
+        merged = {}
+        partial_stats = map_fn(
+            compute_episode_partial_stats,
+            [meta.root] * len(episodes),
+            episodes,
+            [features] * len(episodes),
+            [meta.fps] * len(episodes),
+            [ranges] * len(episodes),
+            [frames_per_chunk] * len(episodes),
+            [num_quantile_bins] * len(episodes),
+            [dataset.video_backend] * len(episodes),
+        )
+        for ep_stats in tqdm(partial_stats, total=len(episodes), desc="Computing stats"):
+            for key, (stats, count) in ep_stats.items():
+                if key not in merged:
+                    merged[key] = (RunningQuantileStats(DEFAULT_QUANTILES, num_quantile_bins), 0)
+                merged[key][0].merge(stats)
+                merged[key] = (merged[key][0], merged[key][1] + count)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    dataset_stats = {}
+    for key, (stats, count) in merged.items():
+        ft_stats = stats.get_statistics()
+        if features[key]["dtype"] in ["image", "video"]:
+            ft_stats = {k: (v / 255.0).reshape(-1, 1, 1) for k, v in ft_stats.items() if k != "count"}
+        ft_stats["count"] = np.array([count])
+        dataset_stats[key] = ft_stats
+    return dataset_stats
+
+
+@parser.wrap()
+def compute_stats(cfg: ComputeStatsConfig) -> None:
+    dataset = LeRobotDataset(
+        cfg.repo_id, root=cfg.root, video_backend=cfg.video_backend, use_video_frame_index=False
+    )
+    logging.info(f"Computing statistics of {cfg.repo_id} ({dataset.num_episodes} episodes)")
+    stats = compute_dataset_stats(
+        dataset,
+        num_workers=cfg.num_workers,
+        frames_per_chunk=cfg.frames_per_chunk,
+        num_quantile_bins=cfg.num_quantile_bins,
+    )
+    dataset.meta.stats = stats
+    write_stats(stats, dataset.root)
+    logging.info(f"Statistics written to {dataset.root}")
+
+    if cfg.push_to_hub:
+        dataset.push_to_hub()
+
+
+def main() -> None:
+    init_logging()
+    compute_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,13 @@ Split into more than two splits:
         --operation.type split \
         --operation.splits '{"train": 0.6, "val": 0.2, "test": 0.2}'
 
+Estimate the cost of deleting episodes without editing the dataset:
+    python -m lerobot.scripts.lerobot_edit_dataset \
+        --repo_id lerobot/pusht \
+        --operation.type delete_episodes \
+        --operation.episode_indices "[0, 2, 5]" \
+        --dry_run true
+
 Merge multiple datasets:
     python -m lerobot.scripts.lerobot_edit_dataset \
         --repo_id lerobot/pusht_merged \
@@ -77,7 +84,9 @@ from pathlib import Path
 
 from lerobot.configs import parser
 from lerobot.datasets.dataset_tools import (
+    _fractions_to_episode_indices,
     delete_episodes,
+    estimate_video_edits,
     merge_datasets,
     remove_feature,
     split_dataset,
@@ -118,6 +127,10 @@ class EditDatasetConfig:
     root: str | None = None
     new_repo_id: str | None = None
     push_to_hub: bool = False
+    # Number of processes rewriting video files, all the CPUs if None
+    num_workers: int | None = None
+    # Log the planned video edits and their estimated cost, without editing the dataset
+    dry_run: bool = False
 
 
 def get_output_path(repo_id: str, new_repo_id: str | None, root: Path | None) -> tuple[str, Path]:
@@ -147,6 +160,15 @@ def handle_delete_episodes(cfg: EditDatasetConfig) -> None:
         raise ValueError("episode_indices must be specified for delete_episodes operation")
 
     dataset = LeRobotDataset(cfg.repo_id, root=cfg.root)
+
+    if cfg.dry_run:
+        episodes_to_keep = [
+            i for i in range(dataset.meta.total_episodes) if i not in cfg.operation.episode_indices
+        ]
+        estimate = estimate_video_edits(dataset, episodes_to_keep, num_workers=cfg.num_workers)
+        logging.info(f"Video edits to delete episodes {cfg.operation.episode_indices}:\n{estimate}")
+        return
+
     output_repo_id, output_dir = get_output_path(
         cfg.repo_id, cfg.new_repo_id, Path(cfg.root) if cfg.root else None
     )
@@ -160,6 +182,7 @@ def handle_delete_episodes(cfg: EditDatasetConfig) -> None:
         episode_indices=cfg.operation.episode_indices,
         output_dir=output_dir,
         repo_id=output_repo_id,
+        num_workers=cfg.num_workers,
     )
 
     logging.info(f"Dataset saved to {output_dir}")
@@ -181,8 +204,17 @@ def handle_split(cfg: EditDatasetConfig) -> None:
 
     dataset = LeRobotDataset(cfg.repo_id, root=cfg.root)
 
+    if cfg.dry_run:
+        splits = cfg.operation.splits
+        if all(isinstance(v, float) for v in splits.values()):
+            splits = _fractions_to_episode_indices(dataset.meta.total_episodes, splits)
+        for split_name, episodes in splits.items():
+            estimate = estimate_video_edits(dataset, episodes, num_workers=cfg.num_workers)
+            logging.info(f"Video edits of split '{split_name}':\n{estimate}")
+        return
+
     logging.info(f"Splitting dataset {cfg.repo_id} with splits: {cfg.operation.splits}")
-    split_datasets = split_dataset(dataset, splits=cfg.operation.splits)
+    split_datasets = split_dataset(dataset, splits=cfg.operation.splits, num_workers=cfg.num_workers)
 
     for split_name, split_ds in split_datasets.items():
         split_repo_id = f"{cfg.repo_id}_{split_name}"
@@ -248,6 +280,7 @@ def handle_remove_feature(cfg: EditDatasetConfig) -> None:
         feature_names=cfg.operation.feature_names,
         output_dir=output_dir,
         repo_id=output_repo_id,
+        num_workers=cfg.num_workers,
     )
 
     logging.info(f"Dataset saved to {output_dir}")
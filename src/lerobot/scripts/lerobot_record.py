@@ -112,6 +112,8 @@ from lerobot.teleoperators import (  # noqa: F401
 from lerobot.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop
 from lerobot.utils.constants import ACTION, OBS_STR
 from lerobot.utils.control_utils import (
+    BackgroundWorker,
+    ControlLoopTimings,
     init_keyboard_listener,
     is_headless,
     predict_action,
@@ -119,7 +121,7 @@ from lerobot.utils.control_utils import (
     sanity_check_dataset_robot_compatibility,
 )
 from lerobot.utils.import_utils import register_third_party_devices
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.robot_utils import RateScheduler
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
@@ -164,6 +166,9 @@ class DatasetRecordConfig:
     # Number of episodes to record before batch encoding videos
     # Set to 1 for immediate encoding (default behavior), or higher for batched encoding
     video_encoding_batch_size: int = 1
+    # Encode videos while recording, as frames are captured, instead of writing frames as PNG images which are
+    # encoded at the end of each episode. This shortens the time spent saving episodes between resets.
+    streaming_encoding: bool = False
     # Rename map for the observation to override the image and state keys
     rename_map: dict[str, str] = field(default_factory=dict)
 
@@ -228,9 +233,14 @@ class RecordConfig:
                                V
                     [ robot.send_action() ] -- (Robot Executes)
                                V
-                    ( Save to Dataset )
-                               V
-                  ( Rerun Log / Loop Wait )
+     .-------------------------+-------------------------.
+     V                         V                         V
+( Save to Dataset )       ( Rerun Log )              ( Loop Wait )
+  [dataset worker]        [display worker]         [control thread]
+
+The control thread only reads the observation, computes and sends the action: frames are saved to the dataset
+and logged to Rerun by background workers fed by bounded queues. Cameras are read by their own threads. The
+latency of each stage and the number of control periods overrun are returned by `record_loop`.
 """
 
 
@@ -256,7 +266,7 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+) -> ControlLoopTimings:
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
@@ -286,87 +296,165 @@ def record_loop(
         preprocessor.reset()
         postprocessor.reset()
 
-    timestamp = 0
-    start_episode_t = time.perf_counter()
-    while timestamp < control_time_s:
-        start_loop_t = time.perf_counter()
-
-        if events["exit_early"]:
-            events["exit_early"] = False
-            break
-
-        # Get robot observation
-        obs = robot.get_observation()
-
-        # Applies a pipeline to the raw robot observation, default is IdentityProcessor
-        obs_processed = robot_observation_processor(obs)
-
-        if policy is not None or dataset is not None:
-            observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix=OBS_STR)
-
-        # Get action from either policy or teleop
-        if policy is not None and preprocessor is not None and postprocessor is not None:
-            action_values = predict_action(
-                observation=observation_frame,
-                policy=policy,
-                device=get_safe_torch_device(policy.config.device),
-                preprocessor=preprocessor,
-                postprocessor=postprocessor,
-                use_amp=policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
-            )
+    timings = ControlLoopTimings(fps)
 
-            act_processed_policy: RobotAction = make_robot_action(action_values, dataset.features)
-
-        elif policy is None and isinstance(teleop, Teleoperator):
-            act = teleop.get_action()
-
-            # Applies a pipeline to the raw teleop action, default is IdentityProcessor
-            act_processed_teleop = teleop_action_processor((act, obs))
-
-        elif policy is None and isinstance(teleop, list):
-            arm_action = teleop_arm.get_action()
-            arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
-            keyboard_action = teleop_keyboard.get_action()
-            base_action = robot._from_keyboard_to_base_action(keyboard_action)
-            act = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
-            act_processed_teleop = teleop_action_processor((act, obs))
-        else:
-            logging.info(
-                "No policy or teleoperator provided, skipping action generation."
-                "This is likely to happen when resetting the environment without a teleop device."
-                "The robot won't be at its rest position at the start of the next episode."
-            )
-            continue
-
-        # Applies a pipeline to the action, default is IdentityProcessor
-        if policy is not None and act_processed_policy is not None:
-            action_values = act_processed_policy
-            robot_action_to_send = robot_action_processor((act_processed_policy, obs))
-        else:
-            action_values = act_processed_teleop
-            robot_action_to_send = robot_action_processor((act_processed_teleop, obs))
-
-        # Send action to robot
-        # Action can eventually be clipped using `max_relative_target`,
-        # so action actually sent is saved in the dataset. action = postprocessor.process(action)
-        # TODO(steven, pepijn, adil): we should use a pipeline step to clip the action, so the sent action is the action that we input to the robot.
-        _sent_action = robot.send_action(robot_action_to_send)
-
-        # Write to dataset
-        if dataset is not None:
+    def write_frame(observation_frame: dict | None, obs_processed: RobotObservation, action_values: dict):
+        with timings.time("dataset"):
+            if observation_frame is None:
+                observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix=OBS_STR)
             action_frame = build_dataset_frame(dataset.features, action_values, prefix=ACTION)
-            frame = {**observation_frame, **action_frame, "task": single_task}
-            dataset.add_frame(frame)
+            dataset.add_frame({**observation_frame, **action_frame, "task": single_task})
 
-        if display_data:
+    def display_frame(obs_processed: RobotObservation, action_values: dict):
+        with timings.time("display"):
             log_rerun_data(observation=obs_processed, action=action_values)
 
-        dt_s = time.perf_counter() - start_loop_t
-        busy_wait(1 / fps - dt_s)
-
-        timestamp = time.perf_counter() - start_episode_t
+    # Frames are written in order and never dropped, whereas a late frame is not worth displaying
+    workers = []
+    dataset_worker = display_worker = None
+    if dataset is not None:
+        dataset_worker = BackgroundWorker(write_frame, maxsize=fps, name="record_loop_dataset")
+        workers.append(dataset_worker)
+    if display_data:
+        display_worker = BackgroundWorker(
+            display_frame, maxsize=1, drop_when_full=True, name="record_loop_display"
+        )
+        workers.append(display_worker)
+
+    scheduler = RateScheduler(fps)
+    logged_no_action = False
+    try:
+        timestamp = 0
+        start_episode_t = time.perf_counter()
+        scheduler.start()
+        while timestamp < control_time_s:
+            start_loop_t = time.perf_counter()
+
+            if events["exit_early"]:
+                events["exit_early"] = False
+                break
+
+            with timings.time("observation"):
+                # Get robot observation
+                obs = robot.get_observation()
+
+                # Applies a pipeline to the raw robot observation, default is IdentityProcessor
+                obs_processed = robot_observation_processor(obs)
+
+            # The observation frame is built by the dataset worker, unless it is needed by the policy
+            observation_frame = None
+            if policy is not None:
+                observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix=OBS_STR)
+
+            # Get action from either policy or teleop
+            with timings.time("action"):
+                if policy is not None and preprocessor is not None and postprocessor is not None:
+                    action_values = predict_action(
+                        observation=observation_frame,
+                        policy=policy,
+                        device=get_safe_torch_device(policy.config.device),
+                        preprocessor=preprocessor,
+                        postprocessor=postprocessor,
+                        use_amp=policy.config.use_amp,
+                        task=single_task,
+                        robot_type=robot.robot_type,
+                    )
+
+                    act_processed_policy: RobotAction = make_robot_action(action_values, dataset.features)
+
+                elif policy is None and isinstance(teleop, Teleoperator):
+                    act = teleop.get_action()
+
+                    # Applies a pipeline to the raw teleop action, default is IdentityProcessor
+                    act_processed_teleop = teleop_action_processor((act, obs))
+
+                elif policy is None and isinstance(teleop, list):
+                    arm_action = teleop_arm.get_action()
+                    arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
+                    keyboard_action = teleop_keyboard.get_action()
+                    base_action = robot._from_keyboard_to_base_action(keyboard_action)
+                    act = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
+                    act_processed_teleop = teleop_action_processor((act, obs))
+                else:
+                    if not logged_no_action:
+                        logging.info(
+                            "No policy or teleoperator provided, skipping action generation."
+                            "This is likely to happen when resetting the environment without a teleop device."
+                            "The robot won't be at its rest position at the start of the next episode."
+                        )
+                        logged_no_action = True
+                    act_processed_teleop = None
+
+                # Applies a pipeline to the action, default is IdentityProcessor
+                if policy is not None and act_processed_policy is not None:
+                    action_values = act_processed_policy
+                    robot_action_to_send = robot_action_processor((act_processed_policy, obs))
+                elif act_processed_teleop is not None:
+                    action_values = act_processed_teleop
+                    robot_action_to_send = robot_action_processor((act_processed_teleop, obs))
+                else:
+                    action_values = None
+
+            # Without an action, the loop still keeps its rate until the end of the episode
+            if action_values is not None:
+                # Send action to robot
+                # Action can eventually be clipped using `max_relative_target`,
+                # so action actually sent is saved in the dataset. action = postprocessor.process(action)
+                # TODO(steven, pepijn, adil): we should use a pipeline step to clip the action, so the sent action is the action that we input to the robot.
+                with timings.time("send_action"):
+                    _sent_action = robot.send_action(robot_action_to_send)
+
+                # Write to dataset
+                if dataset_worker is not None:
+                    dataset_worker.submit(observation_frame, obs_processed, action_values)
+
+                if display_worker is not None:
+                    display_worker.submit(obs_processed, action_values)
+
+            timings.add("control", time.perf_counter() - start_loop_t)
+            jitter_s = scheduler.wait()
+            if jitter_s is not None:
+                timings.add("jitter", jitter_s)
+
+            timestamp = time.perf_counter() - start_episode_t
+    finally:
+        # Wait for all the frames to be written to the dataset
+        for worker in workers:
+            worker.stop(raise_error=False)
+    for worker in workers:
+        worker.stop()
+
+    return timings
+
+
+def log_image_writer_stats(
+    dataset: LeRobotDataset, previous_stats: dict[str, int | float] | None = None
+) -> dict[str, int | float] | None:
+    """Log the backpressure of the image writer, which slows down the control loop when it can't keep up.
+
+    The counters of the image writer are cumulative, so the difference with `previous_stats`, the stats returned
+    by the previous call, is logged: e.g. the frames blocked or dropped during the last episode only.
+
+    Returns:
+        The current stats of the image writer, to be passed to the next call, or None without image writer.
+    """
+    if dataset.image_writer is None:
+        return None
+    stats = dataset.image_writer.get_stats()
+    delta = {
+        key: stats[key] - (previous_stats[key] if previous_stats is not None else 0)
+        for key in ["num_frames", "num_blocked_frames", "blocked_time_s", "num_dropped_frames"]
+    }
+    message = (
+        f"Image writer: {delta['num_frames']} frames queued (max queue depth {stats['max_queue_depth']} "
+        f"since the start), {delta['num_blocked_frames']} blocked for {delta['blocked_time_s']:.2f}s, "
+        f"{delta['num_dropped_frames']} dropped"
+    )
+    if delta["num_blocked_frames"] > 0 or delta["num_dropped_frames"] > 0:
+        logging.warning(message + ". Consider increasing the number of image writer processes or threads.")
+    else:
+        logging.info(message)
+    return stats
 
 
 @parser.wrap()
@@ -401,6 +489,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             cfg.dataset.repo_id,
             root=cfg.dataset.root,
             batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+            streaming_encoding=cfg.dataset.streaming_encoding,
         )
 
         if hasattr(robot, "cameras") and len(robot.cameras) > 0:
@@ -422,6 +511,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             image_writer_processes=cfg.dataset.num_image_writer_processes,
             image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
             batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+            streaming_encoding=cfg.dataset.streaming_encoding,
         )
 
     # Load pretrained policy
@@ -447,9 +537,10 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
 
     with VideoEncodingManager(dataset):
         recorded_episodes = 0
+        image_writer_stats = None
         while recorded_episodes < cfg.dataset.num_episodes and not events["stop_recording"]:
             log_say(f"Recording episode {dataset.num_episodes}", cfg.play_sounds)
-            record_loop(
+            timings = record_loop(
                 robot=robot,
                 events=events,
                 fps=cfg.dataset.fps,
@@ -492,7 +583,16 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 dataset.clear_episode_buffer()
                 continue
 
-            dataset.save_episode()
+            image_writer_stats = log_image_writer_stats(dataset, image_writer_stats)
+            if timings.num_overruns > 0:
+                logging.warning(f"Control loop missed {timings.num_overruns} periods: {timings}")
+            else:
+                logging.info(f"Control loop: {timings}")
+            # Timings are stored in the episodes metadata, unless the dataset was recorded without them
+            if dataset.meta.episodes is None or "timing/num_overruns" in dataset.meta.episodes.column_names:
+                dataset.save_episode(episode_metadata=timings.to_episode_metadata())
+            else:
+                dataset.save_episode()
             recorded_episodes += 1
 
     log_say("Stop recording", cfg.play_sounds, blocking=True)
@@ -34,6 +34,7 @@ from lerobot.envs.utils import close_envs
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.factory import make_policy, make_pre_post_processors
 from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.processor import DeviceProcessorStep, ImageToFloatProcessorStep
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.scripts.lerobot_eval import eval_policy_all
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
@@ -243,6 +244,17 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
         **postprocessor_kwargs,
     )
 
+    if cfg.dataset.return_uint8_frames and not any(
+        isinstance(step, ImageToFloatProcessorStep) for step in preprocessor.steps
+    ):
+        # Frames are sent to the device as uint8 and converted to float right after the device step
+        steps = list(preprocessor.steps)
+        device_step_idx = next(
+            (i for i, step in enumerate(steps) if isinstance(step, DeviceProcessorStep)), -1
+        )
+        steps.insert(device_step_idx + 1, ImageToFloatProcessorStep())
+        preprocessor.steps = steps
+
     if is_main_process:
         logging.info("Creating optimizer and scheduler")
     optimizer, lr_scheduler = make_optimizer_and_scheduler(cfg, policy)
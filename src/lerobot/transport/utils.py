@@ -134,14 +134,16 @@ def bytes_to_python_object(buffer: bytes) -> Any:
     return obj
 
 
-def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+def bytes_to_transitions(buffer: bytes) -> list[Transition] | Transition:
+    """Deserialize a list of transitions, or transitions stacked by `stack_transitions`."""
     buffer = io.BytesIO(buffer)
     buffer.seek(0)
     transitions = torch.load(buffer, weights_only=True)
     return transitions
 
 
-def transitions_to_bytes(transitions: list[Transition]) -> bytes:
+def transitions_to_bytes(transitions: list[Transition] | Transition) -> bytes:
+    """Serialize a list of transitions, or transitions stacked by `stack_transitions`."""
     buffer = io.BytesIO()
     torch.save(transitions, buffer)
     return buffer.getvalue()
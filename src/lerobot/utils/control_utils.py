@@ -18,8 +18,12 @@
 
 
 import logging
+import queue
+import threading
+import time
 import traceback
-from contextlib import nullcontext
+from collections.abc import Callable
+from contextlib import contextmanager, nullcontext
 from copy import copy
 from functools import cache
 from typing import Any
@@ -233,3 +237,131 @@ def sanity_check_dataset_robot_compatibility(
         raise ValueError(
             "Dataset metadata compatibility check failed with mismatches:\n" + "\n".join(mismatches)
         )
+
+
+# Stages of `record_loop`: the control thread reads the observation, computes the action and sends it to the robot
+# ("control" being the whole control step, and "jitter" the lateness of the wake-up for the next one), while the
+# frames are written to the dataset and displayed by workers
+CONTROL_LOOP_STAGES = ("observation", "action", "send_action", "control", "jitter", "dataset", "display")
+# Upper edges of the bins of the latency histograms of the stages, in milliseconds
+LATENCY_HISTOGRAM_BINS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, float("inf"))
+
+
+class ControlLoopTimings:
+    """
+    Latencies of the stages of a control loop, and number of control periods overrun.
+
+    Stages can be timed from several threads. The timings of an episode are stored in the episodes metadata with
+    `to_episode_metadata`.
+
+    Example
+    --------
+    ```python
+    timings = ControlLoopTimings(fps=30)
+    with timings.time("observation"):
+        obs = robot.get_observation()
+    ```
+    """
+
+    def __init__(self, fps: float):
+        self.period_s = 1 / fps
+        self.latencies: dict[str, list[float]] = {stage: [] for stage in CONTROL_LOOP_STAGES}
+        self.num_overruns = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def time(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def add(self, stage: str, latency_s: float) -> None:
+        with self._lock:
+            self.latencies.setdefault(stage, []).append(latency_s)
+            if stage == "control" and latency_s > self.period_s:
+                self.num_overruns += 1
+
+    def to_episode_metadata(self) -> dict[str, Any]:
+        """
+        Flattened timings, e.g. `timing/observation/p99_ms`, with the same keys for every episode so that they can
+        be stored in the episodes metadata. The histograms count the latencies in the bins of
+        `LATENCY_HISTOGRAM_BINS_MS`.
+        """
+        metadata = {"timing/num_overruns": self.num_overruns}
+        with self._lock:
+            for stage in CONTROL_LOOP_STAGES:
+                latencies_ms = np.array(self.latencies[stage]) * 1e3
+                counts, _ = np.histogram(latencies_ms, bins=(0, *LATENCY_HISTOGRAM_BINS_MS))
+                metadata[f"timing/{stage}/histogram"] = counts
+                for name, value in [
+                    ("mean_ms", latencies_ms.mean() if len(latencies_ms) else 0.0),
+                    ("p50_ms", np.percentile(latencies_ms, 50) if len(latencies_ms) else 0.0),
+                    ("p99_ms", np.percentile(latencies_ms, 99) if len(latencies_ms) else 0.0),
+                    ("max_ms", latencies_ms.max() if len(latencies_ms) else 0.0),
+                ]:
+                    metadata[f"timing/{stage}/{name}"] = float(value)
+        return metadata
+
+    def __str__(self) -> str:
+        stages = ", ".join(
+            f"{stage} {np.mean(latencies) * 1e3:.1f}/{np.percentile(latencies, 99) * 1e3:.1f}"
+            for stage, latencies in self.latencies.items()
+            if latencies
+        )
+        return f"{self.num_overruns} overruns, latency mean/p99 in ms: {stages}"
+
+
+class BackgroundWorker:
+    """
+    Run a function on the items of a bounded queue in a background thread, to take work off a control loop.
+
+    `submit` blocks while the queue is full, unless `drop_when_full` is set, in which case the item is dropped,
+    e.g. for visualization. Errors raised by the function are raised again by the next call to `submit` or `stop`.
+    """
+
+    def __init__(self, fn: Callable, maxsize: int, drop_when_full: bool = False, name: str | None = None):
+        self.fn = fn
+        self.drop_when_full = drop_when_full
+        self.num_dropped = 0
+        self.queue = queue.Queue(maxsize=maxsize)
+        self._error: BaseException | None = None
+        self.thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while True:
+            args = self.queue.get()
+            try:
+                if args is None:
+                    return
+                if self._error is None:
+                    self.fn(*args)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self.queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, *args) -> None:
+        self._raise_error()
+        if self.drop_when_full:
+            try:
+                self.queue.put_nowait(args)
+            except queue.Full:
+                self.num_dropped += 1
+        else:
+            self.queue.put(args)
+
+    def stop(self, raise_error: bool = True) -> None:
+        """Process the items left in the queue and stop the thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        if raise_error:
+            self._raise_error()
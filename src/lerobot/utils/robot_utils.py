@@ -14,16 +14,111 @@
 
 import platform
 import time
+from collections import deque
+
+import numpy as np
+
+# Remaining time under which waits spin instead of sleeping, to make up for the inaccuracy of `time.sleep`.
+# On Mac and Windows, `time.sleep` is less accurate than on Linux.
+DEFAULT_SPIN_THRESHOLD_S = 0.0005 if platform.system() == "Linux" else 0.002
+
+# Number of the latest wake-ups whose jitter is kept by a `RateScheduler` for its percentiles, about 5 minutes at
+# 30 fps, so that loops running for hours use a constant memory
+DEFAULT_MAX_NUM_JITTERS = 10_000
+
+
+def sleep_until(deadline: float, spin_threshold_s: float = DEFAULT_SPIN_THRESHOLD_S) -> None:
+    """
+    Wait until `time.perf_counter()` reaches `deadline`: sleep until `spin_threshold_s` before the deadline, then
+    spin for the remaining time, so that waits are precise without consuming CPU cycles for the whole wait.
+    """
+    remaining_s = deadline - time.perf_counter()
+    if remaining_s > spin_threshold_s:
+        time.sleep(remaining_s - spin_threshold_s)
+    while time.perf_counter() < deadline:
+        pass
 
 
 def busy_wait(seconds):
-    if platform.system() == "Darwin" or platform.system() == "Windows":
-        # On Mac and Windows, `time.sleep` is not accurate and we need to use this while loop trick,
-        # but it consumes CPU cycles.
-        end_time = time.perf_counter() + seconds
-        while time.perf_counter() < end_time:
-            pass
-    else:
-        # On Linux time.sleep is accurate
-        if seconds > 0:
-            time.sleep(seconds)
+    if seconds > 0:
+        sleep_until(time.perf_counter() + seconds)
+
+
+class RateScheduler:
+    """
+    Pace a loop at a given frequency, and keep track of the jitter of its wake-ups.
+
+    Deadlines are absolute (`start + k / fps`), so that waiting errors don't accumulate over the periods. When
+    an iteration overruns its period, the next deadline is set one period after the end of the iteration, rather
+    than catching up with a burst of iterations.
+
+    The jitter percentiles are computed over the last `max_num_jitters` wake-ups, while the maximum jitter and the
+    number of overruns are tracked since the start (or the last `reset_stats`).
+
+    Example
+    --------
+    ```python
+    scheduler = RateScheduler(fps=30)
+    scheduler.start()
+    while True:
+        robot.send_action(teleop.get_action())
+        scheduler.wait()
+    print(scheduler.jitter_stats())
+    ```
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        spin_threshold_s: float = DEFAULT_SPIN_THRESHOLD_S,
+        max_num_jitters: int = DEFAULT_MAX_NUM_JITTERS,
+    ):
+        self.period_s = 1 / fps
+        self.spin_threshold_s = spin_threshold_s
+        self.deadline: float | None = None
+        self.jitters_s: deque[float] = deque(maxlen=max_num_jitters)
+        self.max_jitter_s = 0.0
+        self.num_overruns = 0
+
+    def start(self) -> None:
+        """Start the first period now, e.g. right before the loop."""
+        self.deadline = time.perf_counter() + self.period_s
+
+    def wait(self) -> float | None:
+        """
+        Wait until the end of the current period.
+
+        Returns:
+            float | None: How late the loop woke up after the end of the period, in seconds, or None if the period
+            was already over.
+        """
+        now = time.perf_counter()
+        if self.deadline is None or now >= self.deadline:
+            if self.deadline is not None:
+                self.num_overruns += 1
+            self.deadline = now + self.period_s
+            return None
+
+        sleep_until(self.deadline, self.spin_threshold_s)
+        jitter_s = time.perf_counter() - self.deadline
+        self.jitters_s.append(jitter_s)
+        self.max_jitter_s = max(self.max_jitter_s, jitter_s)
+        self.deadline += self.period_s
+        return jitter_s
+
+    def jitter_stats(self) -> dict[str, float]:
+        """Percentiles of the lateness of the wake-ups in milliseconds, and number of periods overrun."""
+        jitters_ms = np.array(self.jitters_s) * 1e3 if self.jitters_s else np.zeros(1)
+        p50, p90, p99 = np.percentile(jitters_ms, [50, 90, 99])
+        return {
+            "p50_ms": float(p50),
+            "p90_ms": float(p90),
+            "p99_ms": float(p99),
+            "max_ms": self.max_jitter_s * 1e3,
+            "num_overruns": self.num_overruns,
+        }
+
+    def reset_stats(self) -> None:
+        self.jitters_s.clear()
+        self.max_jitter_s = 0.0
+        self.num_overruns = 0
@@ -70,6 +70,59 @@ def move_transition_to_device(transition: Transition, device: str = "cpu") -> Tr
     return transition
 
 
+def stack_transitions(transitions: list[Transition]) -> Transition:
+    """
+    Stack transitions into a single transition, whose values have a leading dimension of `len(transitions)`.
+
+    The batch dimension of 1 of the states, actions and complementary info of each transition, if any, is removed
+    before stacking, as done by `ReplayBuffer.add`. Rewards, dones and truncateds are stacked into 1D tensors.
+    """
+    if len(transitions) == 0:
+        raise ValueError("Cannot stack an empty list of transitions.")
+
+    def stack(values: list) -> torch.Tensor:
+        return torch.stack([torch.as_tensor(value).squeeze(0) for value in values])
+
+    def stack_scalars(values: list, dtype: torch.dtype | None = None) -> torch.Tensor:
+        return torch.stack([torch.as_tensor(value, dtype=dtype).reshape(()) for value in values])
+
+    first = transitions[0]
+    complementary_info = None
+    if first.get("complementary_info") is not None:
+        complementary_info = {
+            key: stack([t["complementary_info"][key] for t in transitions])
+            for key in first["complementary_info"]
+        }
+
+    return Transition(
+        state={key: stack([t["state"][key] for t in transitions]) for key in first["state"]},
+        action=stack([t[ACTION] for t in transitions]),
+        reward=stack_scalars([t["reward"] for t in transitions], dtype=torch.float32),
+        next_state={key: stack([t["next_state"][key] for t in transitions]) for key in first["next_state"]},
+        done=stack_scalars([t["done"] for t in transitions], dtype=torch.bool),
+        truncated=stack_scalars([t["truncated"] for t in transitions], dtype=torch.bool),
+        complementary_info=complementary_info,
+    )
+
+
+def index_transitions(transitions: Transition, indices: torch.Tensor) -> Transition:
+    """Select stacked transitions (see `stack_transitions`) with a boolean mask or integer indices."""
+    complementary_info = transitions.get("complementary_info")
+    return Transition(
+        state={key: val[indices] for key, val in transitions["state"].items()},
+        action=transitions[ACTION][indices],
+        reward=transitions["reward"][indices],
+        next_state={key: val[indices] for key, val in transitions["next_state"].items()},
+        done=transitions["done"][indices],
+        truncated=transitions["truncated"][indices],
+        complementary_info=(
+            {key: val[indices] for key, val in complementary_info.items()}
+            if complementary_info is not None
+            else None
+        ),
+    )
+
+
 def move_state_dict_to_device(state_dict, device="cpu"):
     """
     Recursively move all tensors in a (potentially) nested
@@ -66,8 +66,9 @@ def log_rerun_data(
 
             if _is_scalar(v):
                 rr.log(key, rr.Scalars(float(v)))
-            elif isinstance(v, np.ndarray):
-                arr = v
+            elif isinstance(v, np.ndarray) or hasattr(v, "__array__"):
+                # Array-like values, e.g. compressed camera frames, are decoded
+                arr = np.asarray(v)
                 # Convert CHW -> HWC when needed
                 if arr.ndim == 3 and arr.shape[0] in (1, 3, 4) and arr.shape[-1] not in (1, 3, 4):
                     arr = np.transpose(arr, (1, 2, 0))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Example of running a specific test:
+# ```bash
+# pytest tests/cameras/test_camera_group.py::test_aligned_snapshot
+# ```
+
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras import CameraGroup, TimestampedFrame
+
+
+class ScriptedCamera:
+    """Camera returning frames captured at scripted times (relative to `start`), one per read."""
+
+    def __init__(
+        self,
+        capture_offsets_s: list[float],
+        sequences: list[int] | None = None,
+        start: float | None = None,
+        fps: int = 30,
+    ):
+        self.fps = fps
+        start = start if start is not None else time.perf_counter()
+        sequences = sequences if sequences is not None else list(range(len(capture_offsets_s)))
+        self.frames = [
+            TimestampedFrame(np.full((2, 2, 3), seq, dtype=np.uint8), start + offset, seq)
+            for offset, seq in zip(capture_offsets_s, sequences, strict=True)
+        ]
+        self.num_reads = 0
+
+    def async_read_timestamped(self, timeout_ms: float = 200, after_sequence: int = -1) -> TimestampedFrame:
+        for frame in self.frames:
+            if frame.sequence > after_sequence:
+                self.num_reads += 1
+                return frame
+        raise TimeoutError("No new frame.")
+
+
+def test_empty_group():
+    group = CameraGroup({})
+    assert len(group) == 0
+    assert group.async_read() == {}
+
+
+def test_aligned_snapshot():
+    start = time.perf_counter()
+    front = ScriptedCamera([0.0, 0.033], start=start)
+    wrist = ScriptedCamera([0.002, 0.035], start=start)
+    group = CameraGroup({"front": front, "wrist": wrist})
+
+    frames = group.async_read()
+    assert set(frames) == {"front", "wrist"}
+    assert front.num_reads == wrist.num_reads == 1
+    assert group.get_stats()["num_misaligned"] == 0
+    assert group.get_stats()["last_spread_ms"] == pytest.approx(2.0, abs=1e-3)
+
+
+def test_lagging_camera_is_read_again():
+    # The first frame of the wrist camera is a full period older than the frame of the front camera
+    front = ScriptedCamera([0.033, 0.066])
+    wrist = ScriptedCamera([0.0, 0.034])
+    group = CameraGroup({"front": front, "wrist": wrist})
+
+    snapshot = group.async_read_timestamped()
+    assert snapshot["front"].sequence == 0
+    assert snapshot["wrist"].sequence == 1
+    assert wrist.num_reads == 2
+    stats = group.get_stats()
+    assert stats["num_misaligned"] == 0
+    assert stats["num_dropped"] == {"front": 0, "wrist": 0}
+
+
+def test_misaligned_snapshot():
+    # The wrist camera has no newer frame to align with the front camera
+    front = ScriptedCamera([0.1])
+    wrist = ScriptedCamera([0.0])
+    group = CameraGroup({"front": front, "wrist": wrist}, tolerance_ms=10)
+
+    frames = group.async_read_timestamped()
+    assert frames["wrist"].sequence == 0
+    assert group.get_stats()["num_misaligned"] == 1
+
+
+def test_dropped_and_stale_frames():
+    front = ScriptedCamera([-1.0, -0.5, 0.0], sequences=[0, 3, 4])
+    group = CameraGroup({"front": front}, max_age_ms=100)
+
+    group.async_read()
+    group.async_read()
+    group.async_read()
+    stats = group.get_stats()
+    assert stats["num_snapshots"] == 3
+    assert stats["num_dropped"] == {"front": 2}
+    assert stats["num_stale"] == {"front": 2}
+
+
+def test_timeout():
+    group = CameraGroup({"front": ScriptedCamera([])})
+    with pytest.raises(TimeoutError):
+        group.async_read()
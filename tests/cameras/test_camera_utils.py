@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import warnings
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.cameras.utils import FrameRingBuffer
+from lerobot.policies.utils import prepare_observation_for_inference
+
+
+def test_frame_ring_buffer_reuses_released_buffers():
+    frame_buffers = FrameRingBuffer((4, 4, 3), num_buffers=2)
+    addresses = set()
+    for _ in range(10):
+        frame = frame_buffers.read_only(frame_buffers.next_buffer())
+        addresses.add(frame.ctypes.data)
+        del frame
+    assert len(frame_buffers) == 2
+    assert len(addresses) <= 2
+    assert frame_buffers.num_allocations == 0
+
+
+def test_frame_ring_buffer_grows_while_frames_are_held():
+    frame_buffers = FrameRingBuffer((4, 4, 3), num_buffers=2, max_num_buffers=3)
+    held_frames = []
+    for value in range(5):
+        buffer = frame_buffers.next_buffer()
+        buffer[:] = value
+        held_frames.append(frame_buffers.read_only(buffer))
+        del buffer
+
+    assert len(frame_buffers) == 3
+    assert frame_buffers.num_allocations == 3
+    for value, frame in enumerate(held_frames):
+        assert not frame.flags.writeable
+        assert (frame == value).all()
+
+    # Views of views keep their buffer from being reused as well
+    crops = [frame[1:3] for frame in held_frames]
+    del held_frames
+    frame_buffers.next_buffer()[:] = 255
+    assert all((crop == value).all() for value, crop in enumerate(crops))
+
+
+def test_frame_ring_buffer_releases_leases():
+    frame_buffers = FrameRingBuffer((4, 4, 3), num_buffers=2)
+
+    # A buffer that is never handed out is released by the next call
+    frame_buffers.next_buffer()
+    assert frame_buffers.num_leased == 1
+    buffer = frame_buffers.next_buffer()
+    assert frame_buffers.num_leased == 1
+
+    frame = frame_buffers.read_only(buffer)
+    crop = frame[1:3]
+    del frame
+    assert frame_buffers.num_leased == 1
+    del crop
+    assert frame_buffers.num_leased == 0
+
+    # Arrays that are not part of the ring are handed out without a lease
+    view = frame_buffers.read_only(np.zeros((4, 4, 3), dtype=np.uint8))
+    assert not view.flags.writeable
+    assert frame_buffers.num_leased == 0
+
+
+def test_frame_ring_buffer_releases_leases_while_locked():
+    frame_buffers = FrameRingBuffer((4, 4, 3), num_buffers=2)
+    frames = [frame_buffers.read_only(frame_buffers.next_buffer())]
+
+    def release_while_locked():
+        # e.g. the garbage collector drops the last view of a frame while `next_buffer` holds the lock
+        with frame_buffers.lock:
+            frames.clear()
+
+    thread = threading.Thread(target=release_while_locked, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert frame_buffers.num_leased == 0
+
+
+def test_prepare_observation_for_inference_copies_read_only_frames():
+    frame_buffers = FrameRingBuffer((4, 4, 3))
+    buffer = frame_buffers.next_buffer()
+    buffer[:] = 255
+    # Not an image, so converted to a tensor without being normalized
+    observation = {"depth": frame_buffers.read_only(buffer)}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        observation = prepare_observation_for_inference(observation, torch.device("cpu"))
+    observation["depth"].zero_()
+    assert (buffer == 255).all()
+
+
+def test_frame_ring_buffer_invalid_sizes():
+    with pytest.raises(ValueError):
+        FrameRingBuffer((4, 4, 3), num_buffers=0)
+    with pytest.raises(ValueError):
+        FrameRingBuffer((4, 4, 3), num_buffers=4, max_num_buffers=2)
+
+    frame_buffers = FrameRingBuffer((2, 3), dtype=np.uint16)
+    assert frame_buffers.next_buffer().dtype == np.uint16
@@ -19,13 +19,15 @@
 # pytest tests/cameras/test_opencv.py::test_connect
 # ```
 
+import pickle
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
-from lerobot.cameras.configs import Cv2Rotation
-from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+from lerobot.cameras.configs import ColorMode, Cv2Rotation
+from lerobot.cameras.opencv import JpegFrame, OpenCVCamera, OpenCVCameraConfig
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 # NOTE(Steven): more tests + assertions?
@@ -226,3 +228,82 @@ def test_rotation(rotation, index_or_path):
         assert camera.width == original_width
         assert camera.height == original_height
         assert img.shape[:2] == (original_height, original_width)
+
+
+@pytest.fixture
+def mjpeg_video_path(tmp_path):
+    video_path = tmp_path / "video.avi"
+    writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+    rng = np.random.default_rng(0)
+    for _ in range(12):
+        writer.write(cv2.GaussianBlur(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8), (9, 9), 3))
+    writer.release()
+    return video_path
+
+
+@pytest.mark.parametrize("color_mode", [ColorMode.RGB, ColorMode.BGR], ids=["rgb", "bgr"])
+@pytest.mark.parametrize(
+    "rotation",
+    [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_180],
+    ids=["no_rot", "rot90", "rot180"],
+)
+def test_read_into_frame_buffers(mjpeg_video_path, rotation, color_mode):
+    config = OpenCVCameraConfig(index_or_path=mjpeg_video_path, rotation=rotation, color_mode=color_mode)
+    reference_camera, camera = OpenCVCamera(config), OpenCVCamera(config)
+    reference_camera.connect(warmup=False)
+    camera.connect(warmup=False)
+
+    held_frames = []
+    for _ in range(10):
+        expected = reference_camera.read()
+        frame = camera._read_into_frame_buffers()
+        assert not frame.flags.writeable
+        np.testing.assert_array_equal(frame, expected)
+        held_frames.append((frame, expected))
+
+    # Frames still referenced are never overwritten by the next reads
+    for frame, expected in held_frames:
+        np.testing.assert_array_equal(frame, expected)
+    assert len(camera.frame_buffers) == len(held_frames)
+
+    reference_camera.disconnect()
+    camera.disconnect()
+
+
+@pytest.mark.parametrize("color_mode", [ColorMode.RGB, ColorMode.BGR], ids=["rgb", "bgr"])
+@pytest.mark.parametrize(
+    "rotation", [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90], ids=["no_rot", "rot90"]
+)
+def test_mjpeg_passthrough(mjpeg_video_path, rotation, color_mode):
+    reference_camera = OpenCVCamera(
+        OpenCVCameraConfig(index_or_path=mjpeg_video_path, rotation=rotation, color_mode=color_mode)
+    )
+    config = OpenCVCameraConfig(
+        index_or_path=mjpeg_video_path, rotation=rotation, color_mode=color_mode, mjpeg_passthrough=True
+    )
+    assert config.fourcc == "MJPG"
+    camera = OpenCVCamera(config)
+    reference_camera.connect(warmup=False)
+    camera.connect(warmup=False)
+
+    for read in (camera.read, camera._read_into_frame_buffers):
+        expected = reference_camera.read()
+        frame = read()
+        assert isinstance(frame, JpegFrame)
+        assert frame.shape == expected.shape
+        assert frame.data.nbytes < expected.nbytes
+        # The JPEG decoders of OpenCV and FFmpeg slightly differ
+        np.testing.assert_allclose(np.asarray(frame), expected, atol=16)
+        assert np.asarray(frame) is frame.decode()
+
+        unpickled = pickle.loads(pickle.dumps(frame))
+        assert unpickled._decoded is None
+        np.testing.assert_array_equal(np.asarray(unpickled), np.asarray(frame))
+
+    reference_camera.disconnect()
+    camera.disconnect()
+
+
+def test_mjpeg_passthrough_requires_mjpg():
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=0, fourcc="YUYV", mjpeg_passthrough=True)
@@ -14,11 +14,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from unittest.mock import patch
 
+import pytest
 import torch
 
-from lerobot.datasets.aggregate import aggregate_datasets
+from lerobot.datasets.aggregate import (
+    AGGREGATION_CHECKPOINT,
+    AGGREGATION_STAGING_SUFFIX,
+    aggregate_datasets,
+    write_data_file,
+    write_video_file,
+)
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from tests.fixtures.constants import DUMMY_REPO_ID
 
@@ -380,3 +388,97 @@ def test_video_timestamps_regression(tmp_path, lerobot_dataset_factory):
         for key in aggr_ds.meta.video_keys:
             assert key in item, f"Video key {key} missing from item {i}"
             assert item[key].shape[0] == 3, f"Expected 3 channels for video key {key}"
+
+
+def load_aggregated_dataset(repo_id, root):
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(root)
+        return LeRobotDataset(repo_id, root=root)
+
+
+def test_aggregate_resume(tmp_path, lerobot_dataset_factory):
+    """Test that an interrupted aggregation resumes without rewriting the files already written."""
+    ds_0 = lerobot_dataset_factory(
+        root=tmp_path / "resume_0", repo_id=f"{DUMMY_REPO_ID}_resume_0", total_episodes=4, total_frames=120
+    )
+    ds_1 = lerobot_dataset_factory(
+        root=tmp_path / "resume_1", repo_id=f"{DUMMY_REPO_ID}_resume_1", total_episodes=3, total_frames=90
+    )
+    kwargs = {
+        "repo_ids": [ds_0.repo_id, ds_1.repo_id],
+        "roots": [ds_0.root, ds_1.root],
+        "aggr_repo_id": f"{DUMMY_REPO_ID}_resume_aggr",
+        "aggr_root": tmp_path / "resume_aggr",
+        "num_workers": 0,
+    }
+
+    calls = []
+
+    def failing_write_video_file(dst_path, sources):
+        calls.append(dst_path)
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return write_video_file(dst_path, sources)
+
+    with (
+        patch("lerobot.datasets.aggregate.write_video_file", failing_write_video_file),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        aggregate_datasets(**kwargs)
+
+    assert not (tmp_path / "resume_aggr").exists()
+    staging_dir = tmp_path / f".resume_aggr{AGGREGATION_STAGING_SUFFIX}"
+    done = json.loads((staging_dir / AGGREGATION_CHECKPOINT).read_text())["done"]
+    assert len(done) > 0
+
+    with patch("lerobot.datasets.aggregate.write_data_file", wraps=write_data_file) as mock_write_data_file:
+        throughput = aggregate_datasets(**kwargs)
+    assert not staging_dir.exists()
+    # All the data files were written before the interruption
+    mock_write_data_file.assert_not_called()
+    assert throughput["num_frames"] == 0
+    assert throughput["num_mb"] > 0
+
+    aggr_ds = load_aggregated_dataset(kwargs["aggr_repo_id"], kwargs["aggr_root"])
+    assert_episode_and_frame_counts(aggr_ds, ds_0.num_episodes + ds_1.num_episodes, len(ds_0) + len(ds_1))
+    assert_dataset_content_integrity(aggr_ds, ds_0, ds_1)
+    assert_video_frames_integrity(aggr_ds, ds_0, ds_1)
+
+
+def test_aggregate_parallel(tmp_path, lerobot_dataset_factory):
+    """Test that aggregating with a process pool gives the same dataset as aggregating in-process."""
+    datasets = [
+        lerobot_dataset_factory(
+            root=tmp_path / f"parallel_{i}",
+            repo_id=f"{DUMMY_REPO_ID}_parallel_{i}",
+            total_episodes=3,
+            total_frames=60,
+        )
+        for i in range(3)
+    ]
+
+    aggregated = []
+    for num_workers in [0, 2]:
+        aggr_repo_id = f"{DUMMY_REPO_ID}_parallel_aggr_{num_workers}"
+        throughput = aggregate_datasets(
+            repo_ids=[ds.repo_id for ds in datasets],
+            roots=[ds.root for ds in datasets],
+            aggr_repo_id=aggr_repo_id,
+            aggr_root=tmp_path / aggr_repo_id,
+            video_files_size_in_mb=0.1,
+            num_workers=num_workers,
+        )
+        assert throughput["num_frames"] == 180
+        assert throughput["frames_per_s"] > 0
+        aggregated.append(load_aggregated_dataset(aggr_repo_id, tmp_path / aggr_repo_id))
+
+    assert aggregated[0].meta.episodes.to_pandas().equals(aggregated[1].meta.episodes.to_pandas())
+    assert_dataset_iteration_works(aggregated[1])
+    for i in [0, 59, 60, 179]:
+        for key, value in aggregated[0][i].items():
+            if torch.is_tensor(value):
+                assert torch.equal(value, aggregated[1][i][key])
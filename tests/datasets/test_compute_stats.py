@@ -463,6 +463,18 @@ def test_running_quantile_stats_vector_length_consistency():
         running_stats.update(np.array([[1.0, 2.0, 3.0]]))  # Different length
 
 
+def test_running_quantile_stats_boolean_features():
+    """Test that boolean features (e.g. `done`) are handled like 0/1 values."""
+    running_stats = RunningQuantileStats()
+    running_stats.update(np.array([[False], [False], [True]]))
+    running_stats.update(np.array([[True], [False]]))
+
+    stats = running_stats.get_statistics()
+    assert stats["min"][0] == 0 and stats["max"][0] == 1
+    np.testing.assert_allclose(stats["mean"], [0.4])
+    assert 0 <= stats["q50"][0] <= 1
+
+
 def test_running_quantile_stats_reshape_handling():
     """Test that various input shapes are handled correctly."""
     running_stats = RunningQuantileStats()
@@ -832,3 +844,103 @@ def test_fixed_quantiles_always_computed():
         for q_key in expected_quantiles:
             assert q_key in episode_stats[key]
             assert episode_stats[key][q_key].shape == (features[key]["shape"][0],)
+
+
+def test_running_quantile_stats_merge_with_bin_range():
+    """Statistics with the same bin range merge into the statistics of all the vectors."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(0, 1, (1000, 3))
+    bin_range = (data.min(axis=0), data.max(axis=0))
+
+    full = RunningQuantileStats(bin_range=bin_range)
+    full.update(data)
+    merged = RunningQuantileStats()
+    for part in np.array_split(data, [100, 550]):
+        part_stats = RunningQuantileStats(bin_range=bin_range)
+        part_stats.update(part)
+        merged.merge(part_stats)
+
+    expected, result = full.get_statistics(), merged.get_statistics()
+    for key in expected:
+        np.testing.assert_allclose(result[key], expected[key], rtol=1e-10)
+    np.testing.assert_allclose(result["std"], np.std(data, axis=0), rtol=1e-8)
+
+    other = RunningQuantileStats(num_quantile_bins=100)
+    other.update(rng.normal(0, 1, (10, 3)))
+    with pytest.raises(ValueError, match="number of quantile bins"):
+        merged.merge(other)
+
+
+@pytest.mark.parametrize("num_parts", [2, 7])
+def test_running_quantile_stats_merge_without_bin_range(num_parts):
+    """Statistics of parts with different ranges merge into the same histograms as the whole data."""
+    rng = np.random.default_rng(0)
+    data = np.concatenate([rng.normal(0, 1, (2000, 2)), rng.exponential(10, (2000, 2)) - 50], axis=0)
+    data = np.concatenate([data, np.full((4000, 1), 3.0)], axis=1)
+
+    sequential = RunningQuantileStats()
+    merged = RunningQuantileStats()
+    for part in np.array_split(data, num_parts):
+        sequential.update(part)
+        part_stats = RunningQuantileStats()
+        part_stats.update(part)
+        merged.merge(part_stats)
+    full = RunningQuantileStats()
+    full.update(data)
+
+    for stats in [sequential, merged]:
+        np.testing.assert_array_equal(stats._histograms, full._histograms)
+        for edges, full_edges in zip(stats._bin_edges, full._bin_edges, strict=True):
+            np.testing.assert_array_equal(edges, full_edges)
+
+
+@pytest.mark.parametrize(
+    "distribution",
+    [
+        lambda rng, n: rng.normal(0, 1, (n, 4)),
+        lambda rng, n: rng.lognormal(0, 2, (n, 4)),
+        lambda rng, n: rng.integers(0, 256, (n, 4)),
+        lambda rng, n: np.sort(rng.uniform(-1e3, 1e3, (n, 4)), axis=0),
+    ],
+)
+def test_running_quantile_stats_accuracy(distribution):
+    """Quantiles are within a few bins of `np.quantile`, even when the range keeps expanding."""
+    rng = np.random.default_rng(0)
+    quantiles = [0.0, 0.01, 0.1, 0.5, 0.9, 0.99, 1.0]
+    data = distribution(rng, 20_000)
+    running_stats = RunningQuantileStats(quantile_list=quantiles, num_quantile_bins=1000)
+    for batch in np.array_split(data, 50):
+        running_stats.update(batch)
+    stats = running_stats.get_statistics()
+
+    bin_width = np.array([edges[1] - edges[0] for edges in running_stats._bin_edges])
+    assert np.all(bin_width <= 2 * (data.max(axis=0) - data.min(axis=0)) / 999)
+    for q, q_key in zip(quantiles, running_stats._quantile_keys, strict=True):
+        expected = np.quantile(data, q, axis=0)
+        assert np.all(np.abs(stats[q_key] - expected) <= bin_width), q_key
+
+
+def test_compute_dataset_stats(tmp_path, lerobot_dataset_factory):
+    from lerobot.scripts.lerobot_compute_stats import compute_dataset_stats
+
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=4, total_frames=200)
+    stats = compute_dataset_stats(dataset, num_workers=0, frames_per_chunk=16)
+    assert set(stats) == {key for key, ft in dataset.features.items() if ft["dtype"] != "string"}
+
+    # Numerical features are computed exactly on the whole dataset
+    action = np.stack(dataset.hf_dataset["action"]).astype(np.float64)
+    expected = get_feature_stats(action, axis=0, keepdims=False)
+    for key in expected:
+        np.testing.assert_allclose(stats["action"][key], expected[key], rtol=1e-6)
+
+    for key in dataset.meta.video_keys:
+        assert stats[key]["mean"].shape == (3, 1, 1)
+        assert np.all((stats[key]["min"] >= 0) & (stats[key]["max"] <= 1))
+        assert stats[key]["count"].item() == sum(
+            len(sample_indices(length)) for length in dataset.meta.episodes["length"]
+        )
+
+    parallel_stats = compute_dataset_stats(dataset, num_workers=2, frames_per_chunk=16)
+    for key in stats:
+        for stat_key in stats[key]:
+            np.testing.assert_allclose(parallel_stats[key][stat_key], stats[key][stat_key], rtol=1e-10)
@@ -22,8 +22,11 @@ import pytest
 import torch
 
 from lerobot.datasets.dataset_tools import (
+    _plan_video_edits,
+    _ranges_on_keyframes,
     add_features,
     delete_episodes,
+    estimate_video_edits,
     merge_datasets,
     modify_features,
     remove_feature,
@@ -1047,3 +1050,110 @@ def test_modify_features_preserves_file_structure(sample_dataset, tmp_path):
         assert new_chunk_indices == original_chunk_indices, "Chunk indices should be preserved"
         assert new_file_indices == original_file_indices, "File indices should be preserved"
         assert "reward" in modified_dataset.meta.features
+
+
+@pytest.fixture
+def video_dataset(tmp_path, empty_lerobot_dataset_factory):
+    """Create a sample dataset with two cameras stored as videos."""
+    features = {
+        "action": {"dtype": "float32", "shape": (2,), "names": None},
+        "observation.images.top": {"dtype": "video", "shape": (48, 64, 3), "names": None},
+        "observation.images.wrist": {"dtype": "video", "shape": (48, 64, 3), "names": None},
+    }
+
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test_video_dataset", features=features, use_videos=True
+    )
+
+    for _ in range(5):
+        for _ in range(10):
+            frame = {
+                "action": np.random.randn(2).astype(np.float32),
+                "observation.images.top": np.random.randint(0, 255, size=(48, 64, 3), dtype=np.uint8),
+                "observation.images.wrist": np.random.randint(0, 255, size=(48, 64, 3), dtype=np.uint8),
+                "task": "task_0",
+            }
+            dataset.add_frame(frame)
+        dataset.save_episode()
+
+    dataset.finalize()
+    return dataset
+
+
+def test_delete_episodes_stream_copies_keyframe_aligned_videos(video_dataset, tmp_path):
+    """Episodes are encoded on their own, so the kept ones are remuxed without being re-encoded."""
+    output_dir = tmp_path / "filtered"
+    episode_mapping = {0: 0, 1: 1, 3: 2, 4: 3}
+    edits = _plan_video_edits(video_dataset, episode_mapping)
+    assert [edit.method for edit in edits] == ["stream_copy", "stream_copy"]
+    assert edits[0].episodes == [0, 1, 3, 4]
+    assert edits[0].num_frames == 40
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        new_dataset = delete_episodes(
+            video_dataset, episode_indices=[2], output_dir=output_dir, num_workers=2
+        )
+
+    assert new_dataset.meta.total_episodes == 4
+    assert len(new_dataset) == 40
+    # Stream copied frames are identical to the source frames
+    for new_idx, old_idx in [(0, 0), (20, 30), (39, 49)]:
+        for key in video_dataset.meta.video_keys:
+            assert torch.equal(new_dataset[new_idx][key], video_dataset[old_idx][key])
+
+
+def test_delete_episodes_reencodes_unaligned_videos(video_dataset, tmp_path):
+    output_dir = tmp_path / "filtered"
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+        patch("lerobot.datasets.dataset_tools._ranges_on_keyframes", return_value=False),
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(output_dir)
+
+        assert [edit.method for edit in _plan_video_edits(video_dataset, {0: 0, 3: 1})] == [
+            "reencode",
+            "reencode",
+        ]
+        new_dataset = delete_episodes(video_dataset, episode_indices=[1, 2, 4], output_dir=output_dir)
+
+    assert new_dataset.meta.total_episodes == 2
+    assert len(new_dataset) == 20
+    key = "observation.images.top"
+    assert new_dataset[10][key].shape == video_dataset[30][key].shape
+    assert torch.allclose(new_dataset[10][key], video_dataset[30][key], atol=0.5)
+
+
+def test_ranges_on_keyframes(video_dataset):
+    fps = video_dataset.meta.fps
+    video_path = video_dataset.root / video_dataset.meta.get_video_file_path(0, "observation.images.top")
+    end_timestamp = 50 / fps
+
+    assert _ranges_on_keyframes(video_path, [(10 / fps, 20 / fps)], end_timestamp, tolerance_s=0.5 / fps)
+    assert _ranges_on_keyframes(video_path, [(40 / fps, end_timestamp)], end_timestamp, tolerance_s=0.5 / fps)
+    # Keyframes are only encoded every other frame
+    assert not _ranges_on_keyframes(video_path, [(11 / fps, 20 / fps)], end_timestamp, tolerance_s=0.5 / fps)
+
+
+def test_estimate_video_edits(video_dataset):
+    estimate = estimate_video_edits(video_dataset, episodes_to_keep=[0, 1, 2, 3, 4], num_workers=2)
+    assert estimate.num_files == {"copy": 2, "stream_copy": 0, "reencode": 0}
+    assert estimate.num_reencoded_frames == 0
+    assert estimate.num_workers == 2
+
+    with patch("lerobot.datasets.dataset_tools._ranges_on_keyframes", return_value=False):
+        estimate = estimate_video_edits(
+            video_dataset, episodes_to_keep=[0, 1], video_keys=["observation.images.top"]
+        )
+    assert estimate.num_files == {"copy": 0, "stream_copy": 0, "reencode": 1}
+    assert estimate.num_reencoded_frames == 20
+    assert estimate.estimated_time_s > 0
+    assert "reencode: 1 files" in str(estimate)
@@ -14,13 +14,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datasets
+import numpy as np
 import pytest
 import torch
 from datasets import Dataset
 from huggingface_hub import DatasetCard
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
-from lerobot.datasets.utils import combine_feature_dicts, create_lerobot_dataset_card, hf_transform_to_torch
+from lerobot.datasets.utils import (
+    EpisodeIndex,
+    arrow_array_to_tensor,
+    combine_feature_dicts,
+    create_lerobot_dataset_card,
+    hf_transform_to_torch,
+)
 from lerobot.utils.constants import ACTION, OBS_IMAGES
 
 
@@ -57,6 +65,81 @@ def test_calculate_episode_data_index():
     assert torch.equal(episode_data_index["to"], torch.tensor([2, 3, 6]))
 
 
+def test_arrow_array_to_tensor_matches_hf_transform():
+    features = datasets.Features(
+        {
+            "scalar": datasets.Value("float64"),
+            "index": datasets.Value("int32"),
+            "vector": datasets.Sequence(length=3, feature=datasets.Value("float32")),
+            "matrix": datasets.Array2D(shape=(2, 2), dtype="float32"),
+        }
+    )
+    dataset = Dataset.from_dict(
+        {
+            "scalar": [0.5, 1.5, 2.5],
+            "index": [0, 1, 2],
+            "vector": [[i, i + 1, i + 2] for i in range(3)],
+            "matrix": [[[i, i], [i, i]] for i in range(3)],
+        },
+        features=features,
+    )
+    dataset.set_transform(hf_transform_to_torch)
+
+    for key in features:
+        column = dataset.data.column(key).take([2, 0, 2])
+        expected = torch.stack(dataset[key][[2, 0, 2]])
+        actual = arrow_array_to_tensor(column)
+        assert actual.dtype == expected.dtype, key
+        assert torch.equal(actual, expected), key
+
+
+def test_episode_index():
+    index = EpisodeIndex()
+    index.append({"episode_index": 0, "length": 10, "stats/action/mean": np.array([0.5, 1.0])})
+    index.append({"episode_index": 1, "length": 7, "stats/action/mean": np.array([1.5, 2.0])})
+    index.update(0, {"videos/cam/chunk_index": 0})
+
+    assert len(index) == 2
+    assert index.column_names == ["episode_index", "length", "stats/action/mean", "videos/cam/chunk_index"]
+    assert index[1]["length"] == 7
+    assert index[-1]["videos/cam/chunk_index"] is None
+    assert index.get(1, "videos/cam/chunk_index", -1) == -1
+    assert index.get(1, "missing") is None
+    np.testing.assert_array_equal(index["length"], [10, 7])
+
+    table = index.to_table(1)
+    assert table.num_rows == 1
+    assert table.column("stats/action/mean").to_pylist() == [[1.5, 2.0]]
+    assert table.column("videos/cam/chunk_index").to_pylist() == [None]
+
+
+def test_episode_index_grows():
+    index = EpisodeIndex(capacity=2)
+    for episode_index in range(5):
+        index.append({"episode_index": episode_index, "tasks": ["pick"], "success": episode_index % 2 == 0})
+    index.update(-1, {"videos/cam/to_timestamp": 1.5})
+
+    assert len(index) == 5
+    np.testing.assert_array_equal(index["episode_index"], np.arange(5))
+    assert index["episode_index"].dtype == np.int64
+    assert index[2] == {
+        "episode_index": 2,
+        "tasks": ["pick"],
+        "success": True,
+        "videos/cam/to_timestamp": None,
+    }
+    assert index["videos/cam/to_timestamp"].tolist() == [None] * 4 + [1.5]
+    assert isinstance(index.get(4, "episode_index"), int)
+    with pytest.raises(IndexError):
+        index.get(5, "episode_index")
+
+    table = index.to_table(3)
+    assert table.column("episode_index").to_pylist() == [3, 4]
+    assert table.column("tasks").to_pylist() == [["pick"], ["pick"]]
+    assert table.column("success").to_pylist() == [False, True]
+    assert table.column("videos/cam/to_timestamp").to_pylist() == [None, 1.5]
+
+
 def test_merge_simple_vectors():
     g1 = {
         ACTION: {
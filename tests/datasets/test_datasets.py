@@ -792,6 +792,121 @@ def test_update_chunk_settings_video_dataset(tmp_path):
     assert dataset.meta.video_files_size_in_mb == new_video_size
 
 
+def test_streaming_encoding(tmp_path, empty_lerobot_dataset_factory):
+    """Videos encoded while recording match the ones encoded from PNG images when saving episodes."""
+    features = {
+        f"{OBS_IMAGES}.cam": {
+            "dtype": "video",
+            "shape": (32, 48, 3),
+            "names": ["height", "width", "channels"],
+        },
+        ACTION: {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    rng = np.random.default_rng(0)
+    episodes = [rng.integers(0, 256, (length, 32, 48, 3), dtype=np.uint8) for length in [12, 7]]
+
+    datasets = {}
+    for streaming_encoding in [False, True]:
+        dataset = empty_lerobot_dataset_factory(
+            root=tmp_path / f"streaming_{streaming_encoding}",
+            features=features,
+            streaming_encoding=streaming_encoding,
+        )
+        for frames in episodes:
+            for frame in frames:
+                dataset.add_frame({f"{OBS_IMAGES}.cam": frame, ACTION: np.zeros(2, np.float32), "task": "a"})
+            dataset.save_episode()
+        # An episode which is discarded before being saved
+        dataset.add_frame({f"{OBS_IMAGES}.cam": episodes[0][0], ACTION: np.zeros(2, np.float32), "task": "a"})
+        dataset.clear_episode_buffer()
+        dataset.finalize()
+        # No image nor temporary video is left behind
+        assert not any(dataset.root.rglob("*.png"))
+        assert {p.name for p in dataset.root.iterdir()} <= {"data", "images", "meta", "videos"}
+        datasets[streaming_encoding] = LeRobotDataset(DUMMY_REPO_ID, root=dataset.root)
+
+    expected, result = datasets[False], datasets[True]
+    key = f"{OBS_IMAGES}.cam"
+    for stat_key, value in expected.meta.stats[key].items():
+        np.testing.assert_allclose(result.meta.stats[key][stat_key], value)
+    for idx in [0, 11, 12, 18]:
+        torch.testing.assert_close(result[idx][key], expected[idx][key])
+
+    with pytest.raises(ValueError, match="batch encoding"):
+        empty_lerobot_dataset_factory(
+            root=tmp_path / "batched", features=features, streaming_encoding=True, batch_encoding_size=2
+        )
+
+
+def test_video_files_appended_while_recording(tmp_path, empty_lerobot_dataset_factory):
+    """Episode videos are appended to the open video file, which is closed to be read while recording."""
+    key = f"{OBS_IMAGES}.cam"
+    features = {
+        key: {"dtype": "video", "shape": (32, 48, 3), "names": ["height", "width", "channels"]},
+        ACTION: {"dtype": "float32", "shape": (1,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    video_path = dataset.root / dataset.meta.video_path.format(video_key=key, chunk_index=0, file_index=0)
+
+    episode_lengths = [10, 7, 12]
+    for ep_idx, length in enumerate(episode_lengths):
+        for frame_index in range(length):
+            image = np.full((32, 48, 3), 20 * ep_idx + frame_index, dtype=np.uint8)
+            dataset.add_frame({key: image, ACTION: np.zeros(1, np.float32), "task": "a"})
+        dataset.save_episode()
+        if ep_idx == 0:
+            assert not video_path.exists()
+            # Loading the recorded data closes the video file, which is then reopened for the next episodes
+            dataset._ensure_hf_dataset_loaded()
+            assert video_path.exists()
+    dataset.finalize()
+
+    assert [p.name for p in video_path.parent.iterdir()] == [video_path.name]
+    dataset = LeRobotDataset(DUMMY_REPO_ID, root=dataset.root)
+    assert dataset.meta.episodes[f"videos/{key}/file_index"] == [0, 0, 0]
+    for ep_idx, length in enumerate(episode_lengths):
+        start = sum(episode_lengths[:ep_idx])
+        for frame_index in [0, length - 1]:
+            pixel = dataset[start + frame_index][key].mean().item() * 255
+            assert pixel == pytest.approx(20 * ep_idx + frame_index, abs=3)
+
+
+def test_episodes_metadata_written_in_batches(tmp_path, empty_lerobot_dataset_factory):
+    """Episodes metadata are written every `metadata_buffer_size` episodes, once their videos are encoded."""
+    key = f"{OBS_IMAGES}.cam"
+    features = {
+        key: {"dtype": "video", "shape": (32, 48, 3), "names": ["height", "width", "channels"]},
+        ACTION: {"dtype": "float32", "shape": (1,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, batch_encoding_size=2)
+    dataset.meta.metadata_buffer_size = 3
+    episodes_path = dataset.root / "meta/episodes/chunk-000/file-000.parquet"
+
+    episode_lengths = [5, 6, 7, 8, 9]
+    for ep_idx, length in enumerate(episode_lengths):
+        for frame_index in range(length):
+            image = np.full((32, 48, 3), 20 * ep_idx + frame_index, dtype=np.uint8)
+            dataset.add_frame({key: image, ACTION: np.zeros(1, np.float32), "task": "a"})
+        dataset.save_episode()
+        # Episode 2 has all its metadata once the videos of episodes 2 and 3 are encoded
+        assert episodes_path.exists() == (ep_idx >= 3)
+        assert dataset.meta.total_episodes == ep_idx + 1
+    # Encode the videos of the last episode, as done by `VideoEncodingManager`
+    dataset._batch_save_episode_video(4)
+    dataset.finalize()
+
+    dataset = LeRobotDataset(DUMMY_REPO_ID, root=dataset.root)
+    assert dataset.meta.total_episodes == 5
+    assert dataset.meta.episodes["length"] == episode_lengths
+    assert dataset.meta.episodes[f"videos/{key}/to_timestamp"] == pytest.approx(
+        np.cumsum(episode_lengths) / dataset.fps
+    )
+    for ep_idx, length in enumerate(episode_lengths):
+        start = sum(episode_lengths[:ep_idx])
+        pixel = dataset[start + length - 1][key].mean().item() * 255
+        assert pixel == pytest.approx(20 * ep_idx + length - 1, abs=3)
+
+
 def test_episode_index_distribution(tmp_path, empty_lerobot_dataset_factory):
     """Test that all frames have correct episode indices across multiple episodes."""
     features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
@@ -1026,6 +1141,143 @@ def test_episode_boundary_integrity(tmp_path, empty_lerobot_dataset_factory):
         cumulative += ep_length
 
 
+def test_delta_timestamps_window_and_padding(tmp_path, empty_lerobot_dataset_factory):
+    """Test delta windows are clamped to the episode range and padded positions are flagged."""
+    features = {
+        "state": {"dtype": "float32", "shape": (1,), "names": None},
+        ACTION: {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=False)
+
+    frames_per_episode = [6, 4]
+    for ep_length in frames_per_episode:
+        for frame_idx in range(ep_length):
+            dataset.add_frame(
+                {
+                    "state": np.array([frame_idx], dtype=np.float32),
+                    ACTION: np.array([frame_idx, -frame_idx], dtype=np.float32),
+                    "task": "Dummy task",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+
+    fps = dataset.fps
+    delta_timestamps = {"state": [-2 / fps, 0.0], ACTION: [i / fps for i in range(3)]}
+    loaded_dataset = LeRobotDataset(dataset.repo_id, root=dataset.root, delta_timestamps=delta_timestamps)
+
+    # First frame of the first episode: past states are padded with the first state
+    item = loaded_dataset[0]
+    assert torch.equal(item["state"], torch.tensor([0.0, 0.0]))
+    assert item["state_is_pad"].tolist() == [True, False]
+    assert torch.equal(item[ACTION][:, 0], torch.tensor([0.0, 1.0, 2.0]))
+    assert item["action_is_pad"].tolist() == [False, False, False]
+
+    # Last frame of the first episode: future actions are padded with the last action
+    item = loaded_dataset[5]
+    assert torch.equal(item["state"], torch.tensor([3.0, 5.0]))
+    assert torch.equal(item[ACTION], torch.tensor([[5.0, -5.0], [5.0, -5.0], [5.0, -5.0]]))
+    assert item["action_is_pad"].tolist() == [False, True, True]
+
+    # Second frame of the second episode never crosses the episode boundary
+    item = loaded_dataset[7]
+    assert torch.equal(item["state"], torch.tensor([0.0, 1.0]))
+    assert item["state_is_pad"].tolist() == [True, False]
+    assert torch.equal(item[ACTION][:, 0], torch.tensor([1.0, 2.0, 3.0]))
+    assert item["action_is_pad"].tolist() == [False, False, False]
+
+
+@pytest.mark.parametrize("use_videos", [False, True])
+def test_getitems_matches_getitem(tmp_path, lerobot_dataset_factory, use_videos):
+    """Test the batched `__getitems__` path returns the same samples as `__getitem__`."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=3, total_frames=60, use_videos=use_videos
+    )
+    fps = dataset.fps
+    dataset.delta_timestamps = {key: [-1 / fps, 0.0, 1 / fps] for key in dataset.meta.camera_keys + [ACTION]}
+    dataset.delta_indices = {key: [-1, 0, 1] for key in dataset.delta_timestamps}
+
+    indices = [0, 19, 20, 59, 5]
+    items = dataset.__getitems__(indices)
+
+    assert len(items) == len(indices)
+    for idx, item in zip(indices, items, strict=True):
+        expected = dataset[idx]
+        assert set(item) == set(expected)
+        for key, value in expected.items():
+            if isinstance(value, torch.Tensor):
+                assert value.shape == item[key].shape, key
+                assert torch.allclose(value.float(), item[key].float(), atol=1e-6), key
+            else:
+                assert value == item[key], key
+
+    # The default DataLoader collation works on the batched samples
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=4, shuffle=False)
+    batch = next(iter(dataloader))
+    assert batch[ACTION].shape[:2] == (4, 3)
+
+
+@pytest.mark.parametrize("use_videos", [False, True])
+def test_return_uint8_frames(tmp_path, lerobot_dataset_factory, use_videos):
+    """Test camera frames are returned as uint8 and match the float32 frames."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=2, total_frames=40, use_videos=use_videos
+    )
+    uint8_dataset = lerobot_dataset_factory(
+        root=tmp_path / "test",
+        total_episodes=2,
+        total_frames=40,
+        use_videos=use_videos,
+        return_uint8_frames=True,
+    )
+
+    indices = [0, 21, 39]
+    for idx, item in zip(indices, uint8_dataset.__getitems__(indices), strict=True):
+        expected = dataset[idx]
+        for key in dataset.meta.camera_keys:
+            assert item[key].dtype == torch.uint8
+            torch.testing.assert_close(item[key].float() / 255, expected[key])
+            assert torch.equal(uint8_dataset[idx][key], item[key])
+        assert torch.equal(item[ACTION], expected[ACTION])
+
+
+def test_video_frame_index(tmp_path, lerobot_dataset_factory):
+    """Test video frames addressed through the frame index match the timestamp-matched frames."""
+    root = tmp_path / "test"
+    dataset = lerobot_dataset_factory(root=root, total_episodes=3, total_frames=60, use_videos=True)
+    reference = lerobot_dataset_factory(
+        root=root, total_episodes=3, total_frames=60, use_videos=True, use_video_frame_index=False
+    )
+    assert set(dataset._video_frame_starts) == set(dataset.meta.video_keys)
+    assert reference._video_frame_starts == {}
+    assert len(list((root / "meta" / "frame_index").rglob("*.parquet"))) > 0
+
+    fps = dataset.fps
+    for ds in [dataset, reference]:
+        ds.delta_timestamps = {key: [-1 / fps, 0.0] for key in ds.meta.video_keys}
+        ds.delta_indices = {key: [-1, 0] for key in ds.delta_timestamps}
+
+    indices = [0, 19, 20, 41, 59]
+    for idx, item in zip(indices, dataset.__getitems__(indices), strict=True):
+        expected = reference[idx]
+        for key in dataset.meta.video_keys:
+            torch.testing.assert_close(item[key], expected[key])
+            torch.testing.assert_close(dataset[idx][key], expected[key])
+            assert torch.equal(item[f"{key}_is_pad"], expected[f"{key}_is_pad"])
+
+
+def test_video_frame_index_fallback_when_out_of_sync(tmp_path, lerobot_dataset_factory, caplog):
+    """Test video keys whose timestamps don't match the video files fall back to timestamp matching."""
+    root = tmp_path / "test"
+    dataset = lerobot_dataset_factory(root=root, total_episodes=2, total_frames=40, use_videos=True)
+    dataset.tolerance_s = 0.0
+    dataset._video_frame_starts = {}
+    with caplog.at_level(logging.WARNING):
+        dataset._build_video_frame_lookup()
+    assert dataset._video_frame_starts == {}
+    assert "Falling back to timestamp matching" in caplog.text
+
+
 def test_task_indexing_and_validation(tmp_path, empty_lerobot_dataset_factory):
     """Test that tasks are properly indexed and retrievable."""
     features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import numpy as np
+import PIL.Image
+import pytest
+import torch
+
+from lerobot.datasets.frame_cache import FRAME_CACHE_DIR, VideoFrameCache
+from lerobot.datasets.video_utils import decode_video_frames, encode_video_frames
+
+FPS = 30
+NUM_FRAMES = 30
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    imgs_dir = tmp_path / "images"
+    imgs_dir.mkdir()
+    for frame_index in range(NUM_FRAMES):
+        img = np.full((16, 24, 3), 8 * frame_index, dtype=np.uint8)
+        PIL.Image.fromarray(img).save(imgs_dir / f"frame-{frame_index:06d}.png")
+    path = tmp_path / "video.mp4"
+    encode_video_frames(imgs_dir, path, FPS, vcodec="h264")
+    return path
+
+
+def decode(video_path, timestamps):
+    return decode_video_frames(video_path, timestamps, tolerance_s=1e-4, backend="pyav")
+
+
+def test_memory_tier_lru(video_path):
+    frame_bytes = 3 * 16 * 24
+    cache = VideoFrameCache(FPS, max_memory_mb=2.5 * frame_bytes / 1024**2)
+    timestamps = [0.0, 1 / FPS, 2 / FPS]
+    frames = decode(video_path, timestamps)
+
+    assert cache.get(video_path, timestamps) == [None, None, None]
+    cache.put(video_path, timestamps, frames)
+    cached = cache.get(video_path, timestamps)
+
+    # Only the 2 most recently added frames fit
+    assert cached[0] is None
+    assert cached[1].dtype == torch.uint8
+    torch.testing.assert_close(cached[1] / 255, frames[1])
+    torch.testing.assert_close(cached[2] / 255, frames[2])
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["evictions"]) == (2, 4, 1)
+
+
+def test_disk_tier_persists_across_instances(video_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    timestamps = [0.5, 0.0]
+    frames = decode(video_path, timestamps)
+    VideoFrameCache(FPS, cache_dir, max_memory_mb=0).put(video_path, timestamps, frames)
+
+    # A new process (simulated by pickling) reads the frames back from disk
+    cache = pickle.loads(pickle.dumps(VideoFrameCache(FPS, cache_dir)))
+    cached = cache.get(video_path, timestamps + [0.1])
+    torch.testing.assert_close(torch.stack(cached[:2]) / 255, frames)
+    assert cached[2] is None
+    assert (cache.stats()["disk_hits"], cache.stats()["misses"]) == (2, 1)
+
+    cache.clear()
+    assert not cache_dir.exists()
+
+
+def test_invalidation_on_video_change(video_path, tmp_path):
+    cache = VideoFrameCache(FPS, tmp_path / "cache")
+    cache.put(video_path, [0.0], decode(video_path, [0.0]))
+    assert cache.get(video_path, [0.0])[0] is not None
+
+    stat = video_path.stat()
+    os.utime(video_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get(video_path, [0.0]) == [None]
+    assert VideoFrameCache(FPS, tmp_path / "cache").get(video_path, [0.0]) == [None]
+
+
+def test_disk_tier_size_cap(video_path, tmp_path):
+    spill_bytes = (NUM_FRAMES + 1) * (3 * 16 * 24 + 1)
+    cache = VideoFrameCache(FPS, tmp_path / "cache", max_memory_mb=0, max_disk_mb=spill_bytes / 2 / 1024**2)
+    cache.put(video_path, [0.0], decode(video_path, [0.0]))
+    # The video doesn't fit in the on-disk tier, so nothing is spilled
+    assert not any((tmp_path / "cache").glob("*/*.u8"))
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_dataset_frame_cache(tmp_path, lerobot_dataset_factory, batched):
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "test",
+        total_episodes=2,
+        total_frames=40,
+        use_videos=True,
+        video_frame_cache_disk_mb=64,
+    )
+    reference = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=2, total_frames=40)
+    assert reference.video_frame_cache is None
+
+    indices = [3, 25, 39]
+    for _ in range(2):
+        items = dataset.__getitems__(indices) if batched else [dataset[idx] for idx in indices]
+    for idx, item in zip(indices, items, strict=True):
+        for key in dataset.meta.video_keys:
+            torch.testing.assert_close(item[key], reference[idx][key])
+
+    stats = dataset.video_frame_cache.stats()
+    num_lookups = len(indices) * len(dataset.meta.video_keys)
+    assert stats["misses"] == num_lookups
+    assert stats["disk_hits"] == num_lookups
+    assert any((tmp_path / "test" / FRAME_CACHE_DIR).iterdir())
@@ -139,6 +139,37 @@ def test_write_image_image(tmp_path, img_factory):
     assert np.array_equal(image_pil, saved_image)
 
 
+class LazyArray:
+    """Array-like frame converted to an array only when needed, like compressed camera frames."""
+
+    def __init__(self, array):
+        self.shape = array.shape
+        self._array = array
+
+    def __array__(self, dtype=None, copy=None):
+        return self._array
+
+
+def test_write_image_array_like(tmp_path, img_array_factory):
+    image_array = img_array_factory()
+    fpath = tmp_path / DUMMY_IMAGE
+    assert write_image(LazyArray(image_array), fpath)
+    assert np.array_equal(image_array, np.array(Image.open(fpath)))
+
+
+def test_save_image_array_like_in_process(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1)
+    try:
+        image_array = img_array_factory()
+        fpath = tmp_path / DUMMY_IMAGE
+        # Array-like frames are pickled to the writer processes instead of being copied in shared memory
+        writer.save_image(LazyArray(image_array), fpath)
+        writer.wait_until_done()
+        assert np.array_equal(image_array, np.array(Image.open(fpath)))
+    finally:
+        writer.stop()
+
+
 def test_write_image_exception(tmp_path):
     image_array = "invalid data"
     fpath = tmp_path / DUMMY_IMAGE
@@ -324,6 +355,58 @@ def test_wait_until_done_multiprocessing(tmp_path, img_array_factory):
         writer.stop()
 
 
+def test_save_image_shared_memory_backpressure(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=1, num_slots=2)
+    try:
+        num_images = 20
+        image_arrays = [img_array_factory(height=100, width=100) for _ in range(num_images)]
+        fpaths = [tmp_path / f"frame_{i:06d}.png" for i in range(num_images)]
+        for image_array, fpath in zip(image_arrays, fpaths, strict=True):
+            writer.save_image(image_array, fpath)
+            assert writer.queue_depth <= 2
+        writer.wait_until_done()
+        for image_array, fpath in zip(image_arrays, fpaths, strict=True):
+            assert np.array_equal(np.array(Image.open(fpath)), image_array)
+
+        # Images of a given shape share the same slots
+        assert len(writer.rings) == 1
+        stats = writer.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 2
+        assert stats["num_frames"] == num_images
+        assert stats["num_blocked_frames"] > 0
+        assert stats["num_dropped_frames"] == 0
+    finally:
+        writer.stop()
+
+
+def test_save_image_without_shared_memory(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=1, num_slots=0)
+    try:
+        image_array = img_array_factory()
+        fpath = tmp_path / DUMMY_IMAGE
+        writer.save_image(image_array, fpath)
+        writer.wait_until_done()
+        assert np.array_equal(np.array(Image.open(fpath)), image_array)
+        assert writer.rings == {}
+    finally:
+        writer.stop()
+
+
+def test_get_stats_dropped_frames(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=1, num_threads=1)
+    try:
+        writer.save_image(img_array_factory(), tmp_path / "missing_dir" / DUMMY_IMAGE)
+        writer.save_image(img_array_factory(), tmp_path / DUMMY_IMAGE)
+        writer.wait_until_done()
+        stats = writer.get_stats()
+        assert stats["num_frames"] == 2
+        assert stats["num_dropped_frames"] == 1
+        assert stats["num_blocked_frames"] == 0
+    finally:
+        writer.stop()
+
+
 def test_exception_handling(tmp_path, img_array_factory):
     writer = AsyncImageWriter()
     try:
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import PIL.Image
+import pytest
+import torch
+
+from lerobot.datasets.video_utils import (
+    StreamingVideoEncoder,
+    VideoDecoderCache,
+    VideoFileAppender,
+    VideoFrameIndex,
+    decode_video_frames,
+    decode_video_frames_at_indices,
+    decode_video_frames_batch,
+    encode_video_frames,
+    get_video_keyframe_timestamps,
+    plan_video_decoding,
+)
+
+FPS = 30
+NUM_FRAMES = 60
+
+
+@pytest.fixture(scope="module")
+def video_path(tmp_path_factory):
+    """A short video where each frame has a distinct uniform intensity, with a key frame every 10 frames."""
+    tmp_dir = tmp_path_factory.mktemp("video")
+    imgs_dir = tmp_dir / "images"
+    imgs_dir.mkdir()
+    for frame_index in range(NUM_FRAMES):
+        img = np.full((32, 48, 3), 4 * frame_index, dtype=np.uint8)
+        PIL.Image.fromarray(img).save(imgs_dir / f"frame-{frame_index:06d}.png")
+    path = tmp_dir / "video.mp4"
+    encode_video_frames(imgs_dir, path, FPS, vcodec="h264", g=10)
+    return path
+
+
+def test_get_video_keyframe_timestamps(video_path):
+    keyframe_ts = get_video_keyframe_timestamps(video_path)
+    assert keyframe_ts[0] == pytest.approx(0.0)
+    assert list(keyframe_ts) == sorted(keyframe_ts)
+    assert len(keyframe_ts) < NUM_FRAMES
+
+
+def test_plan_video_decoding():
+    keyframe_ts = (0.0, 1.0, 2.0, 3.0)
+    timestamps = [2.5, 0.1, 0.2, 2.1, 0.9, 0.1]
+    ranges = plan_video_decoding(timestamps, keyframe_ts)
+    # Requests sharing a key frame are merged, requests past the next key frame start a new range
+    assert [[timestamps[pos] for pos in decode_range] for decode_range in ranges] == [
+        [0.1, 0.1, 0.2, 0.9],
+        [2.1, 2.5],
+    ]
+    assert sorted(pos for decode_range in ranges for pos in decode_range) == list(range(len(timestamps)))
+
+
+def test_plan_video_decoding_keeps_decoding_forward():
+    keyframe_ts = (0.0, 1.0, 2.0)
+    # The key frame of 1.5 (1.0) is after 0.9, so a new range starts, even though no key frame is skipped
+    ranges = plan_video_decoding([0.9, 1.5, 1.7], keyframe_ts)
+    assert ranges == [[0], [1, 2]]
+    assert plan_video_decoding([0.1, 1.2], keyframe_ts) == [[0], [1]]
+    ranges = plan_video_decoding([0.5, 1.2], (0.0,))
+    assert ranges == [[0, 1]]
+
+
+@pytest.mark.parametrize("backend", ["pyav"])
+def test_decode_video_frames_batch_matches_per_sample(video_path, backend):
+    timestamps = [1.5, 0.0, 1 / FPS, 1.5, 0.5, 1.9]
+    frames = decode_video_frames_batch(video_path, timestamps, tolerance_s=1e-4, backend=backend)
+    assert frames.shape == (len(timestamps), 3, 32, 48)
+    for ts, frame in zip(timestamps, frames, strict=True):
+        expected = decode_video_frames(video_path, [ts], tolerance_s=1e-4, backend=backend)[0]
+        torch.testing.assert_close(frame, expected)
+
+
+@pytest.fixture
+def fake_decoder_cache(monkeypatch):
+    """Patches `VideoDecoderCache` to create fake 100x100 decoders, as torchcodec may not be available."""
+    handles = {}
+
+    def create_decoder(self, video_path):
+        handles[video_path] = MagicMock()
+        return SimpleNamespace(metadata=SimpleNamespace(height=100, width=100)), handles[video_path]
+
+    monkeypatch.setattr(VideoDecoderCache, "_create_decoder", create_decoder)
+    return handles
+
+
+def test_video_decoder_cache_lru_eviction(fake_decoder_cache):
+    cache = VideoDecoderCache(max_decoders=2)
+    decoder_a = cache.get_decoder("a.mp4")
+    cache.get_decoder("b.mp4")
+    assert cache.get_decoder("a.mp4") is decoder_a
+    # "b.mp4" is the least recently used
+    cache.get_decoder("c.mp4")
+
+    assert cache.size() == 2
+    fake_decoder_cache["b.mp4"].close.assert_called_once()
+    fake_decoder_cache["a.mp4"].close.assert_not_called()
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+    assert stats["hit_rate"] == pytest.approx(0.25)
+
+    cache.clear()
+    assert cache.size() == 0
+    fake_decoder_cache["a.mp4"].close.assert_called_once()
+
+
+def test_video_decoder_cache_memory_budget(fake_decoder_cache):
+    decoder_mb = 100 * 100 * 3 * VideoDecoderCache.DECODER_BUFFERED_FRAMES / 1024**2
+    cache = VideoDecoderCache(max_memory_mb=2.5 * decoder_mb)
+    for path in ["a.mp4", "b.mp4", "c.mp4", "d.mp4"]:
+        cache.get_decoder(path)
+    assert cache.size() == 2
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["memory_mb"] == pytest.approx(2 * decoder_mb)
+
+    # The most recently used decoder is kept even if it alone exceeds the budget
+    cache = VideoDecoderCache(max_memory_mb=decoder_mb / 2)
+    cache.get_decoder("a.mp4")
+    assert cache.size() == 1
+
+
+def test_video_decoder_cache_is_per_process(fake_decoder_cache, monkeypatch):
+    cache = VideoDecoderCache(max_decoders=4)
+    cache.get_decoder("a.mp4")
+
+    # Spawned workers unpickle an empty cache with the same configuration
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert unpickled.size() == 0
+    assert unpickled.max_decoders == 4
+
+    # Forked workers drop inherited decoders without closing the parent's file handles
+    monkeypatch.setattr("lerobot.datasets.video_utils.os.getpid", lambda: -1)
+    assert cache.size() == 0
+    assert cache.stats()["misses"] == 0
+    fake_decoder_cache["a.mp4"].close.assert_not_called()
+
+
+@pytest.mark.parametrize("backend", ["pyav"])
+def test_decode_video_frames_return_uint8(video_path, backend):
+    timestamps = [0.5, 0.0, 1.0]
+    frames = decode_video_frames_batch(video_path, timestamps, 1e-4, backend, return_uint8=True)
+    assert frames.dtype == torch.uint8
+    expected = decode_video_frames_batch(video_path, timestamps, 1e-4, backend)
+    torch.testing.assert_close(frames.float() / 255, expected)
+
+    frames = decode_video_frames(video_path, timestamps[:1], 1e-4, backend, return_uint8=True)
+    assert frames.dtype == torch.uint8
+    torch.testing.assert_close(frames.float() / 255, expected[:1])
+
+
+def test_video_frame_index(video_path):
+    frame_index = VideoFrameIndex.from_video(video_path)
+    assert len(frame_index) == NUM_FRAMES
+    np.testing.assert_allclose(frame_index.timestamps, np.arange(NUM_FRAMES) / FPS, atol=1e-6)
+    np.testing.assert_allclose(
+        frame_index.timestamps[frame_index.is_keyframe], get_video_keyframe_timestamps(video_path)
+    )
+    keyframes = np.flatnonzero(frame_index.is_keyframe)
+    positions = np.arange(NUM_FRAMES)
+    expected = keyframes[np.searchsorted(keyframes, positions, side="right") - 1]
+    np.testing.assert_array_equal(frame_index.keyframe_positions(positions), expected)
+    assert frame_index.video_size == video_path.stat().st_size
+
+    loaded = VideoFrameIndex.from_table(frame_index.to_table())
+    assert loaded.time_base == frame_index.time_base
+    np.testing.assert_array_equal(loaded.pts, frame_index.pts)
+    np.testing.assert_array_equal(loaded.is_keyframe, frame_index.is_keyframe)
+    np.testing.assert_array_equal(loaded.byte_offset, frame_index.byte_offset)
+
+
+@pytest.mark.parametrize("backend", ["pyav"])
+def test_decode_video_frames_at_indices(video_path, backend):
+    frame_index = VideoFrameIndex.from_video(video_path)
+    positions = [45, 0, 1, 45, 15, 57]
+    frames = decode_video_frames_at_indices(video_path, positions, frame_index, backend)
+    expected = decode_video_frames_batch(video_path, [pos / FPS for pos in positions], 1e-4, backend)
+    torch.testing.assert_close(frames, expected)
+
+    with pytest.raises(IndexError):
+        decode_video_frames_at_indices(video_path, [NUM_FRAMES], frame_index, backend)
+
+
+@pytest.mark.parametrize("approximate_fps", [FPS, FPS * 1.1])
+def test_decode_video_frames_at_indices_torchcodec(video_path, monkeypatch, approximate_fps):
+    """Fetches frames by index from a fake torchcodec decoder, as torchcodec may not be available."""
+    frame_index = VideoFrameIndex.from_video(video_path)
+    all_frames = decode_video_frames_at_indices(
+        video_path, list(range(NUM_FRAMES)), frame_index, "pyav", return_uint8=True
+    )
+    exact_ts = torch.from_numpy(frame_index.timestamps)
+
+    class FakeDecoder:
+        metadata = SimpleNamespace(height=32, width=48)
+
+        def get_frames_at(self, indices):
+            # Like the "approximate" seek mode, which derives timestamps from the average frame rate
+            positions = [min(round(i / FPS * approximate_fps), NUM_FRAMES - 1) for i in indices]
+            return SimpleNamespace(data=all_frames[positions], pts_seconds=exact_ts[positions])
+
+        def get_frames_played_at(self, seconds):
+            positions = [int(torch.argmin((exact_ts - ts).abs())) for ts in seconds]
+            return SimpleNamespace(data=all_frames[positions], pts_seconds=exact_ts[positions])
+
+    monkeypatch.setattr(VideoDecoderCache, "_create_decoder", lambda self, path: (FakeDecoder(), MagicMock()))
+    positions = [45, 0, 1, 45, 15, 57]
+    frames = decode_video_frames_at_indices(
+        video_path, positions, frame_index, "torchcodec", decoder_cache=VideoDecoderCache()
+    )
+    torch.testing.assert_close(frames, all_frames[positions].float() / 255)
+
+
+def test_streaming_video_encoder(video_path, tmp_path):
+    encoder = StreamingVideoEncoder(tmp_path / "video.mp4", FPS, vcodec="h264", g=10, queue_size=4)
+    for frame_index in range(NUM_FRAMES):
+        image = np.full((32, 48, 3), 4 * frame_index, dtype=np.uint8)
+        # Channel first float images are converted as they are by `write_image`
+        encoder.add_frame(image if frame_index % 2 else image.transpose(2, 0, 1) / 255)
+    path = encoder.finish()
+
+    # Frames are encoded as by `encode_video_frames` from PNG images
+    timestamps = [i / FPS for i in range(NUM_FRAMES)]
+    torch.testing.assert_close(
+        decode_video_frames_batch(path, timestamps, 1e-4, "pyav"),
+        decode_video_frames_batch(video_path, timestamps, 1e-4, "pyav"),
+    )
+
+    sampled = encoder.sample_frames()
+    assert sampled.shape == (NUM_FRAMES, 3, 32, 48)
+    np.testing.assert_array_equal(sampled[:, 0, 0, 0], 4 * np.arange(NUM_FRAMES))
+
+
+def test_streaming_video_encoder_sampled_frames_are_bounded(tmp_path):
+    encoder = StreamingVideoEncoder(tmp_path / "video.mp4", FPS, vcodec="h264", max_sampled_frames=16)
+    for frame_index in range(100):
+        encoder.add_frame(np.full((16, 16, 3), frame_index, dtype=np.uint8))
+    encoder.finish()
+    assert len(encoder._sampled_frames) <= 16
+    sampled = encoder.sample_frames()
+    # The closest kept frames are used
+    assert len(sampled) == 100
+    assert np.all(np.abs(sampled[:, 0, 0, 0].astype(int) - np.arange(100)) <= encoder._sampling_stride // 2)
+
+    encoder = StreamingVideoEncoder(tmp_path / "error.mp4", FPS, vcodec="h264")
+    encoder.add_frame(np.zeros((16, 16), dtype=np.uint8))
+    with pytest.raises(RuntimeError, match="Encoding"):
+        encoder.finish()
+    encoder.cancel()
+    assert not (tmp_path / "error.mp4").exists()
+
+
+def test_video_file_appender(video_path, tmp_path):
+    output_path = tmp_path / "videos" / "file-000.mp4"
+    appender = VideoFileAppender(output_path)
+    duration = NUM_FRAMES / FPS
+    for i in range(3):
+        appender.append(video_path, from_timestamp=i * duration)
+    # The file is only readable once closed
+    assert not output_path.exists()
+    assert appender.size_in_bytes > 0
+    appender.close()
+    assert [p.name for p in output_path.parent.iterdir()] == ["file-000.mp4"]
+    # The released file is a regular mp4, not the fragmented one written while appending
+    assert b"moof" not in output_path.read_bytes()
+
+    timestamps = VideoFrameIndex.from_video(output_path).timestamps
+    np.testing.assert_allclose(timestamps, np.arange(3 * NUM_FRAMES) / FPS, atol=1e-6)
+    positions = [0, 17, 59]
+    expected = decode_video_frames_batch(video_path, [pos / FPS for pos in positions], 1e-4, "pyav")
+    for i in range(3):
+        timestamps = [i * duration + pos / FPS for pos in positions]
+        torch.testing.assert_close(decode_video_frames_batch(output_path, timestamps, 1e-4, "pyav"), expected)
+
+
+def test_video_file_appender_recover_partial_files(video_path, tmp_path):
+    videos_dir = tmp_path / "videos"
+    output_path = videos_dir / "chunk-000" / "file-000.mp4"
+    appender = VideoFileAppender(output_path)
+    duration = NUM_FRAMES / FPS
+    for i in range(2):
+        appender.append(video_path, from_timestamp=i * duration)
+    unreadable_path = videos_dir / "chunk-000" / "file-001.mp4.partial"
+    unreadable_path.write_bytes(b"")
+
+    # Crash: the appender is never closed, the episodes before the last one appended can be read back
+    assert VideoFileAppender.recover_partial_files(videos_dir) == [output_path]
+    assert not unreadable_path.exists()
+    assert sorted(p.name for p in output_path.parent.iterdir()) == ["file-000.mp4"]
+    assert b"moof" not in output_path.read_bytes()
+    timestamps = VideoFrameIndex.from_video(output_path).timestamps
+    assert timestamps.size >= NUM_FRAMES
+    positions = [0, 17, 59]
+    expected = decode_video_frames_batch(video_path, [pos / FPS for pos in positions], 1e-4, "pyav")
+    torch.testing.assert_close(
+        decode_video_frames_batch(output_path, timestamps[positions].tolist(), 1e-4, "pyav"), expected
+    )
@@ -257,6 +257,29 @@ def test_sac_policy_with_default_config(batch_size: int, state_dim: int, action_
         assert selected_action.shape == (batch_size, action_dim)
 
 
+def test_sac_policy_critic_loss_with_importance_sampling_weights():
+    batch_size = 4
+    batch = create_default_train_batch(batch_size=batch_size, action_dim=6, state_dim=6)
+    config = create_default_config(state_dim=6, continuous_action_dim=6)
+    policy = SACPolicy(config=config)
+
+    # The next actions are sampled from the actor
+    with seeded_context(0):
+        critic_output = policy.forward(batch, model="critic")
+    assert critic_output["td_error"].shape == (batch_size,)
+    assert torch.all(critic_output["td_error"] >= 0)
+    assert not critic_output["td_error"].requires_grad
+
+    with seeded_context(0):
+        weighted_output = policy.forward({**batch, "weights": torch.ones(batch_size)}, model="critic")
+    torch.testing.assert_close(weighted_output["loss_critic"], critic_output["loss_critic"])
+
+    with seeded_context(0):
+        weights = torch.tensor([1.0, 0.0, 0.0, 0.0])
+        first_sample_output = policy.forward({**batch, "weights": weights}, model="critic")
+    assert first_sample_output["loss_critic"] < critic_output["loss_critic"]
+
+
 @pytest.mark.parametrize("batch_size,state_dim,action_dim", [(2, 6, 6), (1, 10, 10)])
 def test_sac_policy_with_visual_input(batch_size: int, state_dim: int, action_dim: int):
     config = create_config_with_visual_input(state_dim=state_dim, continuous_action_dim=action_dim)
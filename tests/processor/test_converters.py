@@ -201,6 +201,26 @@ def test_to_tensor_empty_dict():
     assert len(result) == 0
 
 
+def test_to_tensor_array_likes():
+    """Test to_tensor with objects implementing __array__, and read-only arrays."""
+
+    class ArrayLike:
+        def __array__(self, dtype=None, copy=None):
+            array = np.arange(6, dtype=np.uint8).reshape(2, 3)
+            array.flags.writeable = False
+            return array
+
+    result = to_tensor(ArrayLike(), dtype=None)
+    assert result.dtype == torch.uint8
+    assert torch.equal(result, torch.arange(6, dtype=torch.uint8).reshape(2, 3))
+
+    read_only = np.zeros(3, dtype=np.float32)
+    read_only.flags.writeable = False
+    result = to_tensor(read_only, dtype=None)
+    result += 1
+    assert (read_only == 0).all()
+
+
 def test_to_tensor_unsupported_type():
     """Test to_tensor with unsupported types raises TypeError."""
     with pytest.raises(TypeError, match="Unsupported type for tensor conversion"):
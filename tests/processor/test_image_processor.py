@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+
+import pytest
+import torch
+
+from lerobot.processor import (
+    DataProcessorPipeline,
+    DeviceProcessorStep,
+    ImageToFloatProcessorStep,
+    TransitionKey,
+)
+from lerobot.processor.converters import create_transition, identity_transition
+from lerobot.utils.constants import OBS_IMAGE, OBS_IMAGES, OBS_STATE
+
+
+def test_uint8_images_are_converted():
+    processor = ImageToFloatProcessorStep()
+    image = torch.randint(0, 256, (2, 3, 8, 8), dtype=torch.uint8)
+    state = torch.randint(0, 10, (2, 4), dtype=torch.uint8)
+    transition = create_transition(observation={f"{OBS_IMAGES}.top": image, OBS_STATE: state})
+
+    result = processor(transition)[TransitionKey.OBSERVATION]
+
+    assert result[f"{OBS_IMAGES}.top"].dtype == torch.float32
+    torch.testing.assert_close(result[f"{OBS_IMAGES}.top"], image.float() / 255)
+    # Only images are converted
+    assert result[OBS_STATE] is state
+
+
+def test_float_images_are_unchanged():
+    processor = ImageToFloatProcessorStep(float_dtype="bfloat16")
+    image = torch.rand(3, 8, 8)
+    transition = create_transition(observation={OBS_IMAGE: image})
+    assert processor(transition)[TransitionKey.OBSERVATION][OBS_IMAGE] is image
+
+
+def test_float_dtype():
+    processor = ImageToFloatProcessorStep(float_dtype="float16")
+    transition = create_transition(observation={OBS_IMAGE: torch.full((3, 2, 2), 255, dtype=torch.uint8)})
+    result = processor(transition)[TransitionKey.OBSERVATION][OBS_IMAGE]
+    assert result.dtype == torch.float16
+    assert torch.all(result == 1)
+
+    with pytest.raises(ValueError, match="Invalid float_dtype"):
+        ImageToFloatProcessorStep(float_dtype="int8")
+
+
+def test_pipeline_after_device_step_and_serialization():
+    pipeline = DataProcessorPipeline(
+        [DeviceProcessorStep(device="cpu"), ImageToFloatProcessorStep(float_dtype="float32")],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+    image = torch.randint(0, 256, (3, 8, 8), dtype=torch.uint8)
+    result = pipeline(create_transition(observation={OBS_IMAGE: image}))
+    torch.testing.assert_close(result[TransitionKey.OBSERVATION][OBS_IMAGE], image.float() / 255)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline.save_pretrained(tmp_dir)
+        loaded = DataProcessorPipeline.from_pretrained(
+            tmp_dir,
+            config_filename="dataprocessorpipeline.json",
+            to_transition=identity_transition,
+            to_output=identity_transition,
+        )
+    assert isinstance(loaded.steps[1], ImageToFloatProcessorStep)
+    assert loaded.steps[1].get_config() == {"float_dtype": "float32"}
@@ -14,13 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+
 import numpy as np
 import pytest
 import torch
 
 from lerobot.configs.types import FeatureType, PipelineFeatureType
-from lerobot.processor import TransitionKey, VanillaObservationProcessorStep
-from lerobot.processor.converters import create_transition
+from lerobot.processor import DataProcessorPipeline, TransitionKey, VanillaObservationProcessorStep
+from lerobot.processor.converters import create_transition, identity_transition
 from lerobot.utils.constants import OBS_ENV_STATE, OBS_IMAGE, OBS_IMAGES, OBS_STATE
 from tests.conftest import assert_contract_is_typed
 
@@ -51,6 +53,32 @@ def test_process_single_image():
     assert processed_img.max() <= 1.0
 
 
+def test_process_jpeg_frame_through_pipeline():
+    """Camera frames in MJPEG passthrough mode (`JpegFrame`) are decoded by the pipeline."""
+    cv2 = pytest.importorskip("cv2")
+    from lerobot.cameras.opencv import JpegFrame
+
+    image = np.zeros((48, 64, 3), dtype=np.uint8)
+    image[:, 32:] = 200
+    _, data = cv2.imencode(".jpg", image)
+    frame = JpegFrame(data, 48, 64)
+
+    pipeline = DataProcessorPipeline(
+        [VanillaObservationProcessorStep()], to_transition=identity_transition, to_output=identity_transition
+    )
+    with warnings.catch_warnings():
+        # The decoded frame is read-only, it must not be shared with a tensor
+        warnings.simplefilter("error")
+        result = pipeline(
+            create_transition(observation={"pixels": {"front": frame}, "agent_pos": np.zeros(6)})
+        )
+    processed_img = result[TransitionKey.OBSERVATION][f"{OBS_IMAGES}.front"]
+
+    assert processed_img.shape == (1, 3, 48, 64)
+    expected = torch.from_numpy(np.array(frame)).permute(2, 0, 1).float() / 255
+    torch.testing.assert_close(processed_img[0], expected)
+
+
 def test_process_image_dict():
     """Test processing multiple images in a dictionary."""
     processor = VanillaObservationProcessorStep()
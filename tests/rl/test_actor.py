@@ -135,6 +135,35 @@ def test_push_transitions_to_transport_queue():
         assert_transitions_equal(deserialized_transition, transitions[i])
 
 
+@require_package("grpc")
+def test_push_stacked_transitions_to_transport_queue():
+    from lerobot.rl.actor import push_transitions_to_transport_queue
+    from lerobot.transport.utils import bytes_to_transitions
+
+    transitions = [
+        Transition(
+            state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            action=torch.randn(5),
+            reward=torch.tensor(1.0 + i),
+            done=torch.tensor(False),
+            truncated=torch.tensor(False),
+            next_state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            complementary_info={"step": torch.tensor(i)},
+        )
+        for i in range(3)
+    ]
+
+    transitions_queue = Queue()
+    push_transitions_to_transport_queue(transitions, transitions_queue, stack=True)
+
+    stacked_transitions = bytes_to_transitions(transitions_queue.get())
+    assert stacked_transitions["state"][OBS_STR].shape == (3, 3, 64, 64)
+    assert stacked_transitions["reward"].tolist() == [1.0, 2.0, 3.0]
+    assert stacked_transitions["complementary_info"]["step"].tolist() == [0, 1, 2]
+    for i, transition in enumerate(transitions):
+        assert torch.equal(stacked_transitions["next_state"]["state"][i], transition["next_state"]["state"])
+
+
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_transitions_stream():
@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
+from lerobot.cameras import TimestampedFrame
 from lerobot.robots.reachy2 import (
     REACHY2_ANTENNAS_JOINTS,
     REACHY2_L_ARM_JOINTS,
@@ -139,7 +141,15 @@ def _make_reachy2_camera_mock(*args, **kwargs):
     cam.height = height
     cam.connect = MagicMock()
     cam.disconnect = MagicMock()
-    cam.async_read = MagicMock(side_effect=lambda: np.zeros((height, width, 3), dtype=np.uint8))
+    cam.fps = getattr(cfg, "fps", kwargs.get("fps", 30))
+    cam.async_read = MagicMock(
+        side_effect=lambda *args, **kwargs: np.zeros((height, width, 3), dtype=np.uint8)
+    )
+    cam.async_read_timestamped = MagicMock(
+        side_effect=lambda timeout_ms=200, after_sequence=-1: TimestampedFrame(
+            cam.async_read(), time.perf_counter(), after_sequence + 1
+        )
+    )
     return cam
 
 
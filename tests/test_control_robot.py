@@ -14,14 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import patch
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+from lerobot.datasets.utils import load_episodes
+from lerobot.processor import make_default_processors
 from lerobot.scripts.lerobot_calibrate import CalibrateConfig, calibrate
-from lerobot.scripts.lerobot_record import DatasetRecordConfig, RecordConfig, record
+from lerobot.scripts.lerobot_record import (
+    DatasetRecordConfig,
+    RecordConfig,
+    log_image_writer_stats,
+    record,
+    record_loop,
+)
 from lerobot.scripts.lerobot_replay import DatasetReplayConfig, ReplayConfig, replay
 from lerobot.scripts.lerobot_teleoperate import TeleoperateConfig, teleoperate
 from tests.fixtures.constants import DUMMY_REPO_ID
-from tests.mocks.mock_robot import MockRobotConfig
+from tests.mocks.mock_robot import MockRobot, MockRobotConfig
 from tests.mocks.mock_teleop import MockTeleopConfig
 
 
@@ -67,6 +78,10 @@ def test_record_and_resume(tmp_path):
     assert dataset.meta.total_episodes == dataset.num_episodes == 1
     assert dataset.meta.total_frames == dataset.num_frames == 3
     assert dataset.meta.total_tasks == 1
+    # Timings of the recording loop are stored in the episodes metadata
+    episodes = load_episodes(dataset.root)
+    assert episodes["timing/control/histogram"][0][-1] == 0
+    assert sum(episodes["timing/dataset/histogram"][0]) == 3
 
     cfg.resume = True
     # Mock the revision to prevent Hub calls during resume
@@ -81,6 +96,7 @@ def test_record_and_resume(tmp_path):
     assert dataset.meta.total_episodes == dataset.num_episodes == 2
     assert dataset.meta.total_frames == dataset.num_frames == 6
     assert dataset.meta.total_tasks == 1
+    assert len(load_episodes(dataset.root)["timing/num_overruns"]) == 2
 
 
 def test_record_and_replay(tmp_path):
@@ -121,3 +137,49 @@ def test_record_and_replay(tmp_path):
         mock_get_safe_version.return_value = "v3.0"
         mock_snapshot_download.return_value = str(tmp_path / "record_and_replay")
         replay(replay_cfg)
+
+
+def test_log_image_writer_stats_logs_per_episode_deltas(caplog):
+    image_writer = MagicMock()
+    dataset = SimpleNamespace(image_writer=image_writer)
+    stats = {"max_queue_depth": 8, "num_blocked_frames": 0, "blocked_time_s": 0.0, "num_dropped_frames": 0}
+
+    image_writer.get_stats.return_value = {**stats, "num_frames": 100, "num_dropped_frames": 1}
+    with caplog.at_level(logging.INFO):
+        previous_stats = log_image_writer_stats(dataset)
+    assert caplog.records[-1].levelno == logging.WARNING
+
+    # No frame was dropped during the next episode
+    image_writer.get_stats.return_value = {**stats, "num_frames": 200, "num_dropped_frames": 1}
+    with caplog.at_level(logging.INFO):
+        log_image_writer_stats(dataset, previous_stats)
+    assert caplog.records[-1].levelno == logging.INFO
+    assert "100 frames queued" in caplog.records[-1].getMessage()
+
+    assert log_image_writer_stats(SimpleNamespace(image_writer=None)) is None
+
+
+def test_record_loop_without_action_keeps_rate(caplog):
+    robot = MockRobot(MockRobotConfig())
+    robot.connect()
+    teleop_action_processor, robot_action_processor, robot_observation_processor = make_default_processors()
+
+    # Without a policy nor a teleoperator, e.g. during a reset, the loop waits for the next period
+    fps, control_time_s = 50, 0.2
+    start = time.perf_counter()
+    with caplog.at_level(logging.INFO), patch.object(robot, "send_action") as send_action:
+        timings = record_loop(
+            robot=robot,
+            events={"exit_early": False},
+            fps=fps,
+            teleop_action_processor=teleop_action_processor,
+            robot_action_processor=robot_action_processor,
+            robot_observation_processor=robot_observation_processor,
+            control_time_s=control_time_s,
+        )
+    robot.disconnect()
+
+    assert time.perf_counter() - start >= control_time_s
+    assert len(timings.latencies["control"]) <= control_time_s * fps + 1
+    send_action.assert_not_called()
+    assert sum("No policy or teleoperator" in record.getMessage() for record in caplog.records) == 1
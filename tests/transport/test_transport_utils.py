@@ -551,6 +551,36 @@ def test_transitions_to_bytes_multiple_transitions():
         assert_transitions_equal(original, reconstructed_item)
 
 
+@require_package("grpc")
+def test_transitions_to_bytes_stacked_transitions():
+    from lerobot.transport.utils import bytes_to_transitions, transitions_to_bytes
+    from lerobot.utils.transition import stack_transitions
+
+    """Test converting transitions stacked into tensors."""
+    transitions = [
+        Transition(
+            state={"data": torch.randn(1, 10)},
+            action=torch.randn(1, 3),
+            reward=float(i),
+            done=i == 4,
+            truncated=False,
+            next_state={"data": torch.randn(1, 10)},
+            complementary_info={"discrete_penalty": torch.tensor([1.0])},
+        )
+        for i in range(5)
+    ]
+
+    reconstructed = bytes_to_transitions(transitions_to_bytes(stack_transitions(transitions)))
+
+    assert reconstructed["state"]["data"].shape == (5, 10)
+    assert reconstructed["complementary_info"]["discrete_penalty"].shape == (5,)
+    assert reconstructed["done"].tolist() == [False, False, False, False, True]
+    for i, transition in enumerate(transitions):
+        assert torch.equal(reconstructed["state"]["data"][i], transition["state"]["data"][0])
+        assert torch.equal(reconstructed[ACTION][i], transition[ACTION][0])
+        assert reconstructed["reward"][i] == transition["reward"]
+
+
 @require_package("grpc")
 def test_receive_bytes_in_chunks_unknown_state():
     from lerobot.transport.utils import receive_bytes_in_chunks
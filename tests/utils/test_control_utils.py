@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from lerobot.utils.control_utils import (
+    CONTROL_LOOP_STAGES,
+    LATENCY_HISTOGRAM_BINS_MS,
+    BackgroundWorker,
+    ControlLoopTimings,
+)
+
+
+def test_control_loop_timings():
+    timings = ControlLoopTimings(fps=100)
+    for latency_s in [0.001, 0.004, 0.008, 0.015]:
+        timings.add("control", latency_s)
+    timings.add("observation", 0.003)
+
+    metadata = timings.to_episode_metadata()
+    assert metadata["timing/num_overruns"] == 1
+    assert metadata["timing/control/histogram"].tolist() == [0, 1, 1, 1, 1, 0, 0, 0, 0, 0]
+    assert metadata["timing/control/max_ms"] == pytest.approx(15)
+    assert metadata["timing/observation/p50_ms"] == pytest.approx(3)
+    # Stages which were not timed have the same metadata keys, e.g. when nothing is displayed
+    assert metadata["timing/display/histogram"].sum() == 0
+    assert metadata["timing/display/mean_ms"] == 0.0
+    assert len(metadata) == 1 + 5 * len(CONTROL_LOOP_STAGES)
+    assert all(
+        len(metadata[f"timing/{s}/histogram"]) == len(LATENCY_HISTOGRAM_BINS_MS) for s in CONTROL_LOOP_STAGES
+    )
+
+
+def test_background_worker():
+    results = []
+    worker = BackgroundWorker(results.append, maxsize=2)
+    for i in range(10):
+        worker.submit(i)
+    worker.stop()
+    assert results == list(range(10))
+    assert not worker.thread.is_alive()
+
+
+def test_background_worker_drop_when_full():
+    release = threading.Event()
+    results = []
+
+    def fn(i):
+        release.wait()
+        results.append(i)
+
+    worker = BackgroundWorker(fn, maxsize=1, drop_when_full=True)
+    for i in range(5):
+        worker.submit(i)
+    release.set()
+    worker.stop()
+    # The first item is being processed when the second one fills the queue
+    assert len(results) + worker.num_dropped == 5
+    assert worker.num_dropped >= 3
+
+
+def test_background_worker_error():
+    def fn(i):
+        raise ValueError(f"Invalid item {i}")
+
+    worker = BackgroundWorker(fn, maxsize=1)
+    worker.submit(0)
+    with pytest.raises(ValueError, match="Invalid item 0"):
+        worker.stop()
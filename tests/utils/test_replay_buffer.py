@@ -17,12 +17,14 @@
 import sys
 from collections.abc import Callable
 
+import numpy as np
 import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import BatchTransition, ReplayBuffer, SumTree, random_crop_vectorized
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
+from lerobot.utils.transition import Transition, index_transitions, stack_transitions
 from tests.fixtures.constants import DUMMY_REPO_ID
 
 
@@ -43,6 +45,7 @@ def create_empty_replay_buffer(
     optimize_memory: bool = False,
     use_drq: bool = False,
     image_augmentation_function: Callable | None = None,
+    prioritized: bool = False,
 ) -> ReplayBuffer:
     buffer_capacity = 10
     device = "cpu"
@@ -53,6 +56,7 @@ def create_empty_replay_buffer(
         optimize_memory=optimize_memory,
         use_drq=use_drq,
         image_augmentation_function=image_augmentation_function,
+        prioritized=prioritized,
     )
 
 
@@ -679,3 +683,353 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        "cpu",
+        pytest.param(
+            "cuda", marks=pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+        ),
+    ],
+)
+def test_async_iterator_batches_match_storage(device):
+    replay_buffer = ReplayBuffer(
+        10, device, state_dims(), use_drq=False, optimize_memory=True, store_images_as_uint8=True
+    )
+    for _ in range(10):
+        replay_buffer.add(
+            create_dummy_state(),
+            create_dummy_action(),
+            torch.rand(()).item(),
+            None,
+            False,
+            False,
+            complementary_info={"discrete_penalty": torch.tensor([1.0])},
+        )
+
+    iterator = replay_buffer.get_iterator(batch_size=4, async_prefetch=True, queue_size=2)
+    # More batches than staging buffers, which are reused: batches kept by the learner are not overwritten
+    batches = []
+    for _ in range(10):
+        batches.append(next(iterator))
+        assert replay_buffer.last_batch_wait_s >= 0
+    del iterator
+
+    for batch in batches:
+        idx = batch["indices"]
+        next_idx = (idx + 1) % replay_buffer.capacity
+        for key in state_dims():
+            expected_states = replay_buffer._load_states(replay_buffer.states[key], idx, device)
+            expected_next_states = replay_buffer._load_states(replay_buffer.states[key], next_idx, device)
+            assert batch["state"][key].device.type == device
+            assert torch.equal(batch["state"][key], expected_states)
+            assert torch.equal(batch["next_state"][key], expected_next_states)
+        assert torch.equal(batch[ACTION].cpu(), replay_buffer.actions[idx])
+        assert torch.equal(batch["reward"].cpu(), replay_buffer.rewards[idx])
+        assert batch["done"].dtype == torch.float32
+        assert torch.equal(batch["complementary_info"]["discrete_penalty"].cpu(), torch.ones(4))
+
+
+def test_async_iterator_raises_sampling_errors():
+    # The only transition has no next state yet, so it can't be sampled by priority
+    replay_buffer = create_empty_replay_buffer(optimize_memory=True, prioritized=True)
+    replay_buffer.add(create_dummy_state(), create_dummy_action(), 1.0, None, False, False)
+
+    iterator = replay_buffer.get_iterator(batch_size=1, async_prefetch=True)
+    with pytest.raises(RuntimeError, match="before a transition has a next state"):
+        next(iterator)
+
+
+def test_sum_tree():
+    tree = SumTree(5)
+    tree.update(np.arange(5), np.array([1.0, 0.0, 2.0, 3.0, 4.0]))
+    assert tree.total() == 10.0
+
+    tree.update(np.array([4]), np.array([0.5]))
+    assert tree.total() == 6.5
+    assert np.array_equal(tree.get(np.array([2, 4])), [2.0, 0.5])
+
+    # Cumulative sums: [0, 1) -> 0, [1, 3) -> 2, [3, 6) -> 3, [6, 6.5) -> 4
+    found = tree.find(np.array([0.0, 0.99, 1.0, 2.5, 3.0, 5.99, 6.0, 6.49]))
+    assert found.tolist() == [0, 0, 2, 2, 3, 3, 4, 4]
+    # Leaves without priority are never found, even for out of range prefix sums
+    assert tree.find(np.array([6.5, 100.0])).tolist() == [4, 4]
+
+
+def test_prioritized_sampling_follows_priorities():
+    torch.manual_seed(0)
+    replay_buffer = create_empty_replay_buffer(prioritized=True)
+    for _ in range(4):
+        replay_buffer.add(
+            create_dummy_state(), create_dummy_action(), 1.0, create_dummy_state(), False, False
+        )
+
+    batch = replay_buffer.sample(4)
+    # New transitions have the same maximum priority
+    assert torch.equal(batch["weights"], torch.ones(4))
+
+    # Priorities of about [1, 1, 4, 1]: each quarter of the total priority is sampled once, so the first quarter
+    # samples 0 or 1 and the third one samples 2.
+    replay_buffer.update_priorities(torch.tensor([0, 1, 2, 3]), torch.tensor([1.0, 1.0, -10.0, 1.0]))
+    batch = replay_buffer.sample(4)
+    assert batch["indices"][0] in (0, 1)
+    assert batch["indices"][2] == 2
+    for i, idx in enumerate(batch["indices"]):
+        assert torch.equal(batch[ACTION][i], replay_buffer.actions[idx])
+
+    # Rarely sampled transitions get the highest weight, normalized to 1
+    assert batch["weights"].max() == 1.0
+    assert torch.all(batch["weights"][batch["indices"] == 2] < 1.0)
+
+
+def test_prioritized_sampling_with_memory_optimization():
+    replay_buffer = create_empty_replay_buffer(optimize_memory=True, prioritized=True)
+    states = [create_dummy_state() for _ in range(3)]
+    for state in states:
+        replay_buffer.add(state, create_dummy_action(), 1.0, None, False, False)
+
+    # The last transition has no next state yet
+    replay_buffer.update_priorities(torch.tensor([2]), torch.tensor([1e6]))
+    batch = replay_buffer.sample(10)
+    assert set(batch["indices"].tolist()) <= {0, 1}
+    for i, idx in enumerate(batch["indices"]):
+        assert torch.equal(batch["next_state"][OBS_STATE][i], states[idx + 1][OBS_STATE])
+
+
+def test_update_priorities_requires_prioritized_buffer(replay_buffer, dummy_state, dummy_action):
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+    batch = replay_buffer.sample(1)
+    assert torch.equal(batch["weights"], torch.ones(1))
+    with pytest.raises(RuntimeError, match="prioritized mode"):
+        replay_buffer.update_priorities(batch["indices"], torch.ones(1))
+
+
+def test_store_images_as_uint8():
+    replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, store_images_as_uint8=True)
+    float_replay_buffer = create_empty_replay_buffer()
+    states = [create_dummy_state() for _ in range(4)]
+    for state, next_state in zip(states[:-1], states[1:], strict=True):
+        replay_buffer.add(state, create_dummy_action(), 1.0, next_state, False, False)
+        float_replay_buffer.add(state, create_dummy_action(), 1.0, next_state, False, False)
+
+    assert replay_buffer.states[OBS_IMAGE].dtype == torch.uint8
+    assert replay_buffer.states[OBS_STATE].dtype == torch.float32
+    assert get_object_memory(replay_buffer) < get_object_memory(float_replay_buffer) / 3
+
+    batch = replay_buffer.sample(8)
+    assert batch["state"][OBS_IMAGE].dtype == torch.float32
+    for i, idx in enumerate(batch["indices"]):
+        # Images are rounded to the nearest pixel value
+        torch.testing.assert_close(
+            batch["state"][OBS_IMAGE][i], states[idx][OBS_IMAGE], rtol=0, atol=0.5 / 255 + 1e-6
+        )
+        torch.testing.assert_close(
+            batch["next_state"][OBS_IMAGE][i], states[idx + 1][OBS_IMAGE], rtol=0, atol=0.5 / 255 + 1e-6
+        )
+        assert torch.equal(batch["state"][OBS_STATE][i], states[idx][OBS_STATE])
+
+
+def test_memory_optimization_stores_next_state_of_truncated_episodes():
+    replay_buffer = create_empty_replay_buffer(optimize_memory=True)
+    states = [create_dummy_state() for _ in range(5)]
+    # A first episode truncated after 2 transitions, then an episode whose next states aren't known yet
+    replay_buffer.add(states[0], create_dummy_action(), 1.0, states[1], False, False)
+    replay_buffer.add(states[1], create_dummy_action(), 1.0, states[2], False, True)
+    replay_buffer.add(states[3], create_dummy_action(), 1.0, None, False, False)
+    replay_buffer.add(states[4], create_dummy_action(), 1.0, None, False, False)
+
+    # The next state of the truncated transition is stored in the slot after it, which isn't a transition
+    assert replay_buffer.size == 5
+    assert len(replay_buffer) == 4
+    assert replay_buffer.frame_only.tolist()[:5] == [False, False, True, False, False]
+    assert replay_buffer.episode_ends.tolist()[:5] == [False, True, False, False, False]
+    assert not replay_buffer.actions[2].any()
+    assert replay_buffer.rewards[2] == 0
+
+    # Neither the frame nor the last transition, whose next state isn't stored yet, are sampled
+    expected_next_states = {0: states[1], 1: states[2], 3: states[4]}
+    sampled_indices = set()
+    for _ in range(20):
+        batch = replay_buffer.sample(5)
+        sampled_indices.update(batch["indices"].tolist())
+        for i, idx in enumerate(batch["indices"].tolist()):
+            assert torch.equal(batch["next_state"][OBS_STATE][i], expected_next_states[idx][OBS_STATE])
+    assert sampled_indices == {0, 1, 3}
+
+    # Once overwritten by transitions, the frame slot isn't excluded from the length anymore
+    for _ in range(replay_buffer.capacity):
+        replay_buffer.add(create_dummy_state(), create_dummy_action(), 1.0, None, False, False)
+    assert not replay_buffer.frame_only.any()
+    assert len(replay_buffer) == replay_buffer.capacity
+
+
+def test_storage_dir_reopens_flushed_buffer(tmp_path):
+    replay_buffer = ReplayBuffer(
+        10, "cpu", state_dims(), use_drq=False, optimize_memory=True, storage_dir=tmp_path / "buffer"
+    )
+
+    def add_transition(truncated: bool = False):
+        replay_buffer.add(
+            create_dummy_state(),
+            create_dummy_action(),
+            1.0,
+            create_dummy_state(),
+            False,
+            truncated,
+            complementary_info={"discrete_penalty": torch.tensor([1.0])},
+        )
+
+    for _ in range(4):
+        add_transition()
+    add_transition(truncated=True)
+    assert (tmp_path / "buffer" / f"states.{OBS_IMAGE}.bin").exists()
+
+    replay_buffer.flush()
+    # Transitions added after the last flush are lost on reopening
+    add_transition()
+
+    reopened_buffer = ReplayBuffer.from_storage_dir(tmp_path / "buffer", device="cpu", use_drq=False)
+    assert len(reopened_buffer) == 5
+    assert reopened_buffer.size == 6
+    assert reopened_buffer.position == 6
+    assert reopened_buffer.frame_only[5]
+    for i in range(6):
+        for key in state_dims():
+            assert torch.equal(reopened_buffer.states[key][i], replay_buffer.states[key][i])
+        assert torch.equal(reopened_buffer.actions[i], replay_buffer.actions[i])
+    assert reopened_buffer.complementary_info_keys == ["discrete_penalty"]
+
+    # The reopened buffer writes to the same files
+    reopened_buffer.add(
+        create_dummy_state(),
+        create_dummy_action(),
+        1.0,
+        create_dummy_state(),
+        False,
+        False,
+        complementary_info={"discrete_penalty": torch.tensor([1.0])},
+    )
+    assert torch.equal(replay_buffer.actions[6], reopened_buffer.actions[6])
+    batch = reopened_buffer.sample(4)
+    assert batch[ACTION].shape == (4, *replay_buffer.actions.shape[1:])
+    assert batch["complementary_info"]["discrete_penalty"].shape == (4,)
+
+
+def test_storage_dir_restores_priorities(tmp_path):
+    replay_buffer = ReplayBuffer(10, "cpu", [OBS_STATE], prioritized=True, storage_dir=tmp_path)
+    for _ in range(4):
+        replay_buffer.add(
+            {OBS_STATE: torch.randn(10)},
+            create_dummy_action(),
+            1.0,
+            {OBS_STATE: torch.randn(10)},
+            False,
+            False,
+        )
+    replay_buffer.update_priorities(torch.tensor([0, 1, 2, 3]), torch.tensor([1.0, 2.0, 3.0, 4.0]))
+    replay_buffer.flush()
+
+    reopened_buffer = ReplayBuffer.from_storage_dir(tmp_path, device="cpu", prioritized=True)
+    np.testing.assert_array_equal(
+        reopened_buffer.sum_tree.get(np.arange(10)), replay_buffer.sum_tree.get(np.arange(10))
+    )
+    assert reopened_buffer.max_priority == replay_buffer.max_priority
+
+    # A new buffer in the same directory replaces the previous one
+    ReplayBuffer(10, "cpu", [OBS_STATE], storage_dir=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        ReplayBuffer.from_storage_dir(tmp_path, device="cpu")
+
+
+def test_storage_dir_requires_cpu_storage(tmp_path):
+    with pytest.raises(ValueError, match="'cpu' storage device"):
+        ReplayBuffer(10, "cpu", [OBS_STATE], storage_device="cuda", storage_dir=tmp_path)
+    with pytest.raises(RuntimeError, match="stored in a directory"):
+        ReplayBuffer(10, "cpu", [OBS_STATE]).flush()
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+@pytest.mark.parametrize("prioritized", [False, True])
+def test_add_batch_matches_add(optimize_memory, prioritized):
+    buffers = [
+        ReplayBuffer(
+            10,
+            "cpu",
+            state_dims(),
+            optimize_memory=optimize_memory,
+            prioritized=prioritized,
+            store_images_as_uint8=True,
+        )
+        for _ in range(2)
+    ]
+    transitions = [
+        Transition(
+            state=create_dummy_state(),
+            action=create_dummy_action(),
+            reward=float(i),
+            next_state=create_dummy_state(),
+            done=i % 7 == 6,
+            truncated=i % 5 == 4,
+            complementary_info={"discrete_penalty": torch.tensor([float(i)])},
+        )
+        for i in range(40)
+    ]
+
+    # Batches wrapping around the end of the buffer, and one larger than the buffer
+    start = 0
+    for batch_size in [3, 9, 1, 0, 15, 12]:
+        batch = transitions[start : start + batch_size]
+        for transition in batch:
+            buffers[0].add(**transition)
+        if batch:
+            buffers[1].add_batch(**stack_transitions(batch))
+        start += batch_size
+
+        assert buffers[1].position == buffers[0].position
+        assert len(buffers[1]) == len(buffers[0])
+        # The buffer is filled from its first slot
+        size = len(buffers[0])
+        for key in state_dims():
+            assert torch.equal(buffers[1].states[key][:size], buffers[0].states[key][:size])
+            assert torch.equal(buffers[1].next_states[key][:size], buffers[0].next_states[key][:size])
+        for name in ["dones", "truncateds", "episode_ends", "frame_only"]:
+            assert torch.equal(getattr(buffers[1], name)[:size], getattr(buffers[0], name)[:size]), name
+        # Frame-only slots hold no action, reward nor complementary info
+        transition_slots = ~buffers[0].frame_only[:size]
+        assert torch.equal(
+            buffers[1].actions[:size][transition_slots], buffers[0].actions[:size][transition_slots]
+        )
+        assert torch.equal(
+            buffers[1].rewards[:size][transition_slots], buffers[0].rewards[:size][transition_slots]
+        )
+        assert torch.equal(
+            buffers[1].complementary_info["discrete_penalty"][:size][transition_slots],
+            buffers[0].complementary_info["discrete_penalty"][:size][transition_slots],
+        )
+        if prioritized:
+            np.testing.assert_array_equal(
+                buffers[1].sum_tree.get(np.arange(10)), buffers[0].sum_tree.get(np.arange(10))
+            )
+
+
+def test_index_transitions():
+    transitions = stack_transitions(
+        [
+            Transition(
+                state=create_dummy_state(),
+                action=create_dummy_action(),
+                reward=float(i),
+                next_state=create_dummy_state(),
+                done=False,
+                truncated=False,
+                complementary_info=None,
+            )
+            for i in range(4)
+        ]
+    )
+    selected = index_transitions(transitions, torch.tensor([True, False, True, False]))
+    assert selected["reward"].tolist() == [0.0, 2.0]
+    assert selected["state"][OBS_IMAGE].shape == (2, 3, 84, 84)
+    assert selected["complementary_info"] is None
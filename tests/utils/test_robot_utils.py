@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from lerobot.utils.robot_utils import RateScheduler, busy_wait, sleep_until
+
+
+def test_sleep_until():
+    deadline = time.perf_counter() + 0.01
+    sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+
+
+def test_busy_wait_negative():
+    start = time.perf_counter()
+    busy_wait(-1)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_rate_scheduler_does_not_drift():
+    fps, num_periods = 100, 50
+    scheduler = RateScheduler(fps)
+    start = time.perf_counter()
+    scheduler.start()
+    for _ in range(num_periods):
+        # Work taking a variable part of the period
+        time.sleep(0.002)
+        scheduler.wait()
+    elapsed = time.perf_counter() - start
+
+    # Deadlines are absolute, so that the errors of the waits don't accumulate
+    assert elapsed == pytest.approx(num_periods / fps, abs=0.01)
+    stats = scheduler.jitter_stats()
+    assert stats["num_overruns"] == 0
+    assert 0 <= stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert len(scheduler.jitters_s) == num_periods
+
+
+def test_rate_scheduler_overrun():
+    scheduler = RateScheduler(fps=100)
+    scheduler.start()
+    time.sleep(0.025)
+    # The period is over: the scheduler returns immediately and restarts from now
+    start = time.perf_counter()
+    assert scheduler.wait() is None
+    assert time.perf_counter() - start < 0.005
+    assert scheduler.num_overruns == 1
+    assert scheduler.wait() is not None
+    assert time.perf_counter() - start == pytest.approx(0.01, abs=0.005)
+
+    scheduler.reset_stats()
+    assert scheduler.jitter_stats()["num_overruns"] == 0
+
+
+def test_rate_scheduler_bounds_jitter_history():
+    scheduler = RateScheduler(fps=1000, max_num_jitters=5)
+    scheduler.start()
+    for _ in range(20):
+        scheduler.wait()
+
+    # Only the latest jitters are kept, the maximum is tracked over all the wake-ups
+    assert len(scheduler.jitters_s) == 5
+    assert scheduler.jitter_stats()["max_ms"] >= max(scheduler.jitters_s) * 1e3
+
+    scheduler.reset_stats()
+    assert len(scheduler.jitters_s) == 0
+    assert scheduler.jitter_stats()["max_ms"] == 0